@@ -0,0 +1,50 @@
+"""Add checkpoint columns to pipeline_runs for resumable gift-leads runs.
+
+Revision ID: 028
+Revises: 027
+Create Date: 2026-10-18
+
+Stores the run arguments, the last completed step and a zlib-compressed
+JSON blob of intermediate step outputs so a run interrupted by a redeploy
+can resume without repeating Apify and LLM work.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '028'
+down_revision: Union[str, None] = '027'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _column_exists(conn, table: str, column: str) -> bool:
+    result = conn.execute(sa.text(
+        "SELECT column_name FROM information_schema.columns "
+        f"WHERE table_name = '{table}' AND column_name = '{column}'"
+    ))
+    return result.fetchone() is not None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    columns = {
+        'run_params': sa.JSON(),
+        'last_completed_step': sa.String(50),
+        'checkpoint_data': sa.LargeBinary(),
+    }
+    for col_name, col_type in columns.items():
+        if _column_exists(conn, 'pipeline_runs', col_name):
+            print(f"=== {col_name} column already exists ===", flush=True)
+        else:
+            print(f"=== ADDING {col_name} column to pipeline_runs ===", flush=True)
+            op.add_column('pipeline_runs', sa.Column(col_name, col_type, nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('pipeline_runs', 'checkpoint_data')
+    op.drop_column('pipeline_runs', 'last_completed_step')
+    op.drop_column('pipeline_runs', 'run_params')
@@ -0,0 +1,58 @@
+"""Add executor queue fields to pipeline_runs.
+
+Revision ID: 029
+Revises: 028
+Create Date: 2026-10-18
+
+Pipeline runs are now queued through a central executor: rows start as
+'queued' with a priority, carry the latest progress message for polling,
+and can be flagged for cancellation from any worker.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '029'
+down_revision: Union[str, None] = '028'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _column_exists(conn, table: str, column: str) -> bool:
+    result = conn.execute(sa.text(
+        "SELECT column_name FROM information_schema.columns "
+        f"WHERE table_name = '{table}' AND column_name = '{column}'"
+    ))
+    return result.fetchone() is not None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    columns = {
+        'priority': sa.Column('priority', sa.Integer(), nullable=True),
+        'progress': sa.Column('progress', sa.JSON(), nullable=True),
+        'cancel_requested': sa.Column(
+            'cancel_requested', sa.Boolean(), nullable=False, server_default='false'
+        ),
+    }
+    for col_name, column in columns.items():
+        if _column_exists(conn, 'pipeline_runs', col_name):
+            print(f"=== {col_name} column already exists ===", flush=True)
+        else:
+            print(f"=== ADDING {col_name} column to pipeline_runs ===", flush=True)
+            op.add_column('pipeline_runs', column)
+
+    # The executor looks up queued runs on startup
+    op.create_index(
+        'ix_pipeline_runs_status', 'pipeline_runs', ['status'], if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_pipeline_runs_status', table_name='pipeline_runs', if_exists=True)
+    op.drop_column('pipeline_runs', 'cancel_requested')
+    op.drop_column('pipeline_runs', 'progress')
+    op.drop_column('pipeline_runs', 'priority')
@@ -0,0 +1,41 @@
+"""Add result column to pipeline_runs.
+
+Revision ID: 030
+Revises: 029
+Create Date: 2026-10-18
+
+Stores the runner's return value (e.g. the gift-leads lead list and cost
+summary) so API clients can fetch it when polling a finished run.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '030'
+down_revision: Union[str, None] = '029'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _column_exists(conn, table: str, column: str) -> bool:
+    result = conn.execute(sa.text(
+        "SELECT column_name FROM information_schema.columns "
+        f"WHERE table_name = '{table}' AND column_name = '{column}'"
+    ))
+    return result.fetchone() is not None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    if _column_exists(conn, 'pipeline_runs', 'result'):
+        print("=== result column already exists ===", flush=True)
+    else:
+        print("=== ADDING result column to pipeline_runs ===", flush=True)
+        op.add_column('pipeline_runs', sa.Column('result', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('pipeline_runs', 'result')
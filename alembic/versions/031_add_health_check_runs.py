@@ -0,0 +1,51 @@
+"""Add health_check_runs table.
+
+Revision ID: 031
+Revises: 030
+Create Date: 2026-10-18
+
+History of production health check results for trend analysis; the
+status endpoint itself is served from an in-memory cache.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '031'
+down_revision: Union[str, None] = '030'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _table_exists(conn, table: str) -> bool:
+    result = conn.execute(sa.text(
+        "SELECT table_name FROM information_schema.tables "
+        f"WHERE table_name = '{table}'"
+    ))
+    return result.fetchone() is not None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    if _table_exists(conn, 'health_check_runs'):
+        print("=== health_check_runs table already exists ===", flush=True)
+        return
+
+    print("=== CREATING health_check_runs table ===", flush=True)
+    op.create_table(
+        'health_check_runs',
+        sa.Column('id', sa.UUID(), primary_key=True),
+        sa.Column('status', sa.String(20), nullable=False),
+        sa.Column('passing', sa.Integer(), nullable=False),
+        sa.Column('total', sa.Integer(), nullable=False),
+        sa.Column('checks', sa.JSON(), nullable=False),
+        sa.Column('duration_ms', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now(), index=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('health_check_runs')
@@ -0,0 +1,43 @@
+"""Add prompt-cache token columns to cost_log.
+
+Revision ID: 032
+Revises: 031
+Create Date: 2026-10-18
+
+LLM calls now mark their static prompt prefixes for provider caching; these
+columns record how many input tokens were read from / written to the cache.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '032'
+down_revision: Union[str, None] = '031'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _column_exists(conn, table: str, column: str) -> bool:
+    result = conn.execute(sa.text(
+        "SELECT column_name FROM information_schema.columns "
+        f"WHERE table_name = '{table}' AND column_name = '{column}'"
+    ))
+    return result.fetchone() is not None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    for col_name in ('cache_read_tokens', 'cache_write_tokens'):
+        if _column_exists(conn, 'cost_log', col_name):
+            print(f"=== {col_name} column already exists ===", flush=True)
+        else:
+            print(f"=== ADDING {col_name} column to cost_log ===", flush=True)
+            op.add_column('cost_log', sa.Column(col_name, sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('cost_log', 'cache_write_tokens')
+    op.drop_column('cost_log', 'cache_read_tokens')
@@ -17,10 +17,22 @@ class Settings(BaseSettings):
 
     # HeyReach
     heyreach_api_key: str = ""
+    heyreach_requests_per_second: float = 4.0  # HeyReach allows 300 requests/min per API key
+    heyreach_burst: int = 10
+    heyreach_max_retries: int = 4  # Retries on 429/5xx, exponential backoff
+    heyreach_backoff_seconds: float = 1.0  # First retry delay; doubles each attempt
+    heyreach_upload_chunk_size: int = 100  # Leads per AddLeadsToListV2 call
+    heyreach_upload_concurrency: int = 4  # Chunks in flight at once
 
     # DeepSeek
     deepseek_api_key: str = ""
     deepseek_model: str = "deepseek-chat"
+    icp_requalify_concurrency: int = 8  # Concurrent tier-1 gift-lead ICP checks
+    icp_verdict_cache_ttl_seconds: int = 86400  # Reuse a (lead, ICP) verdict this long
+
+    # Webhook ingestion
+    webhook_debug_sample_rate: float = 0.0  # Fraction of webhook bodies logged (0 = off, 1 = all)
+    webhook_debug_max_body_chars: int = 2000  # Body prefix included in a sampled log line
 
     # Slack
     slack_bot_token: str = ""
@@ -29,6 +41,20 @@ class Settings(BaseSettings):
     slack_engagement_channel_id: str = ""  # For LinkedIn engagement notifications
     slack_pitched_channel_id: str = ""  # For pitched+ prospect tracking cards
     slack_signing_secret: str = ""
+    slack_channel_rate_per_second: float = 1.0  # Sustained chat.postMessage/update rate per channel
+    slack_channel_burst: int = 5  # Messages allowed back-to-back before the rate applies
+    slack_max_retries: int = 3  # Retries on 429 (waits Retry-After each time)
+    slack_progress_interval_seconds: float = 3.0  # Min gap between edits of a pipeline progress message
+    slack_interaction_concurrency: int = 10  # Deferred /slack/interactions jobs run at once
+
+    # Few-shot example retrieval
+    example_index_path: str = ""  # JSON snapshot of the example index (empty = rebuild from DB on startup)
+
+    # Prompt assembly (token estimates, see app.prompts.budget; 0 = unlimited)
+    prompt_history_token_budget: int = 1500  # Conversation history per LLM call
+    prompt_history_recent_turns: int = 6  # Newest messages kept verbatim while they fit
+    prompt_history_compressed_chars: int = 200  # Older messages are clipped to this length
+    prompt_examples_token_budget: int = 1200  # Few-shot examples per generation prompt
 
     # Apify
     apify_api_token: str = ""
@@ -36,9 +62,15 @@ class Settings(BaseSettings):
     # Database
     database_url: str = "sqlite+aiosqlite:///./speed_to_lead.db"
     content_db_url: str = ""  # contentCreator's Postgres (for trend scout)
+    content_db_pool_size: int = 3
+    trend_scout_dedupe_days: int = 30  # Skip topics already saved within this window
 
     # Perplexity (for trend scout)
     perplexity_api_key: str = ""
+    trend_scout_search_concurrency: int = 3  # Starting concurrent searches; adapts to 429s
+    trend_scout_max_search_concurrency: int = 8
+    trend_scout_score_chunk_size: int = 3  # Search results per Claude scoring call
+    trend_scout_score_concurrency: int = 3  # Starting concurrent scoring calls; adapts to 429s
 
     # Anthropic (for trend scout ICP scoring)
     anthropic_api_key: str = ""
@@ -50,6 +82,8 @@ class Settings(BaseSettings):
     google_oauth_client_secret: str = ""  # OAuth client secret
     google_oauth_refresh_token: str = ""  # OAuth refresh token (personal account)
 
+    blocking_io_workers: int = 4  # Threads for blocking Drive/MinIO SDK calls
+
     # MinIO / Obsidian
     minio_endpoint: str = ""
     minio_access_key: str = ""
@@ -57,6 +91,24 @@ class Settings(BaseSettings):
     minio_bucket: str = "obsidian-vault"
     obsidian_vault_path: str = ""
 
+    # Pipelines
+    pipeline_max_concurrent_runs: int = 2  # Across all types; per-type caps in pipeline_executor
+    personalization_concurrency: int = 8  # In-flight DeepSeek DM generations/validations
+    personalization_timeout_seconds: float = 90.0  # Per-lead cap (includes retries inside one call)
+
+    # Engagement
+    engagement_concurrency: int = 5  # Posts summarized/notified in parallel per check
+    engagement_apify_batch_size: int = 25  # Max profiles per Apify posts scrape
+
+    # Health checks
+    health_check_concurrency: int = 4  # Checks in flight (each holds a pool connection)
+    health_check_timeout_seconds: float = 10.0  # Per-check cap; slow check reports a warning
+    health_check_cache_ttl_seconds: float = 300.0  # /admin/health-check/status serves this cached
+
+    # Scheduler
+    scheduler_persistent_jobs: bool = True  # DB job store + leader lock (False: in-memory, every worker runs jobs)
+    scheduler_leader_poll_seconds: float = 30.0  # Leader lock re-check / follower takeover interval
+
     # App
     secret_key: str = "change-me-in-production"
     environment: str = "development"
@@ -80,6 +132,23 @@ class Settings(BaseSettings):
             url = url.replace("postgresql://", "postgresql+asyncpg://", 1)
         return url
 
+    @property
+    def async_content_db_url(self) -> str:
+        """Get content DB URL for async driver (asyncpg)."""
+        url = self.content_db_url
+        for prefix in ("postgresql://", "postgres://"):
+            if url.startswith(prefix):
+                return url.replace(prefix, "postgresql+asyncpg://", 1)
+        return url
+
+    @property
+    def sync_database_url(self) -> str:
+        """Get database URL for sync drivers (APScheduler job store)."""
+        url = self.database_url
+        url = url.replace("postgresql+asyncpg://", "postgresql://", 1)
+        url = url.replace("sqlite+aiosqlite://", "sqlite://", 1)
+        return url
+
 
 @lru_cache
 def get_settings() -> Settings:
@@ -29,11 +29,13 @@ try:
     logger.info("Models imported")
 
     from app.schemas import HeyReachWebhookPayload, HealthResponse
+    from app.middleware import RequestLogMiddleware
     logger.info("Schemas imported")
 
     from app.services.deepseek import generate_reply_draft
     from app.services.example_retriever import get_similar_examples, format_examples_for_prompt
     from app.services.slack import SlackBot
+    from app.services.webhook_ingest import log_webhook_sample, parse_json, parse_payload, payload_keys
     logger.info("Services imported")
 
     from app.routers.slack import router as slack_router
@@ -58,7 +60,19 @@ async def lifespan(app: FastAPI):
     from app.services.scheduler import get_scheduler_service
     scheduler = get_scheduler_service()
     scheduler.start()
-    logger.info("Scheduler started with daily/weekly report jobs")
+    logger.info(f"Scheduler started with daily/weekly report jobs (leader={scheduler.is_leader})")
+
+    from app.services.pipeline_executor import get_pipeline_executor
+    pipeline_executor = get_pipeline_executor()
+    await pipeline_executor.start()
+
+    # Build the few-shot example index now so the first webhook doesn't pay for it
+    from app.services.example_index import get_example_index
+    try:
+        async with async_session_factory() as session:
+            await get_example_index().ensure_loaded(session)
+    except Exception as e:
+        logger.warning(f"Example index warm-up failed (will retry on first use): {e}")
 
     yield
 
@@ -66,10 +80,27 @@ async def lifespan(app: FastAPI):
     scheduler.shutdown(wait=False)
     logger.info("Scheduler shut down")
 
+    await pipeline_executor.shutdown()
+
     from app.services.heyreach import _client as heyreach_client
     if heyreach_client:
         await heyreach_client.close()
 
+    from app.services.content_db import dispose_content_engine
+    await dispose_content_engine()
+
+    from app.services.blocking_io import shutdown_blocking_io
+    shutdown_blocking_io()
+
+    # Let clicks that were already acknowledged finish before Slack writes drain
+    from app.services.interaction_queue import _queue as interaction_queue
+    if interaction_queue:
+        await interaction_queue.join()
+
+    from app.services.slack import _bot as slack_bot
+    if slack_bot:
+        await slack_bot.drain()
+
 
 app = FastAPI(
     title="Speed to Lead",
@@ -88,14 +119,7 @@ app.include_router(costs_router)
 app.include_router(clients_router)
 
 
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    """Log all incoming requests for debugging."""
-    logger.info(f"Request: {request.method} {request.url.path}")
-    logger.info(f"Headers: {dict(request.headers)}")
-    response = await call_next(request)
-    logger.info(f"Response status: {response.status_code}")
-    return response
+app.add_middleware(RequestLogMiddleware)
 
 
 @app.get("/health", response_model=HealthResponse)
@@ -332,10 +356,9 @@ async def admin_health_check(request: Request) -> dict:
     if auth_header != expected:
         raise HTTPException(status_code=401, detail="Unauthorized")
 
-    from app.services.health_check import run_health_check
+    from app.services.health_check import refresh_health_report
 
-    async with async_session_factory() as session:
-        report = await run_health_check(session)
+    report = await refresh_health_report()
 
     return {
         "status": report.status.value,
@@ -358,21 +381,59 @@ async def admin_health_check(request: Request) -> dict:
 async def admin_health_check_status() -> dict:
     """Quick health check summary - no auth required.
 
-    Returns overall status and names of failing checks only.
+    Returns overall status and names of failing checks only, served from
+    the cached report (refreshed at most every health_check_cache_ttl_seconds).
     """
-    from app.services.health_check import run_health_check
+    from app.services.health_check import get_cached_health_report
 
-    async with async_session_factory() as session:
-        report = await run_health_check(session)
+    report = await get_cached_health_report()
 
     return {
         "status": report.status.value,
+        "timestamp": report.timestamp.isoformat(),
         "passing": report.passing,
         "total": len(report.checks),
         "failing": [c.name for c in report.failing],
     }
 
 
+@app.get("/admin/health-check/history")
+async def admin_health_check_history(request: Request, limit: int = 50) -> dict:
+    """Recent health check runs for trend analysis, newest first.
+
+    Protected by SECRET_KEY in the Authorization header.
+    """
+    auth_header = request.headers.get("Authorization", "")
+    expected = f"Bearer {settings.secret_key}"
+
+    if auth_header != expected:
+        raise HTTPException(status_code=401, detail="Unauthorized")
+
+    from app.models import HealthCheckRun
+
+    async with async_session_factory() as session:
+        result = await session.execute(
+            select(HealthCheckRun)
+            .order_by(HealthCheckRun.created_at.desc())
+            .limit(min(limit, 500))
+        )
+        runs = result.scalars().all()
+
+    return {
+        "runs": [
+            {
+                "status": run.status,
+                "passing": run.passing,
+                "total": run.total,
+                "failing": [c["name"] for c in run.checks if c["status"] != "ok"],
+                "duration_ms": run.duration_ms,
+                "created_at": run.created_at.isoformat(),
+            }
+            for run in runs
+        ],
+    }
+
+
 @app.post("/admin/campaign-fuel-check")
 async def admin_campaign_fuel_check(request: Request) -> dict:
     """Run campaign fuel check manually.
@@ -394,7 +455,6 @@ async def admin_campaign_fuel_check(request: Request) -> dict:
 @app.post("/admin/run-competitor-pipeline")
 async def admin_run_competitor_pipeline(
     request: Request,
-    background_tasks: BackgroundTasks,
     keywords: str = "ceos",
     days_back: int = 7,
     min_reactions: int = 50,
@@ -402,7 +462,8 @@ async def admin_run_competitor_pipeline(
 ) -> dict:
     """Trigger the competitor post pipeline manually.
 
-    Runs in the background so the response returns immediately.
+    Queued on the pipeline executor so the response returns immediately;
+    poll /api/pipelines/runs/{run_id} for progress.
     Protected by SECRET_KEY in the Authorization header.
     """
     auth_header = request.headers.get("Authorization", "")
@@ -411,22 +472,29 @@ async def admin_run_competitor_pipeline(
     if auth_header != expected:
         raise HTTPException(status_code=401, detail="Unauthorized")
 
-    from app.services.prospect_pipeline import run_competitor_post_pipeline
+    from app.services.pipeline_executor import get_pipeline_executor
 
-    background_tasks.add_task(
-        run_competitor_post_pipeline,
-        keywords=keywords,
-        days_back=days_back,
-        min_reactions=min_reactions,
-        dry_run=dry_run,
+    run_id = await get_pipeline_executor().submit(
+        "competitor_post",
+        {
+            "keywords": keywords,
+            "days_back": days_back,
+            "min_reactions": min_reactions,
+            "dry_run": dry_run,
+        },
     )
-    return {"status": "started", "keywords": keywords, "days_back": days_back, "dry_run": dry_run}
+    return {
+        "status": "queued",
+        "run_id": str(run_id),
+        "keywords": keywords,
+        "days_back": days_back,
+        "dry_run": dry_run,
+    }
 
 
 @app.post("/admin/run-lead-finder")
 async def admin_run_lead_finder(
     request: Request,
-    background_tasks: BackgroundTasks,
     job_titles: str | None = None,
     company_keywords: str | None = None,
     location: str = "united states",
@@ -436,7 +504,8 @@ async def admin_run_lead_finder(
     """Trigger the lead finder pipeline manually.
 
     job_titles and company_keywords are comma-separated strings.
-    Runs in the background so the response returns immediately.
+    Queued on the pipeline executor so the response returns immediately;
+    poll /api/pipelines/runs/{run_id} for progress.
     Protected by SECRET_KEY in the Authorization header.
     """
     auth_header = request.headers.get("Authorization", "")
@@ -445,20 +514,29 @@ async def admin_run_lead_finder(
     if auth_header != expected:
         raise HTTPException(status_code=401, detail="Unauthorized")
 
-    from app.services.lead_finder_pipeline import run_lead_finder_pipeline
+    from app.services.pipeline_executor import get_pipeline_executor
 
     titles = [t.strip() for t in job_titles.split(",")] if job_titles else None
     keywords = [k.strip() for k in company_keywords.split(",")] if company_keywords else None
 
-    background_tasks.add_task(
-        run_lead_finder_pipeline,
-        job_titles=titles,
-        company_keywords=keywords,
-        location=location,
-        fetch_count=fetch_count,
-        dry_run=dry_run,
+    run_id = await get_pipeline_executor().submit(
+        "lead_finder",
+        {
+            "job_titles": titles,
+            "company_keywords": keywords,
+            "location": location,
+            "fetch_count": fetch_count,
+            "dry_run": dry_run,
+        },
     )
-    return {"status": "started", "job_titles": titles, "company_keywords": keywords, "fetch_count": fetch_count, "dry_run": dry_run}
+    return {
+        "status": "queued",
+        "run_id": str(run_id),
+        "job_titles": titles,
+        "company_keywords": keywords,
+        "fetch_count": fetch_count,
+        "dry_run": dry_run,
+    }
 
 
 @app.get("/admin/pipeline-runs")
@@ -499,11 +577,153 @@ async def admin_list_pipeline_runs(
             "completed_at": r.completed_at.isoformat() if r.completed_at else None,
             "duration_seconds": r.duration_seconds,
             "error_message": r.error_message,
+            "last_completed_step": r.last_completed_step,
+            "priority": r.priority,
+            "progress": r.progress,
         }
         for r in runs
     ]
 
 
+@app.post("/admin/pipeline-runs/{run_id}/resume")
+async def admin_resume_pipeline_run(
+    run_id: uuid.UUID,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """Resume an interrupted or failed gift leads run from its last checkpoint.
+
+    Re-queued on the pipeline executor so the response returns immediately.
+    Protected by SECRET_KEY in the Authorization header.
+    """
+    auth_header = request.headers.get("Authorization", "")
+    expected = f"Bearer {settings.secret_key}"
+
+    if auth_header != expected:
+        raise HTTPException(status_code=401, detail="Unauthorized")
+
+    from app.services.gift_pipeline.checkpoints import RESUMABLE_STATUSES, RUN_TYPE
+
+    run = await db.get(PipelineRun, run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="Pipeline run not found")
+    if run.run_type != RUN_TYPE or run.status not in RESUMABLE_STATUSES:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Run is not resumable (type={run.run_type}, status={run.status})",
+        )
+
+    from app.services.gift_pipeline import resume_gift_leads_pipeline
+    from app.services.pipeline_executor import get_pipeline_executor
+
+    async def _resume(run_id: uuid.UUID, progress) -> dict | None:
+        return await resume_gift_leads_pipeline(run_id, progress=progress)
+
+    await get_pipeline_executor().submit(RUN_TYPE, runner=_resume, run_id=run_id)
+    return {
+        "status": "resuming",
+        "run_id": str(run_id),
+        "last_completed_step": run.last_completed_step,
+    }
+
+
+@app.post("/admin/pipeline-runs/{run_id}/cancel")
+async def admin_cancel_pipeline_run(
+    run_id: uuid.UUID,
+    request: Request,
+) -> dict:
+    """Cancel a queued or running pipeline run.
+
+    Protected by SECRET_KEY in the Authorization header.
+    """
+    auth_header = request.headers.get("Authorization", "")
+    expected = f"Bearer {settings.secret_key}"
+
+    if auth_header != expected:
+        raise HTTPException(status_code=401, detail="Unauthorized")
+
+    from app.services.pipeline_executor import get_pipeline_executor
+
+    if not await get_pipeline_executor().cancel(run_id):
+        raise HTTPException(status_code=409, detail="Run is not queued or running")
+    return {"status": "cancelling", "run_id": str(run_id)}
+
+
+@app.get("/admin/pipeline-queue")
+async def admin_pipeline_queue(request: Request) -> dict:
+    """Show this worker's pipeline executor queue and running runs.
+
+    Protected by SECRET_KEY in the Authorization header.
+    """
+    auth_header = request.headers.get("Authorization", "")
+    expected = f"Bearer {settings.secret_key}"
+
+    if auth_header != expected:
+        raise HTTPException(status_code=401, detail="Unauthorized")
+
+    from app.services.pipeline_executor import get_pipeline_executor
+
+    return get_pipeline_executor().snapshot()
+
+
+@app.get("/admin/scheduler-jobs")
+async def admin_scheduler_jobs(request: Request) -> dict:
+    """List scheduled jobs from the shared job store.
+
+    Protected by SECRET_KEY in the Authorization header.
+    """
+    auth_header = request.headers.get("Authorization", "")
+    expected = f"Bearer {settings.secret_key}"
+
+    if auth_header != expected:
+        raise HTTPException(status_code=401, detail="Unauthorized")
+
+    from app.services.scheduler import get_scheduler_service
+
+    scheduler = get_scheduler_service()
+    return {
+        "is_leader": scheduler.is_leader,
+        "jobs": [
+            {**job, "next_run_time": job["next_run_time"].isoformat() if job["next_run_time"] else None}
+            for job in scheduler.list_jobs()
+        ],
+    }
+
+
+@app.get("/admin/slack-dispatch")
+async def admin_slack_dispatch(request: Request) -> dict:
+    """Slack delivery counters (sent, failed, rate limited, coalesced).
+
+    Protected by SECRET_KEY in the Authorization header.
+    """
+    auth_header = request.headers.get("Authorization", "")
+    expected = f"Bearer {settings.secret_key}"
+
+    if auth_header != expected:
+        raise HTTPException(status_code=401, detail="Unauthorized")
+
+    from app.services.slack import get_slack_bot
+
+    return get_slack_bot().dispatch_stats()
+
+
+@app.get("/admin/slack-interactions")
+async def admin_slack_interactions(request: Request) -> dict:
+    """Deferred Slack interaction queue counters (queued, deduplicated, failed).
+
+    Protected by SECRET_KEY in the Authorization header.
+    """
+    auth_header = request.headers.get("Authorization", "")
+    expected = f"Bearer {settings.secret_key}"
+
+    if auth_header != expected:
+        raise HTTPException(status_code=401, detail="Unauthorized")
+
+    from app.services.interaction_queue import get_interaction_queue
+
+    return get_interaction_queue().stats()
+
+
 @app.post("/admin/expire-stale-drafts")
 async def admin_expire_stale_drafts(
     request: Request,
@@ -542,10 +762,9 @@ async def process_incoming_message(payload: HeyReachWebhookPayload) -> dict:
     Returns:
         Dict with draft_id if successful.
     """
-    print("=== PROCESSING MESSAGE IN BACKGROUND ===", flush=True)
     try:
         async with async_session_factory() as session:
-            print("Database session opened", flush=True)
+            logger.debug("Database session opened")
             # 1. Upsert conversation record
             result = await session.execute(
                 select(Conversation).where(
@@ -637,7 +856,6 @@ async def process_incoming_message(payload: HeyReachWebhookPayload) -> dict:
                     logger.info(f"Removed {lead_profile_url_for_followup} from follow-up list (replied within 24h)")
 
             # 3. Generate AI draft via DeepSeek (with stage detection)
-            print(f"Generating AI draft for conversation {conversation.id}", flush=True)
             logger.info(f"Generating AI draft for conversation {conversation.id}")
 
             # Build lead context for better AI drafts
@@ -690,8 +908,6 @@ async def process_incoming_message(payload: HeyReachWebhookPayload) -> dict:
                 stage_reasoning=stage_reasoning,
                 reply=reply,
             )
-            print(f"Detected stage: {draft_result.detected_stage.value}", flush=True)
-            print(f"Generated draft: {draft_result.reply[:100]}...", flush=True)
             logger.info(f"Detected stage: {draft_result.detected_stage.value}")
             logger.info(f"Generated draft: {draft_result.reply[:100]}...")
 
@@ -723,7 +939,6 @@ async def process_incoming_message(payload: HeyReachWebhookPayload) -> dict:
                     logger.info(f"Linked prospect {prospect.id} to conversation {conversation.id}")
 
             # 5. QA check before sending to Slack
-            print("Running QA check on draft...", flush=True)
             logger.info(f"Running QA check on draft for {payload.lead_name}")
 
             qa_result = None
@@ -811,7 +1026,7 @@ async def process_incoming_message(payload: HeyReachWebhookPayload) -> dict:
             await session.commit()
 
             # 7. Send draft to Slack for approval (with QA annotation)
-            print("Sending to Slack...", flush=True)
+            logger.debug("Sending to Slack...")
             slack_bot = SlackBot()
             slack_ts = await slack_bot.send_draft_notification(
                 draft_id=draft_id,
@@ -832,7 +1047,6 @@ async def process_incoming_message(payload: HeyReachWebhookPayload) -> dict:
                 qa_verdict=qa_result.verdict if qa_result else None,
                 qa_issues=[{"type": i.type, "detail": i.detail, "severity": i.severity} for i in qa_result.issues] if qa_result and qa_result.issues else None,
             )
-            print(f"Slack notification sent, ts: {slack_ts}", flush=True)
             logger.info(f"Sent Slack notification, ts: {slack_ts}")
 
             # 8. Update draft with Slack message timestamp
@@ -843,7 +1057,6 @@ async def process_incoming_message(payload: HeyReachWebhookPayload) -> dict:
             return {"draft_id": str(draft.id)}
 
     except Exception as e:
-        print(f"!!! ERROR processing message: {e}", flush=True)
         logger.error(f"Error processing message: {e}", exc_info=True)
         return {"error": str(e)}
 
@@ -874,39 +1087,35 @@ async def heyreach_webhook(
     Returns:
         Acknowledgment response.
     """
-    # Log raw body for debugging - use print with flush to ensure it appears
-    print("=== WEBHOOK RECEIVED ===", flush=True)
     body = await request.body()
-    print(f"Body length: {len(body)}", flush=True)
-    logger.info(f"Raw webhook body: {body.decode('utf-8', errors='replace')}")
 
-    # Parse the JSON body
     try:
-        import json
-        data = json.loads(body)
-        logger.info(f"Parsed webhook data: {data}")
-    except Exception as e:
-        logger.error(f"Failed to parse webhook body: {e}")
+        payload, data, error = parse_payload(HeyReachWebhookPayload, body)
+    except ValueError as e:
+        logger.error(f"Failed to parse webhook body ({len(body)} bytes): {e}")
         return {"status": "error", "message": "Invalid JSON"}
 
-    # Try to parse with our schema
-    try:
-        payload = HeyReachWebhookPayload(**data)
-        background_tasks.add_task(process_incoming_message, payload)
-        return {
-            "status": "received",
-            "conversation_id": payload.conversation_id,
-            "lead_name": payload.lead_name,
-        }
-    except Exception as e:
-        logger.error(f"Schema validation failed: {e}")
-        # Return success anyway to acknowledge receipt, log for debugging
+    log_webhook_sample("heyreach", body, valid=payload is not None)
+    if payload is None:
+        logger.error(f"Schema validation failed: {error}")
+        # Return success anyway to acknowledge receipt
         return {
             "status": "received_raw",
             "message": "Payload logged for analysis",
-            "keys": list(data.keys()) if isinstance(data, dict) else "not a dict",
+            "keys": payload_keys(data),
         }
 
+    logger.info(
+        f"HeyReach webhook: conversation={payload.conversation_id} "
+        f"lead={payload.lead_name} ({len(body)} bytes)"
+    )
+    background_tasks.add_task(process_incoming_message, payload)
+    return {
+        "status": "received",
+        "conversation_id": payload.conversation_id,
+        "lead_name": payload.lead_name,
+    }
+
 
 async def process_outgoing_message(payload: HeyReachWebhookPayload) -> dict:
     """Process an outgoing message from HeyReach webhook.
@@ -923,7 +1132,6 @@ async def process_outgoing_message(payload: HeyReachWebhookPayload) -> dict:
     Returns:
         Dict with message_log_id if successful.
     """
-    print("=== PROCESSING OUTGOING MESSAGE IN BACKGROUND ===", flush=True)
     try:
         async with async_session_factory() as session:
             from datetime import datetime, timedelta, timezone
@@ -1025,7 +1233,6 @@ async def process_outgoing_message(payload: HeyReachWebhookPayload) -> dict:
             return {"status": "logged", "created": created, "deduped": deduped}
 
     except Exception as e:
-        print(f"!!! ERROR processing outgoing message: {e}", flush=True)
         logger.error(f"Error processing outgoing message: {e}", exc_info=True)
         return {"error": str(e)}
 
@@ -1054,36 +1261,35 @@ async def heyreach_outgoing_webhook(
     Returns:
         Acknowledgment response.
     """
-    print("=== OUTGOING WEBHOOK RECEIVED ===", flush=True)
     body = await request.body()
-    print(f"Body length: {len(body)}", flush=True)
-    logger.info(f"Raw outgoing webhook body: {body.decode('utf-8', errors='replace')}")
 
     try:
-        import json
-        data = json.loads(body)
-        logger.info(f"Parsed outgoing webhook data: {data}")
-    except Exception as e:
-        logger.error(f"Failed to parse outgoing webhook body: {e}")
+        payload, data, error = parse_payload(HeyReachWebhookPayload, body)
+    except ValueError as e:
+        logger.error(f"Failed to parse outgoing webhook body ({len(body)} bytes): {e}")
         return {"status": "error", "message": "Invalid JSON"}
 
-    try:
-        payload = HeyReachWebhookPayload(**data)
-        background_tasks.add_task(process_outgoing_message, payload)
-        return {
-            "status": "received",
-            "conversation_id": payload.conversation_id,
-            "lead_name": payload.lead_name,
-            "direction": "outgoing",
-        }
-    except Exception as e:
-        logger.error(f"Outgoing webhook schema validation failed: {e}")
+    log_webhook_sample("heyreach_outgoing", body, valid=payload is not None)
+    if payload is None:
+        logger.error(f"Outgoing webhook schema validation failed: {error}")
         return {
             "status": "received_raw",
             "message": "Payload logged for analysis",
-            "keys": list(data.keys()) if isinstance(data, dict) else "not a dict",
+            "keys": payload_keys(data),
         }
 
+    logger.info(
+        f"HeyReach outgoing webhook: conversation={payload.conversation_id} "
+        f"lead={payload.lead_name} ({len(body)} bytes)"
+    )
+    background_tasks.add_task(process_outgoing_message, payload)
+    return {
+        "status": "received",
+        "conversation_id": payload.conversation_id,
+        "lead_name": payload.lead_name,
+        "direction": "outgoing",
+    }
+
 
 # =============================================================================
 # CONNECTION TRACKING WEBHOOKS
@@ -1095,7 +1301,6 @@ async def process_connection_sent(data: dict) -> dict:
 
     Sets connection_sent_at on the matching Prospect.
     """
-    print("=== PROCESSING CONNECTION SENT IN BACKGROUND ===", flush=True)
     try:
         async with async_session_factory() as session:
             from datetime import datetime, timezone
@@ -1136,7 +1341,6 @@ async def process_connection_accepted(data: dict) -> dict:
 
     Sets connection_accepted_at on the matching Prospect.
     """
-    print("=== PROCESSING CONNECTION ACCEPTED IN BACKGROUND ===", flush=True)
     try:
         async with async_session_factory() as session:
             from datetime import datetime, timezone
@@ -1205,18 +1409,16 @@ async def heyreach_connection_sent_webhook(
     background_tasks: BackgroundTasks,
 ) -> dict:
     """Receive webhook from HeyReach when a connection request is sent."""
-    print("=== CONNECTION SENT WEBHOOK RECEIVED ===", flush=True)
     body = await request.body()
-    logger.info(f"Raw connection-sent webhook body: {body.decode('utf-8', errors='replace')}")
 
     try:
-        import json
-        data = json.loads(body)
-        logger.info(f"Parsed connection-sent data keys: {list(data.keys()) if isinstance(data, dict) else 'not a dict'}")
-    except Exception as e:
+        data = parse_json(body)
+    except ValueError as e:
         logger.error(f"Failed to parse connection-sent webhook body: {e}")
         return {"status": "error", "message": "Invalid JSON"}
 
+    log_webhook_sample("heyreach_connection_sent", body)
+    logger.info(f"HeyReach connection-sent webhook: keys={payload_keys(data)}")
     background_tasks.add_task(process_connection_sent, data)
     return {"status": "received", "event": "connection_sent"}
 
@@ -1234,18 +1436,16 @@ async def heyreach_connection_accepted_webhook(
     background_tasks: BackgroundTasks,
 ) -> dict:
     """Receive webhook from HeyReach when a connection request is accepted."""
-    print("=== CONNECTION ACCEPTED WEBHOOK RECEIVED ===", flush=True)
     body = await request.body()
-    logger.info(f"Raw connection-accepted webhook body: {body.decode('utf-8', errors='replace')}")
 
     try:
-        import json
-        data = json.loads(body)
-        logger.info(f"Parsed connection-accepted data keys: {list(data.keys()) if isinstance(data, dict) else 'not a dict'}")
-    except Exception as e:
+        data = parse_json(body)
+    except ValueError as e:
         logger.error(f"Failed to parse connection-accepted webhook body: {e}")
         return {"status": "error", "message": "Invalid JSON"}
 
+    log_webhook_sample("heyreach_connection_accepted", body)
+    logger.info(f"HeyReach connection-accepted webhook: keys={payload_keys(data)}")
     background_tasks.add_task(process_connection_accepted, data)
     return {"status": "received", "event": "connection_accepted"}
 
@@ -1284,7 +1484,7 @@ async def check_and_remove_from_followup(session, linkedin_url: str) -> bool:
         True if prospect was stopped/removed, False otherwise.
     """
     from datetime import datetime, timedelta, timezone
-    from app.services.heyreach import get_heyreach_client, HeyReachError
+    from app.services.heyreach import get_heyreach_client, HeyReachError, stop_and_remove_lead
     from app.routers.slack import HEYREACH_FOLLOW_UP_CAMPAIGN_ID
 
     normalized_url = normalize_linkedin_url(linkedin_url)
@@ -1315,23 +1515,17 @@ async def check_and_remove_from_followup(session, linkedin_url: str) -> bool:
     )
 
     try:
-        heyreach = get_heyreach_client()
-
-        # Stop the lead in the follow-up campaign
-        await heyreach.stop_lead_in_campaign(
+        # Stop the lead in the follow-up campaign and remove it from the list
+        await stop_and_remove_lead(
             campaign_id=HEYREACH_FOLLOW_UP_CAMPAIGN_ID,
+            list_id=prospect.followup_list_id,
             linkedin_url=normalized_url,
+            client=get_heyreach_client(),
         )
         logger.info(
-            f"Stopped {normalized_url} in campaign {HEYREACH_FOLLOW_UP_CAMPAIGN_ID}"
-        )
-
-        # Remove from the follow-up list
-        await heyreach.remove_lead_from_list(
-            list_id=prospect.followup_list_id,
-            linkedin_url=normalized_url,
+            f"Stopped {normalized_url} in campaign {HEYREACH_FOLLOW_UP_CAMPAIGN_ID} "
+            f"and removed from follow-up list {prospect.followup_list_id}"
         )
-        logger.info(f"Removed {normalized_url} from follow-up list {prospect.followup_list_id}")
 
         # Clear the follow-up tracking fields
         prospect.followup_list_id = None
@@ -2342,7 +2536,7 @@ async def admin_generate_gift_leads_sheet(
     """
     from sqlalchemy import or_
 
-    from app.services.google_sheets import get_google_sheets_service
+    from app.services.google_sheets import create_gift_leads_sheet_async
     from app.services.slack import get_slack_bot
 
     async with async_session_factory() as session:
@@ -2433,15 +2627,13 @@ async def admin_generate_gift_leads_sheet(
 
     # Create Google Sheet
     sheet_url = None
-    sheets_svc = get_google_sheets_service()
-    if sheets_svc:
-        try:
-            sheet_url = sheets_svc.create_gift_leads_sheet(
-                prospect_name=prospect_display_name,
-                leads=leads,
-            )
-        except Exception as e:
-            logger.error(f"Failed to create Google Sheet: {e}", exc_info=True)
+    try:
+        sheet_url = await create_gift_leads_sheet_async(
+            prospect_name=prospect_display_name,
+            leads=leads,
+        )
+    except Exception as e:
+        logger.error(f"Failed to create Google Sheet: {e}", exc_info=True)
 
     # Compose draft DM
     first_name = prospect_display_name.split()[0] if prospect_display_name else "there"
@@ -2515,9 +2707,9 @@ async def admin_trigger_gift_leads(
     """
     from sqlalchemy import or_
 
-    from app.services.gift_pipeline.cost_tracker import CostTracker
-    from app.services.gift_pipeline.deepseek_calls import check_icp_match
-    from app.services.google_sheets import get_google_sheets_service
+    from app.services.gift_pipeline.constants import GIFT_SHEET_MAX_LEADS
+    from app.services.gift_pipeline.icp_requalify import requalify_leads
+    from app.services.google_sheets import create_gift_leads_sheet_async
     from app.services.slack import get_slack_bot
 
     keyword_list = [k.strip() for k in keywords.split(",") if k.strip()]
@@ -2585,47 +2777,21 @@ async def admin_trigger_gift_leads(
     # ICP re-qualification: filter leads through DeepSeek
     icp_criteria = icp_label or ", ".join(keyword_list)
     if leads:
-        cost_tracker = CostTracker()
-        qualified_leads = []
-        rejected_leads = []
-        error_leads = []
-        for lead in leads:
-            name = lead.get("full_name", "Unknown")
-            try:
-                icp_result = await check_icp_match(
-                    lead, cost_tracker, icp_criteria, strict=True,
-                )
-                lead["icp_reason"] = icp_result.get("reason", "")
-                lead["icp_confidence"] = icp_result.get("confidence", "")
-                is_match = icp_result.get("match", False)
-                logger.info(
-                    f"ICP check [{name}]: match={is_match}, "
-                    f"confidence={icp_result.get('confidence', '?')}, "
-                    f"reason={icp_result.get('reason', 'none')}"
-                )
-                if is_match:
-                    qualified_leads.append(lead)
-                else:
-                    rejected_leads.append(name)
-            except Exception as e:
-                logger.error(
-                    f"ICP re-qualification FAILED for {name}: {e}",
-                    exc_info=True,
-                )
-                lead["icp_reason"] = f"Error: {e}"
-                error_leads.append(name)
-                # Don't keep leads that failed ICP check — we can't trust them
         before_count = len(leads)
-        leads = qualified_leads[:15]
+        requalified = await requalify_leads(
+            leads, icp_criteria, stop_after=max(min_leads, GIFT_SHEET_MAX_LEADS),
+        )
+        leads = requalified.qualified[:GIFT_SHEET_MAX_LEADS]
         logger.info(
             f"ICP re-qualification: {before_count} → {len(leads)} leads "
             f"(ICP: {icp_criteria[:60]}) | "
-            f"rejected={len(rejected_leads)}, errors={len(error_leads)}"
+            f"rejected={len(requalified.rejected)}, errors={len(requalified.errors)}, "
+            f"cached={requalified.cache_hits}, skipped={requalified.skipped}"
         )
-        if rejected_leads:
-            logger.info(f"ICP rejected: {', '.join(rejected_leads[:10])}")
-        if error_leads:
-            logger.error(f"ICP errors: {', '.join(error_leads)}")
+        if requalified.rejected:
+            logger.info(f"ICP rejected: {', '.join(requalified.rejected[:10])}")
+        if requalified.errors:
+            logger.error(f"ICP errors: {', '.join(requalified.errors)}")
 
     # Check if Tier 1 has enough leads
     prospect_id = prospect.id if prospect else None
@@ -2634,15 +2800,13 @@ async def admin_trigger_gift_leads(
     if len(leads) >= min_leads:
         # Tier 1 success: create sheet and post to Slack
         sheet_url = None
-        sheets_svc = get_google_sheets_service()
-        if sheets_svc:
-            try:
-                sheet_url = sheets_svc.create_gift_leads_sheet(
-                    prospect_name=conv.lead_name,
-                    leads=leads,
-                )
-            except Exception as e:
-                logger.error(f"Failed to create Google Sheet: {e}", exc_info=True)
+        try:
+            sheet_url = await create_gift_leads_sheet_async(
+                prospect_name=conv.lead_name,
+                leads=leads,
+            )
+        except Exception as e:
+            logger.error(f"Failed to create Google Sheet: {e}", exc_info=True)
 
         icp_text = icp_label or ", ".join(keyword_list)
         if sheet_url:
@@ -2726,7 +2890,8 @@ async def _admin_gift_leads_fallback(
     Combines any Tier 1 leads with pipeline/lead-finder leads, deduplicates,
     creates a Google Sheet, and posts to Slack.
     """
-    from app.services.google_sheets import get_google_sheets_service
+    from app.services.gift_pipeline.constants import GIFT_SHEET_MAX_LEADS
+    from app.services.google_sheets import create_gift_leads_sheet_async
     from app.services.slack import get_slack_bot
 
     slack_bot = get_slack_bot()
@@ -2747,13 +2912,16 @@ async def _admin_gift_leads_fallback(
                 logger.error(f"Failed to post pipeline progress: {e}")
 
         try:
-            from app.services.gift_pipeline import run_gift_leads_pipeline_async
+            from app.services.pipeline_executor import get_pipeline_executor
 
-            pipeline_result = await run_gift_leads_pipeline_async(
-                prospect_url=linkedin_url,
-                prospect_name=conv_lead_name,
+            pipeline_result = await get_pipeline_executor().run(
+                "gift_leads",
+                {
+                    "prospect_url": linkedin_url,
+                    "prospect_name": conv_lead_name,
+                    "user_icp": icp_label,
+                },
                 progress=post_progress,
-                user_icp=icp_label,
             )
             pipeline_leads = pipeline_result.get("leads", [])
             if pipeline_leads:
@@ -2801,14 +2969,10 @@ async def _admin_gift_leads_fallback(
                     logger.info(f"Tier 3: stored {stored} Apify leads to DB pool")
 
                 # ICP qualify the Apify results
-                from app.services.gift_pipeline.cost_tracker import CostTracker
-                from app.services.gift_pipeline.deepseek_calls import check_icp_match
-
-                cost_tracker = CostTracker()
-                qualified = []
-                for lead in apify_leads:
-                    # Normalize to our format
-                    normalized = {
+                from app.services.gift_pipeline.icp_requalify import requalify_leads
+
+                normalized_leads = [
+                    {
                         "full_name": lead.get("fullName", ""),
                         "job_title": lead.get("jobTitle", ""),
                         "company_name": lead.get("companyName", ""),
@@ -2817,21 +2981,22 @@ async def _admin_gift_leads_fallback(
                         "activity_score": 0,
                         "linkedin_url": lead.get("linkedinUrl", ""),
                     }
-                    try:
-                        icp_result = await check_icp_match(
-                            normalized, cost_tracker, icp_text, strict=True,
-                        )
-                        if icp_result.get("match", True):
-                            qualified.append(normalized)
-                    except Exception:
-                        qualified.append(normalized)
+                    for lead in apify_leads
+                ]
+                requalified = await requalify_leads(
+                    normalized_leads,
+                    icp_text,
+                    stop_after=max(min_leads, GIFT_SHEET_MAX_LEADS) - len(all_leads),
+                    keep_on_error=True,
+                )
+                qualified = requalified.qualified
                 all_leads = _dedup_leads(all_leads + qualified)
 
         except Exception as e:
             logger.error(f"Lead finder fallback error: {e}", exc_info=True)
             await slack_bot.send_confirmation(f"Lead finder error: {e}")
 
-    all_leads = all_leads[:15]
+    all_leads = all_leads[:GIFT_SHEET_MAX_LEADS]
 
     if not all_leads:
         await slack_bot.send_confirmation(
@@ -2842,15 +3007,13 @@ async def _admin_gift_leads_fallback(
 
     # Create Google Sheet and post to Slack
     sheet_url = None
-    sheets_svc = get_google_sheets_service()
-    if sheets_svc:
-        try:
-            sheet_url = sheets_svc.create_gift_leads_sheet(
-                prospect_name=conv_lead_name,
-                leads=all_leads,
-            )
-        except Exception as e:
-            logger.error(f"Failed to create Google Sheet: {e}", exc_info=True)
+    try:
+        sheet_url = await create_gift_leads_sheet_async(
+            prospect_name=conv_lead_name,
+            leads=all_leads,
+        )
+    except Exception as e:
+        logger.error(f"Failed to create Google Sheet: {e}", exc_info=True)
 
     if sheet_url:
         draft_dm = (
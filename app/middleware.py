@@ -0,0 +1,39 @@
+"""ASGI middleware."""
+
+import logging
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+
+class RequestLogMiddleware:
+    """Log one line per HTTP request: method, path, status and duration.
+
+    Plain ASGI rather than ``@app.middleware("http")`` so the request and
+    response bodies are passed through untouched instead of being re-wrapped.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            logger.info(f"{scope['method']} {scope['path']} {status} {elapsed_ms:.1f}ms")
@@ -6,7 +6,7 @@ from datetime import date, datetime, timezone
 from decimal import Decimal
 from typing import Any
 
-from sqlalchemy import Boolean, Integer, JSON, Date, DateTime, Enum, ForeignKey, Numeric, String, Text
+from sqlalchemy import Boolean, Integer, JSON, Date, DateTime, Enum, ForeignKey, LargeBinary, Numeric, String, Text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -466,7 +466,7 @@ class PipelineRun(Base):
     prospect_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
     prospect_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
     icp_description: Mapped[str | None] = mapped_column(Text, nullable=True)
-    status: Mapped[str] = mapped_column(String(20), default="started")  # started, completed, failed
+    status: Mapped[str] = mapped_column(String(20), default="started", index=True)  # queued, started, completed, failed, cancelled
 
     # Pipeline metrics
     queries_generated: Mapped[int] = mapped_column(default=0)
@@ -500,6 +500,17 @@ class PipelineRun(Base):
     duration_seconds: Mapped[int | None] = mapped_column(nullable=True)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
 
+    # Checkpointing (resumable runs)
+    run_params: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)  # Arguments to replay on resume
+    last_completed_step: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    checkpoint_data: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)  # zlib-compressed JSON
+
+    # Executor queue (see services/pipeline_executor.py)
+    priority: Mapped[int | None] = mapped_column(nullable=True)  # Lower runs first
+    progress: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)  # Latest progress message
+    cancel_requested: Mapped[bool] = mapped_column(Boolean, default=False)
+    result: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)  # Runner's return value
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
     )
@@ -747,6 +758,8 @@ class CostLog(Base):
     cost_usd: Mapped[Decimal] = mapped_column(Numeric(10, 6))
     units: Mapped[int | None] = mapped_column(nullable=True)
     unit_type: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    cache_read_tokens: Mapped[int | None] = mapped_column(nullable=True)  # Prompt-cache hits (LLM calls)
+    cache_write_tokens: Mapped[int | None] = mapped_column(nullable=True)  # Prompt-cache writes (LLM calls)
     pipeline_run_id: Mapped[uuid.UUID | None] = mapped_column(
         ForeignKey("pipeline_runs.id"), nullable=True, index=True
     )
@@ -797,3 +810,24 @@ class Client(Base):
         default=lambda: datetime.now(timezone.utc),
         onupdate=lambda: datetime.now(timezone.utc),
     )
+
+
+class HealthCheckRun(Base):
+    """One production health check run, kept for trend analysis."""
+
+    __tablename__ = "health_check_runs"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+    status: Mapped[str] = mapped_column(String(20))  # ok, warning, critical
+    passing: Mapped[int] = mapped_column(Integer)
+    total: Mapped[int] = mapped_column(Integer)
+    checks: Mapped[list[dict[str, Any]]] = mapped_column(JSON)  # [{name, status, message}]
+    duration_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        index=True,
+    )
@@ -0,0 +1,91 @@
+"""Token budgeting for prompt sections.
+
+Conversation threads grow without bound and are rendered into the stage
+detection, generation, QA and judge prompts of every reply. ``fit_history``
+keeps a thread inside a per-call token budget: a thread that fits is left
+alone; otherwise the most recent turns stay verbatim, older turns are
+compressed to a clipped one-liner, and whatever still doesn't fit is
+dropped (oldest first) and reported as omitted.
+
+Token counts come from ``count_tokens``, a local BPE-style estimate (word and
+punctuation pieces, ~4 characters per token for long words). It slightly
+over-counts compared with the providers' tokenizers, which is the safe side
+for a budget, and needs no network round trip or extra dependency.
+"""
+
+import math
+import re
+from functools import lru_cache
+
+_PIECE_RE = re.compile(r"\w+|[^\w\s]")
+_SENTENCE_END_RE = re.compile(r"[.!?](?=\s)")
+
+OMITTED_MARKER = "_({count} earlier messages omitted)_"
+
+
+@lru_cache(maxsize=4096)
+def count_tokens(text: str) -> int:
+    """Estimate the number of LLM tokens in ``text``."""
+    # Short words are one token; long ones split roughly every 4 characters
+    return sum(max(1, math.ceil((len(piece) - 2) / 4)) for piece in _PIECE_RE.findall(text))
+
+
+@lru_cache(maxsize=2048)
+def compress_message(content: str, max_chars: int) -> str:
+    """Clip a message to roughly ``max_chars``, preferring a sentence end.
+
+    Results are cached, so an older turn is only compressed once however many
+    prompts of the conversation it appears in.
+    """
+    text = " ".join(content.split())
+    if len(text) <= max_chars:
+        return text
+    head = text[:max_chars]
+    sentence_ends = [m.end() for m in _SENTENCE_END_RE.finditer(head + " ")]
+    if sentence_ends and sentence_ends[-1] >= max_chars // 2:
+        return head[:sentence_ends[-1]] + " …"
+    cut = head.rsplit(" ", 1)[0] if " " in head else head
+    return cut + " …"
+
+
+def fit_history(
+    conversation_history: list[dict],
+    max_tokens: int,
+    render,
+    *,
+    recent_turns: int,
+    compressed_chars: int,
+) -> tuple[list[str], int]:
+    """Render as much of a conversation as fits in ``max_tokens``.
+
+    Args:
+        conversation_history: Message dicts, oldest first.
+        max_tokens: Token budget for the rendered lines (0 = unlimited).
+        render: ``render(msg, content) -> str`` producing one prompt line.
+        recent_turns: The newest messages that are kept verbatim while they fit.
+        compressed_chars: Length older (or overflowing) messages are clipped to.
+
+    Returns:
+        ``(lines, omitted)``: rendered lines, oldest first, and how many of
+        the oldest messages were dropped. A thread that fits is returned
+        verbatim; otherwise the newest message is always kept verbatim.
+    """
+    verbatim = [render(msg, msg.get("content", "")) for msg in conversation_history]
+    if max_tokens <= 0 or sum(count_tokens(line) for line in verbatim) <= max_tokens:
+        return verbatim, 0
+
+    lines: list[str] = []
+    used = 0
+    total = len(conversation_history)
+    for age, msg in enumerate(reversed(conversation_history)):
+        content = msg.get("content", "")
+        line = verbatim[total - 1 - age]
+        cost = count_tokens(line)
+        if age > 0 and (age >= recent_turns or used + cost > max_tokens):
+            line = render(msg, compress_message(content, compressed_chars))
+            cost = count_tokens(line)
+            if used + cost > max_tokens:
+                return lines[::-1], total - age
+        lines.append(line)
+        used += cost
+    return lines[::-1], 0
@@ -1,15 +1,33 @@
 """Shared prompt utilities for history formatting and lead context rendering."""
 
+from app.config import settings
+from app.prompts.budget import OMITTED_MARKER, fit_history
 
-def build_history_section(conversation_history: list[dict] | None) -> str:
+
+def _history_line(msg: dict, content: str) -> str:
+    prefix = "**Lead:**" if msg.get("role", "unknown") == "lead" else "**You:**"
+    time = msg.get("time", "")
+    if time:
+        return f"{prefix} [{time}] {content}"
+    return f"{prefix} {content}"
+
+
+def build_history_section(
+    conversation_history: list[dict] | None,
+    max_tokens: int | None = None,
+) -> str:
     """Format conversation history with correct role prefixes.
 
     Uses the 'role' field from each message dict. Messages with role 'lead'
-    are prefixed with **Lead:**, all others with **You:**.
+    are prefixed with **Lead:**, all others with **You:**. Long threads are
+    fitted to a token budget: recent messages verbatim, older ones clipped,
+    the oldest dropped behind an "earlier messages omitted" marker.
 
     Args:
         conversation_history: List of message dicts with 'role', 'content',
             and optional 'time' fields.
+        max_tokens: Token budget for the history (defaults to
+            ``settings.prompt_history_token_budget``; 0 = unlimited).
 
     Returns:
         Formatted history string, or "No previous messages." if empty.
@@ -17,16 +35,15 @@ def build_history_section(conversation_history: list[dict] | None) -> str:
     if not conversation_history:
         return "No previous messages."
 
-    history_lines = []
-    for msg in conversation_history:
-        role = msg.get("role", "unknown")
-        content = msg.get("content", "")
-        time = msg.get("time", "")
-        prefix = "**Lead:**" if role == "lead" else "**You:**"
-        if time:
-            history_lines.append(f"{prefix} [{time}] {content}")
-        else:
-            history_lines.append(f"{prefix} {content}")
+    history_lines, omitted = fit_history(
+        conversation_history,
+        settings.prompt_history_token_budget if max_tokens is None else max_tokens,
+        _history_line,
+        recent_turns=settings.prompt_history_recent_turns,
+        compressed_chars=settings.prompt_history_compressed_chars,
+    )
+    if omitted:
+        history_lines.insert(0, OMITTED_MARKER.format(count=omitted))
 
     return "\n".join(history_lines) if history_lines else "No previous messages."
 
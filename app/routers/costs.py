@@ -29,6 +29,8 @@ class CostEntry(BaseModel):
     cost_usd: float
     units: int | None = None
     unit_type: str | None = None
+    cache_read_tokens: int | None = None
+    cache_write_tokens: int | None = None
     pipeline_run_id: str | None = None
     daily_metrics_id: str | None = None
     note: str | None = None
@@ -55,6 +57,8 @@ async def log_costs(body: CostBatchRequest, db: AsyncSession = Depends(get_db))
             cost_usd=Decimal(str(entry.cost_usd)),
             units=entry.units,
             unit_type=entry.unit_type,
+            cache_read_tokens=entry.cache_read_tokens,
+            cache_write_tokens=entry.cache_write_tokens,
             pipeline_run_id=uuid.UUID(entry.pipeline_run_id) if entry.pipeline_run_id else None,
             daily_metrics_id=uuid.UUID(entry.daily_metrics_id) if entry.daily_metrics_id else None,
             note=entry.note,
@@ -107,6 +111,8 @@ async def get_costs(
                 "cost_usd": float(r.cost_usd),
                 "units": r.units,
                 "unit_type": r.unit_type,
+                "cache_read_tokens": r.cache_read_tokens,
+                "cache_write_tokens": r.cache_write_tokens,
                 "pipeline_run_id": str(r.pipeline_run_id) if r.pipeline_run_id else None,
                 "note": r.note,
             }
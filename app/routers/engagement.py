@@ -307,11 +307,16 @@ async def delete_watchlist_profile(
 @router.post("/check-now")
 async def check_now(
     background_tasks: BackgroundTasks,
+    force: bool = True,
 ) -> dict[str, Any]:
-    """Manually trigger engagement post check."""
+    """Manually trigger engagement post check.
+
+    Polls every active profile by default; pass force=false to check only
+    the profiles that are due, as the scheduled run does.
+    """
     from app.services.engagement import check_engagement_posts
 
-    background_tasks.add_task(check_engagement_posts)
+    background_tasks.add_task(check_engagement_posts, force=force)
 
     return {"status": "started", "message": "Engagement check running in background"}
 
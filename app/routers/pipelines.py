@@ -1,31 +1,23 @@
-"""Pipelines API router for triggering multichannel-outreach pipelines."""
+"""Pipelines API router for triggering lead pipelines and polling their runs."""
 
 import logging
-import os
-import subprocess
-import sys
-import threading
-from pathlib import Path
+import uuid
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
+from app.database import async_session_factory
+from app.models import PipelineRun
+from app.services.pipeline_executor import get_pipeline_executor
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/pipelines", tags=["pipelines"])
 
-# Path to multichannel-outreach project (default: sibling directory)
-MULTICHANNEL_OUTREACH_PATH = os.environ.get(
-    "MULTICHANNEL_OUTREACH_PATH",
-    str(Path(__file__).resolve().parents[2] / ".." / "multichannel-outreach"),
-)
-GIFT_LEADS_SCRIPT = str(
-    Path(MULTICHANNEL_OUTREACH_PATH) / "execution" / "gift_leads_list.py"
-)
-
 
 class GiftLeadsRequest(BaseModel):
     prospect_url: str
+    prospect_name: str | None = None
     icp: str | None = None
     pain_points: str | None = None
     days_back: int = 14
@@ -36,28 +28,18 @@ class GiftLeadsRequest(BaseModel):
     skip_research: bool = False
 
 
-def _stream_output(proc: subprocess.Popen, prospect_url: str) -> None:
-    """Read subprocess stdout/stderr in a background thread and log it."""
-    try:
-        if proc.stdout:
-            for line in proc.stdout:
-                logger.info("[gift-leads] %s", line.rstrip())
-        proc.wait()
-        logger.info(
-            "Gift leads pipeline finished for %s (exit code %d)",
-            prospect_url,
-            proc.returncode,
-        )
-    except Exception as e:
-        logger.error("Error streaming gift-leads output: %s", e)
+def _name_from_profile_url(prospect_url: str) -> str:
+    """Fallback display name from a LinkedIn URL slug (…/in/john-doe → john-doe)."""
+    return prospect_url.rstrip("/").rsplit("/", 1)[-1] or prospect_url
 
 
 @router.post("/gift-leads")
 async def start_gift_leads(body: GiftLeadsRequest) -> dict:
-    """Start the gift-leads pipeline as a background subprocess.
+    """Queue the gift-leads pipeline on the pipeline executor.
 
-    The pipeline is long-running (1-5 min) so this returns immediately.
-    Output is streamed to the app logger.
+    Runs the in-process async orchestrator, so this returns immediately;
+    poll /api/pipelines/runs/{run_id} for step-by-step progress and the
+    final lead list.
     """
     if body.skip_research and not body.icp:
         raise HTTPException(
@@ -65,51 +47,50 @@ async def start_gift_leads(body: GiftLeadsRequest) -> dict:
             detail="skip_research requires icp to be provided",
         )
 
-    script_path = Path(GIFT_LEADS_SCRIPT)
-    if not script_path.exists():
-        raise HTTPException(
-            status_code=500,
-            detail=f"Gift leads script not found at {GIFT_LEADS_SCRIPT}",
-        )
-
-    cmd = [
-        sys.executable,
-        str(script_path),
-        "--prospect-url", body.prospect_url,
-        "--days-back", str(body.days_back),
-        "--min-reactions", str(body.min_reactions),
-        "--min-leads", str(body.min_leads),
-        "--max-leads", str(body.max_leads),
-    ]
-
-    if body.icp:
-        cmd.extend(["--icp", body.icp])
-    if body.pain_points:
-        cmd.extend(["--pain-points", body.pain_points])
-    if body.dry_run:
-        cmd.append("--dry-run")
-    if body.skip_research:
-        cmd.append("--skip-research")
-
-    logger.info("Starting gift-leads pipeline: %s", " ".join(cmd))
-
-    proc = subprocess.Popen(
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-        cwd=str(Path(GIFT_LEADS_SCRIPT).parent.parent),
+    prospect_name = body.prospect_name or _name_from_profile_url(body.prospect_url)
+    run_id = await get_pipeline_executor().submit(
+        "gift_leads",
+        {
+            "prospect_url": body.prospect_url,
+            "prospect_name": prospect_name,
+            "user_icp": body.icp,
+            "user_pain_points": body.pain_points,
+            "days_back": body.days_back,
+            "min_reactions": body.min_reactions,
+            "min_leads": body.min_leads,
+            "max_leads": body.max_leads,
+            "skip_research": body.skip_research,
+            "dry_run": body.dry_run,
+        },
     )
-
-    # Stream output in background thread so we don't block
-    thread = threading.Thread(
-        target=_stream_output,
-        args=(proc, body.prospect_url),
-        daemon=True,
-    )
-    thread.start()
+    logger.info(f"Gift leads pipeline queued for {body.prospect_url} (run {run_id})")
 
     return {
         "status": "started",
+        "run_id": str(run_id),
         "message": f"Gift leads pipeline started for {body.prospect_url}",
     }
+
+
+@router.get("/runs/{run_id}")
+async def get_pipeline_run_status(run_id: uuid.UUID) -> dict:
+    """Status, latest progress and (once finished) result of a pipeline run."""
+    async with async_session_factory() as session:
+        run = await session.get(PipelineRun, run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="Pipeline run not found")
+
+    return {
+        "id": str(run.id),
+        "run_type": run.run_type,
+        "status": run.status,
+        "priority": run.priority,
+        "queue_position": get_pipeline_executor().queue_position(run.id),
+        "progress": run.progress,
+        "last_completed_step": run.last_completed_step,
+        "final_leads": run.final_leads,
+        "started_at": run.started_at.isoformat() if run.started_at else None,
+        "completed_at": run.completed_at.isoformat() if run.completed_at else None,
+        "error_message": run.error_message,
+        "result": run.result,
+    }
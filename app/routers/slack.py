@@ -30,7 +30,9 @@ from app.models import (
     ReplyClassification,
 )
 from app.services.deepseek import generate_reply_draft
+from app.services.example_index import get_example_index
 from app.services.heyreach import get_heyreach_client, HeyReachError
+from app.services.interaction_queue import get_interaction_queue
 
 # HeyReach list ID for follow-up sequences
 HEYREACH_FOLLOW_UP_LIST_ID = 511495
@@ -298,6 +300,11 @@ async def _process_approve(draft_id: uuid.UUID, message_ts: str) -> None:
                 )
                 return
 
+            # A repeated click queued behind the first one must not send twice
+            if draft.status in (DraftStatus.APPROVED, DraftStatus.REJECTED):
+                logger.info(f"Draft {draft_id} already {draft.status.value}, ignoring approve")
+                return
+
             conversation = draft.conversation
 
             if not conversation.linkedin_account_id:
@@ -335,6 +342,7 @@ async def _process_approve(draft_id: uuid.UUID, message_ts: str) -> None:
             session.add(message_log)
 
             await session.commit()
+            get_example_index().add_approved(draft, conversation)
 
             # Update Slack message
             slack_bot = get_slack_bot()
@@ -545,6 +553,10 @@ async def _process_reject(draft_id: uuid.UUID, message_ts: str) -> None:
                 )
                 return
 
+            if draft.status == DraftStatus.APPROVED:
+                logger.info(f"Draft {draft_id} already approved, ignoring reject")
+                return
+
             draft.status = DraftStatus.REJECTED
             await session.commit()
 
@@ -666,6 +678,14 @@ async def _process_modal_submit(draft_id: uuid.UUID, edited_text: str) -> None:
                 )
                 return
 
+            if draft.status in (DraftStatus.APPROVED, DraftStatus.REJECTED):
+                logger.info(f"Draft {draft_id} already {draft.status.value}, ignoring edited send")
+                slack_bot = get_slack_bot()
+                await slack_bot.send_confirmation(
+                    f"Not sent: this draft was already {draft.status.value}."
+                )
+                return
+
             conversation = draft.conversation
 
             if not conversation.linkedin_account_id:
@@ -703,6 +723,7 @@ async def _process_modal_submit(draft_id: uuid.UUID, edited_text: str) -> None:
             session.add(message_log)
 
             await session.commit()
+            get_example_index().add_approved(draft, conversation)
 
             # Update original Slack message if we have the ts
             slack_bot = get_slack_bot()
@@ -1760,27 +1781,21 @@ async def _process_gift_leads_with_send(
 
         # Post-search ICP re-qualification
         if leads and icp_description:
-            from app.services.gift_pipeline.deepseek_calls import check_icp_match
-            from app.services.gift_pipeline.cost_tracker import CostTracker
-
-            cost_tracker = CostTracker()
-            qualified_leads = []
-            for lead in leads:
-                try:
-                    icp_result = await check_icp_match(
-                        lead, cost_tracker, icp_description, strict=True,
-                    )
-                    if icp_result.get("match", True):
-                        qualified_leads.append(lead)
-                except Exception as e:
-                    logger.warning(f"ICP re-qualification error for {lead.get('full_name')}: {e}")
-                    qualified_leads.append(lead)  # Keep on error
+            from app.services.gift_pipeline.constants import GIFT_SHEET_MAX_LEADS
+            from app.services.gift_pipeline.icp_requalify import requalify_leads
 
             before_count = len(leads)
-            leads = qualified_leads[:15]
+            requalified = await requalify_leads(
+                leads,
+                icp_description,
+                stop_after=GIFT_SHEET_MAX_LEADS,
+                keep_on_error=True,
+            )
+            leads = requalified.qualified
             logger.info(
                 f"ICP re-qualification: {before_count} → {len(leads)} leads "
-                f"(ICP: {icp_description[:60]})"
+                f"(ICP: {icp_description[:60]}, cached={requalified.cache_hits}, "
+                f"skipped={requalified.skipped})"
             )
 
         if not leads:
@@ -1797,19 +1812,18 @@ async def _process_gift_leads_with_send(
 
         # Create Google Sheet with leads (if configured)
         sheet_url = None
-        from app.services.google_sheets import get_google_sheets_service
+        from app.services.google_sheets import create_gift_leads_sheet_async
 
-        sheets_svc = get_google_sheets_service()
-        if sheets_svc:
-            try:
-                sheet_url = sheets_svc.create_gift_leads_sheet(
-                    prospect_name=prospect_name,
-                    leads=leads,
-                )
+        try:
+            sheet_url = await create_gift_leads_sheet_async(
+                prospect_name=prospect_name,
+                leads=leads,
+            )
+            if sheet_url:
                 logger.info(f"Created gift leads sheet: {sheet_url}")
-            except Exception as e:
-                logger.error(f"Failed to create Google Sheet: {e}", exc_info=True)
-                # Continue without sheet - will fall back to text-only DM
+        except Exception as e:
+            logger.error(f"Failed to create Google Sheet: {e}", exc_info=True)
+            # Continue without sheet - will fall back to text-only DM
 
         slack_bot = get_slack_bot()
 
@@ -1903,13 +1917,17 @@ async def _run_gift_pipeline_fallback(
             logger.error(f"Failed to post pipeline progress: {e}")
 
     try:
-        from app.services.gift_pipeline import run_gift_leads_pipeline_async
-
-        pipeline_result = await run_gift_leads_pipeline_async(
-            prospect_url=prospect.linkedin_url,
-            prospect_name=prospect_name,
+        from app.services.pipeline_executor import PRIORITY_INTERACTIVE, get_pipeline_executor
+
+        pipeline_result = await get_pipeline_executor().run(
+            "gift_leads",
+            {
+                "prospect_url": prospect.linkedin_url,
+                "prospect_name": prospect_name,
+                "user_icp": icp_description,
+            },
+            priority=PRIORITY_INTERACTIVE,
             progress=post_progress,
-            user_icp=icp_description,
         )
 
         leads = pipeline_result.get("leads", [])
@@ -1920,18 +1938,17 @@ async def _run_gift_pipeline_fallback(
 
         # Create Google Sheet
         sheet_url = None
-        from app.services.google_sheets import get_google_sheets_service
+        from app.services.google_sheets import create_gift_leads_sheet_async
 
-        sheets_svc = get_google_sheets_service()
-        if sheets_svc:
-            try:
-                sheet_url = sheets_svc.create_gift_leads_sheet(
-                    prospect_name=prospect_name,
-                    leads=leads,
-                )
+        try:
+            sheet_url = await create_gift_leads_sheet_async(
+                prospect_name=prospect_name,
+                leads=leads,
+            )
+            if sheet_url:
                 logger.info(f"Created gift leads sheet: {sheet_url}")
-            except Exception as e:
-                logger.error(f"Failed to create Google Sheet: {e}", exc_info=True)
+        except Exception as e:
+            logger.error(f"Failed to create Google Sheet: {e}", exc_info=True)
 
         if auto_send:
             await _auto_send_gift_leads(
@@ -2631,19 +2648,89 @@ async def _send_pitched_message_now(
         await slack_bot.send_confirmation(f"Error: {e}")
 
 
+# Actions that only open a modal: run them outside the per-entity lock so a
+# slow send on the same draft can't outlive the 3s trigger_id
+_MODAL_ACTIONS = frozenset({
+    "edit",
+    "gift_leads",
+    "classify_not_icp",
+    "configure_followups",
+    "confirm_icp_gift_leads",
+    "send_gift_leads_dm",
+    "edit_gift_leads_dm",
+    "pitched_send_message",
+    "engagement_edit",
+})
+
+# Immediate ephemeral feedback (via response_url) for actions whose result
+# only shows up once the deferred work finishes
+_ACTION_FEEDBACK = {
+    "approve": ":hourglass_flowing_sand: Sending message...",
+    "regenerate": ":hourglass_flowing_sand: Regenerating draft...",
+    "reject": ":hourglass_flowing_sand: Skipping draft...",
+    "snooze_1h": ":hourglass_flowing_sand: Snoozing...",
+    "snooze_4h": ":hourglass_flowing_sand: Snoozing...",
+    "snooze_tomorrow": ":hourglass_flowing_sand: Snoozing...",
+    "funnel_pitched": ":hourglass_flowing_sand: Marking as pitched...",
+    "funnel_calendar_sent": ":hourglass_flowing_sand: Marking calendar sent...",
+    "classify_positive": ":hourglass_flowing_sand: Recording positive reply...",
+    "classify_not_interested": ":hourglass_flowing_sand: Recording not interested...",
+    "pitched_calendar_sent": ":hourglass_flowing_sand: Updating stage...",
+    "pitched_booked": ":hourglass_flowing_sand: Updating stage...",
+    "engagement_done": ":hourglass_flowing_sand: Marking done...",
+    "engagement_skip": ":hourglass_flowing_sand: Skipping...",
+    "send_gift_leads_as_is": ":hourglass_flowing_sand: Sending message...",
+    "skip_followups": ":hourglass_flowing_sand: Skipping follow-ups...",
+}
+
+
+def _entity_key(raw: str) -> str | None:
+    """Serialization key for an action value or modal private_metadata.
+
+    Values are either a bare UUID or JSON carrying prospect_id/conversation_id.
+    """
+    if not raw:
+        return None
+    try:
+        parsed = json.loads(raw)
+    except (json.JSONDecodeError, TypeError):
+        parsed = None
+    if isinstance(parsed, dict):
+        for field in ("prospect_id", "conversation_id"):
+            if parsed.get(field):
+                return f"{field}:{parsed[field]}"
+        return None
+    return f"entity:{raw}"
+
+
+def _interaction_keys(payload: dict[str, Any]) -> tuple[str | None, str | None]:
+    """Return (serialization key, dedupe key) for an interaction payload."""
+    if payload.get("type") == "block_actions":
+        actions = payload.get("actions") or [{}]
+        action_id = actions[0].get("action_id", "")
+        value = actions[0].get("value", "")
+        message_ts = payload.get("message", {}).get("ts", "")
+        key = None if action_id in _MODAL_ACTIONS else _entity_key(value)
+        return key, f"{action_id}:{value}:{message_ts}"
+
+    if payload.get("type") == "view_submission":
+        view = payload.get("view", {})
+        return _entity_key(view.get("private_metadata", "")), view.get("id") or None
+
+    return None, None
+
+
 @router.post("/interactions")
-async def slack_interactions(
-    request: Request,
-    background_tasks: BackgroundTasks,
-) -> dict:
+async def slack_interactions(request: Request) -> dict:
     """Handle Slack interaction callbacks (button clicks, modal submissions).
 
     This endpoint receives:
     - block_actions: When user clicks a button
     - view_submission: When user submits a modal
 
-    Slack expects a response within 3 seconds, so slow operations
-    are handled in background tasks.
+    Slack expects a response within 3 seconds, so the endpoint acknowledges
+    right after verifying the signature; routing and all DB work run on the
+    interaction queue, serialized per draft/prospect/conversation.
     """
     print("=== SLACK INTERACTION RECEIVED ===", flush=True)
     # Verify signature
@@ -2653,14 +2740,37 @@ async def slack_interactions(
     # Parse payload
     payload = parse_slack_payload(body)
     payload_type = payload.get("type", "")
-
     logger.info(f"Received Slack interaction: type={payload_type}")
 
+    queue = get_interaction_queue()
+    key, dedupe_key = _interaction_keys(payload)
+    task = queue.submit(lambda: _dispatch_interaction(payload), key=key, dedupe_key=dedupe_key)
+
+    if task is not None and payload_type == "block_actions":
+        action_id = (payload.get("actions") or [{}])[0].get("action_id", "")
+        feedback = _ACTION_FEEDBACK.get(action_id)
+        if feedback:
+            queue.send_feedback(payload.get("response_url", ""), feedback)
+
+    return {"ok": True}
+
+
+async def _dispatch_interaction(payload: dict[str, Any]) -> None:
+    """Route a queued interaction, then run the work its handler deferred."""
+    background_tasks = BackgroundTasks()
+    await _route_interaction(payload, background_tasks)
+    await background_tasks()
+
+
+async def _route_interaction(payload: dict[str, Any], background_tasks: BackgroundTasks) -> None:
+    """Route an interaction payload to its handler."""
+    payload_type = payload.get("type", "")
+
     if payload_type == "block_actions":
         # Handle button clicks
         actions = payload.get("actions", [])
         if not actions:
-            return {"ok": True}
+            return
 
         action = actions[0]
         action_id = action.get("action_id", "")
@@ -2673,13 +2783,13 @@ async def slack_interactions(
         if action_id in ("engagement_done", "engagement_edit", "engagement_skip", "engagement_open_post"):
             if action_id == "engagement_open_post":
                 # Link button - no server-side action needed
-                return {"ok": True}
+                return
 
             try:
                 post_id = uuid.UUID(value_str)
             except ValueError:
                 logger.error(f"Invalid engagement post_id: {value_str}")
-                return {"ok": True}
+                return
 
             if action_id == "engagement_done":
                 await handle_engagement_done(post_id, message_ts, background_tasks)
@@ -2687,7 +2797,7 @@ async def slack_interactions(
                 await handle_engagement_edit(post_id, trigger_id)
             elif action_id == "engagement_skip":
                 await handle_engagement_skip(post_id, message_ts, background_tasks)
-            return {"ok": True}
+            return
 
         # Handle pitched channel actions (use prospect_id)
         if action_id in ("pitched_send_message", "pitched_calendar_sent", "pitched_booked"):
@@ -2695,7 +2805,7 @@ async def slack_interactions(
                 prospect_id = uuid.UUID(value_str)
             except ValueError:
                 logger.error(f"Invalid prospect_id: {value_str}")
-                return {"ok": True}
+                return
 
             if action_id == "pitched_send_message":
                 await handle_pitched_send_message(prospect_id, trigger_id)
@@ -2703,7 +2813,7 @@ async def slack_interactions(
                 await handle_pitched_calendar_sent(prospect_id, message_ts, background_tasks)
             elif action_id == "pitched_booked":
                 await handle_pitched_booked(prospect_id, message_ts, background_tasks)
-            return {"ok": True}
+            return
 
         # Handle streamlined gift leads actions (use prospect_id or conversation_id)
         if action_id in ("confirm_icp_gift_leads", "send_gift_leads_dm",
@@ -2728,7 +2838,7 @@ async def slack_interactions(
                     prospect_id = uuid.UUID(value_str)
                 except ValueError:
                     logger.error(f"Invalid value for {action_id}: {value_str}")
-                    return {"ok": True}
+                    return
 
             if action_id == "confirm_icp_gift_leads":
                 if prospect_id:
@@ -2764,7 +2874,7 @@ async def slack_interactions(
                     await _handle_edit_gift_leads_via_conversation(
                         conversation_id, trigger_id, draft_dm, message_ts=message_ts,
                     )
-            return {"ok": True}
+            return
 
         # Handle follow-up configuration actions (use conversation_id)
         if action_id in ("configure_followups", "skip_followups"):
@@ -2772,20 +2882,20 @@ async def slack_interactions(
                 conversation_id = uuid.UUID(value_str)
             except ValueError:
                 logger.error(f"Invalid conversation_id: {value_str}")
-                return {"ok": True}
+                return
 
             if action_id == "configure_followups":
                 await handle_configure_followups(conversation_id, trigger_id, message_ts)
             elif action_id == "skip_followups":
                 await handle_skip_followups(conversation_id, message_ts, background_tasks)
-            return {"ok": True}
+            return
 
         # Handle draft actions (use draft_id)
         try:
             draft_id = uuid.UUID(value_str)
         except ValueError:
             logger.error(f"Invalid draft_id: {value_str}")
-            return {"ok": True}
+            return
 
         # Get slack user ID for classification tracking
         slack_user_id = payload.get("user", {}).get("id", "unknown")
@@ -2793,7 +2903,7 @@ async def slack_interactions(
         # Handle gift leads action (uses draft_id)
         if action_id == "gift_leads":
             await handle_gift_leads(draft_id, trigger_id)
-            return {"ok": True}
+            return
 
         # Route to appropriate handler
         if action_id == "approve":
@@ -2836,7 +2946,7 @@ async def slack_interactions(
                 conversation_id = uuid.UUID(private_metadata)
             except ValueError:
                 logger.error(f"Invalid conversation_id in metadata: {private_metadata}")
-                return {"ok": True}
+                return
 
             # Extract FOLLOW_UP1 from view values
             follow_up1 = (
@@ -2855,7 +2965,7 @@ async def slack_interactions(
                 draft_id = uuid.UUID(private_metadata)
             except ValueError:
                 logger.error(f"Invalid draft_id in metadata: {private_metadata}")
-                return {"ok": True}
+                return
 
             # Extract edited text from view values
             edited_text = (
@@ -2873,7 +2983,7 @@ async def slack_interactions(
                 post_id = uuid.UUID(private_metadata)
             except ValueError:
                 logger.error(f"Invalid post_id in metadata: {private_metadata}")
-                return {"ok": True}
+                return
 
             edited_comment = (
                 values.get("comment_input", {})
@@ -2890,7 +3000,7 @@ async def slack_interactions(
                 prospect_id = uuid.UUID(private_metadata)
             except ValueError:
                 logger.error(f"Invalid prospect_id in metadata: {private_metadata}")
-                return {"ok": True}
+                return
 
             message_text = (
                 values.get("message_input", {})
@@ -2918,7 +3028,7 @@ async def slack_interactions(
                 draft_id = uuid.UUID(private_metadata)
             except ValueError:
                 logger.error(f"Invalid draft_id in metadata: {private_metadata}")
-                return {"ok": True}
+                return
 
             # Extract notes from view values (optional)
             notes = (
@@ -2936,7 +3046,7 @@ async def slack_interactions(
                 prospect_id = uuid.UUID(private_metadata)
             except ValueError:
                 logger.error(f"Invalid prospect_id in metadata: {private_metadata}")
-                return {"ok": True}
+                return
 
             keywords_text = (
                 values.get("keywords_input", {})
@@ -2970,7 +3080,7 @@ async def slack_interactions(
                 prospect_id = uuid.UUID(private_metadata)
             except ValueError:
                 logger.error(f"Invalid prospect_id in metadata: {private_metadata}")
-                return {"ok": True}
+                return
 
             keywords_text = (
                 values.get("keywords_input", {})
@@ -3027,7 +3137,7 @@ async def slack_interactions(
                     prospect_id = uuid.UUID(private_metadata)
                 except ValueError:
                     logger.error(f"Invalid metadata in send DM modal: {private_metadata}")
-                    return {"ok": True}
+                    return
 
             message_text = (
                 values.get("dm_input", {})
@@ -3041,8 +3151,6 @@ async def slack_interactions(
                     conversation_id, orig_message_ts or None,
                 )
 
-    return {"ok": True}
-
 
 @router.post("/test-followup-message")
 async def test_followup_message(
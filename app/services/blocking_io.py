@@ -0,0 +1,43 @@
+"""Dedicated thread pool for blocking third-party SDK calls.
+
+Google Drive (googleapiclient) and MinIO are synchronous. Calling them
+from an async handler freezes the event loop for the whole round trip, so
+their async facades run the calls here instead. The pool is bounded by
+``blocking_io_workers`` and kept separate from the default executor so a
+burst of slow Drive calls can't starve ``asyncio.to_thread`` users.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from app.config import settings
+
+T = TypeVar("T")
+
+_executor: ThreadPoolExecutor | None = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.blocking_io_workers,
+            thread_name_prefix="blocking-io",
+        )
+    return _executor
+
+
+async def run_blocking(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run ``fn(*args, **kwargs)`` on the blocking-I/O pool and await the result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), functools.partial(fn, *args, **kwargs))
+
+
+def shutdown_blocking_io() -> None:
+    """Stop the pool (app shutdown); in-flight calls are allowed to finish."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
@@ -1,14 +1,12 @@
 """Campaign fuel monitor: checks HeyReach campaign health and auto-tops-up when low."""
 
-import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
 
-import httpx
 from sqlalchemy import func, select
 
-from app.config import settings
 from app.models import Prospect, ProspectSource
+from app.services.heyreach import get_heyreach_client
 
 logger = logging.getLogger(__name__)
 
@@ -23,8 +21,6 @@ ACTIVE_CAMPAIGN_ID = 300178
 ACCOUNT_IDS = [78135]
 HEYREACH_LIST_ID = 480247
 
-HEYREACH_BASE_URL = "https://api.heyreach.io/api/public"
-
 
 # ---------------------------------------------------------------------------
 # HeyReach API helpers
@@ -36,20 +32,7 @@ async def check_campaign_fuel() -> dict | None:
     Returns dict with pending, in_progress, finished, total, days_of_fuel,
     campaign_name, campaign_id — or None if campaign not found.
     """
-    async with httpx.AsyncClient(
-        headers={
-            "X-API-KEY": settings.heyreach_api_key,
-            "Content-Type": "application/json",
-            "Accept": "text/plain",
-        },
-        timeout=30.0,
-    ) as client:
-        resp = await client.post(
-            f"{HEYREACH_BASE_URL}/campaign/GetAll",
-            json={"offset": 0, "limit": 50},
-        )
-        resp.raise_for_status()
-        data = resp.json()
+    data = await get_heyreach_client().get_campaigns(offset=0, limit=50)
 
     campaigns = data.get("items", [])
     for c in campaigns:
@@ -78,25 +61,12 @@ async def get_daily_connection_stats() -> list[int]:
     now = datetime.now(timezone.utc)
     start = now - timedelta(days=7)
 
-    async with httpx.AsyncClient(
-        headers={
-            "X-API-KEY": settings.heyreach_api_key,
-            "Content-Type": "application/json",
-            "Accept": "text/plain",
-        },
-        timeout=30.0,
-    ) as client:
-        resp = await client.post(
-            f"{HEYREACH_BASE_URL}/stats/GetOverallStats",
-            json={
-                "campaignIds": [ACTIVE_CAMPAIGN_ID],
-                "accountIds": ACCOUNT_IDS,
-                "startDate": start.strftime("%Y-%m-%dT00:00:00Z"),
-                "endDate": now.strftime("%Y-%m-%dT23:59:59Z"),
-            },
-        )
-        resp.raise_for_status()
-        data = resp.json()
+    data = await get_heyreach_client().get_overall_stats(
+        campaign_ids=[ACTIVE_CAMPAIGN_ID],
+        account_ids=ACCOUNT_IDS,
+        start_date=start.strftime("%Y-%m-%dT00:00:00Z"),
+        end_date=now.strftime("%Y-%m-%dT23:59:59Z"),
+    )
 
     # Response shape: {"byDayStats": {"2026-02-18T00:00:00Z": {"connectionsSent": 30, ...}, ...}}
     by_day = data.get("byDayStats", {})
@@ -257,13 +227,15 @@ async def monitor_and_topup() -> dict:
 
     if not batch_triggered and unprocessed == 0:
         try:
-            from app.services.lead_finder_pipeline import run_lead_finder_pipeline
+            from app.services.pipeline_executor import PRIORITY_SCHEDULED, get_pipeline_executor
 
             # Fetch 3x deficit to account for funnel losses (dedup, ICP filter)
             fetch_count = max(deficit * 3, 50)
 
             logger.info(f"Auto-triggering lead finder pipeline (deficit={deficit}, fetch_count={fetch_count})")
-            asyncio.create_task(run_lead_finder_pipeline(fetch_count=fetch_count))
+            await get_pipeline_executor().submit(
+                "lead_finder", {"fetch_count": fetch_count}, priority=PRIORITY_SCHEDULED,
+            )
             lead_finder_triggered = True
         except Exception as e:
             logger.error(f"Auto lead finder pipeline failed: {e}", exc_info=True)
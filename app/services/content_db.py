@@ -1,15 +1,20 @@
-"""Sync SQLAlchemy session for contentCreator's Postgres database.
+"""Async SQLAlchemy access to contentCreator's Postgres database.
 
 Used by trend scout to write TrendingTopic rows into the content DB.
 Kept lightweight — only defines the single model we need to write to.
+Writes go through a small pooled asyncpg engine so a trend-scout run
+never blocks the event loop serving webhooks.
 """
 
+import hashlib
 import logging
+import re
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 
-from sqlalchemy import Column, Integer, JSON, String, Text, create_engine
-from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy import Column, Integer, JSON, String, Text, insert, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
 
 from app.config import settings
 
@@ -44,96 +49,118 @@ class TrendingTopic(ContentBase):
 # Engine / session helpers (lazy-initialised)
 # ---------------------------------------------------------------------------
 
-_engine = None
-_SessionFactory = None
+_engine: AsyncEngine | None = None
+_SessionFactory: async_sessionmaker[AsyncSession] | None = None
 
 
-def _get_content_engine():
+def _get_content_engine() -> AsyncEngine:
     global _engine
     if _engine is None:
-        url = settings.content_db_url
+        url = settings.async_content_db_url
         if not url:
             raise RuntimeError("CONTENT_DB_URL is not configured")
-        _engine = create_engine(url, pool_pre_ping=True)
+        connect_args = {}
+        if "postgresql" in url:
+            from app.database import ssl_context
+            connect_args["ssl"] = ssl_context
+        pool_args = {}
+        if not url.startswith("sqlite"):
+            pool_args = {"pool_size": settings.content_db_pool_size, "max_overflow": 2}
+        _engine = create_async_engine(url, pool_pre_ping=True, connect_args=connect_args, **pool_args)
     return _engine
 
 
-def _get_content_session() -> Session:
+def _get_content_session() -> AsyncSession:
     global _SessionFactory
     if _SessionFactory is None:
-        _SessionFactory = sessionmaker(
+        _SessionFactory = async_sessionmaker(
             bind=_get_content_engine(),
-            autocommit=False,
+            expire_on_commit=False,
             autoflush=False,
         )
     return _SessionFactory()
 
 
+async def dispose_content_engine() -> None:
+    """Close pooled content DB connections (app shutdown)."""
+    global _engine, _SessionFactory
+    if _engine is not None:
+        await _engine.dispose()
+    _engine = None
+    _SessionFactory = None
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
 
-def save_trending_topic(
-    topic: str,
-    summary: str | None = None,
-    source_urls: list | None = None,
-    relevance_score: int | None = None,
-    content_angles: list | None = None,
-    search_query: str | None = None,
-    batch_id: str | None = None,
-    source_platform: str | None = None,
-    notes: str | None = None,
-) -> dict:
-    """Save a trending topic to the contentCreator DB.
+def topic_hash(topic: str) -> str:
+    """Hash of a topic title with case, punctuation and spacing normalized away."""
+    normalized = " ".join(re.findall(r"[a-z0-9]+", (topic or "").lower()))
+    return hashlib.sha1(normalized.encode()).hexdigest()
+
+
+async def _recent_topic_hashes(session: AsyncSession) -> set[str]:
+    cutoff = (datetime.now() - timedelta(days=settings.trend_scout_dedupe_days)).isoformat()
+    result = await session.execute(
+        select(TrendingTopic.topic).where(TrendingTopic.created_at >= cutoff)
+    )
+    return {topic_hash(topic) for topic in result.scalars()}
+
+
+async def save_trending_topics(topics: list[dict], batch_id: str | None = None) -> list[dict]:
+    """Bulk-insert trending topics into the contentCreator DB.
+
+    Topics whose normalized title matches one already in the batch or saved
+    within ``trend_scout_dedupe_days`` are skipped. All new rows are written
+    in a single INSERT.
+
+    Args:
+        topics: Dicts with ``topic`` plus optional summary, source_urls,
+            relevance_score, content_angles, search_query, source_platform
+            and notes.
+        batch_id: Trend scout run identifier.
 
     Returns:
-        Dict representation of the saved row.
+        Dict representations of the rows that were inserted.
     """
-    now = datetime.now().isoformat()
-    entry_id = str(uuid.uuid4())[:8]
-    src_urls = source_urls or []
-    angles = content_angles or []
-
-    entry = TrendingTopic(
-        id=entry_id,
-        topic=topic,
-        summary=summary,
-        source_urls=src_urls,
-        relevance_score=relevance_score,
-        content_angles=angles,
-        search_query=search_query,
-        batch_id=batch_id,
-        status="new",
-        source_platform=source_platform,
-        created_at=now,
-        updated_at=now,
-        notes=notes,
-    )
+    if not topics:
+        return []
 
-    session = _get_content_session()
-    try:
-        session.add(entry)
-        session.commit()
-        logger.info(f"Saved trending topic '{topic}' (batch={batch_id})")
-    except Exception:
-        session.rollback()
-        raise
-    finally:
-        session.close()
-
-    # Build return dict from known values (not the detached ORM object)
-    return {
-        "id": entry_id,
-        "topic": topic,
-        "summary": summary,
-        "source_urls": src_urls,
-        "relevance_score": relevance_score,
-        "content_angles": angles,
-        "search_query": search_query,
-        "batch_id": batch_id,
-        "status": "new",
-        "source_platform": source_platform,
-        "created_at": now,
-        "updated_at": now,
-    }
+    now = datetime.now().isoformat()
+    async with _get_content_session() as session:
+        seen = await _recent_topic_hashes(session)
+        rows = []
+        for t in topics:
+            key = topic_hash(t["topic"])
+            if key in seen:
+                logger.info(f"Skipping duplicate trending topic '{t['topic']}'")
+                continue
+            seen.add(key)
+            rows.append({
+                "id": str(uuid.uuid4())[:8],
+                "topic": t["topic"],
+                "summary": t.get("summary"),
+                "source_urls": t.get("source_urls") or [],
+                "relevance_score": t.get("relevance_score"),
+                "content_angles": t.get("content_angles") or [],
+                "search_query": t.get("search_query"),
+                "batch_id": batch_id,
+                "status": "new",
+                "source_platform": t.get("source_platform"),
+                "created_at": now,
+                "updated_at": now,
+                "notes": t.get("notes"),
+            })
+
+        if rows:
+            try:
+                await session.execute(insert(TrendingTopic).values(rows))
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+            logger.info(f"Saved {len(rows)} trending topics (batch={batch_id})")
+
+    return rows
@@ -3,6 +3,7 @@
 import json
 import logging
 from dataclasses import dataclass, field
+from decimal import Decimal
 
 from openai import AsyncOpenAI
 
@@ -17,9 +18,16 @@ from app.prompts.stage_detector import (
     build_stage_detection_prompt,
 )
 from app.prompts.stages import get_stage_prompt
+from app.services.llm_usage import LLMUsage, record_llm_cost
 
 logger = logging.getLogger(__name__)
 
+# deepseek-chat pricing; prompt prefixes served from DeepSeek's context cache
+# are billed at the cache-hit rate, so system prompts are kept byte-stable
+INPUT_PRICE = Decimal("0.00000027")
+CACHE_HIT_PRICE = Decimal("0.00000007")
+OUTPUT_PRICE = Decimal("0.0000011")
+
 
 class DeepSeekError(Exception):
     """Custom exception for DeepSeek API errors."""
@@ -60,6 +68,13 @@ class DeepSeekClient:
             base_url=settings.deepseek_base_url,
         )
 
+    def _record_usage(self, operation: str, completion) -> None:
+        """Log a completion's token usage (incl. context-cache hits) to cost_log."""
+        if not completion.usage:
+            return
+        usage = LLMUsage.from_deepseek(completion.usage)
+        record_llm_cost("deepseek", operation, usage, usage.cost(INPUT_PRICE, OUTPUT_PRICE, CACHE_HIT_PRICE))
+
     async def detect_stage(
         self,
         lead_name: str,
@@ -97,6 +112,7 @@ class DeepSeekClient:
                 max_tokens=200,
                 temperature=0.3,  # Lower temperature for more consistent stage detection
             )
+            self._record_usage("detect_stage", completion)
 
             if not completion.choices:
                 return FunnelStage.POSITIVE_REPLY, "Fallback: empty response"
@@ -194,6 +210,7 @@ class DeepSeekClient:
                 max_tokens=500,
                 temperature=0.7,
             )
+            self._record_usage(f"generate_{stage.value}", completion)
 
             if not completion.choices:
                 raise DeepSeekError("DeepSeek returned empty response")
@@ -247,6 +264,7 @@ class DeepSeekClient:
                 max_tokens=500,
                 temperature=0.7,
             )
+            self._record_usage("comment_draft", completion)
 
             if not completion.choices:
                 raise DeepSeekError("DeepSeek returned empty response for comment drafting")
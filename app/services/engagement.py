@@ -13,10 +13,12 @@ from decimal import Decimal
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.database import async_session_factory
 from app.models import DailyMetrics, EngagementPost, WatchedProfile
 from app.services.apify import ApifyError, ApifyService, get_apify_service
 from app.services.deepseek import DeepSeekError, get_deepseek_client
+from app.services.engagement_polling import load_post_history, select_due_profiles
 from app.services.slack import SlackError, get_slack_bot
 
 # DeepSeek pricing (deepseek-chat): $0.27/M input, $1.10/M output
@@ -26,17 +28,23 @@ DEEPSEEK_OUTPUT_COST_PER_TOKEN = Decimal("0.0000011")
 logger = logging.getLogger(__name__)
 
 
-async def check_engagement_posts() -> dict:
-    """Main orchestration: check all active profiles for new posts.
+async def check_engagement_posts(force: bool = False) -> dict:
+    """Main orchestration: check due profiles for new posts.
 
     Flow:
-    1. Fetch active WatchedProfiles from DB
-    2. Scrape recent posts via Apify LinkedIn profile posts scraper
-    3. Skip already-seen posts (unique constraint on post_url)
-    4. For new posts: call DeepSeek for summary + draft comment
-    5. Send Slack notification to engagement channel
-    6. Store EngagementPost record with slack_message_ts
-    7. Update profile's last_checked_at
+    1. Fetch active WatchedProfiles that are due a poll (see engagement_polling)
+    2. Scrape recent posts via Apify, in batches of engagement_apify_batch_size
+    3. Skip already-seen posts (one batched post_url IN query)
+    4. For new posts, concurrently: call DeepSeek for summary + draft comment
+    5. ...and send Slack notification to engagement channel
+    6. Store all EngagementPost records (with slack_message_ts) in one commit
+    7. Update profiles' last_checked_at
+
+    No DB connection is held during the Apify scrape or the per-post
+    DeepSeek/Slack fan-out (bounded by settings.engagement_concurrency).
+
+    Args:
+        force: Poll every active profile, ignoring their learned cadence.
 
     Returns:
         Summary dict with counts.
@@ -44,6 +52,7 @@ async def check_engagement_posts() -> dict:
     logger.info("Starting engagement post check...")
 
     profiles_checked = 0
+    profiles_skipped = 0
     posts_found = 0
     posts_new = 0
     posts_notified = 0
@@ -52,91 +61,136 @@ async def check_engagement_posts() -> dict:
     deepseek_cost_usd = Decimal("0")
 
     try:
+        # 1. Fetch active profiles
         async with async_session_factory() as session:
-            # 1. Fetch active profiles
             result = await session.execute(
                 select(WatchedProfile).where(WatchedProfile.is_active == True)
             )
-            profiles = result.scalars().all()
-
-            if not profiles:
-                logger.info("No active watched profiles found")
-                return {
-                    "profiles_checked": 0,
-                    "posts_found": 0,
-                    "posts_new": 0,
-                    "posts_notified": 0,
-                    "errors": [],
-                    "apify_cost_usd": 0,
-                    "deepseek_cost_usd": 0,
-                }
-
-            logger.info(f"Checking {len(profiles)} active profiles")
-
-            # 2. Scrape posts for all profiles in one Apify call
-            profile_urls = [p.linkedin_url for p in profiles]
-            profile_map = {p.linkedin_url: p for p in profiles}
-
-            apify = get_apify_service()
+            profiles = list(result.scalars().all())
+            if profiles and not force:
+                history = await load_post_history(session, [p.id for p in profiles])
+                due = select_due_profiles(profiles, history)
+                profiles_skipped = len(profiles) - len(due)
+                profiles = due
+
+        if not profiles:
+            logger.info(f"No watched profiles due for a check ({profiles_skipped} not yet due)")
+            return {
+                "profiles_checked": 0,
+                "profiles_skipped": profiles_skipped,
+                "posts_found": 0,
+                "posts_new": 0,
+                "posts_notified": 0,
+                "errors": [],
+                "apify_cost_usd": 0,
+                "deepseek_cost_usd": 0,
+            }
+
+        logger.info(f"Checking {len(profiles)} due profiles ({profiles_skipped} not yet due)")
+
+        # 2. Scrape posts in bounded Apify batches, highest-priority profiles first
+        profile_map = {p.linkedin_url: p for p in profiles}
+        batch_size = settings.engagement_apify_batch_size
+
+        apify = get_apify_service()
+        all_posts = []
+        scraped_profiles = []
+        for start in range(0, len(profiles), batch_size):
+            batch = profiles[start:start + batch_size]
             try:
-                all_posts, apify_run_cost = await asyncio.to_thread(
+                batch_posts, apify_run_cost = await asyncio.to_thread(
                     apify.scrape_profile_posts,
-                    linkedin_urls=profile_urls,
+                    linkedin_urls=[p.linkedin_url for p in batch],
                     max_posts=1,
                 )
-                apify_cost_usd = Decimal(str(apify_run_cost))
             except ApifyError as e:
-                logger.error(f"Apify scrape failed: {e}", exc_info=True)
+                logger.error(f"Apify scrape failed for batch of {len(batch)}: {e}", exc_info=True)
                 errors.append(f"Apify: {e}")
-                return {
-                    "profiles_checked": 0,
-                    "posts_found": 0,
-                    "posts_new": 0,
-                    "posts_notified": 0,
-                    "errors": errors[:10],
-                    "apify_cost_usd": 0,
-                    "deepseek_cost_usd": 0,
-                }
-
-            posts_found = len(all_posts)
-            logger.info(f"Apify returned {posts_found} total posts")
-
-            # Keep only the newest post per profile (first result per input URL)
-            seen_profiles: set[str] = set()
-            filtered_posts = []
-            for item in all_posts:
-                input_url = item.get("input", "")
-                if isinstance(input_url, dict):
-                    input_url = input_url.get("url", "")
-                input_key = input_url.rstrip("/").lower()
-                if input_key and input_key in seen_profiles:
-                    continue
-                if input_key:
-                    seen_profiles.add(input_key)
-                filtered_posts.append(item)
-
-            logger.info(f"Filtered to {len(filtered_posts)} posts (1 per profile)")
-
-            # 3-7. Process each post
-            for item in filtered_posts:
-                try:
-                    notified, post_deepseek_cost = await _process_post(
-                        session, item, profile_map, apify
-                    )
-                    deepseek_cost_usd += post_deepseek_cost
-                    if notified:
-                        posts_notified += 1
-                    posts_new += 1
-                except _AlreadySeen:
-                    continue
-                except Exception as e:
-                    error_msg = f"Error processing post: {e}"
-                    logger.error(error_msg, exc_info=True)
-                    errors.append(error_msg)
+                continue
+            apify_cost_usd += Decimal(str(apify_run_cost))
+            all_posts.extend(batch_posts)
+            scraped_profiles.extend(batch)
+
+        if not scraped_profiles:
+            return {
+                "profiles_checked": 0,
+                "profiles_skipped": profiles_skipped,
+                "posts_found": 0,
+                "posts_new": 0,
+                "posts_notified": 0,
+                "errors": errors[:10],
+                "apify_cost_usd": 0,
+                "deepseek_cost_usd": 0,
+            }
+
+        posts_found = len(all_posts)
+        logger.info(f"Apify returned {posts_found} total posts")
+
+        # Keep only the newest post per profile (first result per input URL)
+        seen_profiles: set[str] = set()
+        filtered_posts = []
+        for item in all_posts:
+            input_url = item.get("input", "")
+            if isinstance(input_url, dict):
+                input_url = input_url.get("url", "")
+            input_key = input_url.rstrip("/").lower()
+            if input_key and input_key in seen_profiles:
+                continue
+            if input_key:
+                seen_profiles.add(input_key)
+            filtered_posts.append(item)
+
+        logger.info(f"Filtered to {len(filtered_posts)} posts (1 per profile)")
+
+        # 3. Skip already-seen posts with one IN query
+        new_posts: dict[str, dict] = {}
+        for item in filtered_posts:
+            post_url = apify.extract_post_url(item)
+            if post_url and post_url not in new_posts:
+                new_posts[post_url] = item
+
+        if new_posts:
+            async with async_session_factory() as session:
+                result = await session.execute(
+                    select(EngagementPost.post_url).where(EngagementPost.post_url.in_(list(new_posts)))
+                )
+                for seen_url in result.scalars():
+                    new_posts.pop(seen_url, None)
+
+        logger.info(f"{len(new_posts)} new posts to process")
+
+        # 4-5. Summarize, draft and notify concurrently
+        semaphore = asyncio.Semaphore(settings.engagement_concurrency)
+
+        async def _bounded(post_url: str, item: dict) -> tuple[EngagementPost, Decimal]:
+            async with semaphore:
+                return await _process_post(post_url, item, profile_map, apify)
+
+        results = await asyncio.gather(
+            *(_bounded(post_url, item) for post_url, item in new_posts.items()),
+            return_exceptions=True,
+        )
 
-            # Update last_checked_at for all profiles
-            for profile in profiles:
-                profile.last_checked_at = datetime.now(timezone.utc)
+        # 6-7. Persist everything in one short transaction
+        async with async_session_factory() as session:
+            for outcome in results:
+                if isinstance(outcome, Exception):
+                    error_msg = f"Error processing post: {outcome}"
+                    logger.error(error_msg, exc_info=outcome)
+                    errors.append(error_msg)
+                    continue
+                engagement_post, post_deepseek_cost = outcome
+                session.add(engagement_post)
+                deepseek_cost_usd += post_deepseek_cost
+                posts_new += 1
+                if engagement_post.slack_message_ts is not None:
+                    posts_notified += 1
+
+            # Update last_checked_at for the profiles we actually scraped
+            now = datetime.now(timezone.utc)
+            session.add_all(scraped_profiles)
+            for profile in scraped_profiles:
+                profile.last_checked_at = now
                 profiles_checked += 1
 
             # Persist costs to DailyMetrics
@@ -155,6 +209,7 @@ async def check_engagement_posts() -> dict:
 
     summary = {
         "profiles_checked": profiles_checked,
+        "profiles_skipped": profiles_skipped,
         "posts_found": posts_found,
         "posts_new": posts_new,
         "posts_notified": posts_notified,
@@ -166,32 +221,18 @@ async def check_engagement_posts() -> dict:
     return summary
 
 
-class _AlreadySeen(Exception):
-    pass
-
-
 async def _process_post(
-    session: AsyncSession,
+    post_url: str,
     item: dict,
     profile_map: dict[str, WatchedProfile],
     apify: ApifyService,
-) -> tuple[bool, Decimal]:
-    """Process a single post from Apify results.
+) -> tuple[EngagementPost, Decimal]:
+    """Summarize, draft and notify for a single new post from Apify results.
 
-    Returns (notified, deepseek_cost_usd).
-    Raises _AlreadySeen if the post URL was already in the DB.
-    """
-    post_url = apify.extract_post_url(item)
-    if not post_url:
-        return False, Decimal("0")
-
-    # 3. Skip already-seen posts
-    existing = await session.execute(
-        select(EngagementPost).where(EngagementPost.post_url == post_url)
-    )
-    if existing.scalar_one_or_none():
-        raise _AlreadySeen()
+    Does no DB I/O; the caller adds the returned record to its session.
 
+    Returns (engagement_post, deepseek_cost_usd).
+    """
     # Match post to a watched profile via input URL (the URL we asked Apify to scrape)
     input_url = ""
     raw_input = item.get("input")
@@ -295,9 +336,7 @@ async def _process_post(
         draft_comment=draft_comment,
         slack_message_ts=slack_ts,
     )
-    session.add(engagement_post)
-
-    return slack_ts is not None, post_deepseek_cost
+    return engagement_post, post_deepseek_cost
 
 
 async def _update_daily_metrics(
@@ -0,0 +1,125 @@
+"""Adaptive polling cadence for watched LinkedIn profiles.
+
+Most watched profiles post rarely, so scraping every one of them on every
+scheduled engagement check wastes Apify spend. Each profile gets a poll
+interval learned from its EngagementPost history: roughly half its typical
+gap between posts, stretched out while it stays quiet, shortened for
+high-value categories, and clamped to [MIN_POLL_INTERVAL, MAX_POLL_INTERVAL].
+A check only scrapes the profiles whose interval has elapsed.
+"""
+
+import statistics
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import EngagementPost, WatchedProfile, WatchedProfileCategory
+
+# Checks run every 4h, so a 3h floor keeps frequent posters due on every run
+MIN_POLL_INTERVAL = timedelta(hours=3)
+MAX_POLL_INTERVAL = timedelta(days=7)
+DEFAULT_POLL_INTERVAL = timedelta(hours=12)  # Not enough history yet
+
+HISTORY_WINDOW = timedelta(days=90)
+HISTORY_POSTS = 10  # Most recent posts used for the cadence estimate
+
+# Lower = polled first and more often
+CATEGORY_PRIORITY = {
+    WatchedProfileCategory.PROSPECT: 0,
+    WatchedProfileCategory.COMPETITOR: 1,
+    WatchedProfileCategory.ICP_PEER: 2,
+    WatchedProfileCategory.INFLUENCER: 3,
+}
+CATEGORY_INTERVAL_FACTOR = {
+    WatchedProfileCategory.PROSPECT: 0.5,
+    WatchedProfileCategory.COMPETITOR: 0.75,
+    WatchedProfileCategory.ICP_PEER: 1.0,
+    WatchedProfileCategory.INFLUENCER: 1.0,
+}
+
+
+def _as_utc(value: datetime) -> datetime:
+    """SQLite hands back naive datetimes; treat them as UTC."""
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def estimate_poll_interval(
+    profile: WatchedProfile,
+    post_times: list[datetime],
+    now: datetime | None = None,
+) -> timedelta:
+    """Estimate how often a profile should be polled.
+
+    Args:
+        profile: The watched profile.
+        post_times: When its recent posts were first seen, any order.
+        now: Reference time (defaults to now, UTC).
+
+    Returns:
+        Poll interval, clamped to [MIN_POLL_INTERVAL, MAX_POLL_INTERVAL].
+    """
+    now = now or datetime.now(timezone.utc)
+    times = sorted(_as_utc(t) for t in post_times)[-HISTORY_POSTS:]
+
+    if len(times) >= 2:
+        gaps = [b - a for a, b in zip(times, times[1:])]
+        interval = statistics.median(gaps) / 2
+    else:
+        interval = DEFAULT_POLL_INTERVAL
+
+    # Back off while the profile stays quiet
+    last_seen = times[-1] if times else (_as_utc(profile.created_at) if profile.created_at else now)
+    interval = max(interval, (now - last_seen) / 4)
+
+    interval *= CATEGORY_INTERVAL_FACTOR.get(profile.category, 1.0)
+    return min(max(interval, MIN_POLL_INTERVAL), MAX_POLL_INTERVAL)
+
+
+def select_due_profiles(
+    profiles: list[WatchedProfile],
+    post_history: dict[uuid.UUID, list[datetime]],
+    now: datetime | None = None,
+) -> list[WatchedProfile]:
+    """Return the profiles whose poll interval has elapsed, highest priority first.
+
+    Never-checked profiles are always due. Ties within a category go to the
+    most overdue profile.
+    """
+    now = now or datetime.now(timezone.utc)
+    due: list[tuple[int, float, WatchedProfile]] = []
+
+    for profile in profiles:
+        if profile.last_checked_at is None:
+            overdue = float("inf")
+        else:
+            interval = estimate_poll_interval(profile, post_history.get(profile.id, []), now)
+            overdue = (now - _as_utc(profile.last_checked_at)) / interval
+            if overdue < 1:
+                continue
+        due.append((CATEGORY_PRIORITY.get(profile.category, len(CATEGORY_PRIORITY)), -overdue, profile))
+
+    due.sort(key=lambda entry: entry[:2])
+    return [profile for _, _, profile in due]
+
+
+async def load_post_history(
+    session: AsyncSession,
+    profile_ids: list[uuid.UUID],
+    now: datetime | None = None,
+) -> dict[uuid.UUID, list[datetime]]:
+    """Load recent EngagementPost timestamps per profile in one query."""
+    if not profile_ids:
+        return {}
+    since = (now or datetime.now(timezone.utc)) - HISTORY_WINDOW
+    result = await session.execute(
+        select(EngagementPost.watched_profile_id, EngagementPost.created_at).where(
+            EngagementPost.watched_profile_id.in_(profile_ids),
+            EngagementPost.created_at >= since,
+        )
+    )
+    history: dict[uuid.UUID, list[datetime]] = {}
+    for profile_id, created_at in result.all():
+        history.setdefault(profile_id, []).append(created_at)
+    return history
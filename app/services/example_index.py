@@ -0,0 +1,246 @@
+"""In-memory BM25 index over approved drafts for few-shot retrieval.
+
+One index per funnel stage, keyed by draft id. It is loaded from the DB
+once per process (at startup, or on first use), then kept current by
+``add_approved`` as drafts are approved in Slack, so a webhook never scans
+the drafts table. If ``example_index_path`` is set, the index is also
+snapshotted to disk and only drafts updated since the snapshot are read
+back on the next load.
+"""
+
+import asyncio
+import heapq
+import json
+import logging
+import math
+import re
+from collections import Counter
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models import Conversation, Draft, DraftStatus, FunnelStage
+from app.services.example_retriever import STOP_WORDS, RetrievedExample, build_example
+
+logger = logging.getLogger(__name__)
+
+# Standard BM25 parameters
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9']+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercased word tokens with stop words removed."""
+    return [t for t in _TOKEN_PATTERN.findall(text.lower()) if t not in STOP_WORDS]
+
+
+@dataclass
+class _Doc:
+    example: RetrievedExample
+    terms: Counter
+    length: int
+    seq: int  # insertion order, newest highest
+
+
+class _StageIndex:
+    """BM25 postings for one funnel stage."""
+
+    def __init__(self):
+        self.docs: dict[str, _Doc] = {}
+        self.postings: dict[str, dict[str, int]] = {}
+        self.total_length = 0
+
+    def add(self, doc_id: str, example: RetrievedExample, seq: int) -> None:
+        self.remove(doc_id)
+        terms = Counter(tokenize(example.lead_message))
+        doc = _Doc(example=example, terms=terms, length=sum(terms.values()), seq=seq)
+        self.docs[doc_id] = doc
+        self.total_length += doc.length
+        for term, tf in terms.items():
+            self.postings.setdefault(term, {})[doc_id] = tf
+
+    def remove(self, doc_id: str) -> None:
+        doc = self.docs.pop(doc_id, None)
+        if doc is None:
+            return
+        self.total_length -= doc.length
+        for term in doc.terms:
+            posting = self.postings.get(term)
+            if posting is not None:
+                posting.pop(doc_id, None)
+                if not posting:
+                    del self.postings[term]
+
+    def top_k(self, query: str, k: int) -> list[RetrievedExample]:
+        """Best ``k`` docs by BM25, topped up with the newest when too few match."""
+        if not self.docs:
+            return []
+        n = len(self.docs)
+        avg_length = self.total_length / n or 1.0
+        scores: dict[str, float] = {}
+        for term in set(tokenize(query)):
+            posting = self.postings.get(term)
+            if not posting:
+                continue
+            idf = math.log(1 + (n - len(posting) + 0.5) / (len(posting) + 0.5))
+            for doc_id, tf in posting.items():
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self.docs[doc_id].length / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+        best = heapq.nlargest(k, scores, key=lambda doc_id: (scores[doc_id], self.docs[doc_id].seq))
+        if len(best) < k:
+            matched = set(best)
+            newest = heapq.nlargest(
+                k - len(best),
+                (doc_id for doc_id in self.docs if doc_id not in matched),
+                key=lambda doc_id: self.docs[doc_id].seq,
+            )
+            best.extend(newest)
+        return [self.docs[doc_id].example for doc_id in best]
+
+
+class ExampleIndex:
+    """Per-stage BM25 index of approved drafts."""
+
+    def __init__(self, snapshot_path: str | None = None):
+        self._snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self._stages: dict[FunnelStage, _StageIndex] = {}
+        self._stage_of: dict[str, FunnelStage] = {}
+        self._seq = 0
+        self._watermark: datetime | None = None
+        self._loaded = False
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._stage_of)
+
+    def _add(self, doc_id: str, example: RetrievedExample) -> None:
+        previous = self._stage_of.get(doc_id)
+        if previous is not None and previous != example.funnel_stage:
+            self._stages[previous].remove(doc_id)
+        self._seq += 1
+        self._stages.setdefault(example.funnel_stage, _StageIndex()).add(doc_id, example, self._seq)
+        self._stage_of[doc_id] = example.funnel_stage
+
+    def _track(self, updated_at: datetime | None) -> None:
+        if updated_at is None:
+            return
+        # SQLite hands back naive UTC; keep the watermark timezone-aware
+        if updated_at.tzinfo is None:
+            updated_at = updated_at.replace(tzinfo=timezone.utc)
+        if self._watermark is None or updated_at > self._watermark:
+            self._watermark = updated_at
+
+    async def ensure_loaded(self, db: AsyncSession) -> None:
+        """Build the index on first use: snapshot (if any) plus drafts approved since."""
+        if self._loaded:
+            return
+        async with self._lock:
+            if self._loaded:
+                return
+            await asyncio.to_thread(self._load_snapshot)
+            count = await self._load_from_db(db, since=self._watermark)
+            self._loaded = True
+            logger.info(f"Example index loaded: {len(self)} drafts ({count} read from DB)")
+            if count:
+                await self.save_snapshot()
+
+    async def _load_from_db(self, db: AsyncSession, since: datetime | None) -> int:
+        query = (
+            select(Draft, Conversation)
+            .join(Conversation, Draft.conversation_id == Conversation.id)
+            .where(
+                Draft.status == DraftStatus.APPROVED,
+                Conversation.funnel_stage.is_not(None),
+            )
+            .order_by(Draft.created_at)
+        )
+        if since is not None:
+            query = query.where(Draft.updated_at > since)
+
+        count = 0
+        for draft, conversation in (await db.execute(query)).all():
+            count += 1
+            self._track(draft.updated_at)
+            example = build_example(draft, conversation, conversation.funnel_stage)
+            if example is not None:
+                self._add(str(draft.id), example)
+        return count
+
+    def add_approved(self, draft: Draft, conversation: Conversation) -> None:
+        """Index (or re-index) a draft that was just approved."""
+        stage = conversation.funnel_stage
+        if stage is None or not self._loaded:
+            # Not loaded yet: the one-off DB load will pick it up
+            return
+        # The watermark stays at load time, so the next load re-reads these too
+        example = build_example(draft, conversation, stage)
+        if example is not None:
+            self._add(str(draft.id), example)
+            if self._snapshot_path is not None:
+                asyncio.get_running_loop().create_task(self.save_snapshot())
+
+    def search(self, stage: FunnelStage, query: str, k: int) -> list[RetrievedExample]:
+        """Top ``k`` examples for ``stage`` by BM25 similarity to ``query``."""
+        stage_index = self._stages.get(stage)
+        if stage_index is None:
+            return []
+        return stage_index.top_k(query, k)
+
+    def _load_snapshot(self) -> None:
+        if self._snapshot_path is None or not self._snapshot_path.exists():
+            return
+        try:
+            data = json.loads(self._snapshot_path.read_text(encoding="utf-8"))
+            for doc_id, fields in data["docs"].items():
+                fields["funnel_stage"] = FunnelStage(fields["funnel_stage"])
+                self._add(doc_id, RetrievedExample(**fields))
+            if data.get("watermark"):
+                self._track(datetime.fromisoformat(data["watermark"]))
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable example index snapshot: {e}")
+            self._stages.clear()
+            self._stage_of.clear()
+            self._watermark = None
+
+    async def save_snapshot(self) -> None:
+        """Write the index to ``example_index_path`` (no-op if unset)."""
+        if self._snapshot_path is None:
+            return
+        docs = {}
+        for stage_index in self._stages.values():
+            for doc_id, doc in sorted(stage_index.docs.items(), key=lambda item: item[1].seq):
+                fields = asdict(doc.example)
+                fields["funnel_stage"] = doc.example.funnel_stage.value
+                docs[doc_id] = fields
+        data = {
+            "watermark": self._watermark.isoformat() if self._watermark else None,
+            "docs": docs,
+        }
+        try:
+            await asyncio.to_thread(self._write_snapshot, json.dumps(data))
+        except Exception as e:
+            logger.warning(f"Failed to write example index snapshot: {e}")
+
+    def _write_snapshot(self, payload: str) -> None:
+        self._snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self._snapshot_path.with_suffix(".tmp")
+        tmp.write_text(payload, encoding="utf-8")
+        tmp.replace(self._snapshot_path)
+
+
+_index: ExampleIndex | None = None
+
+
+def get_example_index() -> ExampleIndex:
+    """Get or create the example index singleton."""
+    global _index
+    if _index is None:
+        _index = ExampleIndex(settings.example_index_path or None)
+    return _index
@@ -1,7 +1,7 @@
 """Retrieve similar past conversations as dynamic few-shot examples.
 
-Queries approved/sent drafts from the database, ranked by relevance
-to the current conversation context. These examples are injected into
+Searches every approved/sent draft (via the example_index BM25 index),
+ranked by relevance to the current conversation context. These examples are injected into
 the generation prompt so the AI sees real conversations similar to
 the one it's drafting for.
 """
@@ -9,13 +9,25 @@ the one it's drafting for.
 import logging
 from dataclasses import dataclass
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import Conversation, Draft, DraftStatus, FunnelStage
+from app.models import Conversation, Draft, FunnelStage
 
 logger = logging.getLogger(__name__)
 
+# Very common words ignored when matching lead messages
+STOP_WORDS = frozenset({
+    "the", "a", "an", "is", "are", "was", "were", "be", "been",
+    "being", "have", "has", "had", "do", "does", "did", "will",
+    "would", "could", "should", "may", "might", "can", "shall",
+    "i", "you", "he", "she", "it", "we", "they", "me", "him",
+    "her", "us", "them", "my", "your", "his", "its", "our",
+    "their", "this", "that", "these", "those", "and", "but",
+    "or", "not", "no", "yes", "so", "if", "then", "than",
+    "too", "very", "just", "also", "of", "in", "on", "at",
+    "to", "for", "with", "from", "by", "as", "into", "about",
+})
+
 
 @dataclass
 class RetrievedExample:
@@ -40,67 +52,32 @@ async def get_similar_examples(
 ) -> list[RetrievedExample]:
     """Retrieve approved drafts from the same stage, ranked by relevance.
 
+    Candidates come from the in-memory BM25 index over every approved draft
+    (see example_index), so older but closely matching conversations are
+    considered, not just the most recent ones. The index is loaded from the
+    DB once per process and kept current as drafts are approved.
+
     Args:
         stage: Current funnel stage to filter by.
         lead_context: Current lead context (company, title, is_first_reply, etc.).
         current_lead_message: The lead's current message (for length matching).
-        db: Database session.
+        db: Database session (used only for the one-off index load).
         limit: Max number of examples to return.
 
     Returns:
         List of RetrievedExample, most relevant last (for recency bias).
     """
+    from app.services.example_index import get_example_index
+
     lead_context = lead_context or {}
     over_fetch = limit * 5  # Fetch more than needed, then rank
 
-    # Query approved drafts at the same funnel stage
-    query = (
-        select(Draft, Conversation)
-        .join(Conversation, Draft.conversation_id == Conversation.id)
-        .where(
-            Draft.status == DraftStatus.APPROVED,
-            Conversation.funnel_stage == stage,
-        )
-        .order_by(Draft.created_at.desc())
-        .limit(over_fetch)
-    )
-
-    result = await db.execute(query)
-    rows = result.all()
-
-    if not rows:
-        logger.info(f"No approved examples found for stage {stage.value}")
-        return []
-
-    # Extract lead messages from conversation history
-    examples = []
-    for draft, conversation in rows:
-        lead_message = _extract_last_lead_message(conversation.conversation_history)
-        if not lead_message:
-            continue
-
-        # Use actual_sent_text if available (what was really sent after potential edits)
-        # Fall back to ai_draft for older drafts without actual_sent_text
-        reply_text = draft.actual_sent_text or draft.ai_draft
-        was_edited = (
-            draft.actual_sent_text is not None
-            and draft.actual_sent_text != draft.ai_draft
-        )
-
-        examples.append(
-            RetrievedExample(
-                lead_name=conversation.lead_name or "Lead",
-                lead_message=lead_message,
-                draft_reply=reply_text,
-                company=None,
-                title=None,
-                is_first_reply=draft.is_first_reply,
-                funnel_stage=stage,
-                was_edited=was_edited,
-            )
-        )
+    index = get_example_index()
+    await index.ensure_loaded(db)
+    examples = index.search(stage, current_lead_message, over_fetch)
 
     if not examples:
+        logger.info(f"No approved examples found for stage {stage.value}")
         return []
 
     # Rank by relevance heuristics
@@ -116,6 +93,32 @@ async def get_similar_examples(
     return selected
 
 
+def build_example(draft: Draft, conversation: Conversation, stage: FunnelStage) -> RetrievedExample | None:
+    """Turn an approved draft into a few-shot example (None if the lead never spoke)."""
+    lead_message = _extract_last_lead_message(conversation.conversation_history)
+    if not lead_message:
+        return None
+
+    # Use actual_sent_text if available (what was really sent after potential edits)
+    # Fall back to ai_draft for older drafts without actual_sent_text
+    reply_text = draft.actual_sent_text or draft.ai_draft
+    was_edited = (
+        draft.actual_sent_text is not None
+        and draft.actual_sent_text != draft.ai_draft
+    )
+
+    return RetrievedExample(
+        lead_name=conversation.lead_name or "Lead",
+        lead_message=lead_message,
+        draft_reply=reply_text,
+        company=None,
+        title=None,
+        is_first_reply=draft.is_first_reply,
+        funnel_stage=stage,
+        was_edited=was_edited,
+    )
+
+
 def _extract_last_lead_message(
     conversation_history: list[dict] | None,
 ) -> str | None:
@@ -159,19 +162,7 @@ def _rank_examples(
     current_is_first = lead_context.get("is_first_reply", False)
     current_length = len(current_lead_message)
     current_words = set(current_lead_message.lower().split())
-    # Remove very common words for better matching
-    stop_words = {
-        "the", "a", "an", "is", "are", "was", "were", "be", "been",
-        "being", "have", "has", "had", "do", "does", "did", "will",
-        "would", "could", "should", "may", "might", "can", "shall",
-        "i", "you", "he", "she", "it", "we", "they", "me", "him",
-        "her", "us", "them", "my", "your", "his", "its", "our",
-        "their", "this", "that", "these", "those", "and", "but",
-        "or", "not", "no", "yes", "so", "if", "then", "than",
-        "too", "very", "just", "also", "of", "in", "on", "at",
-        "to", "for", "with", "from", "by", "as", "into", "about",
-    }
-    current_keywords = current_words - stop_words
+    current_keywords = current_words - STOP_WORDS
 
     scored = []
     for ex in examples:
@@ -187,7 +178,7 @@ def _rank_examples(
         score += length_ratio * 2.0
 
         # Keyword overlap in lead messages
-        ex_words = set(ex.lead_message.lower().split()) - stop_words
+        ex_words = set(ex.lead_message.lower().split()) - STOP_WORDS
         overlap = current_keywords & ex_words
         score += len(overlap) * 0.5
 
@@ -202,11 +193,19 @@ def _rank_examples(
     return [ex for _, ex in scored]
 
 
-def format_examples_for_prompt(examples: list[RetrievedExample]) -> str:
+def format_examples_for_prompt(
+    examples: list[RetrievedExample],
+    max_tokens: int | None = None,
+) -> str:
     """Format retrieved examples into a prompt section.
 
+    Examples are added in relevance order until the token budget is spent;
+    an example that doesn't fit whole is left out rather than cut mid-thread.
+
     Args:
         examples: List of RetrievedExample to format.
+        max_tokens: Token budget for the section (defaults to
+            ``settings.prompt_examples_token_budget``; 0 = unlimited).
 
     Returns:
         Formatted string for injection into the prompt, or empty string.
@@ -214,12 +213,19 @@ def format_examples_for_prompt(examples: list[RetrievedExample]) -> str:
     if not examples:
         return ""
 
-    lines = [
+    from app.config import settings
+    from app.prompts.budget import count_tokens
+
+    budget = settings.prompt_examples_token_budget if max_tokens is None else max_tokens
+
+    header = (
         "## Similar Past Conversations (style reference ONLY — do NOT copy questions or structure)\n"
         "Use these to match TONE and LENGTH only. Ask DIFFERENT qualifying questions each time.\n"
-    ]
+    )
+    lines = [header]
+    used = count_tokens(header)
 
-    for i, ex in enumerate(examples, 1):
+    for ex in examples:
         # Build context label
         context_parts = []
         if ex.company:
@@ -230,15 +236,22 @@ def format_examples_for_prompt(examples: list[RetrievedExample]) -> str:
             context_parts.append("continuing conversation")
         context_label = ", ".join(context_parts) if context_parts else "conversation"
 
-        lines.append(f"Example {i} ({context_label}):")
-        lines.append(f'Lead: "{ex.lead_message}"')
+        block = [f"Example {len(lines)} ({context_label}):", f'Lead: "{ex.lead_message}"']
 
         # Split draft reply into separate messages (each line is a message)
         for reply_line in ex.draft_reply.strip().split("\n"):
             reply_line = reply_line.strip()
             if reply_line:
-                lines.append(f'You: "{reply_line}"')
+                block.append(f'You: "{reply_line}"')
 
-        lines.append("[This was approved and sent]\n")
+        block.append("[This was approved and sent]\n")
 
+        cost = count_tokens("\n".join(block))
+        if budget > 0 and used + cost > budget:
+            continue
+        lines.append("\n".join(block))
+        used += cost
+
+    if len(lines) == 1:
+        return ""
     return "\n".join(lines)
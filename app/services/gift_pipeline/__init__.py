@@ -1,5 +1,8 @@
 """Gift leads pipeline — full research fallback for the Slack gift leads button."""
 
-from app.services.gift_pipeline.orchestrator import run_gift_leads_pipeline_async
+from app.services.gift_pipeline.orchestrator import (
+    resume_gift_leads_pipeline,
+    run_gift_leads_pipeline_async,
+)
 
-__all__ = ["run_gift_leads_pipeline_async"]
+__all__ = ["resume_gift_leads_pipeline", "run_gift_leads_pipeline_async"]
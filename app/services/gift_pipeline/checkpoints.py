@@ -0,0 +1,213 @@
+"""Step-level checkpointing of gift leads pipeline runs into PipelineRun.
+
+Each completed step's output (search results, filtered posts, engagers,
+scraped profile batches, qualified leads, ...) is merged into one state
+dict, stored as a zlib-compressed JSON blob on ``PipelineRun.checkpoint_data``.
+A run interrupted by a redeploy or OOM can then be resumed from its last
+completed step instead of repeating the Apify and DeepSeek spend.
+
+Checkpoint writes are best-effort: a failed write is logged and the run
+carries on, it just can't resume past that point.
+"""
+
+import json
+import logging
+import uuid
+import zlib
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any
+
+from app.database import async_session_factory
+from app.models import PipelineRun
+from app.services.gift_pipeline.cost_tracker import CostTracker
+
+logger = logging.getLogger(__name__)
+
+RUN_TYPE = "gift_leads"
+
+# Steps in execution order. "profile_batches" is saved after every batch.
+STEPS = [
+    "prospect_profile",
+    "research",
+    "queries",
+    "search_results",
+    "filtered_posts",
+    "engagers",
+    "profile_batches",
+    "qualified",
+    "signal_notes",
+    "result",
+]
+
+# Statuses a run can be resumed from (started = interrupted mid-run)
+RESUMABLE_STATUSES = ("started", "failed")
+
+# CostTracker keys -> PipelineRun columns
+_COST_COLUMNS = {
+    "apify_google_search": "cost_apify_google",
+    "apify_post_reactions": "cost_apify_reactions",
+    "apify_profile_scraper": "cost_apify_profiles",
+    "deepseek_icp": "cost_deepseek_icp",
+    "deepseek_personalization": "cost_deepseek_personalize",
+}
+_COUNT_COLUMNS = {
+    "google_results": "count_google_searches",
+    "posts_scraped": "count_posts_scraped",
+    "profiles_scraped": "count_profiles_scraped",
+    "icp_checks": "count_icp_checks",
+    "personalizations": "count_personalizations",
+}
+
+
+def encode_checkpoint(state: dict[str, Any]) -> bytes:
+    """Serialize checkpoint state to a compressed blob."""
+    return zlib.compress(json.dumps(state, default=str).encode("utf-8"), 6)
+
+
+def decode_checkpoint(blob: bytes | None) -> dict[str, Any]:
+    """Inverse of encode_checkpoint(). Returns {} for an empty blob."""
+    if not blob:
+        return {}
+    return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+
+def _apply_costs(run: PipelineRun, cost_tracker: CostTracker) -> None:
+    for key, column in _COST_COLUMNS.items():
+        setattr(run, column, Decimal(str(round(cost_tracker.costs.get(key, 0.0), 4))))
+    for key, column in _COUNT_COLUMNS.items():
+        setattr(run, column, cost_tracker.counts.get(key, 0))
+    run.cost_total = Decimal(str(round(cost_tracker.get_total(), 4)))
+
+
+class PipelineCheckpoint:
+    """Checkpoint state for one gift leads PipelineRun."""
+
+    def __init__(
+        self,
+        run_id: uuid.UUID,
+        state: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        persistent: bool = True,
+    ):
+        self.run_id = run_id
+        self.state: dict[str, Any] = state or {}
+        self.params: dict[str, Any] = params or {}
+        self.persistent = persistent
+
+    @property
+    def last_completed_step(self) -> str | None:
+        """Latest step (in STEPS order) that has a saved output."""
+        done = [s for s in STEPS if s in self.state]
+        return done[-1] if done else None
+
+    def has(self, step: str) -> bool:
+        return step in self.state
+
+    def get(self, step: str, default: Any = None) -> Any:
+        return self.state.get(step, default)
+
+    def cost_tracker(self) -> CostTracker:
+        """CostTracker restored from the last checkpoint (fresh if none)."""
+        return CostTracker.from_dict(self.state.get("_costs"))
+
+    @classmethod
+    async def create(
+        cls,
+        prospect_url: str,
+        prospect_name: str,
+        params: dict[str, Any],
+        run_id: uuid.UUID | None = None,
+    ) -> "PipelineCheckpoint":
+        """Create the PipelineRun row for a new run.
+
+        ``run_id`` adopts an existing row (one queued by the pipeline
+        executor) instead of inserting a new one. If the DB write fails the
+        run still goes ahead with an in-memory, non-persistent checkpoint
+        rather than not running at all.
+        """
+        try:
+            async with async_session_factory() as session:
+                run = await session.get(PipelineRun, run_id) if run_id else None
+                if run is None:
+                    run = PipelineRun(run_type=RUN_TYPE)
+                    session.add(run)
+                run.status = "started"
+                run.prospect_url = prospect_url
+                run.prospect_name = prospect_name
+                run.run_params = params
+                await session.commit()
+                return cls(run.id, params=params)
+        except Exception as e:
+            logger.error(f"Could not create gift pipeline run record: {e}")
+            return cls(run_id or uuid.uuid4(), params=params, persistent=False)
+
+    @classmethod
+    async def load(cls, run_id: uuid.UUID) -> "PipelineCheckpoint | None":
+        """Load a resumable run. Returns None if it doesn't exist or already completed."""
+        async with async_session_factory() as session:
+            run = await session.get(PipelineRun, run_id)
+            if run is None or run.run_type != RUN_TYPE or run.status not in RESUMABLE_STATUSES:
+                return None
+            return cls(run.id, decode_checkpoint(run.checkpoint_data), run.run_params or {})
+
+    async def save(
+        self,
+        step: str,
+        data: Any,
+        cost_tracker: CostTracker | None = None,
+        **run_fields: Any,
+    ) -> None:
+        """Record a completed step's output and any PipelineRun metric columns."""
+        self.state[step] = data
+        if cost_tracker is not None:
+            self.state["_costs"] = cost_tracker.to_dict()
+        if not self.persistent:
+            return
+        try:
+            blob = encode_checkpoint(self.state)
+            async with async_session_factory() as session:
+                run = await session.get(PipelineRun, self.run_id)
+                if run is None:
+                    return
+                run.checkpoint_data = blob
+                run.last_completed_step = step
+                for field, value in run_fields.items():
+                    setattr(run, field, value)
+                if cost_tracker is not None:
+                    _apply_costs(run, cost_tracker)
+                await session.commit()
+            logger.info(f"Checkpoint {self.run_id}: {step} ({len(blob)} bytes)")
+        except Exception as e:
+            logger.error(f"Checkpoint write failed for {self.run_id} at {step}: {e}")
+
+    async def finish(
+        self,
+        status: str,
+        cost_tracker: CostTracker | None = None,
+        error_message: str | None = None,
+        **run_fields: Any,
+    ) -> None:
+        """Mark the run completed/failed and record final metrics."""
+        if not self.persistent:
+            return
+        try:
+            async with async_session_factory() as session:
+                run = await session.get(PipelineRun, self.run_id)
+                if run is None:
+                    return
+                run.status = status
+                run.error_message = error_message[:500] if error_message else None
+                run.completed_at = datetime.now(timezone.utc)
+                started_at = run.started_at
+                if started_at is not None:
+                    if started_at.tzinfo is None:
+                        started_at = started_at.replace(tzinfo=timezone.utc)
+                    run.duration_seconds = int((run.completed_at - started_at).total_seconds())
+                for field, value in run_fields.items():
+                    setattr(run, field, value)
+                if cost_tracker is not None:
+                    _apply_costs(run, cost_tracker)
+                await session.commit()
+        except Exception as e:
+            logger.error(f"Could not finalize gift pipeline run {self.run_id}: {e}")
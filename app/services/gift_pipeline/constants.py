@@ -1,5 +1,13 @@
 """Constants for the gift leads pipeline."""
 
+# Headline keyword lists are shared with the other lead pipelines
+from app.services.profile_filters import (  # noqa: F401
+    EMPTY_HEADLINE_INDICATORS,
+    HEADLINE_AUTHORITY_KEYWORDS,
+    HEADLINE_REJECT_KEYWORDS,
+    NON_ENGLISH_INDICATORS,
+)
+
 # Apify Actor IDs
 GOOGLE_SEARCH_ACTOR = "nFJndFXA5zjCTuudP"
 POST_REACTIONS_ACTOR = "J9UfswnR3Kae4O6vm"
@@ -23,47 +31,11 @@ DEEPSEEK_COSTS = {
 # Default allowed countries for location filtering
 DEFAULT_COUNTRIES = ["United States", "Canada", "USA", "America"]
 
-# Headline authority keywords (positive signal)
-HEADLINE_AUTHORITY_KEYWORDS = [
-    "ceo", "founder", "co-founder", "cofounder", "owner",
-    "president", "managing director", "partner",
-    "vp", "vice president", "director",
-    "cto", "cfo", "coo", "cmo", "chief",
-    "head of", "principal", "entrepreneur",
-]
-
-# Hard rejection keywords
-HEADLINE_REJECT_KEYWORDS = [
-    "intern", "student", "trainee", "apprentice",
-    "cashier", "driver", "technician", "mechanic",
-    "nurse", "teacher", "professor", "doctor", "physician",
-    "looking for", "seeking", "open to work",
-    "retired", "unemployed",
-]
-
-# Non-English indicators in headlines
-NON_ENGLISH_INDICATORS = [
-    # Portuguese
-    "diretor", "gerente", "fundador", "empresário", "sócio", "coordenador",
-    # Spanish
-    "gerente", "fundador", "empresario", "socio", "coordinador",
-    # French
-    "directeur", "fondateur", "gérant", "président", "responsable",
-    # German
-    "geschäftsführer", "gründer", "leiter", "inhaber",
-    # Italian
-    "direttore", "fondatore", "titolare", "amministratore",
-    # Dutch
-    "directeur", "oprichter", "eigenaar",
-]
-
-# Placeholder headlines that indicate empty/incomplete profiles
-EMPTY_HEADLINE_INDICATORS = ["--", "n/a", "na", "-", ""]
-
 # Pipeline defaults
 DEFAULT_DAYS_BACK = 14
 DEFAULT_MIN_REACTIONS = 50
 DEFAULT_MIN_LEADS = 10
 DEFAULT_MAX_LEADS = 25
+GIFT_SHEET_MAX_LEADS = 15  # Leads put on a gift sheet
 PROFILE_BATCH_SIZE = 100
 SIGNAL_NOTE_BATCH_SIZE = 10
@@ -46,6 +46,19 @@ class CostTracker:
         cost = (tokens / 1_000_000) * (DEEPSEEK_COSTS["input_per_1m"] + DEEPSEEK_COSTS["output_per_1m"]) / 2
         self.costs["deepseek_personalization"] += cost
 
+    def to_dict(self) -> dict:
+        """Serialize costs and counts (for pipeline checkpoints)."""
+        return {"costs": dict(self.costs), "counts": dict(self.counts)}
+
+    @classmethod
+    def from_dict(cls, data: dict | None) -> "CostTracker":
+        """Rebuild a tracker from to_dict() output, e.g. when resuming a run."""
+        tracker = cls()
+        if data:
+            tracker.costs.update(data.get("costs", {}))
+            tracker.counts.update(data.get("counts", {}))
+        return tracker
+
     def get_total(self) -> float:
         return sum(self.costs.values())
 
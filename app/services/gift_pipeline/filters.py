@@ -4,10 +4,14 @@ import logging
 import re
 from datetime import datetime, timezone
 
-from app.services.gift_pipeline.constants import (
-    EMPTY_HEADLINE_INDICATORS,
-    HEADLINE_REJECT_KEYWORDS,
-    NON_ENGLISH_INDICATORS,
+# Headline, English, location and completeness checks live in the shared
+# filtering engine; re-exported here for the gift pipeline's callers.
+from app.services.profile_filters import (  # noqa: F401
+    filter_by_location,
+    filter_complete_profiles,
+    is_likely_english,
+    is_profile_complete,
+    prefilter_engagers_by_headline,
 )
 
 logger = logging.getLogger(__name__)
@@ -154,76 +158,6 @@ def extract_activity_fields(profile: dict) -> dict:
     }
 
 
-# ---------------------------------------------------------------------------
-# Headline pre-filter
-# ---------------------------------------------------------------------------
-
-def is_likely_english(text: str) -> tuple[bool, str]:
-    """Check if text is likely English based on character analysis."""
-    if not text or len(text) < 3:
-        return True, "too short to analyze"
-
-    non_ascii_chars = sum(1 for c in text if ord(c) > 127)
-    non_ascii_ratio = non_ascii_chars / len(text)
-    if non_ascii_ratio > 0.15:
-        return False, f"high non-ASCII ratio ({non_ascii_ratio:.0%})"
-
-    cjk_count = sum(1 for c in text if '\u4e00' <= c <= '\u9fff' or '\u3040' <= c <= '\u30ff' or '\uac00' <= c <= '\ud7af')
-    if cjk_count > 0:
-        return False, "contains CJK characters"
-
-    cyrillic_count = sum(1 for c in text if '\u0400' <= c <= '\u04ff')
-    if cyrillic_count > 0:
-        return False, "contains Cyrillic characters"
-
-    arabic_count = sum(1 for c in text if '\u0600' <= c <= '\u06ff')
-    if arabic_count > 0:
-        return False, "contains Arabic characters"
-
-    text_lower = text.lower()
-    for indicator in NON_ENGLISH_INDICATORS:
-        if indicator in text_lower:
-            return False, f"contains '{indicator}'"
-
-    return True, "appears English"
-
-
-def prefilter_engagers_by_headline(
-    engagers: list[dict],
-) -> tuple[list[dict], int, int, int]:
-    """Pre-filter engagers by headline before expensive profile scraping.
-
-    Returns:
-        (filtered_engagers, kept_count, rejected_count, non_english_count)
-    """
-    filtered = []
-    rejected_count = 0
-    non_english_count = 0
-
-    for engager in engagers:
-        reactor = engager.get("reactor", {})
-        headline_raw = (reactor.get("headline") or "").strip()
-        headline = headline_raw.lower()
-
-        if not headline:
-            filtered.append(engager)
-            continue
-
-        is_english, _ = is_likely_english(headline_raw)
-        if not is_english:
-            non_english_count += 1
-            continue
-
-        is_rejected = any(kw in headline for kw in HEADLINE_REJECT_KEYWORDS)
-        if is_rejected:
-            rejected_count += 1
-            continue
-
-        filtered.append(engager)
-
-    return filtered, len(filtered), rejected_count, non_english_count
-
-
 # ---------------------------------------------------------------------------
 # Reaction count extraction & post filtering
 # ---------------------------------------------------------------------------
@@ -347,63 +281,3 @@ def enrich_profiles_with_engagement(
             profile["scraped_at"] = sa.isoformat() if sa else None
 
     return profiles
-
-
-# ---------------------------------------------------------------------------
-# Location filter
-# ---------------------------------------------------------------------------
-
-def filter_by_location(profiles: list[dict], allowed_countries: list[str]) -> list[dict]:
-    """Filter profiles by country."""
-    allowed_normalized = [c.lower() for c in allowed_countries]
-    return [
-        p for p in profiles
-        if (p.get("addressCountryOnly") or "").lower() in allowed_normalized
-    ]
-
-
-# ---------------------------------------------------------------------------
-# Profile completeness filter
-# ---------------------------------------------------------------------------
-
-def is_profile_complete(lead: dict) -> dict:
-    """Check if a LinkedIn profile has enough data to evaluate."""
-    missing_fields = []
-
-    headline = (lead.get("headline") or "").strip().lower()
-    if not headline or headline in EMPTY_HEADLINE_INDICATORS:
-        missing_fields.append("headline")
-
-    if not (lead.get("jobTitle") or lead.get("job_title")):
-        missing_fields.append("jobTitle")
-
-    if not (lead.get("companyName") or lead.get("company")):
-        missing_fields.append("companyName")
-
-    exp_count = lead.get("experiencesCount", 0)
-    experiences = lead.get("experiences", [])
-    if exp_count == 0 and len(experiences) == 0:
-        missing_fields.append("experiences")
-
-    has_headline = "headline" not in missing_fields
-    has_job_info = "jobTitle" not in missing_fields and "companyName" not in missing_fields
-    has_experience = "experiences" not in missing_fields
-
-    is_complete = has_job_info or (has_headline and has_experience)
-
-    return {
-        "complete": is_complete,
-        "reason": "sufficient data" if is_complete else f"missing: {', '.join(missing_fields)}",
-        "missing_fields": missing_fields,
-    }
-
-
-def filter_complete_profiles(leads: list[dict]) -> list[dict]:
-    """Filter out leads with incomplete profiles."""
-    complete = []
-    for lead in leads:
-        result = is_profile_complete(lead)
-        if result["complete"]:
-            complete.append(lead)
-    logger.info(f"Profile completeness: {len(leads)} → {len(complete)} leads")
-    return complete
@@ -0,0 +1,167 @@
+"""Tier-1 ICP re-qualification shared by the gift-leads flows.
+
+DB-pool leads are re-checked against the prospect's ICP with DeepSeek
+(``check_icp_match(strict=True)``). Checks run concurrently, stop as soon
+as enough leads have qualified (outstanding calls are cancelled), and
+verdicts are cached per (lead, ICP criteria) so a repeat click on the
+same prospect doesn't pay for the same checks again.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from app.config import settings
+from app.services.gift_pipeline import deepseek_calls
+from app.services.gift_pipeline.cost_tracker import CostTracker
+from app.services.gift_pipeline.filters import normalize_linkedin_url
+
+logger = logging.getLogger(__name__)
+
+_VERDICT_CACHE_MAX = 5000
+
+# (lead key, normalized criteria) -> (verdict, cached_at)
+_verdicts: OrderedDict[tuple[str, str], tuple[dict, float]] = OrderedDict()
+
+
+@dataclass
+class RequalifyResult:
+    """Outcome of a re-qualification run; ``qualified`` keeps input order."""
+
+    qualified: list[dict] = field(default_factory=list)
+    rejected: list[str] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+    checked: int = 0
+    cache_hits: int = 0
+    skipped: int = 0  # Not checked because enough leads had already qualified
+
+
+def _lead_name(lead: dict) -> str:
+    return lead.get("full_name") or lead.get("fullName") or "Unknown"
+
+
+def _cache_key(lead: dict, icp_criteria: str) -> tuple[str, str] | None:
+    url = lead.get("linkedin_url") or lead.get("linkedinUrl")
+    if not url:
+        return None
+    return normalize_linkedin_url(url), " ".join(icp_criteria.lower().split())
+
+
+def _cached_verdict(key: tuple[str, str] | None) -> dict | None:
+    if key is None or key not in _verdicts:
+        return None
+    verdict, cached_at = _verdicts[key]
+    if time.monotonic() - cached_at > settings.icp_verdict_cache_ttl_seconds:
+        del _verdicts[key]
+        return None
+    _verdicts.move_to_end(key)
+    return verdict
+
+
+def _store_verdict(key: tuple[str, str] | None, verdict: dict) -> None:
+    # Error verdicts (DeepSeek down, bad JSON) are worth retrying next time
+    if key is None or verdict.get("confidence") == "error":
+        return
+    _verdicts[key] = (verdict, time.monotonic())
+    _verdicts.move_to_end(key)
+    while len(_verdicts) > _VERDICT_CACHE_MAX:
+        _verdicts.popitem(last=False)
+
+
+def clear_verdict_cache() -> None:
+    _verdicts.clear()
+
+
+async def requalify_leads(
+    leads: list[dict],
+    icp_criteria: str,
+    *,
+    stop_after: int | None = None,
+    keep_on_error: bool = False,
+    cost_tracker: CostTracker | None = None,
+) -> RequalifyResult:
+    """Re-check leads against an ICP concurrently.
+
+    Each lead gets ``icp_reason`` / ``icp_confidence`` set from its verdict.
+
+    Args:
+        leads: Candidate leads, best first.
+        icp_criteria: Target niche passed to check_icp_match.
+        stop_after: Stop once this many leads have qualified; checks still
+            running are cancelled and the rest are skipped.
+        keep_on_error: Treat a lead whose check raised as qualified
+            (benefit of the doubt) instead of dropping it.
+        cost_tracker: Tracker to charge the DeepSeek calls to.
+
+    Returns:
+        RequalifyResult with qualified leads in their original order.
+    """
+    cost_tracker = cost_tracker or CostTracker()
+    result = RequalifyResult()
+    verdicts: dict[int, bool] = {}
+    semaphore = asyncio.Semaphore(settings.icp_requalify_concurrency)
+
+    def enough() -> bool:
+        return stop_after is not None and sum(verdicts.values()) >= stop_after
+
+    def record(index: int, verdict: dict) -> None:
+        lead = leads[index]
+        lead["icp_reason"] = verdict.get("reason", "")
+        lead["icp_confidence"] = verdict.get("confidence", "")
+        is_match = bool(verdict.get("match", keep_on_error))
+        verdicts[index] = is_match
+        if not is_match:
+            result.rejected.append(_lead_name(lead))
+
+    async def check(index: int) -> None:
+        lead = leads[index]
+        async with semaphore:
+            if enough():
+                return
+            key = _cache_key(lead, icp_criteria)
+            try:
+                verdict = await deepseek_calls.check_icp_match(
+                    lead, cost_tracker, icp_criteria, strict=True,
+                )
+            except Exception as e:
+                logger.error(f"ICP re-qualification FAILED for {_lead_name(lead)}: {e}")
+                lead["icp_reason"] = f"Error: {e}"
+                result.errors.append(_lead_name(lead))
+                verdicts[index] = keep_on_error
+                return
+            result.checked += 1
+            _store_verdict(key, verdict)
+            record(index, verdict)
+            logger.info(
+                f"ICP check [{_lead_name(lead)}]: match={verdicts[index]}, "
+                f"confidence={verdict.get('confidence', '?')}, "
+                f"reason={verdict.get('reason', 'none')}"
+            )
+
+    pending_indexes = []
+    for index, lead in enumerate(leads):
+        verdict = _cached_verdict(_cache_key(lead, icp_criteria))
+        if verdict is not None:
+            result.cache_hits += 1
+            record(index, verdict)
+        else:
+            pending_indexes.append(index)
+
+    tasks = [asyncio.create_task(check(index)) for index in pending_indexes if not enough()]
+    try:
+        for finished in asyncio.as_completed(tasks):
+            await finished
+            if enough():
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    result.qualified = [leads[i] for i in sorted(verdicts) if verdicts[i]]
+    result.skipped = len(leads) - len(verdicts)
+    if stop_after is not None:
+        result.qualified = result.qualified[:stop_after]
+    return result
@@ -19,6 +19,7 @@ from app.services.gift_pipeline.apify_actors import (
     scrape_post_engagers,
     search_google,
 )
+from app.services.gift_pipeline.checkpoints import PipelineCheckpoint
 from app.services.gift_pipeline.constants import (
     DEFAULT_COUNTRIES,
     DEFAULT_DAYS_BACK,
@@ -27,8 +28,8 @@ from app.services.gift_pipeline.constants import (
     DEFAULT_MIN_REACTIONS,
     PROFILE_BATCH_SIZE,
 )
-from app.services.gift_pipeline.cost_tracker import CostTracker
 from app.services.gift_pipeline.deepseek_calls import (
+    _fallback_research,
     generate_search_queries,
     generate_signal_notes,
     qualify_leads_with_deepseek,
@@ -52,6 +53,10 @@ logger = logging.getLogger(__name__)
 
 # Type alias for Slack progress callback
 ProgressCallback = Callable[[str], Coroutine[Any, Any, None]]
+# Structured progress: {"message", "step", "step_index", "total_steps", "metrics"}
+EventCallback = Callable[[dict[str, Any]], Coroutine[Any, Any, None]]
+
+TOTAL_STEPS = 12
 
 
 async def _get_existing_profile_urls() -> set[str]:
@@ -151,9 +156,17 @@ async def run_gift_leads_pipeline_async(
     countries: list[str] | None = None,
     min_leads: int = DEFAULT_MIN_LEADS,
     max_leads: int = DEFAULT_MAX_LEADS,
+    skip_research: bool = False,
+    dry_run: bool = False,
+    checkpoint: PipelineCheckpoint | None = None,
+    pipeline_run_id: uuid.UUID | None = None,
+    on_event: EventCallback | None = None,
 ) -> dict[str, Any]:
     """Main async 12-step gift leads pipeline.
 
+    Every completed step is checkpointed into a ``gift_leads`` PipelineRun,
+    so an interrupted run can be picked up with resume_gift_leads_pipeline().
+
     Args:
         prospect_url: LinkedIn profile URL of the prospect.
         prospect_name: Display name for Slack updates.
@@ -165,18 +178,110 @@ async def run_gift_leads_pipeline_async(
         countries: Allowed countries for leads.
         min_leads: Target minimum leads (triggers early-stop).
         max_leads: Maximum leads to return.
+        skip_research: Use user_icp/user_pain_points as-is instead of researching
+            the prospect's business (requires user_icp).
+        dry_run: Don't sync scraped profiles into the Prospect pool.
+        checkpoint: Existing checkpoint to resume from (None starts a new run).
+        pipeline_run_id: PipelineRun queued by the pipeline executor to record into.
+        on_event: Async callback for structured progress events; used instead
+            of ``progress`` when given.
 
     Returns:
-        Dict with pipeline results, leads, and metadata.
+        Dict with pipeline results, leads, and metadata (including run_id).
     """
     if countries is None:
         countries = DEFAULT_COUNTRIES
 
-    cost_tracker = CostTracker()
-    start_time = time.time()
+    if checkpoint is None:
+        checkpoint = await PipelineCheckpoint.create(
+            prospect_url,
+            prospect_name,
+            params={
+                "prospect_url": prospect_url,
+                "prospect_name": prospect_name,
+                "user_icp": user_icp,
+                "user_pain_points": user_pain_points,
+                "days_back": days_back,
+                "min_reactions": min_reactions,
+                "countries": countries,
+                "min_leads": min_leads,
+                "max_leads": max_leads,
+                "skip_research": skip_research,
+                "dry_run": dry_run,
+            },
+            run_id=pipeline_run_id,
+        )
+    try:
+        return await _run_steps(
+            checkpoint, prospect_url, prospect_name, progress, on_event, user_icp, user_pain_points,
+            days_back, min_reactions, countries, min_leads, max_leads, skip_research, dry_run,
+        )
+    except Exception as e:
+        logger.error(f"Gift pipeline run {checkpoint.run_id} failed: {e}", exc_info=True)
+        await checkpoint.finish("failed", error_message=str(e))
+        raise
 
-    async def _progress(msg: str) -> None:
-        if progress:
+
+async def resume_gift_leads_pipeline(
+    run_id: uuid.UUID,
+    progress: ProgressCallback | None = None,
+    on_event: EventCallback | None = None,
+) -> dict[str, Any] | None:
+    """Resume an interrupted or failed gift leads run from its last completed step.
+
+    Returns the pipeline result, or None if the run doesn't exist or isn't resumable.
+    """
+    checkpoint = await PipelineCheckpoint.load(run_id)
+    if checkpoint is None:
+        return None
+
+    params = dict(checkpoint.params)
+    if not params.get("prospect_url"):
+        return None
+
+    logger.info(
+        f"Resuming gift pipeline run {run_id} after step "
+        f"{checkpoint.last_completed_step or '(none)'}"
+    )
+    return await run_gift_leads_pipeline_async(
+        **params, progress=progress, on_event=on_event, checkpoint=checkpoint,
+    )
+
+
+async def _run_steps(
+    checkpoint: PipelineCheckpoint,
+    prospect_url: str,
+    prospect_name: str,
+    progress: ProgressCallback | None,
+    on_event: EventCallback | None,
+    user_icp: str | None,
+    user_pain_points: str | None,
+    days_back: int,
+    min_reactions: int,
+    countries: list[str],
+    min_leads: int,
+    max_leads: int,
+    skip_research: bool,
+    dry_run: bool,
+) -> dict[str, Any]:
+    """Run (or resume) the 12 pipeline steps, checkpointing after each."""
+    cost_tracker = checkpoint.cost_tracker()
+    start_time = time.time()
+    run_id = str(checkpoint.run_id)
+    current_step: dict[str, Any] = {"step": checkpoint.last_completed_step, "index": 0}
+
+    async def _progress(msg: str, step: str | None = None, index: int | None = None) -> None:
+        if step:
+            current_step["step"], current_step["index"] = step, index
+        if on_event:
+            await on_event({
+                "message": msg,
+                "step": current_step["step"],
+                "step_index": current_step["index"],
+                "total_steps": TOTAL_STEPS,
+                "metrics": {k: v for k, v in metrics.items() if isinstance(v, int)},
+            })
+        elif progress:
             await progress(msg)
         logger.info(f"[gift-pipeline] {msg}")
 
@@ -194,210 +299,292 @@ async def run_gift_leads_pipeline_async(
         "icp_qualified": 0,
         "final_leads": 0,
     }
+    metrics.update(checkpoint.get("_metrics", {}))
+
+    async def _stop(error: str, message: str) -> dict[str, Any]:
+        await _progress(message)
+        await checkpoint.finish("completed", cost_tracker, error_message=error)
+        return {"error": error, "leads": [], "metrics": metrics, "run_id": run_id}
+
+    async def _save(step: str, data: Any, **run_fields: Any) -> None:
+        checkpoint.state["_metrics"] = metrics
+        await checkpoint.save(step, data, cost_tracker, **run_fields)
+
+    if checkpoint.has("result"):
+        return checkpoint.get("result")
+
+    if checkpoint.last_completed_step:
+        await _progress(f"Resuming run after step '{checkpoint.last_completed_step}'...")
 
     # ── Step 1: Scrape prospect profile ──
-    await _progress("Step 1/12: Scraping prospect profile...")
-    from app.services.gift_pipeline.apify_actors import scrape_linkedin_profiles as scrape_profiles
-    existing_urls = await _get_existing_profile_urls()
+    if checkpoint.has("prospect_profile"):
+        prospect_profile = checkpoint.get("prospect_profile")
+    else:
+        await _progress("Step 1/12: Scraping prospect profile...", step="prospect_profile", index=1)
+        from app.services.gift_pipeline.apify_actors import scrape_linkedin_profiles as scrape_profiles
+        existing_urls = await _get_existing_profile_urls()
 
-    prospect_profiles = await scrape_profiles(
-        [prospect_url], existing_urls, cost_tracker,
-        wait_seconds=60, poll_interval=15,
-    )
+        prospect_profiles = await scrape_profiles(
+            [prospect_url], existing_urls, cost_tracker,
+            wait_seconds=60, poll_interval=15,
+        )
 
-    if not prospect_profiles:
-        # Try DB fallback for prospect profile
-        async with async_session_factory() as session:
-            result = await session.execute(
-                select(Prospect).where(
-                    Prospect.linkedin_url == normalize_linkedin_url(prospect_url)
+        if not prospect_profiles:
+            # Try DB fallback for prospect profile
+            async with async_session_factory() as session:
+                result = await session.execute(
+                    select(Prospect).where(
+                        Prospect.linkedin_url == normalize_linkedin_url(prospect_url)
+                    )
                 )
-            )
-            db_prospect = result.scalar_one_or_none()
-            if db_prospect:
-                prospect_profile = {
-                    "fullName": db_prospect.full_name,
-                    "headline": db_prospect.headline,
-                    "jobTitle": db_prospect.job_title,
-                    "companyName": db_prospect.company_name,
-                    "companyIndustry": db_prospect.company_industry,
-                }
-            else:
-                await _progress("Could not scrape prospect profile. Pipeline stopped.")
-                return {"error": "Could not scrape prospect profile", "leads": [], "metrics": metrics}
-    else:
-        prospect_profile = prospect_profiles[0]
+                db_prospect = result.scalar_one_or_none()
+                if db_prospect:
+                    prospect_profile = {
+                        "fullName": db_prospect.full_name,
+                        "headline": db_prospect.headline,
+                        "jobTitle": db_prospect.job_title,
+                        "companyName": db_prospect.company_name,
+                        "companyIndustry": db_prospect.company_industry,
+                    }
+                else:
+                    return await _stop(
+                        "Could not scrape prospect profile",
+                        "Could not scrape prospect profile. Pipeline stopped.",
+                    )
+        else:
+            prospect_profile = prospect_profiles[0]
+        await _save("prospect_profile", prospect_profile)
 
     # ── Step 2: Research prospect's business ──
-    await _progress("Step 2/12: Researching prospect's business...")
-    research = await research_prospect_business(
-        prospect_profile, cost_tracker, user_icp, user_pain_points,
-    )
+    if checkpoint.has("research"):
+        research = checkpoint.get("research")
+        icp_description = research.get("icp_description", "")
+    else:
+        await _progress("Step 2/12: Researching prospect's business...", step="research", index=2)
+        if skip_research and user_icp:
+            research = _fallback_research(prospect_profile, user_icp, user_pain_points)
+        else:
+            research = await research_prospect_business(
+                prospect_profile, cost_tracker, user_icp, user_pain_points,
+            )
 
-    icp_description = research.get("icp_description", "")
-    metrics["icp_description"] = icp_description
-    await _progress(f"ICP: {icp_description[:100]}...")
+        icp_description = research.get("icp_description", "")
+        metrics["icp_description"] = icp_description
+        await _progress(f"ICP: {icp_description[:100]}...")
+        await _save("research", research, icp_description=icp_description)
 
     # ── Step 3: Generate search queries ──
-    await _progress("Step 3/12: Generating search queries...")
-    queries = await generate_search_queries(
-        research, cost_tracker, days_back, prospect_profile,
-    )
-    metrics["queries_generated"] = len(queries)
-    await _progress(f"Generated {len(queries)} search queries")
+    if checkpoint.has("queries"):
+        queries = checkpoint.get("queries")
+    else:
+        await _progress("Step 3/12: Generating search queries...", step="queries", index=3)
+        queries = await generate_search_queries(
+            research, cost_tracker, days_back, prospect_profile,
+        )
+        metrics["queries_generated"] = len(queries)
+        await _progress(f"Generated {len(queries)} search queries")
 
-    if not queries:
-        await _progress("No queries generated. Pipeline stopped.")
-        return {"error": "No queries generated", "leads": [], "metrics": metrics}
+        if not queries:
+            return await _stop("No queries generated", "No queries generated. Pipeline stopped.")
+        await _save("queries", queries, queries_generated=len(queries))
 
     # ── Step 4: Search Google for LinkedIn posts ──
-    await _progress("Step 4/12: Searching Google for LinkedIn posts...")
-    all_search_results: list[dict] = []
-    for i, query in enumerate(queries, 1):
-        try:
-            results = await search_google(query, cost_tracker)
-            all_search_results.extend(results)
-        except Exception as e:
-            logger.error(f"Google search error for query {i}: {e}")
-
-    metrics["posts_found"] = len(all_search_results)
-    await _progress(f"Found {len(all_search_results)} search results")
-
-    if not all_search_results:
-        await _progress("No posts found. Pipeline stopped.")
-        return {"error": "No posts found", "leads": [], "metrics": metrics}
+    if checkpoint.has("search_results"):
+        all_search_results = checkpoint.get("search_results")
+    else:
+        await _progress("Step 4/12: Searching Google for LinkedIn posts...", step="search_results", index=4)
+        all_search_results = []
+        for i, query in enumerate(queries, 1):
+            try:
+                results = await search_google(query, cost_tracker)
+                all_search_results.extend(results)
+            except Exception as e:
+                logger.error(f"Google search error for query {i}: {e}")
+
+        metrics["posts_found"] = len(all_search_results)
+        await _progress(f"Found {len(all_search_results)} search results")
+
+        if not all_search_results:
+            return await _stop("No posts found", "No posts found. Pipeline stopped.")
+        await _save("search_results", all_search_results, posts_found=len(all_search_results))
 
     # ── Step 5: Filter posts by reactions ──
-    await _progress("Step 5/12: Filtering posts by reactions...")
-    posts: list[dict] = []
-    for result in all_search_results:
-        if "organicResults" in result:
-            organic = result["organicResults"]
-            if isinstance(organic, list):
-                posts.extend(organic)
+    if checkpoint.has("filtered_posts"):
+        filtered_posts = checkpoint.get("filtered_posts")
+    else:
+        await _progress("Step 5/12: Filtering posts by reactions...", step="filtered_posts", index=5)
+        posts: list[dict] = []
+        for result in all_search_results:
+            if "organicResults" in result:
+                organic = result["organicResults"]
+                if isinstance(organic, list):
+                    posts.extend(organic)
+                else:
+                    posts.append(organic)
             else:
-                posts.append(organic)
-        else:
-            posts.append(result)
+                posts.append(result)
 
-    filtered_posts = filter_posts_by_reactions(posts, min_reactions)
-    metrics["posts_filtered"] = len(filtered_posts)
-    await _progress(f"{len(filtered_posts)} posts with {min_reactions}+ reactions")
+        filtered_posts = filter_posts_by_reactions(posts, min_reactions)
+        metrics["posts_filtered"] = len(filtered_posts)
+        await _progress(f"{len(filtered_posts)} posts with {min_reactions}+ reactions")
 
-    if not filtered_posts:
-        await _progress("No posts meet reaction threshold. Pipeline stopped.")
-        return {"error": "No posts with enough reactions", "leads": [], "metrics": metrics}
+        if not filtered_posts:
+            return await _stop(
+                "No posts with enough reactions",
+                "No posts meet reaction threshold. Pipeline stopped.",
+            )
+        await _save("filtered_posts", filtered_posts)
 
     # ── Step 6: Scrape post engagers ──
-    await _progress("Step 6/12: Scraping post engagers...")
-    post_urls = [
-        p.get("url", p.get("link", ""))
-        for p in filtered_posts
-        if p.get("url") or p.get("link")
-    ]
-    engagers = await scrape_post_engagers(post_urls, cost_tracker)
-    metrics["engagers_found"] = len(engagers)
-    await _progress(f"{len(engagers)} engagers found")
-
-    if not engagers:
-        await _progress("No engagers found. Pipeline stopped.")
-        return {"error": "No engagers found", "leads": [], "metrics": metrics}
+    if checkpoint.has("engagers"):
+        engagers = checkpoint.get("engagers")
+    else:
+        await _progress("Step 6/12: Scraping post engagers...", step="engagers", index=6)
+        post_urls = [
+            p.get("url", p.get("link", ""))
+            for p in filtered_posts
+            if p.get("url") or p.get("link")
+        ]
+        engagers = await scrape_post_engagers(post_urls, cost_tracker)
+        metrics["engagers_found"] = len(engagers)
+        await _progress(f"{len(engagers)} engagers found")
+
+        if not engagers:
+            return await _stop("No engagers found", "No engagers found. Pipeline stopped.")
+        await _save("engagers", engagers, engagers_found=len(engagers))
 
     # Build engagement context
     engagement_context = build_engagement_context(engagers)
 
-    # ── Step 7: Pre-filter by headline ──
-    await _progress("Step 7/12: Pre-filtering by headline...")
+    # ── Step 7: Pre-filter by headline (cheap — recomputed on resume) ──
+    await _progress("Step 7/12: Pre-filtering by headline...", step="prefilter", index=7)
     engagers, kept, rejected, non_english = prefilter_engagers_by_headline(engagers)
     metrics["prefilter_kept"] = kept
     await _progress(f"{kept} passed headline filter ({rejected} rejected, {non_english} non-English)")
 
     if not engagers:
-        await _progress("All engagers filtered out. Pipeline stopped.")
-        return {"error": "All engagers filtered by headline", "leads": [], "metrics": metrics}
+        return await _stop(
+            "All engagers filtered by headline",
+            "All engagers filtered out. Pipeline stopped.",
+        )
 
     # ── Steps 8-10: Batched scrape → filter → qualify (early-stop) ──
-    await _progress("Steps 8-10/12: Scraping profiles & qualifying...")
     profile_urls = aggregate_profile_urls(engagers)
     profile_urls = deduplicate_profile_urls(profile_urls)
-    await _progress(f"{len(profile_urls)} unique profile URLs")
 
-    existing_urls = await _get_existing_profile_urls()
-    qualified: list[dict] = []
-    all_scraped: list[dict] = []
-    total_scraped = 0
-    total_location_filtered = 0
+    batch_state = checkpoint.get("profile_batches") or {
+        "next_batch": 0,
+        "scraped": [],
+        "qualified": [],
+        "total_scraped": 0,
+        "total_location_filtered": 0,
+        "done": False,
+    }
+    qualified: list[dict] = batch_state["qualified"]
+    all_scraped: list[dict] = batch_state["scraped"]
+    total_scraped: int = batch_state["total_scraped"]
+    total_location_filtered: int = batch_state["total_location_filtered"]
 
     num_batches = (len(profile_urls) + PROFILE_BATCH_SIZE - 1) // PROFILE_BATCH_SIZE
-    for batch_idx in range(num_batches):
-        batch_start = batch_idx * PROFILE_BATCH_SIZE
-        batch_end = min(batch_start + PROFILE_BATCH_SIZE, len(profile_urls))
-        batch_urls = profile_urls[batch_start:batch_end]
+    if not batch_state["done"]:
+        await _progress("Steps 8-10/12: Scraping profiles & qualifying...", step="profile_batches", index=8)
+        await _progress(f"{len(profile_urls)} unique profile URLs")
+        existing_urls = await _get_existing_profile_urls()
 
-        await _progress(f"Batch {batch_idx + 1}/{num_batches}: scraping {len(batch_urls)} profiles...")
+        for batch_idx in range(batch_state["next_batch"], num_batches):
+            batch_start = batch_idx * PROFILE_BATCH_SIZE
+            batch_end = min(batch_start + PROFILE_BATCH_SIZE, len(profile_urls))
+            batch_urls = profile_urls[batch_start:batch_end]
 
-        profiles = await scrape_linkedin_profiles(
-            batch_urls, existing_urls, cost_tracker,
-            wait_seconds=120, poll_interval=30,
-        )
-        total_scraped += len(profiles)
+            await _progress(f"Batch {batch_idx + 1}/{num_batches}: scraping {len(batch_urls)} profiles...")
 
-        profiles = enrich_profiles_with_engagement(profiles, engagement_context)
-        all_scraped.extend(profiles)
+            profiles = await scrape_linkedin_profiles(
+                batch_urls, existing_urls, cost_tracker,
+                wait_seconds=120, poll_interval=30,
+            )
+            total_scraped += len(profiles)
 
-        location_filtered = filter_by_location(profiles, countries)
-        total_location_filtered += len(location_filtered)
+            profiles = enrich_profiles_with_engagement(profiles, engagement_context)
+            all_scraped.extend(profiles)
 
-        complete = filter_complete_profiles(location_filtered)
+            location_filtered = filter_by_location(profiles, countries)
+            total_location_filtered += len(location_filtered)
 
-        if complete:
-            batch_qualified = await qualify_leads_with_deepseek(
-                complete, cost_tracker, icp_criteria=icp_description,
-            )
-            qualified.extend(batch_qualified)
-            await _progress(
-                f"Batch {batch_idx + 1}: {len(batch_qualified)} qualified "
-                f"({len(qualified)} total)"
-            )
+            complete = filter_complete_profiles(location_filtered)
+
+            if complete:
+                batch_qualified = await qualify_leads_with_deepseek(
+                    complete, cost_tracker, icp_criteria=icp_description,
+                )
+                qualified.extend(batch_qualified)
+                await _progress(
+                    f"Batch {batch_idx + 1}: {len(batch_qualified)} qualified "
+                    f"({len(qualified)} total)"
+                )
 
-        # Early-stop check
-        if len(qualified) >= min_leads:
-            remaining = len(profile_urls) - batch_end
-            await _progress(
-                f"Early stop: {len(qualified)} leads >= {min_leads} target. "
-                f"Skipped {remaining} profiles."
+            # Early-stop check
+            early_stop = len(qualified) >= min_leads
+            batch_state.update({
+                "next_batch": batch_idx + 1,
+                "total_scraped": total_scraped,
+                "total_location_filtered": total_location_filtered,
+                "done": early_stop or batch_idx + 1 >= num_batches,
+            })
+            await _save(
+                "profile_batches", batch_state,
+                profiles_scraped=total_scraped, location_filtered=total_location_filtered,
             )
-            break
+
+            if early_stop:
+                remaining = len(profile_urls) - batch_end
+                await _progress(
+                    f"Early stop: {len(qualified)} leads >= {min_leads} target. "
+                    f"Skipped {remaining} profiles."
+                )
+                break
 
     metrics["profiles_scraped"] = total_scraped
     metrics["location_filtered"] = total_location_filtered
     metrics["icp_qualified"] = len(qualified)
 
     # ── Sync all scraped profiles to DB ──
-    await _progress("Syncing profiles to DB...")
-    icp_urls = {
-        normalize_linkedin_url(q.get("linkedinUrl") or q.get("linkedin_url", ""))
-        for q in qualified
-    }
-    synced, _ = await _sync_profiles_to_db(all_scraped, icp_urls, icp_description)
-    await _progress(f"Synced {synced} profiles to DB")
-
-    if not qualified:
-        await _progress("No leads passed ICP qualification. Pipeline stopped.")
-        return {"error": "No ICP-qualified leads", "leads": [], "metrics": metrics}
+    if not checkpoint.has("qualified"):
+        icp_urls = {
+            normalize_linkedin_url(q.get("linkedinUrl") or q.get("linkedin_url", ""))
+            for q in qualified
+        }
+        if dry_run:
+            await _progress(f"Dry run: not syncing {len(all_scraped)} profiles to DB")
+        else:
+            await _progress("Syncing profiles to DB...")
+            synced, _ = await _sync_profiles_to_db(all_scraped, icp_urls, icp_description)
+            await _progress(f"Synced {synced} profiles to DB")
+
+        if not qualified:
+            return await _stop(
+                "No ICP-qualified leads",
+                "No leads passed ICP qualification. Pipeline stopped.",
+            )
 
-    # Cap at max_leads (sort by confidence)
-    if len(qualified) > max_leads:
-        confidence_order = {"high": 0, "medium": 1, "low": 2, "local": 3, "error": 4}
-        qualified.sort(key=lambda x: confidence_order.get(x.get("icp_confidence", "low"), 3))
-        qualified = qualified[:max_leads]
+        # Cap at max_leads (sort by confidence)
+        if len(qualified) > max_leads:
+            confidence_order = {"high": 0, "medium": 1, "low": 2, "local": 3, "error": 4}
+            qualified.sort(key=lambda x: confidence_order.get(x.get("icp_confidence", "low"), 3))
+            qualified = qualified[:max_leads]
+        await _save("qualified", qualified, icp_qualified=len(qualified))
+    else:
+        qualified = checkpoint.get("qualified")
 
     # ── Step 11: Generate signal notes ──
-    await _progress("Step 11/12: Generating signal notes...")
-    qualified = await generate_signal_notes(qualified, icp_description, cost_tracker)
+    if checkpoint.has("signal_notes"):
+        qualified = checkpoint.get("signal_notes")
+    else:
+        await _progress("Step 11/12: Generating signal notes...", step="signal_notes", index=11)
+        qualified = await generate_signal_notes(qualified, icp_description, cost_tracker)
+        await _save("signal_notes", qualified)
 
     # ── Step 12: Format results ──
-    await _progress("Step 12/12: Formatting results...")
+    await _progress("Step 12/12: Formatting results...", step="result", index=12)
     leads = []
     for lead in qualified:
         leads.append({
@@ -422,10 +609,14 @@ async def run_gift_leads_pipeline_async(
         f"(cost: ${cost_tracker.get_total():.2f})"
     )
 
-    return {
+    result = {
         "leads": leads,
         "metrics": metrics,
         "cost_summary": cost_tracker.get_summary(),
         "cost_total": cost_tracker.get_total(),
         "duration_seconds": int(elapsed),
+        "run_id": run_id,
     }
+    await _save("result", result)
+    await checkpoint.finish("completed", cost_tracker, final_leads=len(leads))
+    return result
@@ -1,4 +1,8 @@
-"""Google Sheets service for creating shareable gift leads spreadsheets."""
+"""Google Sheets service for creating shareable gift leads spreadsheets.
+
+The Drive client is synchronous; async code should call
+``create_gift_leads_sheet_async``, which runs it on the blocking-I/O pool.
+"""
 
 import csv
 import io
@@ -13,6 +17,7 @@ from googleapiclient.discovery import build
 from googleapiclient.http import MediaInMemoryUpload
 
 from app.config import settings
+from app.services.blocking_io import run_blocking
 
 logger = logging.getLogger(__name__)
 
@@ -146,3 +151,24 @@ def get_google_sheets_service() -> GoogleSheetsService | None:
     except GoogleSheetsError as e:
         logger.warning(f"Google Sheets not configured - {e}")
         return None
+
+
+async def create_gift_leads_sheet_async(
+    prospect_name: str,
+    leads: list[dict],
+) -> str | None:
+    """Create a gift leads sheet without blocking the event loop.
+
+    Both the (first-use) OAuth refresh and the Drive upload/share run on the
+    blocking-I/O pool.
+
+    Returns:
+        The sheet URL, or None if Google Sheets isn't configured.
+
+    Raises:
+        GoogleSheetsError: If creation fails.
+    """
+    sheets_svc = await run_blocking(get_google_sheets_service)
+    if sheets_svc is None:
+        return None
+    return await run_blocking(sheets_svc.create_gift_leads_sheet, prospect_name, leads)
@@ -1,14 +1,30 @@
-"""HeyReach API client for sending LinkedIn messages."""
+"""HeyReach API client for sending LinkedIn messages.
 
+All HeyReach calls go through the shared HeyReachClient (one pooled
+httpx.AsyncClient), which rate limits requests and retries 429/5xx
+responses with exponential backoff. Non-idempotent calls (SendMessage) are
+only retried when HeyReach cannot have acted on them: a 429 or a
+connection that never got established.
+"""
+
+import asyncio
 import logging
+import random
 from typing import Any
 
 import httpx
 
 from app.config import settings
+from app.services.rate_limit import TokenBucket
 
 logger = logging.getLogger(__name__)
 
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+MAX_BACKOFF_SECONDS = 30.0
+
+# Transport errors raised before the request reached HeyReach
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
 
 class HeyReachError(Exception):
     """Custom exception for HeyReach API errors."""
@@ -37,6 +53,58 @@ class HeyReachClient:
             },
             timeout=30.0,
         )
+        self._bucket = TokenBucket(settings.heyreach_requests_per_second, settings.heyreach_burst)
+        self._max_retries = settings.heyreach_max_retries
+
+    def _backoff(self, attempt: int, response: httpx.Response | None = None) -> float:
+        """Delay before retry ``attempt`` (0-based), honouring Retry-After."""
+        if response is not None:
+            try:
+                return min(float(response.headers["Retry-After"]), MAX_BACKOFF_SECONDS)
+            except (KeyError, ValueError):
+                pass
+        delay = settings.heyreach_backoff_seconds * (2 ** attempt)
+        return min(delay + random.uniform(0, settings.heyreach_backoff_seconds), MAX_BACKOFF_SECONDS)
+
+    async def _post(self, path: str, payload: dict[str, Any], *, idempotent: bool = True) -> httpx.Response:
+        """POST under the shared rate limit, retrying transient failures.
+
+        Args:
+            path: API path relative to BASE_URL.
+            payload: JSON body.
+            idempotent: Whether a 5xx or a dropped connection may be retried
+                (the request may already have been applied).
+
+        Returns:
+            The final response (possibly still an error status).
+        """
+        attempt = 0
+        while True:
+            await self._bucket.acquire()
+            last_attempt = attempt >= self._max_retries
+            try:
+                response = await self._client.post(path, json=payload)
+            except _NOT_SENT_ERRORS as e:
+                if last_attempt:
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(f"HeyReach {path} connection failed ({e}), retrying in {delay:.1f}s")
+            except httpx.TransportError as e:
+                if last_attempt or not idempotent:
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(f"HeyReach {path} transport error ({e}), retrying in {delay:.1f}s")
+            else:
+                status = response.status_code
+                retryable = status == 429 or (idempotent and status in RETRYABLE_STATUS_CODES)
+                if not retryable or last_attempt:
+                    return response
+                delay = self._backoff(attempt, response if status == 429 else None)
+                if status == 429:
+                    self._bucket.pause(delay)
+                logger.warning(f"HeyReach {path} returned {status}, retrying in {delay:.1f}s")
+            attempt += 1
+            await asyncio.sleep(delay)
 
     async def send_message(
         self,
@@ -58,14 +126,15 @@ class HeyReachClient:
             HeyReachError: If the API call fails.
         """
         try:
-            response = await self._client.post(
+            response = await self._post(
                 "/inbox/SendMessage",
-                json={
+                {
                     "message": message,
                     "subject": message,  # Often same as message for LinkedIn
                     "conversationId": conversation_id,
                     "linkedInAccountId": linkedin_account_id,
                 },
+                idempotent=False,
             )
 
             if response.status_code != 200:
@@ -142,9 +211,10 @@ class HeyReachClient:
             formatted_leads.append(formatted)
 
         try:
-            response = await self._client.post(
+            # Idempotent: leads already in the list come back as updatedCount
+            response = await self._post(
                 "/list/AddLeadsToListV2",
-                json={
+                {
                     "listId": list_id,
                     "leads": formatted_leads,
                 },
@@ -192,9 +262,9 @@ class HeyReachClient:
             HeyReachError: If the API call fails.
         """
         try:
-            response = await self._client.post(
+            response = await self._post(
                 "/list/RemoveLeadsFromList",
-                json={
+                {
                     "listId": list_id,
                     "profileUrls": [linkedin_url],
                 },
@@ -240,9 +310,9 @@ class HeyReachClient:
             HeyReachError: If the API call fails.
         """
         try:
-            response = await self._client.post(
+            response = await self._post(
                 "/campaign/StopLeadInCampaign",
-                json={
+                {
                     "campaignId": campaign_id,
                     "leadUrl": linkedin_url,
                 },
@@ -271,6 +341,49 @@ class HeyReachClient:
         except Exception as e:
             raise HeyReachError(f"HeyReach API error: {e}") from e
 
+    async def get_campaigns(self, offset: int = 0, limit: int = 50) -> dict[str, Any]:
+        """Fetch campaigns with their progress stats (campaign/GetAll).
+
+        Raises:
+            HeyReachError: If the API call fails.
+        """
+        return await self._post_json("/campaign/GetAll", {"offset": offset, "limit": limit}, "list campaigns")
+
+    async def get_overall_stats(
+        self,
+        campaign_ids: list[int],
+        account_ids: list[int],
+        start_date: str,
+        end_date: str,
+    ) -> dict[str, Any]:
+        """Fetch per-day sending stats (stats/GetOverallStats).
+
+        Raises:
+            HeyReachError: If the API call fails.
+        """
+        return await self._post_json(
+            "/stats/GetOverallStats",
+            {
+                "campaignIds": campaign_ids,
+                "accountIds": account_ids,
+                "startDate": start_date,
+                "endDate": end_date,
+            },
+            "fetch stats",
+        )
+
+    async def _post_json(self, path: str, payload: dict[str, Any], action: str) -> dict[str, Any]:
+        """POST a read-only request and return the parsed JSON body."""
+        try:
+            response = await self._post(path, payload)
+            if response.status_code != 200:
+                raise HeyReachError(f"Failed to {action}: {response.status_code} {response.text[:200]}")
+            return response.json()
+        except HeyReachError:
+            raise
+        except Exception as e:
+            raise HeyReachError(f"HeyReach API error: {e}") from e
+
     async def close(self):
         """Close the HTTP client."""
         await self._client.aclose()
@@ -286,3 +399,92 @@ def get_heyreach_client() -> HeyReachClient:
     if _client is None:
         _client = HeyReachClient()
     return _client
+
+
+async def upload_leads_to_list(
+    list_id: int,
+    leads: list[dict[str, Any]],
+    client: HeyReachClient | None = None,
+    chunk_size: int | None = None,
+) -> dict[str, int]:
+    """Upload leads to a list in concurrent chunks.
+
+    Leads are de-duplicated by profile URL, split into chunks of
+    ``heyreach_upload_chunk_size`` and sent ``heyreach_upload_concurrency`` at
+    a time (each chunk retried by the client). Re-uploading is safe: leads
+    already in the list are reported as updated, not added twice.
+
+    Args:
+        list_id: The HeyReach list ID.
+        leads: Lead dicts in add_leads_to_list format.
+        client: Client to use (defaults to the shared client).
+        chunk_size: Override the configured chunk size.
+
+    Returns:
+        Totals: added, updated, failed (leads HeyReach rejected) and
+        failed_chunks (chunks that errored after retries).
+    """
+    client = client or get_heyreach_client()
+    size = chunk_size or settings.heyreach_upload_chunk_size
+
+    unique: dict[str, dict[str, Any]] = {}
+    for lead in leads:
+        key = (lead.get("linkedin_url") or "").strip().rstrip("/").lower()
+        unique.setdefault(key or str(id(lead)), lead)
+    deduped = list(unique.values())
+    chunks = [deduped[i:i + size] for i in range(0, len(deduped), size)]
+
+    totals = {"added": 0, "updated": 0, "failed": 0, "failed_chunks": 0}
+    semaphore = asyncio.Semaphore(settings.heyreach_upload_concurrency)
+
+    async def _upload(index: int, chunk: list[dict[str, Any]]) -> None:
+        async with semaphore:
+            try:
+                result = await client.add_leads_to_list(list_id, chunk)
+            except HeyReachError as e:
+                totals["failed_chunks"] += 1
+                logger.error(f"HeyReach upload chunk {index + 1}/{len(chunks)} failed: {e}")
+                return
+        if isinstance(result, dict) and "addedCount" in result:
+            totals["added"] += result.get("addedCount", 0) or 0
+            totals["updated"] += result.get("updatedCount", 0) or 0
+            totals["failed"] += result.get("failedCount", 0) or 0
+        else:
+            totals["added"] += len(chunk)
+
+    await asyncio.gather(*(_upload(i, chunk) for i, chunk in enumerate(chunks)))
+
+    logger.info(
+        f"Uploaded {len(deduped)} leads to HeyReach list {list_id} in {len(chunks)} chunks: "
+        f"added={totals['added']}, updated={totals['updated']}, failed={totals['failed']}, "
+        f"failed_chunks={totals['failed_chunks']}"
+    )
+    return totals
+
+
+async def stop_and_remove_lead(
+    campaign_id: int,
+    list_id: int,
+    linkedin_url: str,
+    client: HeyReachClient | None = None,
+) -> dict[str, Any]:
+    """Stop a lead in a campaign and remove it from a list, concurrently.
+
+    Both calls are always attempted; the first failure is raised afterwards.
+
+    Returns:
+        {"stopped": <stop response>, "removed": <remove response>}
+
+    Raises:
+        HeyReachError: If either call fails.
+    """
+    client = client or get_heyreach_client()
+    stopped, removed = await asyncio.gather(
+        client.stop_lead_in_campaign(campaign_id=campaign_id, linkedin_url=linkedin_url),
+        client.remove_lead_from_list(list_id=list_id, linkedin_url=linkedin_url),
+        return_exceptions=True,
+    )
+    for outcome in (stopped, removed):
+        if isinstance(outcome, BaseException):
+            raise outcome
+    return {"stopped": stopped, "removed": removed}
@@ -0,0 +1,138 @@
+"""Deferred processing of Slack interactions.
+
+Slack expects an HTTP 200 within 3 seconds of a button click or modal
+submission. The /slack/interactions endpoint only verifies the signature,
+parses the payload and hands the work to an InteractionQueue, which:
+
+- runs jobs in the background, at most ``slack_interaction_concurrency`` at once;
+- serializes jobs that share a key (e.g. ``draft:<id>``), so an Approve and an
+  Edit submit on the same draft can never interleave;
+- drops a job whose dedupe key is already queued or running, so a
+  double-clicked Approve is only processed once;
+- posts immediate "working on it" feedback to the interaction's response_url.
+"""
+
+import asyncio
+import logging
+from collections import Counter
+from contextlib import nullcontext
+from typing import Awaitable, Callable
+
+from slack_sdk.webhook.async_client import AsyncWebhookClient
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+Job = Callable[[], Awaitable[None]]
+
+# response_url posts are best-effort; don't let a slow Slack hold a worker
+_FEEDBACK_TIMEOUT_SECONDS = 5
+
+
+class InteractionQueue:
+    """Background job queue with per-key serialization and de-duplication."""
+
+    def __init__(self, concurrency: int | None = None):
+        self._semaphore = asyncio.Semaphore(concurrency or settings.slack_interaction_concurrency)
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._lock_users: Counter[str] = Counter()
+        self._inflight: set[str] = set()
+        self._tasks: set[asyncio.Task] = set()
+        self.metrics: Counter[str] = Counter()
+
+    def submit(self, job: Job, *, key: str | None = None, dedupe_key: str | None = None) -> asyncio.Task | None:
+        """Queue a job.
+
+        Args:
+            job: Zero-argument coroutine function to run.
+            key: Jobs with the same key run one at a time, in submit order.
+            dedupe_key: If a job with this dedupe key is already queued or
+                running, the new job is dropped.
+
+        Returns:
+            The job's task, or None if it was dropped as a duplicate.
+        """
+        if dedupe_key is not None:
+            if dedupe_key in self._inflight:
+                self.metrics["deduplicated"] += 1
+                logger.info(f"Dropping duplicate Slack interaction {dedupe_key}")
+                return None
+            self._inflight.add(dedupe_key)
+
+        if key is not None:
+            self._lock_users[key] += 1
+            if key not in self._locks:
+                self._locks[key] = asyncio.Lock()
+
+        self.metrics["queued"] += 1
+        return self._spawn(self._run(job, key, dedupe_key))
+
+    def send_feedback(self, response_url: str, text: str) -> asyncio.Task | None:
+        """Post an ephemeral status message to the clicking user (fire-and-forget)."""
+        if not response_url:
+            return None
+        return self._spawn(self._post_feedback(response_url, text))
+
+    def _spawn(self, coro: Awaitable[None]) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _run(self, job: Job, key: str | None, dedupe_key: str | None) -> None:
+        lock = self._locks[key] if key is not None else nullcontext()
+        try:
+            async with lock:
+                async with self._semaphore:
+                    await job()
+            self.metrics["completed"] += 1
+        except Exception as e:
+            self.metrics["failed"] += 1
+            logger.error(f"Slack interaction job failed (key={key}): {e}", exc_info=True)
+        finally:
+            if dedupe_key is not None:
+                self._inflight.discard(dedupe_key)
+            if key is not None:
+                self._lock_users[key] -= 1
+                if self._lock_users[key] <= 0:
+                    del self._lock_users[key]
+                    self._locks.pop(key, None)
+
+    async def _post_feedback(self, response_url: str, text: str) -> None:
+        try:
+            client = AsyncWebhookClient(response_url, timeout=_FEEDBACK_TIMEOUT_SECONDS)
+            await client.send(text=text, response_type="ephemeral", replace_original=False)
+            self.metrics["feedback_sent"] += 1
+        except Exception as e:
+            self.metrics["feedback_failed"] += 1
+            logger.warning(f"Failed to post Slack interaction feedback: {e}")
+
+    async def join(self) -> None:
+        """Wait until every queued job and feedback post has finished."""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def stats(self) -> dict[str, int]:
+        """Queue counters plus current depth."""
+        return {
+            "queued": self.metrics["queued"],
+            "completed": self.metrics["completed"],
+            "failed": self.metrics["failed"],
+            "deduplicated": self.metrics["deduplicated"],
+            "feedback_sent": self.metrics["feedback_sent"],
+            "feedback_failed": self.metrics["feedback_failed"],
+            "pending": len(self._tasks),
+            "serialized_keys": len(self._locks),
+        }
+
+
+_queue: InteractionQueue | None = None
+
+
+def get_interaction_queue() -> InteractionQueue:
+    """Get or create the interaction queue singleton."""
+    global _queue
+    if _queue is None:
+        _queue = InteractionQueue()
+    return _queue
@@ -7,6 +7,7 @@ Falls back gracefully if the Anthropic API is unavailable.
 import json
 import logging
 from dataclasses import dataclass, field
+from decimal import Decimal
 
 import anthropic
 
@@ -16,11 +17,14 @@ from app.prompts.judge import (
     JUDGE_SYSTEM_PROMPT,
     build_judge_prompt,
 )
+from app.services.llm_usage import LLMUsage, cached_block, record_llm_cost
 
 logger = logging.getLogger(__name__)
 
 SCORE_THRESHOLD = 4.0
 MAX_REVISIONS = 1
+INPUT_PRICE = Decimal("0.000003")  # Sonnet, per uncached input token
+OUTPUT_PRICE = Decimal("0.000015")
 
 
 class JudgeError(Exception):
@@ -92,10 +96,12 @@ async def judge_draft(
             messages=[
                 {"role": "user", "content": user_prompt},
             ],
-            system=JUDGE_SYSTEM_PROMPT,
+            system=[cached_block(JUDGE_SYSTEM_PROMPT)],
         )
 
         raw_text = response.content[0].text.strip()
+        usage = LLMUsage.from_anthropic(response.usage)
+        record_llm_cost("anthropic", "judge", usage, usage.cost(INPUT_PRICE, OUTPUT_PRICE))
     except Exception as e:
         raise JudgeError(f"Anthropic API error: {e}") from e
 
@@ -14,6 +14,7 @@ before scraping new ones.
 """
 
 import logging
+import uuid
 from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Any
@@ -36,6 +37,8 @@ from app.services.prospect_pipeline import (
     upload_to_heyreach,
     _send_pipeline_summary,
 )
+from app.services.personalization import personalize_leads
+from app.services.profile_filters import filter_profiles
 
 logger = logging.getLogger(__name__)
 
@@ -100,10 +103,7 @@ async def _process_surplus_leads(
         })
 
     # Personalize
-    for lead_dict in leads_dicts:
-        lead_dict["personalized_message"] = await generate_personalization_deepseek(lead_dict)
-
-    personalized = [l for l in leads_dicts if l.get("personalized_message")]
+    personalized = await personalize_leads(leads_dicts, generate_personalization_deepseek)
 
     # Upload to HeyReach
     uploaded = await upload_to_heyreach(personalized, heyreach_list_id) if personalized else 0
@@ -226,6 +226,7 @@ async def run_lead_finder_pipeline(
     fetch_count: int = 100,
     heyreach_list_id: int = HEYREACH_LIST_ID,
     dry_run: bool = False,
+    pipeline_run_id: uuid.UUID | None = None,
 ) -> dict[str, Any]:
     """Run the lead finder pipeline.
 
@@ -234,6 +235,7 @@ async def run_lead_finder_pipeline(
     Only scrape new leads if surplus is insufficient.
 
     Scrapes 3x the needed amount so surplus is available for future runs.
+    When started by the pipeline executor, pipeline_run_id is its queued run.
     """
     from app.database import async_session_factory
 
@@ -243,9 +245,13 @@ async def run_lead_finder_pipeline(
         company_keywords = DEFAULT_COMPANY_KEYWORDS
 
     async with async_session_factory() as session:
-        # Create PipelineRun
-        pipeline_run = PipelineRun(run_type="lead_finder", status="started")
-        session.add(pipeline_run)
+        # Create PipelineRun (or adopt the executor's queued one)
+        pipeline_run = await session.get(PipelineRun, pipeline_run_id) if pipeline_run_id else None
+        if pipeline_run is None:
+            pipeline_run = PipelineRun(run_type="lead_finder")
+            session.add(pipeline_run)
+        pipeline_run.status = "started"
+        pipeline_run.started_at = datetime.now(timezone.utc)
         await session.commit()
         run_id = pipeline_run.id
 
@@ -312,6 +318,9 @@ async def run_lead_finder_pipeline(
             new_url_set = set(new_urls)
             leads = [l for l in leads if l["linkedinUrl"] in new_url_set]
 
+            # Drop non-English, hard-reject and incomplete profiles before paying for ICP checks
+            leads = filter_profiles(leads, reject_headlines=True)
+
             if not leads:
                 pipeline_run.status = "completed"
                 pipeline_run.completed_at = datetime.now(timezone.utc)
@@ -336,9 +345,7 @@ async def run_lead_finder_pipeline(
 
             # Step 4: Personalize (only immediate batch)
             logger.info(f"[4/5] Personalizing {len(to_personalize)} leads (storing {len(surplus_to_store)} as surplus)...")
-            for lead in to_personalize:
-                lead["personalized_message"] = await generate_personalization_deepseek(lead)
-            personalized = [l for l in to_personalize if l.get("personalized_message")]
+            personalized = await personalize_leads(to_personalize, generate_personalization_deepseek)
             counts["personalizations"] = len(personalized)
 
             # Step 5: Upload to HeyReach
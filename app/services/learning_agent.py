@@ -28,6 +28,7 @@ from app.models import (
     LearningType,
     QAGuideline,
 )
+from app.services.llm_usage import LLMUsage, cached_block, record_llm_cost
 
 logger = logging.getLogger(__name__)
 
@@ -107,11 +108,13 @@ SEED_GUIDELINES = [
 ]
 
 
+INPUT_PRICE = Decimal("0.000003")  # Sonnet, per uncached input token
+OUTPUT_PRICE = Decimal("0.000015")
+
+
 def _estimate_cost(input_tokens: int, output_tokens: int) -> Decimal:
     """Estimate cost for Claude Sonnet call."""
-    input_cost = Decimal(str(input_tokens)) * Decimal("0.000003")
-    output_cost = Decimal(str(output_tokens)) * Decimal("0.000015")
-    return (input_cost + output_cost).quantize(Decimal("0.000001"))
+    return LLMUsage(input_tokens=input_tokens, output_tokens=output_tokens).cost(INPUT_PRICE, OUTPUT_PRICE)
 
 
 async def analyze_edit(
@@ -152,10 +155,13 @@ async def analyze_edit(
             model=LEARNING_MODEL,
             max_tokens=800,
             messages=[{"role": "user", "content": user_prompt}],
-            system=LEARNING_SYSTEM_PROMPT,
+            # Same system prompt for every edit in the nightly batch
+            system=[cached_block(LEARNING_SYSTEM_PROMPT)],
         )
 
         raw_text = response.content[0].text.strip()
+        usage = LLMUsage.from_anthropic(response.usage)
+        record_llm_cost("anthropic", "analyze_edit", usage, usage.cost(INPUT_PRICE, OUTPUT_PRICE), note=stage)
 
         # Parse JSON
         clean = raw_text
@@ -335,6 +341,8 @@ async def run_weekly_consolidation() -> dict:
             )
 
             raw_text = response.content[0].text.strip()
+            usage = LLMUsage.from_anthropic(response.usage)
+            record_llm_cost("anthropic", "consolidate_guidelines", usage, usage.cost(INPUT_PRICE, OUTPUT_PRICE))
             clean = raw_text
             if clean.startswith("```"):
                 clean = clean.split("\n", 1)[1] if "\n" in clean else clean[3:]
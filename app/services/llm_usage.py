@@ -0,0 +1,129 @@
+"""Prompt caching helpers and LLM usage/cost recording.
+
+Anthropic only caches a prompt prefix that is explicitly marked with
+``cache_control``; ``cached_block`` builds such a block for the static system
+prompts and the per-stage QA guidelines, which are identical across calls.
+DeepSeek caches byte-identical prefixes automatically, so its prompts keep
+the static system prompt first and unchanged.
+
+Every call's token usage, including cache reads/writes, is appended to the
+``cost_log`` ledger in the background so the reply path never waits on it.
+"""
+
+import asyncio
+import logging
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+PROJECT = "speed_to_lead"
+
+# Anthropic bills cache writes at 1.25x and cache reads at 0.1x the input price
+CACHE_WRITE_MULTIPLIER = Decimal("1.25")
+CACHE_READ_MULTIPLIER = Decimal("0.1")
+
+_pending: set[asyncio.Task] = set()
+
+
+def cached_block(text: str) -> dict[str, Any]:
+    """A text content block marked as a prompt-cache breakpoint."""
+    return {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}
+
+
+def _count(value: Any) -> int:
+    # SDK usage fields are absent or None on older models / mocked responses
+    return value if isinstance(value, int) else 0
+
+
+@dataclass
+class LLMUsage:
+    """Token usage of one LLM call.
+
+    ``input_tokens`` excludes cached tokens, matching how Anthropic reports it.
+    """
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+
+    @classmethod
+    def from_anthropic(cls, usage: Any) -> "LLMUsage":
+        return cls(
+            input_tokens=_count(getattr(usage, "input_tokens", 0)),
+            output_tokens=_count(getattr(usage, "output_tokens", 0)),
+            cache_read_tokens=_count(getattr(usage, "cache_read_input_tokens", 0)),
+            cache_write_tokens=_count(getattr(usage, "cache_creation_input_tokens", 0)),
+        )
+
+    @classmethod
+    def from_deepseek(cls, usage: Any) -> "LLMUsage":
+        """DeepSeek reports cache hits inside ``prompt_tokens``; writes are free."""
+        hits = _count(getattr(usage, "prompt_cache_hit_tokens", 0))
+        return cls(
+            input_tokens=max(_count(getattr(usage, "prompt_tokens", 0)) - hits, 0),
+            output_tokens=_count(getattr(usage, "completion_tokens", 0)),
+            cache_read_tokens=hits,
+        )
+
+    def cost(
+        self,
+        input_per_token: Decimal,
+        output_per_token: Decimal,
+        cache_read_per_token: Decimal | None = None,
+    ) -> Decimal:
+        """Cost in USD given per-token prices (cache pricing defaults to Anthropic's)."""
+        if cache_read_per_token is None:
+            cache_read_per_token = input_per_token * CACHE_READ_MULTIPLIER
+        total = (
+            Decimal(self.input_tokens) * input_per_token
+            + Decimal(self.cache_write_tokens) * input_per_token * CACHE_WRITE_MULTIPLIER
+            + Decimal(self.cache_read_tokens) * cache_read_per_token
+            + Decimal(self.output_tokens) * output_per_token
+        )
+        return total.quantize(Decimal("0.000001"))
+
+
+async def _write_cost(provider: str, operation: str, usage: LLMUsage, cost_usd: Decimal, note: str | None) -> None:
+    from app.database import async_session_factory
+    from app.models import CostLog
+
+    try:
+        async with async_session_factory() as session:
+            session.add(CostLog(
+                id=uuid.uuid4(),
+                incurred_at=datetime.now(timezone.utc),
+                project=PROJECT,
+                provider=provider,
+                operation=operation,
+                cost_usd=cost_usd,
+                units=usage.input_tokens + usage.cache_read_tokens + usage.cache_write_tokens + usage.output_tokens,
+                unit_type="tokens",
+                cache_read_tokens=usage.cache_read_tokens,
+                cache_write_tokens=usage.cache_write_tokens,
+                note=note,
+            ))
+            await session.commit()
+    except Exception as e:
+        logger.warning(f"Failed to record {provider} {operation} cost: {e}")
+
+
+def record_llm_cost(
+    provider: str,
+    operation: str,
+    usage: LLMUsage,
+    cost_usd: Decimal,
+    note: str | None = None,
+) -> asyncio.Task | None:
+    """Append a cost_log row for an LLM call (fire-and-forget)."""
+    try:
+        task = asyncio.get_running_loop().create_task(_write_cost(provider, operation, usage, cost_usd, note))
+    except RuntimeError:
+        return None
+    _pending.add(task)
+    task.add_done_callback(_pending.discard)
+    return task
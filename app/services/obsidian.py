@@ -3,6 +3,9 @@
 Reads Obsidian notes for personalising outreach. Locally reads the vault
 directory directly; on Railway falls back to MinIO where Obsidian syncs
 via the "Remotely Save" plugin.
+
+Reads are blocking (disk / MinIO); from async code use ``read_note_async``
+or ``get_common_ground_async``, which only leave the event loop on a cache miss.
 """
 
 import logging
@@ -13,6 +16,7 @@ from pathlib import Path
 from minio import Minio
 
 from app.config import settings
+from app.services.blocking_io import run_blocking
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +69,13 @@ class ObsidianReader:
         logger.warning("Could not read Obsidian note: %s", path)
         return None
 
+    async def read_note_async(self, path: str) -> str | None:
+        """Async read_note: cache hits return inline, misses run on the blocking-I/O pool."""
+        cached = self._cache.get(path)
+        if cached is not None and time.time() - cached[1] < self._cache_ttl:
+            return cached[0]
+        return await run_blocking(self.read_note, path)
+
     def _read_local(self, path: str) -> str | None:
         """Try reading from local vault."""
         # Explicit path first
@@ -123,8 +134,15 @@ def get_obsidian_reader() -> ObsidianReader:
     )
 
 
+_COMMON_GROUND_NOTE = "Ian Personal/Common Ground with Prospects.md"
+
+
 def get_common_ground() -> str | None:
     """Read Ian's common-ground notes for prospect personalisation."""
-    return get_obsidian_reader().read_note(
-        "Ian Personal/Common Ground with Prospects.md"
-    )
+    return get_obsidian_reader().read_note(_COMMON_GROUND_NOTE)
+
+
+async def get_common_ground_async() -> str | None:
+    """Async get_common_ground (safe to call from request handlers)."""
+    reader = await run_blocking(get_obsidian_reader)
+    return await reader.read_note_async(_COMMON_GROUND_NOTE)
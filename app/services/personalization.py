@@ -0,0 +1,80 @@
+"""Bounded-concurrency personalization stage shared by the lead pipelines.
+
+Personalizing and validating DMs is one LLM round-trip per lead, which
+dominated HeyReach top-ups when done in serial loops. These helpers fan
+the calls out under a semaphore (``settings.personalization_concurrency``)
+with a per-lead timeout, so one slow completion can't stall the batch and
+a 100-lead upload isn't bounded by the sum of 100 latencies.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Sequence, TypeVar
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def map_bounded(
+    items: Sequence[T],
+    fn: Callable[[T], Awaitable[R]],
+    concurrency: int | None = None,
+    timeout: float | None = None,
+    label: str = "task",
+) -> list[R | None]:
+    """Run ``fn`` over items concurrently, at most ``concurrency`` at a time.
+
+    Results come back in input order. An item whose call raises or exceeds
+    ``timeout`` seconds yields None (logged) instead of failing the batch.
+    """
+    if not items:
+        return []
+    concurrency = concurrency or settings.personalization_concurrency
+    timeout = timeout if timeout is not None else settings.personalization_timeout_seconds
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _run(index: int, item: T) -> R | None:
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(fn(item), timeout=timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"{label} {index} timed out after {timeout:.0f}s")
+            except Exception as e:
+                logger.error(f"{label} {index} failed: {e}")
+            return None
+
+    return list(await asyncio.gather(*(_run(i, item) for i, item in enumerate(items))))
+
+
+async def personalize_leads(
+    leads: list[dict],
+    generate: Callable[[dict], Awaitable[str | None]],
+    concurrency: int | None = None,
+    timeout: float | None = None,
+) -> list[dict]:
+    """Set ``personalized_message`` on each lead concurrently.
+
+    Args:
+        leads: Lead dicts (mutated in place).
+        generate: Async generator for one lead's message (None on failure).
+        concurrency: Max in-flight generations (defaults to settings).
+        timeout: Per-lead timeout in seconds (defaults to settings).
+
+    Returns:
+        The leads that got a message, in input order.
+    """
+    messages = await map_bounded(leads, generate, concurrency, timeout, label="Personalization")
+    for lead, message in zip(leads, messages):
+        lead["personalized_message"] = message
+    personalized = [lead for lead in leads if lead.get("personalized_message")]
+    logger.info(f"Personalized {len(personalized)}/{len(leads)} leads")
+    return personalized
+
+
+def chunked(items: Sequence[Any], size: int) -> list[Sequence[Any]]:
+    """Split items into consecutive chunks of at most ``size``."""
+    return [items[i : i + size] for i in range(0, len(items), size)]
@@ -0,0 +1,508 @@
+"""Central executor for long-running lead pipelines.
+
+Every gift-leads, competitor-post and lead-finder run goes through one
+queue instead of being started independently by each trigger. A queued
+run is a PipelineRun row with status ``queued``; the executor starts it
+when a slot is free and the pipeline then adopts that same row for its
+metrics, so there is exactly one record per run.
+
+- Concurrency: at most ``settings.pipeline_max_concurrent_runs`` runs at
+  once, and at most CONCURRENCY_LIMITS[run_type] of any one type (Apify
+  actor concurrency and the DB pool are the shared bottlenecks).
+- Priority: lower number runs first. Interactive Slack requests jump
+  ahead of manual admin triggers, which jump ahead of scheduled top-ups.
+- Cancellation: queued runs are dropped, running runs are cancelled. The
+  ``cancel_requested`` flag on the row also lets a different worker
+  cancel a run at its next progress update.
+- Progress: each progress message (plus any structured fields such as
+  the current step) is written to ``PipelineRun.progress`` so clients can
+  poll the run instead of watching logs; a dict result is stored on
+  ``PipelineRun.result``.
+
+Limits are per process. Queued rows left behind by a restart are picked
+up again by start(); interrupted gift-leads runs stay resumable through
+their checkpoints.
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Coroutine
+
+from sqlalchemy import select
+
+from app.config import settings
+from app.database import async_session_factory
+from app.models import PipelineRun
+
+logger = logging.getLogger(__name__)
+
+# Priorities (lower runs first)
+PRIORITY_INTERACTIVE = 0  # Slack button requests someone is waiting on
+PRIORITY_MANUAL = 50  # Admin / API triggers
+PRIORITY_SCHEDULED = 100  # Campaign fuel top-ups
+
+# Run statuses (PipelineRun.status)
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "started"
+STATUS_COMPLETED = "completed"
+STATUS_FAILED = "failed"
+STATUS_CANCELLED = "cancelled"
+ACTIVE_STATUSES = (STATUS_QUEUED, STATUS_RUNNING)
+
+# Finished runs whose results wait() can still return
+_FINISHED_CACHE_SIZE = 100
+
+# Max concurrent runs per run_type (types not listed default to 1)
+CONCURRENCY_LIMITS = {
+    "gift_leads": 1,
+    "competitor_post": 1,
+    "lead_finder": 1,
+}
+
+
+class PipelineCancelledError(Exception):
+    """Raised by PipelineExecutor.wait() when the awaited run was cancelled."""
+
+
+ProgressCallback = Callable[[str], Coroutine[Any, Any, None]]
+# Runners are called as runner(run_id=..., progress=..., **params), where
+# progress(message, **fields) records the message plus any structured fields.
+RunProgress = Callable[..., Awaitable[None]]
+Runner = Callable[..., Awaitable[Any]]
+
+
+# ---------------------------------------------------------------------------
+# Default runners
+# ---------------------------------------------------------------------------
+
+async def _run_gift_leads(run_id: uuid.UUID, progress: RunProgress, **params: Any) -> Any:
+    from app.services.gift_pipeline import run_gift_leads_pipeline_async
+
+    async def on_event(event: dict[str, Any]) -> None:
+        await progress(**event)
+
+    return await run_gift_leads_pipeline_async(**params, on_event=on_event, pipeline_run_id=run_id)
+
+
+async def _run_competitor_post(run_id: uuid.UUID, progress: RunProgress, **params: Any) -> Any:
+    from app.services.prospect_pipeline import run_competitor_post_pipeline
+
+    return await run_competitor_post_pipeline(**params, pipeline_run_id=run_id)
+
+
+async def _run_lead_finder(run_id: uuid.UUID, progress: RunProgress, **params: Any) -> Any:
+    from app.services.lead_finder_pipeline import run_lead_finder_pipeline
+
+    return await run_lead_finder_pipeline(**params, pipeline_run_id=run_id)
+
+
+DEFAULT_RUNNERS: dict[str, Runner] = {
+    "gift_leads": _run_gift_leads,
+    "competitor_post": _run_competitor_post,
+    "lead_finder": _run_lead_finder,
+}
+
+
+# ---------------------------------------------------------------------------
+# Executor
+# ---------------------------------------------------------------------------
+
+@dataclass
+class _Job:
+    run_id: uuid.UUID
+    run_type: str
+    priority: int
+    seq: int
+    params: dict[str, Any]
+    runner: Runner
+    progress: ProgressCallback | None
+    future: asyncio.Future
+    task: asyncio.Task | None = None
+    last_progress: str | None = None
+
+    @property
+    def sort_key(self) -> tuple[int, int]:
+        return (self.priority, self.seq)
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _consume_result(future: asyncio.Future) -> None:
+    """Mark a job future's exception as retrieved when nobody awaits it."""
+    if not future.cancelled():
+        future.exception()
+
+
+class PipelineExecutor:
+    """Priority queue with per-type concurrency caps for pipeline runs."""
+
+    def __init__(
+        self,
+        max_concurrent: int | None = None,
+        limits: dict[str, int] | None = None,
+        runners: dict[str, Runner] | None = None,
+    ):
+        self.max_concurrent = max_concurrent or settings.pipeline_max_concurrent_runs
+        self.limits = dict(CONCURRENCY_LIMITS if limits is None else limits)
+        self.runners: dict[str, Runner] = dict(DEFAULT_RUNNERS if runners is None else runners)
+        self._queue: list[_Job] = []
+        self._running: dict[uuid.UUID, _Job] = {}
+        self._finished: OrderedDict[uuid.UUID, _Job] = OrderedDict()
+        self._seq = itertools.count()
+        self._shutting_down = False
+
+    def register(self, run_type: str, runner: Runner, limit: int | None = None) -> None:
+        """Register (or replace) the default runner for a run type."""
+        self.runners[run_type] = runner
+        if limit is not None:
+            self.limits[run_type] = limit
+
+    # -- Submission -----------------------------------------------------------
+
+    async def submit(
+        self,
+        run_type: str,
+        params: dict[str, Any] | None = None,
+        *,
+        priority: int = PRIORITY_MANUAL,
+        progress: ProgressCallback | None = None,
+        runner: Runner | None = None,
+        prospect_url: str | None = None,
+        prospect_name: str | None = None,
+        run_id: uuid.UUID | None = None,
+    ) -> uuid.UUID:
+        """Queue a run and return its PipelineRun id.
+
+        Args:
+            run_type: gift_leads, competitor_post, lead_finder, ...
+            params: Keyword arguments for the runner (stored on the run row).
+            priority: PRIORITY_INTERACTIVE / PRIORITY_MANUAL / PRIORITY_SCHEDULED.
+            progress: Optional async callback that also receives progress text.
+            runner: Override the registered runner for this one run.
+            prospect_url: Stored on the run row for display.
+            prospect_name: Stored on the run row for display.
+            run_id: Re-queue an existing run (e.g. a resume) instead of creating one.
+        """
+        runner = runner or self.runners.get(run_type)
+        if runner is None:
+            raise ValueError(f"No runner registered for pipeline type '{run_type}'")
+        params = params or {}
+
+        if run_id is None:
+            run_id = await self._create_run(run_type, params, priority, prospect_url, prospect_name)
+        elif self._find(run_id) is not None:
+            return run_id
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(_consume_result)
+        self._queue.append(_Job(
+            run_id=run_id,
+            run_type=run_type,
+            priority=priority,
+            seq=next(self._seq),
+            params=params,
+            runner=runner,
+            progress=progress,
+            future=future,
+        ))
+        logger.info(
+            f"Pipeline run {run_id} queued ({run_type}, priority={priority}, "
+            f"queue={len(self._queue)}, running={len(self._running)})"
+        )
+        self._dispatch()
+        return run_id
+
+    async def wait(self, run_id: uuid.UUID) -> Any:
+        """Wait for a run queued in this process and return its result.
+
+        Raises PipelineCancelledError if the run was cancelled, or the
+        pipeline's own exception if it failed.
+        """
+        job = self._find(run_id) or self._finished.get(run_id)
+        if job is None:
+            raise KeyError(f"Pipeline run {run_id} is not known to this worker")
+        try:
+            return await asyncio.shield(job.future)
+        except asyncio.CancelledError:
+            if job.future.cancelled():
+                raise PipelineCancelledError(f"Pipeline run {run_id} was cancelled") from None
+            raise
+
+    async def run(self, run_type: str, params: dict[str, Any] | None = None, **kwargs: Any) -> Any:
+        """Submit a run and wait for its result (see submit() for arguments)."""
+        run_id = await self.submit(run_type, params, **kwargs)
+        return await self.wait(run_id)
+
+    # -- Cancellation ----------------------------------------------------------
+
+    async def cancel(self, run_id: uuid.UUID) -> bool:
+        """Cancel a queued or running run.
+
+        Returns False if the run doesn't exist or has already finished.
+        """
+        job = self._find(run_id)
+        if job is not None and job.task is None:
+            self._queue.remove(job)
+            self._finished[run_id] = job
+            job.future.cancel()
+            await self._update_run(run_id, status=STATUS_CANCELLED, completed_at=_now())
+            logger.info(f"Pipeline run {run_id} cancelled while queued")
+            return True
+        if job is not None:
+            job.task.cancel()
+            logger.info(f"Pipeline run {run_id} cancellation requested")
+            return True
+
+        # Not in this process: flag it for whichever worker owns it
+        async with async_session_factory() as session:
+            run = await session.get(PipelineRun, run_id)
+            if run is None or run.status not in ACTIVE_STATUSES:
+                return False
+            run.cancel_requested = True
+            if run.status == STATUS_QUEUED:
+                run.status = STATUS_CANCELLED
+                run.completed_at = _now()
+            await session.commit()
+        return True
+
+    # -- Introspection ---------------------------------------------------------
+
+    def queue_position(self, run_id: uuid.UUID) -> int | None:
+        """1-based position of a queued run, or None if not queued here."""
+        for i, job in enumerate(sorted(self._queue, key=lambda j: j.sort_key), start=1):
+            if job.run_id == run_id:
+                return i
+        return None
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current queue and running runs, for admin/status endpoints."""
+        return {
+            "max_concurrent": self.max_concurrent,
+            "limits": self.limits,
+            "running": [
+                {"run_id": str(j.run_id), "run_type": j.run_type, "progress": j.last_progress}
+                for j in self._running.values()
+            ],
+            "queued": [
+                {"run_id": str(j.run_id), "run_type": j.run_type, "priority": j.priority}
+                for j in sorted(self._queue, key=lambda j: j.sort_key)
+            ],
+        }
+
+    # -- Lifecycle -------------------------------------------------------------
+
+    async def start(self) -> int:
+        """Re-queue runs left in the queued state by a previous process.
+
+        Returns the number of runs recovered.
+        """
+        self._shutting_down = False
+        try:
+            async with async_session_factory() as session:
+                result = await session.execute(
+                    select(PipelineRun)
+                    .where(PipelineRun.status == STATUS_QUEUED)
+                    .order_by(PipelineRun.priority, PipelineRun.created_at)
+                )
+                runs = result.scalars().all()
+        except Exception as e:
+            logger.error(f"Could not load queued pipeline runs: {e}")
+            return 0
+
+        known = {j.run_id for j in self._queue} | set(self._running)
+        recovered = 0
+        for run in runs:
+            runner = self.runners.get(run.run_type)
+            if run.id in known or runner is None:
+                continue
+            future: asyncio.Future = asyncio.get_running_loop().create_future()
+            future.add_done_callback(_consume_result)
+            self._queue.append(_Job(
+                run_id=run.id,
+                run_type=run.run_type,
+                priority=run.priority if run.priority is not None else PRIORITY_MANUAL,
+                seq=next(self._seq),
+                params=run.run_params or {},
+                runner=runner,
+                progress=None,
+                future=future,
+            ))
+            recovered += 1
+
+        if recovered:
+            logger.info(f"Recovered {recovered} queued pipeline runs")
+            self._dispatch()
+        return recovered
+
+    async def shutdown(self) -> None:
+        """Stop running tasks without marking them cancelled.
+
+        Their rows keep status ``started`` (resumable) and queued rows stay
+        queued for the next process to pick up.
+        """
+        self._shutting_down = True
+        tasks = [j.task for j in self._running.values() if j.task is not None]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._queue.clear()
+
+    # -- Internals -------------------------------------------------------------
+
+    def _find(self, run_id: uuid.UUID) -> _Job | None:
+        if run_id in self._running:
+            return self._running[run_id]
+        for job in self._queue:
+            if job.run_id == run_id:
+                return job
+        return None
+
+    def _running_count(self, run_type: str) -> int:
+        return sum(1 for j in self._running.values() if j.run_type == run_type)
+
+    def _dispatch(self) -> None:
+        """Start the highest-priority queued runs that fit under the limits."""
+        if self._shutting_down:
+            return
+        for job in sorted(self._queue, key=lambda j: j.sort_key):
+            if len(self._running) >= self.max_concurrent:
+                break
+            if self._running_count(job.run_type) >= self.limits.get(job.run_type, 1):
+                continue
+            self._queue.remove(job)
+            self._running[job.run_id] = job
+            job.task = asyncio.create_task(self._execute(job), name=f"pipeline-{job.run_id}")
+
+    async def _execute(self, job: _Job) -> None:
+        await self._update_run(job.run_id, status=STATUS_RUNNING, started_at=_now())
+        logger.info(f"Pipeline run {job.run_id} started ({job.run_type})")
+        try:
+            result = await job.runner(run_id=job.run_id, progress=self._progress_for(job), **job.params)
+        except asyncio.CancelledError:
+            if not self._shutting_down:
+                await self._finish(job.run_id, STATUS_CANCELLED)
+                logger.info(f"Pipeline run {job.run_id} cancelled")
+            job.future.cancel()
+        except Exception as e:
+            logger.error(f"Pipeline run {job.run_id} ({job.run_type}) failed: {e}", exc_info=True)
+            await self._finish(job.run_id, STATUS_FAILED, error_message=str(e))
+            job.future.set_exception(e)
+        else:
+            await self._finish(job.run_id, STATUS_COMPLETED, result=result)
+            job.future.set_result(result)
+        finally:
+            self._running.pop(job.run_id, None)
+            self._finished[job.run_id] = job
+            while len(self._finished) > _FINISHED_CACHE_SIZE:
+                self._finished.popitem(last=False)
+            self._dispatch()
+
+    def _progress_for(self, job: _Job) -> RunProgress:
+        """Progress callback that records to the run row and forwards to the caller.
+
+        Extra keyword fields (step, step_index, metrics, ...) are stored
+        alongside the message; the caller's callback only gets the text.
+        """
+
+        async def progress(message: str, **fields: Any) -> None:
+            job.last_progress = message
+            cancel_requested = await self._update_run(
+                job.run_id,
+                progress={**fields, "message": message[:500], "updated_at": _now().isoformat()},
+            )
+            if job.progress is not None:
+                try:
+                    await job.progress(message)
+                except Exception as e:
+                    logger.error(f"Progress callback failed for run {job.run_id}: {e}")
+            if cancel_requested and job.task is not None:
+                    job.task.cancel()
+
+        return progress
+
+    async def _create_run(
+        self,
+        run_type: str,
+        params: dict[str, Any],
+        priority: int,
+        prospect_url: str | None,
+        prospect_name: str | None,
+    ) -> uuid.UUID:
+        try:
+            async with async_session_factory() as session:
+                run = PipelineRun(
+                    run_type=run_type,
+                    status=STATUS_QUEUED,
+                    priority=priority,
+                    prospect_url=prospect_url or params.get("prospect_url"),
+                    prospect_name=prospect_name or params.get("prospect_name"),
+                    run_params=params,
+                )
+                session.add(run)
+                await session.commit()
+                return run.id
+        except Exception as e:
+            # Still run it: losing the queue record beats dropping the request
+            logger.error(f"Could not persist queued {run_type} run: {e}")
+            return uuid.uuid4()
+
+    async def _update_run(self, run_id: uuid.UUID, **fields: Any) -> bool:
+        """Best-effort update of the run row. Returns its cancel_requested flag."""
+        try:
+            async with async_session_factory() as session:
+                run = await session.get(PipelineRun, run_id)
+                if run is None:
+                    return False
+                for name, value in fields.items():
+                    setattr(run, name, value)
+                await session.commit()
+                return bool(run.cancel_requested)
+        except Exception as e:
+            logger.error(f"Could not update pipeline run {run_id}: {e}")
+            return False
+
+    async def _finish(
+        self,
+        run_id: uuid.UUID,
+        status: str,
+        error_message: str | None = None,
+        result: Any = None,
+    ) -> None:
+        """Record the final status (unless the pipeline already did) and result."""
+        try:
+            async with async_session_factory() as session:
+                run = await session.get(PipelineRun, run_id)
+                if run is None:
+                    return
+                if isinstance(result, dict):
+                    run.result = json.loads(json.dumps(result, default=str))
+                if status == STATUS_CANCELLED or run.status in ACTIVE_STATUSES:
+                    run.status = status
+                    if error_message and not run.error_message:
+                        run.error_message = error_message[:500]
+                if run.completed_at is None or status == STATUS_CANCELLED:
+                    run.completed_at = _now()
+                await session.commit()
+        except Exception as e:
+            logger.error(f"Could not finalize pipeline run {run_id}: {e}")
+
+
+# Global executor instance
+_executor: PipelineExecutor | None = None
+
+
+def get_pipeline_executor() -> PipelineExecutor:
+    """Get or create the pipeline executor singleton."""
+    global _executor
+    if _executor is None:
+        _executor = PipelineExecutor()
+    return _executor
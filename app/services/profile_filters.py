@@ -0,0 +1,288 @@
+"""Shared profile filtering engine for the lead pipelines.
+
+Headline pre-filtering, English detection, location and completeness checks
+used by the gift, competitor-post, lead-finder and buying-signal pipelines.
+
+Each keyword list is compiled once into a single alternation regex, so a
+headline is scanned once per list instead of once per keyword, and script
+detection classifies a string in one pass. The batch helpers take whole
+engager/profile lists so the per-row work stays in C wherever possible.
+"""
+
+import logging
+import re
+from typing import Iterable, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# Keyword lists
+# ---------------------------------------------------------------------------
+
+# Headline authority keywords (positive signal)
+HEADLINE_AUTHORITY_KEYWORDS = [
+    "ceo", "founder", "co-founder", "cofounder", "owner",
+    "president", "managing director", "partner",
+    "vp", "vice president", "director",
+    "cto", "cfo", "coo", "cmo", "chief",
+    "head of", "principal", "entrepreneur",
+]
+
+# Hard rejection keywords
+HEADLINE_REJECT_KEYWORDS = [
+    "intern", "student", "trainee", "apprentice",
+    "cashier", "driver", "technician", "mechanic",
+    "nurse", "teacher", "professor", "doctor", "physician",
+    "looking for", "seeking", "open to work",
+    "retired", "unemployed",
+]
+
+# Non-English indicators in headlines
+NON_ENGLISH_INDICATORS = [
+    # Portuguese
+    "diretor", "gerente", "fundador", "empresário", "sócio", "coordenador",
+    # Spanish
+    "gerente", "fundador", "empresario", "socio", "coordinador",
+    # French
+    "directeur", "fondateur", "gérant", "président", "responsable",
+    # German
+    "geschäftsführer", "gründer", "leiter", "inhaber",
+    # Italian
+    "direttore", "fondatore", "titolare", "amministratore",
+    # Dutch
+    "directeur", "oprichter", "eigenaar",
+]
+
+# Placeholder headlines that indicate empty/incomplete profiles
+EMPTY_HEADLINE_INDICATORS = ["--", "n/a", "na", "-", ""]
+
+# Headline classification verdicts returned by classify_headlines()
+HEADLINE_KEEP = "keep"
+HEADLINE_REJECTED = "rejected"
+HEADLINE_NON_ENGLISH = "non_english"
+
+
+# ---------------------------------------------------------------------------
+# Compiled matchers
+# ---------------------------------------------------------------------------
+
+class KeywordMatcher:
+    """Substring matcher for a keyword list, compiled into one regex.
+
+    Keywords are matched case-sensitively against already-lowercased text,
+    with the same substring semantics as ``any(kw in text for kw in keywords)``.
+    Longer keywords are tried first so the reported match is the most specific.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        unique = sorted({kw.lower() for kw in keywords if kw}, key=lambda kw: (-len(kw), kw))
+        self.keywords: tuple[str, ...] = tuple(unique)
+        self._search = re.compile("|".join(re.escape(kw) for kw in unique)).search if unique else None
+
+    def search(self, text: str) -> str | None:
+        """Return the first keyword found in ``text``, or None."""
+        if self._search is None or not text:
+            return None
+        match = self._search(text)
+        return match.group(0) if match else None
+
+    def matches(self, text: str) -> bool:
+        """Return True if any keyword occurs in ``text``."""
+        return self.search(text) is not None
+
+
+REJECT_MATCHER = KeywordMatcher(HEADLINE_REJECT_KEYWORDS)
+AUTHORITY_MATCHER = KeywordMatcher(HEADLINE_AUTHORITY_KEYWORDS)
+NON_ENGLISH_MATCHER = KeywordMatcher(NON_ENGLISH_INDICATORS)
+
+_EMPTY_HEADLINES = frozenset(EMPTY_HEADLINE_INDICATORS)
+
+# One character class covering every non-Latin script we reject on.
+_SCRIPT_RE = re.compile("[\u0400-\u04ff\u0600-\u06ff\u3040-\u30ff\u4e00-\u9fff\uac00-\ud7af]")
+
+
+# ---------------------------------------------------------------------------
+# English detection
+# ---------------------------------------------------------------------------
+
+def classify_script(text: str) -> str | None:
+    """Return the non-Latin script found in text (CJK, Cyrillic, Arabic), or None.
+
+    Scans the string once; when several scripts are present the precedence
+    is CJK, then Cyrillic, then Arabic.
+    """
+    found = _SCRIPT_RE.findall(text)
+    if not found:
+        return None
+    cyrillic = arabic = False
+    for c in found:
+        if c >= "\u3040":
+            return "CJK"
+        if c < "\u0600":
+            cyrillic = True
+        else:
+            arabic = True
+    return "Cyrillic" if cyrillic else "Arabic" if arabic else None
+
+
+def is_likely_english(text: str) -> tuple[bool, str]:
+    """Check if text is likely English based on character analysis."""
+    if not text or len(text) < 3:
+        return True, "too short to analyze"
+
+    # Pure-ASCII text (the common case) skips the character-level checks.
+    if not text.isascii():
+        non_ascii_chars = len(text) - len(text.encode("ascii", "ignore"))
+        non_ascii_ratio = non_ascii_chars / len(text)
+        if non_ascii_ratio > 0.15:
+            return False, f"high non-ASCII ratio ({non_ascii_ratio:.0%})"
+
+        script = classify_script(text)
+        if script:
+            return False, f"contains {script} characters"
+
+    indicator = NON_ENGLISH_MATCHER.search(text.lower())
+    if indicator:
+        return False, f"contains '{indicator}'"
+
+    return True, "appears English"
+
+
+# ---------------------------------------------------------------------------
+# Headline pre-filter
+# ---------------------------------------------------------------------------
+
+def classify_headline(headline: str | None) -> str:
+    """Classify one headline as HEADLINE_KEEP, HEADLINE_NON_ENGLISH or HEADLINE_REJECTED.
+
+    Empty headlines are kept: there is nothing to judge them on yet.
+    """
+    headline_raw = (headline or "").strip()
+    if not headline_raw:
+        return HEADLINE_KEEP
+
+    is_english, _ = is_likely_english(headline_raw)
+    if not is_english:
+        return HEADLINE_NON_ENGLISH
+
+    if REJECT_MATCHER.matches(headline_raw.lower()):
+        return HEADLINE_REJECTED
+
+    return HEADLINE_KEEP
+
+
+def classify_headlines(headlines: Sequence[str | None]) -> list[str]:
+    """Classify a batch of headlines, one verdict per input row."""
+    return [classify_headline(h) for h in headlines]
+
+
+def prefilter_engagers_by_headline(
+    engagers: list[dict],
+) -> tuple[list[dict], int, int, int]:
+    """Pre-filter engagers by headline before expensive profile scraping.
+
+    Returns:
+        (filtered_engagers, kept_count, rejected_count, non_english_count)
+    """
+    verdicts = classify_headlines([(e.get("reactor") or {}).get("headline") for e in engagers])
+
+    filtered = [e for e, v in zip(engagers, verdicts) if v == HEADLINE_KEEP]
+    rejected_count = verdicts.count(HEADLINE_REJECTED)
+    non_english_count = verdicts.count(HEADLINE_NON_ENGLISH)
+
+    logger.info(
+        f"Headline pre-filter: {len(engagers)} -> {len(filtered)} "
+        f"(rejected={rejected_count}, non-english={non_english_count})"
+    )
+    return filtered, len(filtered), rejected_count, non_english_count
+
+
+# ---------------------------------------------------------------------------
+# Location filter
+# ---------------------------------------------------------------------------
+
+def filter_by_location(profiles: list[dict], allowed_countries: list[str]) -> list[dict]:
+    """Filter profiles by country (case-insensitive)."""
+    allowed = frozenset(c.lower() for c in allowed_countries)
+    filtered = [p for p in profiles if (p.get("addressCountryOnly") or "").lower() in allowed]
+    logger.info(f"Location filter: {len(profiles)} -> {len(filtered)}")
+    return filtered
+
+
+# ---------------------------------------------------------------------------
+# Profile completeness filter
+# ---------------------------------------------------------------------------
+
+def is_profile_complete(lead: dict) -> dict:
+    """Check if a LinkedIn profile has enough data to evaluate."""
+    missing_fields = []
+
+    headline = (lead.get("headline") or "").strip().lower()
+    if headline in _EMPTY_HEADLINES:
+        missing_fields.append("headline")
+
+    if not (lead.get("jobTitle") or lead.get("job_title")):
+        missing_fields.append("jobTitle")
+
+    if not (lead.get("companyName") or lead.get("company")):
+        missing_fields.append("companyName")
+
+    if lead.get("experiencesCount", 0) == 0 and not lead.get("experiences"):
+        missing_fields.append("experiences")
+
+    has_headline = "headline" not in missing_fields
+    has_job_info = "jobTitle" not in missing_fields and "companyName" not in missing_fields
+    has_experience = "experiences" not in missing_fields
+
+    is_complete = has_job_info or (has_headline and has_experience)
+
+    return {
+        "complete": is_complete,
+        "reason": "sufficient data" if is_complete else f"missing: {', '.join(missing_fields)}",
+        "missing_fields": missing_fields,
+    }
+
+
+def filter_complete_profiles(leads: list[dict]) -> list[dict]:
+    """Filter out leads with incomplete profiles."""
+    complete = [lead for lead in leads if is_profile_complete(lead)["complete"]]
+    logger.info(f"Profile completeness: {len(leads)} -> {len(complete)} leads")
+    return complete
+
+
+# ---------------------------------------------------------------------------
+# Combined batch filter
+# ---------------------------------------------------------------------------
+
+def filter_profiles(
+    profiles: list[dict],
+    allowed_countries: list[str] | None = None,
+    reject_headlines: bool = False,
+    require_complete: bool = True,
+) -> list[dict]:
+    """Run location, headline and completeness checks over a batch in one pass.
+
+    Args:
+        profiles: Normalized profile dicts (linkedinUrl/headline/jobTitle/...).
+        allowed_countries: Keep only these countries; None skips the check.
+        reject_headlines: Drop non-English and hard-reject headlines.
+        require_complete: Drop profiles without enough data to evaluate.
+
+    Returns:
+        The profiles that passed every enabled check, in input order.
+    """
+    allowed = frozenset(c.lower() for c in allowed_countries) if allowed_countries is not None else None
+
+    kept = []
+    for p in profiles:
+        if allowed is not None and (p.get("addressCountryOnly") or "").lower() not in allowed:
+            continue
+        if reject_headlines and classify_headline(p.get("headline")) != HEADLINE_KEEP:
+            continue
+        if require_complete and not is_profile_complete(p)["complete"]:
+            continue
+        kept.append(p)
+
+    logger.info(f"Profile filter: {len(profiles)} -> {len(kept)}")
+    return kept
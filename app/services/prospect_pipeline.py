@@ -14,6 +14,7 @@ import json
 import logging
 import re
 import time
+import uuid
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from typing import Any
@@ -24,6 +25,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
 from app.models import PipelineRun, Prospect, ProspectSource
+from app.services import profile_filters
+from app.services.personalization import chunked, map_bounded, personalize_leads
+from app.services.profile_filters import (  # noqa: F401
+    filter_by_location,
+    filter_complete_profiles,
+    is_likely_english,
+    prefilter_engagers_by_headline,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -53,33 +62,6 @@ DEEPSEEK_COSTS = {
     "avg_personalization_tokens": 800,
 }
 
-# ---------------------------------------------------------------------------
-# Headline filter lists
-# ---------------------------------------------------------------------------
-HEADLINE_AUTHORITY_KEYWORDS = [
-    "ceo", "founder", "co-founder", "cofounder", "owner",
-    "president", "managing director", "partner",
-    "vp", "vice president", "director",
-    "cto", "cfo", "coo", "cmo", "chief",
-    "head of", "principal", "entrepreneur",
-]
-HEADLINE_REJECT_KEYWORDS = [
-    "intern", "student", "trainee", "apprentice",
-    "cashier", "driver", "technician", "mechanic",
-    "nurse", "teacher", "professor", "doctor", "physician",
-    "looking for", "seeking", "open to work",
-    "retired", "unemployed",
-]
-NON_ENGLISH_INDICATORS = [
-    "diretor", "gerente", "fundador", "empresário", "sócio", "coordenador",
-    "empresario", "socio", "coordinador",
-    "directeur", "fondateur", "gérant", "responsable",
-    "geschäftsführer", "gründer", "leiter", "inhaber",
-    "direttore", "fondatore", "titolare", "amministratore",
-    "oprichter", "eigenaar",
-]
-
-
 # ===================================================================
 # SHARED APIFY HELPER
 # ===================================================================
@@ -218,49 +200,8 @@ async def scrape_post_engagers(post_urls: list[str]) -> list[dict]:
 # STEP 4: HEADLINE PRE-FILTER
 # ===================================================================
 
-def is_likely_english(text: str) -> tuple[bool, str]:
-    if not text or len(text) < 3:
-        return True, "too short to analyze"
-    non_ascii = sum(1 for c in text if ord(c) > 127)
-    if non_ascii / len(text) > 0.15:
-        return False, "high non-ASCII ratio"
-    if any("\u4e00" <= c <= "\u9fff" or "\u3040" <= c <= "\u30ff" or "\uac00" <= c <= "\ud7af" for c in text):
-        return False, "contains CJK characters"
-    if any("\u0400" <= c <= "\u04ff" for c in text):
-        return False, "contains Cyrillic characters"
-    if any("\u0600" <= c <= "\u06ff" for c in text):
-        return False, "contains Arabic characters"
-    text_lower = text.lower()
-    for indicator in NON_ENGLISH_INDICATORS:
-        if indicator in text_lower:
-            return False, f"contains '{indicator}'"
-    return True, "appears English"
-
-
-def prefilter_engagers_by_headline(engagers: list[dict]) -> tuple[list[dict], int, int, int]:
-    filtered = []
-    rejected_count = 0
-    non_english_count = 0
-    for engager in engagers:
-        reactor = engager.get("reactor", {})
-        headline_raw = (reactor.get("headline") or "").strip()
-        headline = headline_raw.lower()
-        if not headline:
-            filtered.append(engager)
-            continue
-        is_english, _ = is_likely_english(headline_raw)
-        if not is_english:
-            non_english_count += 1
-            continue
-        if any(kw in headline for kw in HEADLINE_REJECT_KEYWORDS):
-            rejected_count += 1
-            continue
-        filtered.append(engager)
-    logger.info(
-        f"Headline pre-filter: {len(engagers)} -> {len(filtered)} "
-        f"(rejected={rejected_count}, non-english={non_english_count})"
-    )
-    return filtered, len(filtered), rejected_count, non_english_count
+# is_likely_english() and prefilter_engagers_by_headline() come from the
+# shared profile_filters engine.
 
 
 # ===================================================================
@@ -383,32 +324,19 @@ async def scrape_linkedin_profiles(urls: list[str]) -> list[dict]:
 # STEP 8: LOCATION FILTER
 # ===================================================================
 
-def filter_by_location(profiles: list[dict], allowed_countries: list[str]) -> list[dict]:
-    allowed = [c.lower() for c in allowed_countries]
-    filtered = [p for p in profiles if (p.get("addressCountryOnly") or "").lower() in allowed]
-    logger.info(f"Location filter: {len(profiles)} -> {len(filtered)}")
-    return filtered
+# filter_by_location() comes from the shared profile_filters engine.
 
 
 # ===================================================================
 # STEP 9: COMPLETENESS FILTER
 # ===================================================================
 
-EMPTY_HEADLINE_INDICATORS = ["--", "n/a", "na", "-", ""]
-
-
 def is_profile_complete(lead: dict) -> bool:
-    headline = (lead.get("headline") or "").strip().lower()
-    has_headline = bool(headline) and headline not in EMPTY_HEADLINE_INDICATORS
-    has_job_info = bool(lead.get("jobTitle") or lead.get("job_title")) and bool(lead.get("companyName") or lead.get("company"))
-    has_experience = len(lead.get("experiences", [])) > 0 or lead.get("experiencesCount", 0) > 0
-    return bool(has_job_info or (has_headline and has_experience))
+    """Return True if the profile has enough data to evaluate."""
+    return profile_filters.is_profile_complete(lead)["complete"]
 
 
-def filter_complete_profiles(leads: list[dict]) -> list[dict]:
-    complete = [l for l in leads if is_profile_complete(l)]
-    logger.info(f"Completeness filter: {len(leads)} -> {len(complete)}")
-    return complete
+# filter_complete_profiles() comes from the shared profile_filters engine.
 
 
 # ===================================================================
@@ -610,7 +538,57 @@ async def validate_single_message(lead: dict) -> dict:
     if not settings.deepseek_api_key:
         return {"flag": "PASS", "reason": "no API key"}
 
-    prompt = f"""Lead: {lead.get('fullName', '?')}
+    prompt = _format_lead_for_validation(lead)
+
+    try:
+        async with httpx.AsyncClient(timeout=30) as client:
+            resp = await client.post(
+                DEEPSEEK_API_URL,
+                headers={"Authorization": f"Bearer {settings.deepseek_api_key}", "Content-Type": "application/json"},
+                json={
+                    "model": "deepseek-chat",
+                    "messages": [
+                        {"role": "system", "content": VALIDATION_SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt},
+                    ],
+                    "max_tokens": 200,
+                    "temperature": 0.1,
+                    "response_format": {"type": "json_object"},
+                },
+            )
+            resp.raise_for_status()
+            return json.loads(resp.json()["choices"][0]["message"]["content"])
+    except Exception as e:
+        return {"flag": "ERROR", "reason": str(e)}
+
+
+BATCH_VALIDATION_SYSTEM_PROMPT = """You validate LinkedIn DMs for accuracy. For EACH numbered lead, check if:
+1. The service/method mentioned matches the lead's actual business
+2. The authority statement is industry-accurate
+3. The company name is correctly casualized
+
+Respond in JSON with one result per lead, in the same order:
+{
+  "results": [
+    {
+      "index": 1,
+      "flag": "PASS" | "REVIEW" | "FAIL",
+      "inferred_service": "what the message says they do",
+      "actual_service": "what they actually do",
+      "reason": "brief explanation"
+    }
+  ]
+}"""
+
+# Messages checked per batched validation call
+VALIDATION_BATCH_SIZE = 10
+
+# Regenerate-and-revalidate rounds for messages flagged FAIL/REVIEW
+VALIDATION_MAX_RETRIES = 2
+
+
+def _format_lead_for_validation(lead: dict) -> str:
+    return f"""Lead: {lead.get('fullName', '?')}
 Headline: {lead.get('headline', 'N/A')}
 Job Title: {lead.get('jobTitle', 'N/A')}
 Company: {lead.get('companyName', 'N/A')}
@@ -619,41 +597,96 @@ About: {(lead.get('about') or '')[:200] or 'N/A'}
 Message:
 {lead.get('personalized_message', '')}"""
 
+
+async def validate_messages_batch(leads: list[dict]) -> list[dict]:
+    """Validate several personalized messages in one DeepSeek call.
+
+    Returns one verdict per lead, in order. If the response can't be
+    matched up with the input, falls back to validate_single_message()
+    per lead.
+    """
+    if not leads:
+        return []
+    if not settings.deepseek_api_key:
+        return [{"flag": "PASS", "reason": "no API key"} for _ in leads]
+    if len(leads) == 1:
+        return [await validate_single_message(leads[0])]
+
+    prompt = "\n\n".join(
+        f"### Lead {i}\n{_format_lead_for_validation(lead)}" for i, lead in enumerate(leads, 1)
+    )
+
     try:
-        async with httpx.AsyncClient(timeout=30) as client:
+        async with httpx.AsyncClient(timeout=60) as client:
             resp = await client.post(
                 DEEPSEEK_API_URL,
                 headers={"Authorization": f"Bearer {settings.deepseek_api_key}", "Content-Type": "application/json"},
                 json={
                     "model": "deepseek-chat",
                     "messages": [
-                        {"role": "system", "content": VALIDATION_SYSTEM_PROMPT},
+                        {"role": "system", "content": BATCH_VALIDATION_SYSTEM_PROMPT},
                         {"role": "user", "content": prompt},
                     ],
-                    "max_tokens": 200,
+                    "max_tokens": 120 * len(leads),
                     "temperature": 0.1,
                     "response_format": {"type": "json_object"},
                 },
             )
             resp.raise_for_status()
-            return json.loads(resp.json()["choices"][0]["message"]["content"])
+            results = json.loads(resp.json()["choices"][0]["message"]["content"]).get("results", [])
+        by_index = {r.get("index"): r for r in results if isinstance(r, dict)}
+        if all(i in by_index for i in range(1, len(leads) + 1)):
+            return [by_index[i] for i in range(1, len(leads) + 1)]
+        logger.warning(f"Batched validation returned {len(results)}/{len(leads)} results, validating singly")
     except Exception as e:
-        return {"flag": "ERROR", "reason": str(e)}
+        logger.warning(f"Batched validation failed ({e}), validating singly")
 
+    verdicts = await map_bounded(leads, validate_single_message, label="Validation")
+    return [v or {"flag": "ERROR", "reason": "validation timed out"} for v in verdicts]
 
-async def validate_and_fix_batch(leads: list[dict]) -> list[dict]:
-    """Validate all personalized messages and regenerate failures."""
-    for lead in leads:
-        if not lead.get("personalized_message"):
-            continue
-        result = await validate_single_message(lead)
-        lead["validation"] = result
-        if result.get("flag") in ("FAIL", "REVIEW"):
-            logger.info(f"Re-generating message for {lead.get('fullName', '?')}: {result.get('reason', '')}")
-            new_msg = await generate_personalization_deepseek(lead)
+
+async def validate_messages(leads: list[dict]) -> list[dict]:
+    """Validate messages in concurrent batches of VALIDATION_BATCH_SIZE."""
+    batches = chunked(leads, VALIDATION_BATCH_SIZE)
+    results = await map_bounded(batches, validate_messages_batch, label="Validation batch")
+    verdicts: list[dict] = []
+    for batch, batch_verdicts in zip(batches, results):
+        verdicts.extend(batch_verdicts or [{"flag": "ERROR", "reason": "validation timed out"}] * len(batch))
+    return verdicts
+
+
+async def validate_and_fix_batch(
+    leads: list[dict],
+    max_retries: int = VALIDATION_MAX_RETRIES,
+) -> list[dict]:
+    """Validate all personalized messages and regenerate failures.
+
+    Messages flagged FAIL/REVIEW are regenerated concurrently and validated
+    again, up to ``max_retries`` rounds. A lead that still fails keeps its
+    latest message, with the final verdict in ``lead["validation"]``.
+    """
+    pending = [lead for lead in leads if lead.get("personalized_message")]
+    for attempt in range(max_retries + 1):
+        if not pending:
+            break
+        verdicts = await validate_messages(pending)
+        failed = []
+        for lead, verdict in zip(pending, verdicts):
+            lead["validation"] = verdict
+            if verdict.get("flag") in ("FAIL", "REVIEW"):
+                failed.append(lead)
+        if not failed or attempt == max_retries:
+            break
+
+        for lead in failed:
+            logger.info(f"Re-generating message for {lead.get('fullName', '?')}: {lead['validation'].get('reason', '')}")
+        new_messages = await map_bounded(failed, generate_personalization_deepseek, label="Regeneration")
+        pending = []
+        for lead, new_msg in zip(failed, new_messages):
             if new_msg:
                 lead["personalized_message"] = new_msg
                 lead["regenerated"] = True
+                pending.append(lead)
     return leads
 
 
@@ -663,7 +696,7 @@ async def validate_and_fix_batch(leads: list[dict]) -> list[dict]:
 
 async def upload_to_heyreach(leads: list[dict], list_id: int) -> int:
     """Upload leads with personalized messages to HeyReach via the existing client."""
-    from app.services.heyreach import get_heyreach_client, HeyReachError
+    from app.services.heyreach import get_heyreach_client, upload_leads_to_list
 
     if not leads:
         return 0
@@ -682,18 +715,12 @@ async def upload_to_heyreach(leads: list[dict], list_id: int) -> int:
             "custom_fields": {"personalized_message": lead["personalized_message"]},
         })
 
-    total = 0
-    for i in range(0, len(formatted), 100):
-        chunk = formatted[i : i + 100]
-        try:
-            result = await heyreach.add_leads_to_list(list_id, chunk)
-            added = result.get("addedCount", 0) if isinstance(result, dict) else len(chunk)
-            total += added
-        except HeyReachError as e:
-            logger.error(f"HeyReach upload failed: {e}")
+    if not formatted:
+        return 0
 
-    logger.info(f"Uploaded {total} leads to HeyReach list {list_id}")
-    return total
+    # Chunks go up concurrently; leads already in the list count as updated
+    totals = await upload_leads_to_list(list_id, formatted, client=heyreach)
+    return totals["added"] + totals["updated"]
 
 
 # ===================================================================
@@ -805,6 +832,7 @@ async def run_competitor_post_pipeline(
     allowed_countries: list[str] | None = None,
     heyreach_list_id: int = HEYREACH_LIST_ID,
     dry_run: bool = False,
+    pipeline_run_id: uuid.UUID | None = None,
 ) -> dict[str, Any]:
     """Run the full 13-step competitor post pipeline.
 
@@ -814,6 +842,7 @@ async def run_competitor_post_pipeline(
     Surplus leads (ICP-qualified but not yet personalized/uploaded) are stored
     as Prospect records with personalized_message=NULL so they can be
     picked up by future top-up runs without re-scraping.
+    When started by the pipeline executor, pipeline_run_id is its queued run.
     """
     from app.database import async_session_factory
 
@@ -821,9 +850,13 @@ async def run_competitor_post_pipeline(
         allowed_countries = ["United States", "Canada", "USA", "America"]
 
     async with async_session_factory() as session:
-        # Create PipelineRun
-        pipeline_run = PipelineRun(run_type="competitor_post", status="started")
-        session.add(pipeline_run)
+        # Create PipelineRun (or adopt the executor's queued one)
+        pipeline_run = await session.get(PipelineRun, pipeline_run_id) if pipeline_run_id else None
+        if pipeline_run is None:
+            pipeline_run = PipelineRun(run_type="competitor_post")
+            session.add(pipeline_run)
+        pipeline_run.status = "started"
+        pipeline_run.started_at = datetime.now(timezone.utc)
         await session.commit()
         run_id = pipeline_run.id
 
@@ -926,9 +959,7 @@ async def run_competitor_post_pipeline(
 
             # Step 11: Personalize
             logger.info(f"[11/13] Personalizing {len(qualified)} leads...")
-            for lead in qualified:
-                lead["personalized_message"] = await generate_personalization_deepseek(lead)
-            personalized = [l for l in qualified if l.get("personalized_message")]
+            personalized = await personalize_leads(qualified, generate_personalization_deepseek)
             counts["personalizations"] = len(personalized)
 
             # Step 12: Validate & fix
@@ -22,6 +22,8 @@ from decimal import Decimal
 import anthropic
 
 from app.config import settings
+from app.prompts.budget import OMITTED_MARKER, fit_history
+from app.services.llm_usage import LLMUsage, cached_block, record_llm_cost
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +31,8 @@ QA_MODEL = "claude-sonnet-4-20250514"
 PASS_THRESHOLD = 4.0
 FLAG_THRESHOLD = 3.0
 MAX_GUIDELINES_PER_STAGE = 15
+INPUT_PRICE = Decimal("0.000003")  # Per uncached input token
+OUTPUT_PRICE = Decimal("0.000015")
 
 QA_SYSTEM_PROMPT = """\
 You are a QA agent for LinkedIn outreach reply drafts. Your job is to evaluate whether a draft reply is safe and effective to send to a prospect.
@@ -100,16 +104,27 @@ class QAAgentError(Exception):
     pass
 
 
-def _build_qa_prompt(
+def _build_guidelines_section(guidelines: list[dict] | None) -> str:
+    """Render the active QA guidelines (identical for every draft of a stage)."""
+    if not guidelines:
+        return ""
+    parts = ["## Active QA Guidelines:"]
+    for i, g in enumerate(guidelines[:MAX_GUIDELINES_PER_STAGE], 1):
+        gtype = g.get("guideline_type", "rule")
+        content = g.get("content", "")
+        parts.append(f"{i}. [{gtype.upper()}] {content}")
+    return "\n".join(parts)
+
+
+def _build_draft_section(
     lead_name: str,
     lead_message: str,
     ai_draft: str,
     detected_stage: str,
     stage_reasoning: str | None = None,
     conversation_history: list[dict] | None = None,
-    guidelines: list[dict] | None = None,
 ) -> str:
-    """Build the user prompt for QA evaluation."""
+    """Render the per-draft part of the QA prompt."""
     parts = []
 
     parts.append(f"## Lead: {lead_name}")
@@ -119,34 +134,84 @@ def _build_qa_prompt(
 
     if conversation_history:
         parts.append("\n## Conversation History:")
-        for msg in conversation_history:
-            role = msg.get("role", "unknown")
-            content = msg.get("content", "")
-            parts.append(f"**{role}**: {content}")
+        history_lines, omitted = fit_history(
+            conversation_history,
+            settings.prompt_history_token_budget,
+            lambda msg, content: f"**{msg.get('role', 'unknown')}**: {content}",
+            recent_turns=settings.prompt_history_recent_turns,
+            compressed_chars=settings.prompt_history_compressed_chars,
+        )
+        if omitted:
+            parts.append(OMITTED_MARKER.format(count=omitted))
+        parts.extend(history_lines)
 
     parts.append(f"\n## Lead's Latest Message:\n{lead_message}")
     parts.append(f"\n## AI Draft Reply:\n{ai_draft}")
-
-    if guidelines:
-        parts.append("\n## Active QA Guidelines:")
-        for i, g in enumerate(guidelines[:MAX_GUIDELINES_PER_STAGE], 1):
-            gtype = g.get("guideline_type", "rule")
-            content = g.get("content", "")
-            parts.append(f"{i}. [{gtype.upper()}] {content}")
-
     parts.append("\nEvaluate this draft and respond with the JSON object.")
 
     return "\n".join(parts)
 
 
+def _build_qa_messages(
+    lead_name: str,
+    lead_message: str,
+    ai_draft: str,
+    detected_stage: str,
+    stage_reasoning: str | None = None,
+    conversation_history: list[dict] | None = None,
+    guidelines: list[dict] | None = None,
+) -> list[dict]:
+    """Build the QA request messages, static guidelines first.
+
+    The guidelines block is a prompt-cache breakpoint, so consecutive QA
+    checks for the same stage only pay full input price for the draft part.
+    """
+    content = []
+    guidelines_section = _build_guidelines_section(guidelines)
+    if guidelines_section:
+        content.append(cached_block(guidelines_section))
+    content.append({
+        "type": "text",
+        "text": _build_draft_section(
+            lead_name=lead_name,
+            lead_message=lead_message,
+            ai_draft=ai_draft,
+            detected_stage=detected_stage,
+            stage_reasoning=stage_reasoning,
+            conversation_history=conversation_history,
+        ),
+    })
+    return [{"role": "user", "content": content}]
+
+
+def _build_qa_prompt(
+    lead_name: str,
+    lead_message: str,
+    ai_draft: str,
+    detected_stage: str,
+    stage_reasoning: str | None = None,
+    conversation_history: list[dict] | None = None,
+    guidelines: list[dict] | None = None,
+) -> str:
+    """Build the user prompt for QA evaluation (as sent, flattened to text)."""
+    messages = _build_qa_messages(
+        lead_name=lead_name,
+        lead_message=lead_message,
+        ai_draft=ai_draft,
+        detected_stage=detected_stage,
+        stage_reasoning=stage_reasoning,
+        conversation_history=conversation_history,
+        guidelines=guidelines,
+    )
+    return "\n\n".join(block["text"] for block in messages[0]["content"])
+
+
 def _estimate_cost(input_tokens: int, output_tokens: int) -> Decimal:
     """Estimate cost for Claude Sonnet call.
 
     Sonnet pricing: $3/M input, $15/M output (as of 2025).
     """
-    input_cost = Decimal(str(input_tokens)) * Decimal("0.000003")
-    output_cost = Decimal(str(output_tokens)) * Decimal("0.000015")
-    return (input_cost + output_cost).quantize(Decimal("0.000001"))
+    return LLMUsage(input_tokens=input_tokens, output_tokens=output_tokens).cost(INPUT_PRICE, OUTPUT_PRICE)
 
 
 async def load_guidelines_for_stage(session, stage: str) -> list[dict]:
@@ -169,7 +234,8 @@ async def load_guidelines_for_stage(session, stage: str) -> list[dict]:
             QAGuideline.is_active.is_(True),
             or_(QAGuideline.stage == stage, QAGuideline.stage == "all"),
         )
-        .order_by(QAGuideline.occurrences.desc())
+        # Deterministic order keeps the guidelines block byte-identical for the prompt cache
+        .order_by(QAGuideline.occurrences.desc(), QAGuideline.id)
         .limit(MAX_GUIDELINES_PER_STAGE)
     )
     guidelines = result.scalars().all()
@@ -209,7 +275,7 @@ async def qa_check_draft(
     Raises:
         QAAgentError: If the API call fails or response parsing fails.
     """
-    user_prompt = _build_qa_prompt(
+    messages = _build_qa_messages(
         lead_name=lead_name,
         lead_message=lead_message,
         ai_draft=ai_draft,
@@ -224,14 +290,14 @@ async def qa_check_draft(
         response = await client.messages.create(
             model=QA_MODEL,
             max_tokens=600,
-            messages=[{"role": "user", "content": user_prompt}],
-            system=QA_SYSTEM_PROMPT,
+            messages=messages,
+            system=[cached_block(QA_SYSTEM_PROMPT)],
         )
 
         raw_text = response.content[0].text.strip()
-        input_tokens = response.usage.input_tokens
-        output_tokens = response.usage.output_tokens
-        cost = _estimate_cost(input_tokens, output_tokens)
+        usage = LLMUsage.from_anthropic(response.usage)
+        cost = usage.cost(INPUT_PRICE, OUTPUT_PRICE)
+        record_llm_cost("anthropic", "qa_check", usage, cost, note=detected_stage)
 
     except Exception as e:
         raise QAAgentError(f"Anthropic API error: {e}") from e
@@ -0,0 +1,76 @@
+"""Async rate and concurrency limiting shared by the outbound API clients."""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Async token bucket with an optional pause (for Retry-After)."""
+
+    def __init__(self, rate: float, capacity: int):
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def pause(self, seconds: float) -> None:
+        """Block all acquires for ``seconds`` and drain the burst allowance."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+class AdaptiveLimiter:
+    """Concurrency limit that adapts to upstream throttling (AIMD).
+
+    Use as ``async with limiter:``. The limit grows by one after ``limit``
+    consecutive successes and halves whenever the upstream rate-limits us,
+    so concurrency settles just below what the API will accept.
+    """
+
+    def __init__(self, initial: int, maximum: int, minimum: int = 1):
+        self._min = max(1, minimum)
+        self._max = max(self._min, maximum)
+        self.limit = min(max(initial, self._min), self._max)
+        self._active = 0
+        self._successes = 0
+        self._cond = asyncio.Condition()
+
+    async def __aenter__(self) -> "AdaptiveLimiter":
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+
+    def record_success(self) -> None:
+        """Count a successful call; widen the limit after a full window of them."""
+        self._successes += 1
+        if self._successes >= self.limit:
+            self._successes = 0
+            self.limit = min(self._max, self.limit + 1)
+
+    def record_throttle(self) -> None:
+        """Halve the limit after a rate-limit response."""
+        self._successes = 0
+        self.limit = max(self._min, self.limit // 2)
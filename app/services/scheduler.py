@@ -1,11 +1,29 @@
-"""Scheduler service for snooze reminders and scheduled reports using APScheduler."""
+"""Scheduler service for snooze reminders and scheduled reports using APScheduler.
 
+Jobs live in a SQLAlchemy job store on the app database, so snoozes and
+scheduled messages survive redeploys. Every worker shares that store, but
+only the holder of a Postgres advisory lock runs jobs; the others keep
+their scheduler paused and only add/remove jobs.
+"""
+
+import asyncio
+import logging
 import uuid
 from datetime import date, datetime, timedelta, timezone
 
+from apscheduler.jobstores.base import JobLookupError
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.date import DateTrigger
+from sqlalchemy import Connection, Engine, create_engine, text
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# pg advisory lock key for scheduler leadership (arbitrary, app-wide unique)
+SCHEDULER_LOCK_KEY = 727_001
 
 
 def calculate_snooze_time(duration: str) -> datetime:
@@ -291,14 +309,12 @@ async def expire_stale_drafts_task(session=None) -> None:
 async def run_health_check_task() -> None:
     """Run production health checks. Called by scheduler at 10am and 3pm UK time."""
     import logging
-    from app.database import async_session_factory
-    from app.services.health_check import CheckStatus, run_health_check
+    from app.services.health_check import CheckStatus, refresh_health_report
 
     logger = logging.getLogger(__name__)
 
     try:
-        async with async_session_factory() as session:
-            report = await run_health_check(session)
+        report = await refresh_health_report()
 
         logger.info(
             f"Health check completed: {report.status.value} "
@@ -451,19 +467,143 @@ async def send_scheduled_pitched_message(
         logger.error(f"Error sending scheduled message: {e}", exc_info=True)
 
 
+class SchedulerLeaderLock:
+    """Session-level Postgres advisory lock electing the worker that runs jobs.
+
+    The lock is held on a dedicated connection, so Postgres releases it if
+    the leader dies and a follower takes over on its next poll. Non-Postgres
+    databases (local SQLite) are single-process, so the lock always succeeds.
+    """
+
+    def __init__(self, engine: Engine, key: int = SCHEDULER_LOCK_KEY):
+        self._engine = engine
+        self._key = key
+        self._conn: Connection | None = None
+
+    def acquire(self) -> bool:
+        """Try to take (or confirm we still hold) the lock.
+
+        Returns:
+            True if this process holds the lock.
+        """
+        if self._engine.dialect.name != "postgresql":
+            return True
+
+        if self._conn is not None:
+            try:
+                self._conn.execute(text("SELECT 1"))
+                return True
+            except Exception as e:
+                logger.warning(f"Scheduler leader connection lost: {e}")
+                self._close()
+                return False
+
+        conn = self._engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+        try:
+            acquired = conn.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": self._key}
+            ).scalar()
+        except Exception:
+            conn.close()
+            raise
+        if acquired:
+            self._conn = conn
+            return True
+        conn.close()
+        return False
+
+    def release(self) -> None:
+        """Release the lock if held."""
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": self._key})
+        except Exception as e:
+            logger.warning(f"Failed to release scheduler leader lock: {e}")
+        self._close()
+
+    def _close(self) -> None:
+        try:
+            self._conn.close()
+        except Exception:
+            pass
+        self._conn = None
+
+
 class SchedulerService:
     """Service for managing scheduled tasks."""
 
-    def __init__(self):
-        """Initialize the scheduler service."""
-        self._scheduler = AsyncIOScheduler()
-        self._jobs: dict[uuid.UUID, str] = {}  # draft_id -> job_id mapping
+    def __init__(self, jobstore_url: str | None = None):
+        """Initialize the scheduler service.
+
+        Args:
+            jobstore_url: Sync SQLAlchemy URL for a persistent job store shared
+                by all workers. None keeps jobs in memory with no leader election.
+        """
+        self._leader_lock: SchedulerLeaderLock | None = None
+        self._leader_task: asyncio.Task | None = None
+        self._is_leader = False
+
+        if jobstore_url:
+            engine = create_engine(jobstore_url, pool_pre_ping=True)
+            self._scheduler = AsyncIOScheduler(
+                jobstores={"default": SQLAlchemyJobStore(engine=engine)},
+                job_defaults={"coalesce": True},
+            )
+            self._leader_lock = SchedulerLeaderLock(engine)
+        else:
+            self._scheduler = AsyncIOScheduler()
+
+    @property
+    def is_leader(self) -> bool:
+        """Whether this worker executes jobs (always True without a shared store)."""
+        return self._leader_lock is None or self._is_leader
 
     def start(self) -> None:
-        """Start the scheduler and register recurring jobs."""
-        if not self._scheduler.running:
-            self._register_report_jobs()
+        """Start the scheduler and register recurring jobs.
+
+        With a shared job store the scheduler starts paused and only resumes
+        in the worker that wins the leader lock.
+        """
+        if self._scheduler.running:
+            return
+        self._register_report_jobs()
+
+        if self._leader_lock is None:
             self._scheduler.start()
+            return
+
+        self._scheduler.start(paused=True)
+        try:
+            leader = self._leader_lock.acquire()
+        except Exception as e:
+            logger.warning(f"Scheduler leader lock check failed: {e}")
+            leader = False
+        self._set_leader(leader)
+        self._leader_task = asyncio.get_running_loop().create_task(self._leader_loop())
+
+    async def _leader_loop(self) -> None:
+        """Re-check leadership periodically; followers take over a dead leader."""
+        while True:
+            await asyncio.sleep(settings.scheduler_leader_poll_seconds)
+            try:
+                leader = await asyncio.to_thread(self._leader_lock.acquire)
+            except Exception as e:
+                logger.warning(f"Scheduler leader lock check failed: {e}")
+                leader = False
+            self._set_leader(leader)
+
+    def _set_leader(self, leader: bool) -> None:
+        if leader and not self._is_leader:
+            self._scheduler.resume()
+            logger.info("This worker is now the scheduler leader")
+        elif not leader and self._is_leader:
+            self._scheduler.pause()
+            logger.warning("Lost scheduler leadership, pausing job execution")
+        elif leader:
+            # Pick up jobs other workers added to the shared store
+            self._scheduler.wakeup()
+        self._is_leader = leader
 
     def _register_report_jobs(self) -> None:
         """Register daily and weekly report jobs."""
@@ -616,8 +756,14 @@ class SchedulerService:
         Args:
             wait: Whether to wait for running jobs to complete.
         """
+        if self._leader_task is not None:
+            self._leader_task.cancel()
+            self._leader_task = None
         if self._scheduler.running:
             self._scheduler.shutdown(wait=wait)
+        if self._leader_lock is not None:
+            self._leader_lock.release()
+            self._is_leader = False
 
     def add_snooze_reminder(
         self,
@@ -633,22 +779,19 @@ class SchedulerService:
         Returns:
             The job ID.
         """
-        job_id = f"snooze_{draft_id}"
+        job_id = _snooze_job_id(draft_id)
 
-        # Remove existing job if any
-        self.cancel_snooze_reminder(draft_id)
-
-        # Add new job
+        # Replaces any existing reminder for this draft
         self._scheduler.add_job(
             send_snooze_reminder,
             trigger=DateTrigger(run_date=run_time),
             args=[draft_id],
             id=job_id,
             name=f"Snooze reminder for draft {draft_id}",
+            replace_existing=True,
             misfire_grace_time=300,  # 5 minutes grace time
         )
 
-        self._jobs[draft_id] = job_id
         return job_id
 
     def add_scheduled_message(
@@ -689,15 +832,11 @@ class SchedulerService:
         Returns:
             True if a job was cancelled, False if no job existed.
         """
-        job_id = self._jobs.pop(draft_id, None)
-        if job_id:
-            try:
-                self._scheduler.remove_job(job_id)
-                return True
-            except Exception:
-                # Job may not exist
-                pass
-        return False
+        try:
+            self._scheduler.remove_job(_snooze_job_id(draft_id))
+            return True
+        except JobLookupError:
+            return False
 
     def get_job_info(self, draft_id: uuid.UUID) -> dict | None:
         """Get information about a scheduled job.
@@ -708,16 +847,26 @@ class SchedulerService:
         Returns:
             Job information dict or None if no job exists.
         """
-        job_id = self._jobs.get(draft_id)
-        if job_id:
-            job = self._scheduler.get_job(job_id)
-            if job:
-                return {
-                    "id": job.id,
-                    "name": job.name,
-                    "next_run_time": job.next_run_time,
-                }
-        return None
+        job = self._scheduler.get_job(_snooze_job_id(draft_id))
+        return _job_info(job) if job else None
+
+    def list_jobs(self) -> list[dict]:
+        """All jobs in the (shared) job store, soonest first."""
+        jobs = [_job_info(job) for job in self._scheduler.get_jobs()]
+        far_future = datetime.max.replace(tzinfo=timezone.utc)
+        return sorted(jobs, key=lambda j: j["next_run_time"] or far_future)
+
+
+def _snooze_job_id(draft_id: uuid.UUID) -> str:
+    return f"snooze_{draft_id}"
+
+
+def _job_info(job) -> dict:
+    return {
+        "id": job.id,
+        "name": job.name,
+        "next_run_time": job.next_run_time,
+    }
 
 
 # Global scheduler instance
@@ -728,7 +877,8 @@ def get_scheduler_service() -> SchedulerService:
     """Get or create the scheduler service singleton."""
     global _scheduler
     if _scheduler is None:
-        _scheduler = SchedulerService()
+        jobstore_url = settings.sync_database_url if settings.scheduler_persistent_jobs else None
+        _scheduler = SchedulerService(jobstore_url=jobstore_url)
     return _scheduler
 
 
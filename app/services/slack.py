@@ -2,6 +2,7 @@
 
 import json
 import logging
+import os
 import re
 import uuid
 from datetime import date
@@ -14,6 +15,17 @@ from slack_sdk.errors import SlackApiError
 from app.config import settings
 from app.models import FunnelStage, WatchedProfileCategory
 from app.services.reports import format_minutes
+from app.services.slack_dispatch import SlackDispatcher
+from app.services.slack_templates import (
+    DIVIDER,
+    Fmt,
+    Slot,
+    button,
+    compile_template,
+    header,
+    mrkdwn_context,
+    mrkdwn_section,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +50,88 @@ STAGE_DISPLAY = {
 }
 
 
+# Precompiled Block Kit templates (see app.services.slack_templates). Static
+# parts of the rendered blocks are shared between calls, so treat every
+# builder's output as read-only.
+_render_context = compile_template(mrkdwn_context(Slot("text")))
+_render_section = compile_template(mrkdwn_section(Slot("text")))
+
+_DRAFT_HEADER = header("📩 New LinkedIn Reply")
+_render_draft_lead = compile_template({
+    "type": "section",
+    "fields": [
+        {"type": "mrkdwn", "text": Fmt("*From:*\n{lead_info}")},
+        {"type": "mrkdwn", "text": Fmt("*LinkedIn:*\n<{linkedin_url}|View Profile>")},
+    ],
+})
+_render_draft_their_message = compile_template([
+    mrkdwn_section(Fmt("*Their Message:*\n_{lead_message}_")),
+    DIVIDER,
+])
+_render_draft_suggestion = compile_template([
+    mrkdwn_section(Fmt("*🤖 Suggested Reply:*\n{ai_draft}")),
+    DIVIDER,
+])
+
+_CLASSIFY_POSITIVE_BUTTON = button("\U0001f44d Positive Reply", "classify_positive", Slot("draft_id"))
+_CLASSIFY_BUTTONS = [
+    button("\U0001f3af Pitched", "funnel_pitched", Slot("draft_id")),
+    button("\U0001f4c5 Calendar Shown", "funnel_calendar_sent", Slot("draft_id")),
+    button("\U0001f44e Not Interested", "classify_not_interested", Slot("draft_id")),
+    button("\U0001f6ab Not ICP", "classify_not_icp", Slot("draft_id")),
+]
+# Gift Leads uses the streamlined confirm_icp flow when a prospect is known,
+# otherwise the legacy gift_leads flow keyed on the draft
+_GIFT_LEADS_BUTTONS = {
+    True: button("\U0001f381 Gift Leads", "confirm_icp_gift_leads", Slot("prospect_id")),
+    False: button("\U0001f381 Gift Leads", "gift_leads", Slot("draft_id")),
+}
+# (is_first_reply, has_prospect) -> renderer
+_CLASSIFICATION_TEMPLATES = {
+    (first_reply, has_prospect): compile_template([{
+        "type": "actions",
+        "elements": (
+            ([_CLASSIFY_POSITIVE_BUTTON] if first_reply else [])
+            + _CLASSIFY_BUTTONS
+            + [_GIFT_LEADS_BUTTONS[has_prospect]]
+        ),
+    }])
+    for first_reply in (True, False)
+    for has_prospect in (True, False)
+}
+
+_render_action_buttons = compile_template([
+    {
+        "type": "actions",
+        "elements": [
+            button("✅ Send", "approve", Slot("draft_id"), style="primary"),
+            button("✏️ Edit", "edit", Slot("draft_id")),
+            button("🔄 Regenerate", "regenerate", Slot("draft_id")),
+            button("❌ Skip", "reject", Slot("draft_id"), style="danger"),
+        ],
+    },
+    {
+        "type": "actions",
+        "elements": [
+            button("⏰ Snooze 1h", "snooze_1h", Slot("draft_id")),
+            button("⏰ Snooze 4h", "snooze_4h", Slot("draft_id")),
+            button("⏰ Tomorrow", "snooze_tomorrow", Slot("draft_id")),
+        ],
+    },
+])
+
+
+def _format_lead_info(lead_name: str, lead_title: str | None, lead_company: str | None) -> str:
+    """Format 'Name (Title @ Company)' with whichever parts are known."""
+    if lead_title and lead_company:
+        return f"{lead_name} ({lead_title} @ {lead_company})"
+    if lead_title:
+        return f"{lead_name} ({lead_title})"
+    if lead_company:
+        return f"{lead_name} @ {lead_company}"
+    return lead_name
+
+
 def build_draft_message(
     lead_name: str,
     lead_title: str | None,
@@ -67,25 +161,7 @@ def build_draft_message(
     Returns:
         List of Slack Block Kit blocks.
     """
-    # Build lead info line
-    lead_info = lead_name
-    if lead_title and lead_company:
-        lead_info = f"{lead_name} ({lead_title} @ {lead_company})"
-    elif lead_title:
-        lead_info = f"{lead_name} ({lead_title})"
-    elif lead_company:
-        lead_info = f"{lead_name} @ {lead_company}"
-
-    blocks = [
-        {
-            "type": "header",
-            "text": {
-                "type": "plain_text",
-                "text": "📩 New LinkedIn Reply",
-                "emoji": True
-            }
-        },
-    ]
+    blocks = [_DRAFT_HEADER]
 
     # Add funnel stage context if available
     if funnel_stage:
@@ -95,48 +171,18 @@ def build_draft_message(
         stage_text = f"*Stage:* {stage_label}"
         if stage_reasoning:
             stage_text += f"\n_{stage_reasoning}_"
+        blocks.append(_render_context(text=stage_text))
 
-        blocks.append({
-            "type": "context",
-            "elements": [{"type": "mrkdwn", "text": stage_text}]
-        })
-
-    blocks.append({
-        "type": "section",
-        "fields": [
-            {
-                "type": "mrkdwn",
-                "text": f"*From:*\n{lead_info}"
-            },
-            {
-                "type": "mrkdwn",
-                "text": f"*LinkedIn:*\n<{linkedin_url}|View Profile>"
-            }
-        ]
-    })
+    blocks.append(_render_draft_lead(
+        lead_info=_format_lead_info(lead_name, lead_title, lead_company),
+        linkedin_url=linkedin_url,
+    ))
 
     # Show the outbound message that triggered this reply (if available)
     if triggering_message:
-        blocks.append({
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": f"*Our Message:*\n{triggering_message}"
-            }
-        })
+        blocks.append(_render_section(text=f"*Our Message:*\n{triggering_message}"))
 
-    blocks.extend([
-        {
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": f"*Their Message:*\n_{lead_message}_"
-            }
-        },
-        {
-            "type": "divider"
-        },
-    ])
+    blocks.extend(_render_draft_their_message(lead_message=lead_message))
 
     # Add judge quality score if available
     if judge_score is not None:
@@ -149,23 +195,9 @@ def build_draft_message(
         score_text = f"{dot} *Quality: {judge_score:.1f}/5*"
         if revision_count > 0:
             score_text += f"  (revised {revision_count}x)"
-        blocks.append({
-            "type": "context",
-            "elements": [{"type": "mrkdwn", "text": score_text}]
-        })
+        blocks.append(_render_context(text=score_text))
 
-    blocks.extend([
-        {
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": f"*🤖 Suggested Reply:*\n{ai_draft}"
-            }
-        },
-        {
-            "type": "divider"
-        }
-    ])
+    blocks.extend(_render_draft_suggestion(ai_draft=ai_draft))
 
     return blocks
 
@@ -187,73 +219,8 @@ def build_classification_buttons(
     Returns:
         List of Slack Block Kit blocks (context + actions).
     """
-    elements = []
-
-    # Only show Positive Reply button on first reply
-    if is_first_reply:
-        elements.append({
-            "type": "button",
-            "text": {"type": "plain_text", "text": "\U0001f44d Positive Reply", "emoji": True},
-            "action_id": "classify_positive",
-            "value": str(draft_id),
-        })
-
-    # Funnel stage buttons - always show
-    elements.extend([
-        {
-            "type": "button",
-            "text": {"type": "plain_text", "text": "\U0001f3af Pitched", "emoji": True},
-            "action_id": "funnel_pitched",
-            "value": str(draft_id),
-        },
-        {
-            "type": "button",
-            "text": {"type": "plain_text", "text": "\U0001f4c5 Calendar Shown", "emoji": True},
-            "action_id": "funnel_calendar_sent",
-            "value": str(draft_id),
-        },
-    ])
-
-    # Always show Not Interested and Not ICP buttons
-    elements.extend([
-        {
-            "type": "button",
-            "text": {"type": "plain_text", "text": "\U0001f44e Not Interested", "emoji": True},
-            "action_id": "classify_not_interested",
-            "value": str(draft_id),
-        },
-        {
-            "type": "button",
-            "text": {"type": "plain_text", "text": "\U0001f6ab Not ICP", "emoji": True},
-            "action_id": "classify_not_icp",
-            "value": str(draft_id),
-        },
-    ])
-
-    # Gift Leads button (always show)
-    # When prospect_id is available, use the streamlined confirm_icp flow
-    # Otherwise fall back to the legacy gift_leads flow (uses draft_id)
-    if prospect_id is not None:
-        elements.append({
-            "type": "button",
-            "text": {"type": "plain_text", "text": "\U0001f381 Gift Leads", "emoji": True},
-            "action_id": "confirm_icp_gift_leads",
-            "value": str(prospect_id),
-        })
-    else:
-        elements.append({
-            "type": "button",
-            "text": {"type": "plain_text", "text": "\U0001f381 Gift Leads", "emoji": True},
-            "action_id": "gift_leads",
-            "value": str(draft_id),
-        })
-
-    return [
-        {
-            "type": "actions",
-            "elements": elements,
-        }
-    ]
+    render = _CLASSIFICATION_TEMPLATES[(bool(is_first_reply), prospect_id is not None)]
+    return render(draft_id=str(draft_id), prospect_id=str(prospect_id))
 
 
 def build_qa_annotation(
@@ -279,13 +246,7 @@ def build_qa_annotation(
     else:
         badge = f":red_circle: QA Block ({qa_score:.1f}/5)"
 
-    blocks: list[dict[str, Any]] = [
-        {"type": "divider"},
-        {
-            "type": "context",
-            "elements": [{"type": "mrkdwn", "text": badge}],
-        },
-    ]
+    blocks: list[dict[str, Any]] = [DIVIDER, _render_context(text=badge)]
 
     # Add issue details for flagged drafts
     if qa_issues and qa_score < 4.0:
@@ -295,10 +256,7 @@ def build_qa_annotation(
             icon = ":warning:" if severity == "high" else ":information_source:"
             issue_lines.append(f"{icon} {issue.get('type', 'issue')}: {issue.get('detail', '')}")
         if issue_lines:
-            blocks.append({
-                "type": "context",
-                "elements": [{"type": "mrkdwn", "text": "\n".join(issue_lines)}],
-            })
+            blocks.append(_render_context(text="\n".join(issue_lines)))
 
     return blocks
 
@@ -312,62 +270,7 @@ def build_action_buttons(draft_id: uuid.UUID) -> list[dict[str, Any]]:
     Returns:
         List of Slack Block Kit action elements.
     """
-    return [
-        {
-            "type": "actions",
-            "elements": [
-                {
-                    "type": "button",
-                    "text": {"type": "plain_text", "text": "✅ Send", "emoji": True},
-                    "style": "primary",
-                    "action_id": "approve",
-                    "value": str(draft_id)
-                },
-                {
-                    "type": "button",
-                    "text": {"type": "plain_text", "text": "✏️ Edit", "emoji": True},
-                    "action_id": "edit",
-                    "value": str(draft_id)
-                },
-                {
-                    "type": "button",
-                    "text": {"type": "plain_text", "text": "🔄 Regenerate", "emoji": True},
-                    "action_id": "regenerate",
-                    "value": str(draft_id)
-                },
-                {
-                    "type": "button",
-                    "text": {"type": "plain_text", "text": "❌ Skip", "emoji": True},
-                    "style": "danger",
-                    "action_id": "reject",
-                    "value": str(draft_id)
-                }
-            ]
-        },
-        {
-            "type": "actions",
-            "elements": [
-                {
-                    "type": "button",
-                    "text": {"type": "plain_text", "text": "⏰ Snooze 1h", "emoji": True},
-                    "action_id": "snooze_1h",
-                    "value": str(draft_id)
-                },
-                {
-                    "type": "button",
-                    "text": {"type": "plain_text", "text": "⏰ Snooze 4h", "emoji": True},
-                    "action_id": "snooze_4h",
-                    "value": str(draft_id)
-                },
-                {
-                    "type": "button",
-                    "text": {"type": "plain_text", "text": "⏰ Tomorrow", "emoji": True},
-                    "action_id": "snooze_tomorrow",
-                    "value": str(draft_id)
-                }
-            ]
-        }
-    ]
+    return _render_action_buttons(draft_id=str(draft_id))
 
 
 def parse_action_payload(payload: dict) -> tuple[str, uuid.UUID]:
@@ -396,9 +299,18 @@ def parse_action_payload(payload: dict) -> tuple[str, uuid.UUID]:
         raise ValueError(f"Invalid action payload: {e}") from e
 
 
+_FOCUS_PATTERN = re.compile(r"## This Week's Focus\n+(.*?)(?=\n## |\Z)", re.DOTALL)
+
+# path -> ((st_mtime_ns, st_size), focus); re-parsed only when the file changes
+_focus_cache: dict[str, tuple[tuple[int, int], str | None]] = {}
+
+
 def _get_current_focus(path: str | None = None) -> str | None:
     """Read the 'This Week's Focus' section from strategy.md.
 
+    The parsed section is cached per path and invalidated when the file's
+    mtime or size changes.
+
     Args:
         path: Override path to the strategy file (for testing).
 
@@ -406,22 +318,122 @@ def _get_current_focus(path: str | None = None) -> str | None:
         The focus section text, or None if unavailable.
     """
     file_path = path or _STRATEGY_FILE_PATH
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _focus_cache.get(file_path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
     try:
         text = Path(file_path).read_text(encoding="utf-8")
     except (FileNotFoundError, OSError, UnicodeDecodeError):
         return None
 
     # Extract text between "## This Week's Focus" and the next "## " heading (or EOF)
-    match = re.search(
-        r"## This Week's Focus\n+(.*?)(?=\n## |\Z)",
-        text,
-        re.DOTALL,
-    )
-    if not match:
-        return None
-
-    focus = match.group(1).strip()
-    return focus or None
+    match = _FOCUS_PATTERN.search(text)
+    focus = (match.group(1).strip() or None) if match else None
+    _focus_cache[file_path] = (version, focus)
+    return focus
+
+
+_render_daily_header = compile_template([
+    header(Fmt("Daily Metrics - {report_date:%b %d, %Y}")),
+    DIVIDER,
+])
+_render_daily_focus = compile_template(mrkdwn_section(Fmt("*:dart: This Week's Focus*\n{focus}")))
+_render_daily_body = compile_template([
+    {
+        "type": "section",
+        "fields": [
+            {"type": "mrkdwn", "text": Fmt(
+                "*Outreach*\n"
+                "Profiles: {profiles_scraped}\n"
+                "ICP Qualified: {icp_qualified}\n"
+                "Uploaded: {heyreach_uploaded}"
+            )},
+            {"type": "mrkdwn", "text": Fmt(
+                "*Conversations*\n"
+                "New: {new}\n"
+                "Approved: {drafts_approved}\n"
+                "Positive: {positive}"
+            )},
+        ],
+    },
+    {
+        "type": "section",
+        "fields": [
+            {"type": "mrkdwn", "text": Fmt(
+                "*Funnel*\n"
+                "Pitched: {pitched}\n"
+                "Calendar Sent: {calendar_sent}\n"
+                "Booked: {booked}"
+            )},
+            {"type": "mrkdwn", "text": Fmt(
+                "*Content*\n"
+                "Created: {drafts_created}\n"
+                "Scheduled: {drafts_scheduled}\n"
+                "Posted: {drafts_posted}"
+            )},
+        ],
+    },
+    mrkdwn_section(Fmt(
+        "*Response Speed*\n"
+        "Speed to Lead: {stl_avg} avg ({stl_count} replies)\n"
+        "Our Response: {str_avg} avg ({str_count} sent)"
+    )),
+    mrkdwn_context(Fmt("Cost: ${total_cost:.2f}")),
+])
+
+_render_weekly_report = compile_template([
+    header(Fmt("Weekly Summary - Week of {start_date:%b %d, %Y}")),
+    DIVIDER,
+    mrkdwn_section(Fmt(
+        "*Outreach Pipeline*\n"
+        "* Profiles Scraped: {profiles_scraped:,}\n"
+        "* ICP Qualified: {icp_qualified:,} ({icp_rate}%)\n"
+        "* Uploaded to HeyReach: {heyreach_uploaded:,}"
+    )),
+    mrkdwn_section(Fmt(
+        "*Conversations*\n"
+        "* New: {new}\n"
+        "* Positive Reply Rate: {positive_reply_rate}%"
+    )),
+    mrkdwn_section(Fmt(
+        "*Funnel Performance*\n"
+        "* Positive -> Pitched: {positive_to_pitched}\n"
+        "* Pitched -> Calendar: {pitched_to_calendar}\n"
+        "* Calendar -> Booked: {calendar_to_booked}\n"
+        "* Total Booked: {booked}"
+    )),
+    mrkdwn_section(Fmt(
+        "*Response Speed*\n"
+        "* Speed to Lead: {stl_avg} avg ({stl_count} replies)\n"
+        "* Our Response: {str_avg} avg ({str_count} sent)"
+    )),
+    mrkdwn_section(Fmt(
+        "*Content*\n"
+        "* Created: {drafts_created} | "
+        "Scheduled: {drafts_scheduled} | "
+        "Posted: {drafts_posted}"
+    )),
+    mrkdwn_context(Fmt("Weekly Cost: ${total_cost:.2f}")),
+])
+
+
+def _speed_values(speed_metrics: dict[str, Any]) -> dict[str, Any]:
+    """Formatted speed-to-lead / speed-to-reply values for report templates."""
+    speed_to_lead = speed_metrics.get("speed_to_lead")
+    speed_to_reply = speed_metrics.get("speed_to_reply")
+    return {
+        "stl_avg": format_minutes(speed_to_lead.get("avg_minutes") if speed_to_lead else None),
+        "stl_count": speed_to_lead.get("count", 0) if speed_to_lead else 0,
+        "str_avg": format_minutes(speed_to_reply.get("avg_minutes") if speed_to_reply else None),
+        "str_count": speed_to_reply.get("count", 0) if speed_to_reply else 0,
+    }
 
 
 def build_daily_report_blocks(
@@ -443,111 +455,30 @@ def build_daily_report_blocks(
     content = metrics.get("content", {})
     costs = outreach.get("costs", {})
     classifications = conversations.get("classifications", {})
-    speed_metrics = metrics.get("speed_metrics", {})
-
-    total_cost = costs.get("apify", 0) + costs.get("deepseek", 0)
-
-    # Extract speed metrics
-    speed_to_lead = speed_metrics.get("speed_to_lead")
-    speed_to_reply = speed_metrics.get("speed_to_reply")
-    stl_avg = format_minutes(speed_to_lead.get("avg_minutes") if speed_to_lead else None)
-    stl_count = speed_to_lead.get("count", 0) if speed_to_lead else 0
-    str_avg = format_minutes(speed_to_reply.get("avg_minutes") if speed_to_reply else None)
-    str_count = speed_to_reply.get("count", 0) if speed_to_reply else 0
 
-    blocks = [
-        {
-            "type": "header",
-            "text": {
-                "type": "plain_text",
-                "text": f"Daily Metrics - {report_date.strftime('%b %d, %Y')}",
-                "emoji": True
-            }
-        },
-        {
-            "type": "divider"
-        },
-    ]
+    blocks = _render_daily_header(report_date=report_date)
 
     # Append "This Week's Focus" if available
     focus_text = _get_current_focus()
     if focus_text:
-        blocks.append({
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": f"*:dart: This Week's Focus*\n{focus_text}",
-            },
-        })
-
-    blocks.extend([
-        {
-            "type": "section",
-            "fields": [
-                {
-                    "type": "mrkdwn",
-                    "text": (
-                        "*Outreach*\n"
-                        f"Profiles: {outreach.get('profiles_scraped', 0)}\n"
-                        f"ICP Qualified: {outreach.get('icp_qualified', 0)}\n"
-                        f"Uploaded: {outreach.get('heyreach_uploaded', 0)}"
-                    )
-                },
-                {
-                    "type": "mrkdwn",
-                    "text": (
-                        "*Conversations*\n"
-                        f"New: {conversations.get('new', 0)}\n"
-                        f"Approved: {conversations.get('drafts_approved', 0)}\n"
-                        f"Positive: {classifications.get('positive', 0)}"
-                    )
-                }
-            ]
-        },
-        {
-            "type": "section",
-            "fields": [
-                {
-                    "type": "mrkdwn",
-                    "text": (
-                        "*Funnel*\n"
-                        f"Pitched: {funnel.get('pitched', 0)}\n"
-                        f"Calendar Sent: {funnel.get('calendar_sent', 0)}\n"
-                        f"Booked: {funnel.get('booked', 0)}"
-                    )
-                },
-                {
-                    "type": "mrkdwn",
-                    "text": (
-                        "*Content*\n"
-                        f"Created: {content.get('drafts_created', 0)}\n"
-                        f"Scheduled: {content.get('drafts_scheduled', 0)}\n"
-                        f"Posted: {content.get('drafts_posted', 0)}"
-                    )
-                }
-            ]
-        },
-        {
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": (
-                    "*Response Speed*\n"
-                    f"Speed to Lead: {stl_avg} avg ({stl_count} replies)\n"
-                    f"Our Response: {str_avg} avg ({str_count} sent)"
-                )
-            }
-        },
-        {
-            "type": "context",
-            "elements": [
-                {
-                    "type": "mrkdwn",
-                    "text": f"Cost: ${total_cost:.2f}"
-                }
-            ]
-        }
-    ])
+        blocks.append(_render_daily_focus(focus=focus_text))
+
+    blocks.extend(_render_daily_body(
+        profiles_scraped=outreach.get("profiles_scraped", 0),
+        icp_qualified=outreach.get("icp_qualified", 0),
+        heyreach_uploaded=outreach.get("heyreach_uploaded", 0),
+        new=conversations.get("new", 0),
+        drafts_approved=conversations.get("drafts_approved", 0),
+        positive=classifications.get("positive", 0),
+        pitched=funnel.get("pitched", 0),
+        calendar_sent=funnel.get("calendar_sent", 0),
+        booked=funnel.get("booked", 0),
+        drafts_created=content.get("drafts_created", 0),
+        drafts_scheduled=content.get("drafts_scheduled", 0),
+        drafts_posted=content.get("drafts_posted", 0),
+        total_cost=costs.get("apify", 0) + costs.get("deepseek", 0),
+        **_speed_values(metrics.get("speed_metrics", {})),
+    ))
 
     return blocks
 
@@ -573,7 +504,6 @@ def build_weekly_report_blocks(
     content = metrics.get("content", {})
     costs = outreach.get("costs", {})
     classifications = conversations.get("classifications", {})
-    speed_metrics = metrics.get("speed_metrics", {})
 
     # Calculate conversion rates
     positive = classifications.get("positive", 0)
@@ -585,97 +515,24 @@ def build_weekly_report_blocks(
     pitched_to_calendar = f"{(calendar_sent / pitched * 100):.0f}%" if pitched > 0 else "N/A"
     calendar_to_booked = f"{(booked / calendar_sent * 100):.0f}%" if calendar_sent > 0 else "N/A"
 
-    # Extract speed metrics
-    speed_to_lead = speed_metrics.get("speed_to_lead")
-    speed_to_reply = speed_metrics.get("speed_to_reply")
-    stl_avg = format_minutes(speed_to_lead.get("avg_minutes") if speed_to_lead else None)
-    stl_count = speed_to_lead.get("count", 0) if speed_to_lead else 0
-    str_avg = format_minutes(speed_to_reply.get("avg_minutes") if speed_to_reply else None)
-    str_count = speed_to_reply.get("count", 0) if speed_to_reply else 0
-
-    blocks = [
-        {
-            "type": "header",
-            "text": {
-                "type": "plain_text",
-                "text": f"Weekly Summary - Week of {start_date.strftime('%b %d, %Y')}",
-                "emoji": True
-            }
-        },
-        {
-            "type": "divider"
-        },
-        {
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": (
-                    "*Outreach Pipeline*\n"
-                    f"* Profiles Scraped: {outreach.get('profiles_scraped', 0):,}\n"
-                    f"* ICP Qualified: {outreach.get('icp_qualified', 0):,} ({outreach.get('icp_rate', 0)}%)\n"
-                    f"* Uploaded to HeyReach: {outreach.get('heyreach_uploaded', 0):,}"
-                )
-            }
-        },
-        {
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": (
-                    "*Conversations*\n"
-                    f"* New: {conversations.get('new', 0)}\n"
-                    f"* Positive Reply Rate: {conversations.get('positive_reply_rate', 0)}%"
-                )
-            }
-        },
-        {
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": (
-                    "*Funnel Performance*\n"
-                    f"* Positive -> Pitched: {positive_to_pitched}\n"
-                    f"* Pitched -> Calendar: {pitched_to_calendar}\n"
-                    f"* Calendar -> Booked: {calendar_to_booked}\n"
-                    f"* Total Booked: {booked}"
-                )
-            }
-        },
-        {
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": (
-                    "*Response Speed*\n"
-                    f"* Speed to Lead: {stl_avg} avg ({stl_count} replies)\n"
-                    f"* Our Response: {str_avg} avg ({str_count} sent)"
-                )
-            }
-        },
-        {
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": (
-                    "*Content*\n"
-                    f"* Created: {content.get('drafts_created', 0)} | "
-                    f"Scheduled: {content.get('drafts_scheduled', 0)} | "
-                    f"Posted: {content.get('drafts_posted', 0)}"
-                )
-            }
-        },
-        {
-            "type": "context",
-            "elements": [
-                {
-                    "type": "mrkdwn",
-                    "text": f"Weekly Cost: ${costs.get('total', 0):.2f}"
-                }
-            ]
-        }
-    ]
-
-    return blocks
+    return _render_weekly_report(
+        start_date=start_date,
+        profiles_scraped=outreach.get("profiles_scraped", 0),
+        icp_qualified=outreach.get("icp_qualified", 0),
+        icp_rate=outreach.get("icp_rate", 0),
+        heyreach_uploaded=outreach.get("heyreach_uploaded", 0),
+        new=conversations.get("new", 0),
+        positive_reply_rate=conversations.get("positive_reply_rate", 0),
+        positive_to_pitched=positive_to_pitched,
+        pitched_to_calendar=pitched_to_calendar,
+        calendar_to_booked=calendar_to_booked,
+        booked=booked,
+        drafts_created=content.get("drafts_created", 0),
+        drafts_scheduled=content.get("drafts_scheduled", 0),
+        drafts_posted=content.get("drafts_posted", 0),
+        total_cost=costs.get("total", 0),
+        **_speed_values(metrics.get("speed_metrics", {})),
+    )
 
 
 # Category display labels
@@ -745,6 +602,24 @@ def build_trend_scout_report_blocks(
     return blocks
 
 
+_render_pitched_card = compile_template([
+    header(Slot("header_text")),
+    mrkdwn_context(Fmt("*Status:* {stage_label} - {stage_desc}")),
+    mrkdwn_section(Fmt("*LinkedIn:* <{linkedin_url}|View Profile>")),
+])
+
+_render_pitched_card_buttons = compile_template([
+    {
+        "type": "actions",
+        "elements": [
+            button("Send Message", "pitched_send_message", Slot("prospect_id"), style="primary"),
+            button("Calendar Sent", "pitched_calendar_sent", Slot("prospect_id")),
+            button("Booked", "pitched_booked", Slot("prospect_id")),
+        ],
+    }
+])
+
+
 def build_pitched_card_blocks(
     lead_name: str,
     lead_title: str | None,
@@ -766,14 +641,7 @@ def build_pitched_card_blocks(
     Returns:
         List of Slack Block Kit blocks.
     """
-    # Build header with lead info
-    header_text = lead_name
-    if lead_title and lead_company:
-        header_text = f"{lead_name} ({lead_title} @ {lead_company})"
-    elif lead_title:
-        header_text = f"{lead_name} ({lead_title})"
-    elif lead_company:
-        header_text = f"{lead_name} @ {lead_company}"
+    header_text = _format_lead_info(lead_name, lead_title, lead_company)
 
     # Truncate header if too long for Slack (150 char limit for plain_text headers)
     if len(header_text) > 148:
@@ -783,29 +651,12 @@ def build_pitched_card_blocks(
         funnel_stage, (funnel_stage.value, "")
     )
 
-    blocks: list[dict[str, Any]] = [
-        {
-            "type": "header",
-            "text": {
-                "type": "plain_text",
-                "text": header_text,
-                "emoji": True,
-            },
-        },
-        {
-            "type": "context",
-            "elements": [
-                {"type": "mrkdwn", "text": f"*Status:* {stage_label} - {stage_desc}"}
-            ],
-        },
-        {
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": f"*LinkedIn:* <{linkedin_url}|View Profile>",
-            },
-        },
-    ]
+    blocks = _render_pitched_card(
+        header_text=header_text,
+        stage_label=stage_label,
+        stage_desc=stage_desc,
+        linkedin_url=linkedin_url,
+    )
 
     # Add recent inbound messages
     if recent_messages:
@@ -815,15 +666,9 @@ def build_pitched_card_blocks(
             if len(content) > 200:
                 content = content[:197] + "..."
             msg_lines.append(f"> _{content}_")
-        blocks.append({
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": "*Recent Messages:*\n" + "\n".join(msg_lines),
-            },
-        })
+        blocks.append(_render_section(text="*Recent Messages:*\n" + "\n".join(msg_lines)))
 
-    blocks.append({"type": "divider"})
+    blocks.append(DIVIDER)
 
     return blocks
 
@@ -837,32 +682,38 @@ def build_pitched_card_buttons(prospect_id: uuid.UUID) -> list[dict[str, Any]]:
     Returns:
         List of Slack Block Kit action blocks.
     """
-    return [
-        {
-            "type": "actions",
-            "elements": [
-                {
-                    "type": "button",
-                    "text": {"type": "plain_text", "text": "Send Message", "emoji": True},
-                    "style": "primary",
-                    "action_id": "pitched_send_message",
-                    "value": str(prospect_id),
-                },
-                {
-                    "type": "button",
-                    "text": {"type": "plain_text", "text": "Calendar Sent", "emoji": True},
-                    "action_id": "pitched_calendar_sent",
-                    "value": str(prospect_id),
-                },
-                {
-                    "type": "button",
-                    "text": {"type": "plain_text", "text": "Booked", "emoji": True},
-                    "action_id": "pitched_booked",
-                    "value": str(prospect_id),
-                },
-            ],
-        }
-    ]
+    return _render_pitched_card_buttons(prospect_id=str(prospect_id))
+
+
+_render_engagement_message = compile_template([
+    header("LinkedIn Engagement Opportunity"),
+    mrkdwn_context(Fmt("*Category:* {category_label}")),
+    {
+        "type": "section",
+        "text": {"type": "mrkdwn", "text": Slot("author_info")},
+        "accessory": {
+            "type": "button",
+            "text": {"type": "plain_text", "text": "Open Post", "emoji": True},
+            "url": Slot("post_url"),
+            "action_id": "engagement_open_post",
+        },
+    },
+    mrkdwn_section(Fmt("*Summary:*\n{post_summary}")),
+    DIVIDER,
+    mrkdwn_section(Fmt("*Draft Comment:*\n```{draft_comment}```")),
+    DIVIDER,
+])
+
+_render_engagement_buttons = compile_template([
+    {
+        "type": "actions",
+        "elements": [
+            button("Done", "engagement_done", Slot("post_id"), style="primary"),
+            button("Edit", "engagement_edit", Slot("post_id")),
+            button("Skip", "engagement_skip", Slot("post_id"), style="danger"),
+        ],
+    }
+])
 
 
 def build_engagement_message(
@@ -893,50 +744,13 @@ def build_engagement_message(
     if author_headline:
         author_info += f"\n_{author_headline}_"
 
-    blocks = [
-        {
-            "type": "header",
-            "text": {
-                "type": "plain_text",
-                "text": "LinkedIn Engagement Opportunity",
-                "emoji": True,
-            },
-        },
-        {
-            "type": "context",
-            "elements": [
-                {"type": "mrkdwn", "text": f"*Category:* {category_label}"}
-            ],
-        },
-        {
-            "type": "section",
-            "text": {"type": "mrkdwn", "text": author_info},
-            "accessory": {
-                "type": "button",
-                "text": {"type": "plain_text", "text": "Open Post", "emoji": True},
-                "url": post_url,
-                "action_id": "engagement_open_post",
-            },
-        },
-        {
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": f"*Summary:*\n{post_summary}",
-            },
-        },
-        {"type": "divider"},
-        {
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": f"*Draft Comment:*\n```{draft_comment}```",
-            },
-        },
-        {"type": "divider"},
-    ]
-
-    return blocks
+    return _render_engagement_message(
+        category_label=category_label,
+        author_info=author_info,
+        post_url=post_url,
+        post_summary=post_summary,
+        draft_comment=draft_comment,
+    )
 
 
 def build_engagement_buttons(post_id: uuid.UUID) -> list[dict[str, Any]]:
@@ -948,33 +762,16 @@ def build_engagement_buttons(post_id: uuid.UUID) -> list[dict[str, Any]]:
     Returns:
         List of Slack Block Kit action blocks.
     """
-    return [
-        {
-            "type": "actions",
-            "elements": [
-                {
-                    "type": "button",
-                    "text": {"type": "plain_text", "text": "Done", "emoji": True},
-                    "style": "primary",
-                    "action_id": "engagement_done",
-                    "value": str(post_id),
-                },
-                {
-                    "type": "button",
-                    "text": {"type": "plain_text", "text": "Edit", "emoji": True},
-                    "action_id": "engagement_edit",
-                    "value": str(post_id),
-                },
-                {
-                    "type": "button",
-                    "text": {"type": "plain_text", "text": "Skip", "emoji": True},
-                    "style": "danger",
-                    "action_id": "engagement_skip",
-                    "value": str(post_id),
-                },
-            ],
-        }
-    ]
+    return _render_engagement_buttons(post_id=str(post_id))
+
+
+_render_health_alert_header = compile_template([
+    header(Fmt("System Health Check - {status}")),
+    DIVIDER,
+])
+_render_health_alert_footer = compile_template(
+    mrkdwn_context(Fmt("{passing}/{total} checks passing | {timestamp:%Y-%m-%d %H:%M UTC}"))
+)
 
 
 def build_health_check_alert_blocks(
@@ -997,43 +794,19 @@ def build_health_check_alert_blocks(
         CheckStatus.CRITICAL: ":rotating_light:",
     }
 
-    header_text = f"System Health Check - {report.status.value.upper()}"
-
-    blocks: list[dict[str, Any]] = [
-        {
-            "type": "header",
-            "text": {
-                "type": "plain_text",
-                "text": header_text,
-                "emoji": True,
-            },
-        },
-        {"type": "divider"},
-    ]
+    blocks = _render_health_alert_header(status=report.status.value.upper())
 
     for check in report.failing:
         emoji = status_emoji.get(check.status, ":question:")
-        blocks.append({
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": f"{emoji} *{check.name}* [{check.status.value}]\n{check.message}",
-            },
-        })
+        blocks.append(_render_section(
+            text=f"{emoji} *{check.name}* [{check.status.value}]\n{check.message}",
+        ))
 
-    total = len(report.checks)
-    passing = report.passing
-    ts = report.timestamp.strftime("%Y-%m-%d %H:%M UTC")
-
-    blocks.append({
-        "type": "context",
-        "elements": [
-            {
-                "type": "mrkdwn",
-                "text": f"{passing}/{total} checks passing | {ts}",
-            }
-        ],
-    })
+    blocks.append(_render_health_alert_footer(
+        passing=report.passing,
+        total=len(report.checks),
+        timestamp=report.timestamp,
+    ))
 
     return blocks
 
@@ -1076,6 +849,7 @@ class SlackBot:
             or self._channel_id
         )
         self._client = AsyncWebClient(token=self._bot_token)
+        self._dispatcher = SlackDispatcher()
 
     async def send_draft_notification(
         self,
@@ -1146,7 +920,8 @@ class SlackBot:
             # Add action buttons (Send, Edit, etc.)
             blocks.extend(build_action_buttons(draft_id))
 
-            response = await self._client.chat_postMessage(
+            response = await self._dispatcher.send(
+                self._client.chat_postMessage,
                 channel=self._channel_id,
                 blocks=blocks,
                 text=f"New LinkedIn reply from {lead_name}",  # Fallback text
@@ -1176,7 +951,8 @@ class SlackBot:
             SlackError: If update fails.
         """
         try:
-            await self._client.chat_update(
+            await self._dispatcher.send(
+                self._client.chat_update,
                 channel=self._channel_id,
                 ts=message_ts,
                 text=text,
@@ -1207,7 +983,8 @@ class SlackBot:
                     }
                 }
             ]
-            await self._client.chat_update(
+            await self._dispatcher.send(
+                self._client.chat_update,
                 channel=self._channel_id,
                 ts=message_ts,
                 text=final_text,
@@ -1231,7 +1008,8 @@ class SlackBot:
             SlackError: If sending fails.
         """
         try:
-            response = await self._client.chat_postMessage(
+            response = await self._dispatcher.send(
+                self._client.chat_postMessage,
                 channel=self._channel_id,
                 text=text,
             )
@@ -1242,22 +1020,26 @@ class SlackBot:
             raise SlackError(f"Failed to send confirmation: {e}") from e
 
     async def send_pipeline_progress(self, text: str, thread_ts: str) -> str:
-        """Send a progress update as a threaded reply.
+        """Show a progress update in a thread.
+
+        Updates are coalesced into a single threaded reply that is edited
+        in place, at most once per slack_progress_interval_seconds.
 
         Args:
             text: Progress message text.
             thread_ts: Thread timestamp to reply under.
 
         Returns:
-            The reply message timestamp.
+            The progress message timestamp.
         """
         try:
-            response = await self._client.chat_postMessage(
+            return await self._dispatcher.progress(
+                self._client.chat_postMessage,
+                self._client.chat_update,
                 channel=self._channel_id,
-                text=text,
                 thread_ts=thread_ts,
+                text=text,
             )
-            return response["ts"]
         except SlackApiError as e:
             raise SlackError(f"Failed to send pipeline progress: {e.response['error']}") from e
         except Exception as e:
@@ -1327,7 +1109,8 @@ class SlackBot:
             SlackError: If sending fails.
         """
         try:
-            response = await self._client.chat_postMessage(
+            response = await self._dispatcher.send(
+                self._client.chat_postMessage,
                 channel=self._channel_id,
                 text=f"Configure follow-ups for {lead_name}",
                 blocks=[
@@ -1636,7 +1419,8 @@ class SlackBot:
                 },
             ]
 
-            response = await self._client.chat_postMessage(
+            response = await self._dispatcher.send(
+                self._client.chat_postMessage,
                 channel=self._channel_id,
                 blocks=blocks,
                 text=f"Gift Leads for {prospect_name}: {len(leads)} matches",
@@ -1849,7 +1633,8 @@ class SlackBot:
                     ],
                 })
 
-            response = await self._client.chat_postMessage(
+            response = await self._dispatcher.send(
+                self._client.chat_postMessage,
                 channel=self._channel_id,
                 blocks=blocks,
                 text=f"Gift Leads for {prospect_name}: {len(leads)} matches",
@@ -1969,7 +1754,8 @@ class SlackBot:
                 },
             ]
 
-            response = await self._client.chat_postMessage(
+            response = await self._dispatcher.send(
+                self._client.chat_postMessage,
                 channel=self._channel_id,
                 blocks=blocks,
                 text=f"Gift Leads Ready: {prospect_name} ({lead_count} leads)",
@@ -2016,7 +1802,8 @@ class SlackBot:
                 },
             ]
 
-            response = await self._client.chat_postMessage(
+            response = await self._dispatcher.send(
+                self._client.chat_postMessage,
                 channel=self._channel_id,
                 blocks=blocks,
                 text=f"Auto-sent {lead_count} gift leads to {prospect_name}",
@@ -2129,7 +1916,8 @@ class SlackBot:
             )
             blocks.extend(build_pitched_card_buttons(prospect_id))
 
-            response = await self._client.chat_postMessage(
+            response = await self._dispatcher.send(
+                self._client.chat_postMessage,
                 channel=self._pitched_channel_id,
                 blocks=blocks,
                 text=f"Pitched: {lead_name}",
@@ -2190,7 +1978,8 @@ class SlackBot:
             else:
                 blocks.extend(build_pitched_card_buttons(prospect_id))
 
-            await self._client.chat_update(
+            await self._dispatcher.send(
+                self._client.chat_update,
                 channel=self._pitched_channel_id,
                 ts=message_ts,
                 text=f"Pitched: {lead_name}",
@@ -2290,7 +2079,8 @@ class SlackBot:
         """
         try:
             blocks = build_daily_report_blocks(report_date, metrics)
-            response = await self._client.chat_postMessage(
+            response = await self._dispatcher.send(
+                self._client.chat_postMessage,
                 channel=self._metrics_channel_id,
                 blocks=blocks,
                 text=f"Daily Metrics - {report_date.strftime('%b %d, %Y')}",
@@ -2322,7 +2112,8 @@ class SlackBot:
         """
         try:
             blocks = build_weekly_report_blocks(start_date, end_date, metrics)
-            response = await self._client.chat_postMessage(
+            response = await self._dispatcher.send(
+                self._client.chat_postMessage,
                 channel=self._metrics_channel_id,
                 blocks=blocks,
                 text=f"Weekly Summary - Week of {start_date.strftime('%b %d, %Y')}",
@@ -2350,7 +2141,8 @@ class SlackBot:
         """
         try:
             blocks = build_trend_scout_report_blocks(result)
-            response = await self._client.chat_postMessage(
+            response = await self._dispatcher.send(
+                self._client.chat_postMessage,
                 channel=self._metrics_channel_id,
                 blocks=blocks,
                 text=f"Trend Scout: {result.get('topics_saved', 0)} topics saved",
@@ -2380,7 +2172,8 @@ class SlackBot:
         """
         try:
             blocks = build_health_check_alert_blocks(report)
-            response = await self._client.chat_postMessage(
+            response = await self._dispatcher.send(
+                self._client.chat_postMessage,
                 channel=self._metrics_channel_id,
                 blocks=blocks,
                 text=f"System Health Check - {report.status.value.upper()}",
@@ -2429,7 +2222,8 @@ class SlackBot:
             )
             blocks.extend(build_engagement_buttons(post_id))
 
-            response = await self._client.chat_postMessage(
+            response = await self._dispatcher.send(
+                self._client.chat_postMessage,
                 channel=self._engagement_channel_id,
                 blocks=blocks,
                 text=f"Engagement opportunity: {author_name} posted on LinkedIn",
@@ -2463,7 +2257,8 @@ class SlackBot:
             SlackError: If update fails.
         """
         try:
-            await self._client.chat_update(
+            await self._dispatcher.send(
+                self._client.chat_update,
                 channel=self._engagement_channel_id,
                 ts=message_ts,
                 text=text,
@@ -2532,6 +2327,15 @@ class SlackBot:
             ) from e
 
 
+    def dispatch_stats(self) -> dict[str, Any]:
+        """Slack delivery counters for this bot."""
+        return self._dispatcher.stats()
+
+    async def drain(self) -> None:
+        """Wait for pending progress edits and background sends (shutdown)."""
+        await self._dispatcher.drain()
+
+
 # Global bot instance
 _bot: SlackBot | None = None
 
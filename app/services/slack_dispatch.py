@@ -0,0 +1,202 @@
+"""Rate-limited Slack message dispatch.
+
+Every chat.postMessage / chat.update from SlackBot goes through a
+SlackDispatcher, which:
+
+- applies a per-channel token bucket (Slack allows ~1 message/sec per
+  channel with short bursts), so a pipeline spamming progress can't delay
+  draft cards in the same channel behind a wall of 429s;
+- honours Retry-After on rate-limited responses, pausing the whole channel
+  and retrying the call;
+- coalesces pipeline progress updates into one threaded message that is
+  edited in place, sending at most one edit per progress interval;
+- supports fire-and-forget sends and keeps delivery counters.
+"""
+
+import asyncio
+import logging
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from slack_sdk.errors import SlackApiError
+
+from app.config import settings
+from app.services.rate_limit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+SlackCall = Callable[..., Awaitable[Any]]
+
+# Progress threads remembered for coalescing (oldest evicted first)
+_PROGRESS_THREADS_MAX = 200
+
+
+@dataclass
+class _ProgressThread:
+    ts: str | None = None
+    pending: str | None = None
+    last_sent: float = 0.0
+    flush_task: asyncio.Task | None = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+def _retry_after(error: SlackApiError) -> float | None:
+    """Seconds to wait if the error is a rate limit, else None."""
+    response = error.response
+    status = getattr(response, "status_code", None)
+    code = response.get("error") if hasattr(response, "get") else None
+    if status != 429 and code != "ratelimited":
+        return None
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers.get("Retry-After") or headers.get("retry-after") or 1)
+    except (TypeError, ValueError):
+        return 1.0
+
+
+class SlackDispatcher:
+    """Rate limits, retries and coalesces Slack writes."""
+
+    def __init__(
+        self,
+        rate_per_second: float | None = None,
+        burst: int | None = None,
+        max_retries: int | None = None,
+        progress_interval: float | None = None,
+    ):
+        self._rate = rate_per_second or settings.slack_channel_rate_per_second
+        self._burst = burst or settings.slack_channel_burst
+        self._max_retries = settings.slack_max_retries if max_retries is None else max_retries
+        self._progress_interval = (
+            settings.slack_progress_interval_seconds if progress_interval is None else progress_interval
+        )
+        self._buckets: dict[str, TokenBucket] = {}
+        self._progress: OrderedDict[tuple[str, str], _ProgressThread] = OrderedDict()
+        self._background: set[asyncio.Task] = set()
+        self.metrics: Counter[str] = Counter()
+
+    def _bucket(self, channel: str) -> TokenBucket:
+        bucket = self._buckets.get(channel)
+        if bucket is None:
+            bucket = self._buckets[channel] = TokenBucket(self._rate, self._burst)
+        return bucket
+
+    async def send(self, call: SlackCall, *, channel: str, **kwargs: Any) -> Any:
+        """Make a rate-limited Slack call, retrying on 429.
+
+        Args:
+            call: Bound client method, e.g. ``client.chat_postMessage``.
+            channel: Channel the call writes to (selects the token bucket).
+            **kwargs: Passed through to the call.
+
+        Returns:
+            The Slack response.
+
+        Raises:
+            SlackApiError: If Slack rejects the call or retries run out.
+        """
+        bucket = self._bucket(channel)
+        for attempt in range(self._max_retries + 1):
+            await bucket.acquire()
+            try:
+                response = await call(channel=channel, **kwargs)
+            except SlackApiError as e:
+                wait = _retry_after(e)
+                if wait is None or attempt == self._max_retries:
+                    self.metrics["failed"] += 1
+                    raise
+                self.metrics["rate_limited"] += 1
+                logger.warning(f"Slack rate limited on {channel}, retrying in {wait:.0f}s")
+                bucket.pause(wait)
+                continue
+            except Exception:
+                self.metrics["failed"] += 1
+                raise
+            self.metrics["sent"] += 1
+            return response
+
+    def submit(self, call: SlackCall, *, channel: str, **kwargs: Any) -> asyncio.Task:
+        """Fire-and-forget version of send(); failures are logged and counted."""
+        task = asyncio.create_task(self._send_logged(call, channel=channel, **kwargs))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+        return task
+
+    async def _send_logged(self, call: SlackCall, *, channel: str, **kwargs: Any) -> Any:
+        try:
+            return await self.send(call, channel=channel, **kwargs)
+        except Exception as e:
+            logger.error(f"Background Slack send to {channel} failed: {e}")
+            return None
+
+    async def progress(
+        self,
+        post: SlackCall,
+        update: SlackCall,
+        *,
+        channel: str,
+        thread_ts: str,
+        text: str,
+    ) -> str:
+        """Show ``text`` as the progress message in a thread.
+
+        The first update posts a threaded reply. Later updates edit that
+        reply, at most once per progress interval; intermediate texts are
+        dropped in favour of the latest one.
+
+        Returns:
+            The progress message timestamp.
+        """
+        key = (channel, thread_ts)
+        state = self._progress.get(key)
+        if state is None:
+            state = self._progress[key] = _ProgressThread()
+            while len(self._progress) > _PROGRESS_THREADS_MAX:
+                self._progress.popitem(last=False)
+        self._progress.move_to_end(key)
+
+        async with state.lock:
+            if state.ts is None:
+                response = await self.send(post, channel=channel, text=text, thread_ts=thread_ts)
+                state.ts = response["ts"]
+                state.last_sent = time.monotonic()
+                return state.ts
+
+            if state.pending is not None:
+                self.metrics["coalesced"] += 1
+            state.pending = text
+            if state.flush_task is None or state.flush_task.done():
+                state.flush_task = asyncio.create_task(self._flush_progress(update, channel, state))
+                self._background.add(state.flush_task)
+                state.flush_task.add_done_callback(self._background.discard)
+            return state.ts
+
+    async def _flush_progress(self, update: SlackCall, channel: str, state: _ProgressThread) -> None:
+        while state.pending is not None:
+            delay = state.last_sent + self._progress_interval - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            text, state.pending = state.pending, None
+            state.last_sent = time.monotonic()
+            try:
+                await self.send(update, channel=channel, ts=state.ts, text=text)
+            except Exception as e:
+                logger.error(f"Failed to update pipeline progress in {channel}: {e}")
+
+    async def drain(self) -> None:
+        """Wait for background sends and pending progress edits to finish."""
+        while self._background:
+            await asyncio.gather(*list(self._background), return_exceptions=True)
+
+    def stats(self) -> dict[str, Any]:
+        """Delivery counters plus in-flight background sends."""
+        return {
+            "sent": self.metrics["sent"],
+            "failed": self.metrics["failed"],
+            "rate_limited": self.metrics["rate_limited"],
+            "coalesced": self.metrics["coalesced"],
+            "in_flight": len(self._background),
+            "channels": len(self._buckets),
+        }
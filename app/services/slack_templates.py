@@ -0,0 +1,128 @@
+"""Precompiled Slack Block Kit templates.
+
+Block skeletons are declared once as plain dict/list literals containing
+``Slot`` (value inserted as-is) and ``Fmt`` (``str.format``-style template)
+markers. ``compile_template`` turns a skeleton into a render function at
+import time: the containers on a path to a marker become a single generated
+literal expression (``Fmt`` becomes an f-string), and every static subtree
+(button labels, dividers, header text objects) is bound once as a constant
+and shared by reference between renders.
+
+Rendered blocks are therefore read-only: copy before mutating them.
+"""
+
+import string
+from typing import Any, Callable
+
+Renderer = Callable[..., Any]
+
+
+class Slot:
+    """Placeholder replaced by the named render argument."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+
+class Fmt:
+    """Placeholder rendered like ``template.format(**values)`` (plain field names only)."""
+
+    __slots__ = ("template",)
+
+    def __init__(self, template: str):
+        self.template = template
+
+
+def _fstring(template: str, params: set[str]) -> str:
+    """Translate a format template into f-string source."""
+    parts = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        parts.append(literal.replace("{", "{{").replace("}", "}}"))
+        if field is None:
+            continue
+        if not field.isidentifier():
+            raise ValueError(f"Template fields must be plain names, got {field!r}")
+        params.add(field)
+        parts.append("{" + field + (f"!{conversion}" if conversion else "") + (f":{spec}" if spec else "") + "}")
+    return "f" + repr("".join(parts))
+
+
+def _emit(node: Any, consts: list[Any], params: set[str]) -> str | None:
+    """Return source for a node containing markers, or None if it is static."""
+    if isinstance(node, Slot):
+        params.add(node.name)
+        return node.name
+    if isinstance(node, Fmt):
+        return _fstring(node.template, params)
+    if isinstance(node, dict):
+        items = [(key, _emit(value, consts, params)) for key, value in node.items()]
+        if all(src is None for _, src in items):
+            return None
+        return "{" + ", ".join(
+            f"{key!r}: {src if src is not None else _const(node[key], consts)}" for key, src in items
+        ) + "}"
+    if isinstance(node, list):
+        items = [_emit(item, consts, params) for item in node]
+        if all(src is None for src in items):
+            return None
+        return "[" + ", ".join(
+            src if src is not None else _const(item, consts) for item, src in zip(node, items)
+        ) + "]"
+    return None
+
+
+def _const(value: Any, consts: list[Any]) -> str:
+    consts.append(value)
+    return f"_c{len(consts) - 1}"
+
+
+def compile_template(skeleton: Any) -> Renderer:
+    """Compile a block skeleton into a ``render(**values)`` function.
+
+    Every marker name becomes a required keyword argument; extra keyword
+    arguments are ignored. A list skeleton always renders to a fresh
+    top-level list so callers can ``append``/``extend`` the result.
+    """
+    consts: list[Any] = []
+    params: set[str] = set()
+    body = _emit(skeleton, consts, params)
+    if body is None:
+        body = f"list({_const(skeleton, consts)})" if isinstance(skeleton, list) else _const(skeleton, consts)
+
+    signature = ", ".join([*(["*", *sorted(params)] if params else []), "**_unused"])
+    namespace: dict[str, Any] = {f"_c{i}": value for i, value in enumerate(consts)}
+    exec(f"def render({signature}):\n    return {body}\n", namespace)
+    return namespace["render"]
+
+
+def button(text: str, action_id: str, value: Any, style: str | None = None) -> dict[str, Any]:
+    """Button element skeleton (value is usually a Slot)."""
+    element: dict[str, Any] = {
+        "type": "button",
+        "text": {"type": "plain_text", "text": text, "emoji": True},
+    }
+    if style:
+        element["style"] = style
+    element["action_id"] = action_id
+    element["value"] = value
+    return element
+
+
+def header(text: Any) -> dict[str, Any]:
+    """Header block skeleton."""
+    return {"type": "header", "text": {"type": "plain_text", "text": text, "emoji": True}}
+
+
+def mrkdwn_section(text: Any) -> dict[str, Any]:
+    """Section block skeleton with mrkdwn text."""
+    return {"type": "section", "text": {"type": "mrkdwn", "text": text}}
+
+
+def mrkdwn_context(text: Any) -> dict[str, Any]:
+    """Context block skeleton with a single mrkdwn element."""
+    return {"type": "context", "elements": [{"type": "mrkdwn", "text": text}]}
+
+
+DIVIDER: dict[str, Any] = {"type": "divider"}
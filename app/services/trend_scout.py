@@ -1,9 +1,12 @@
 """Trend Scout: async pipeline for discovering trending ICP-relevant topics.
 
 Three-phase pipeline:
-1. Parallel Perplexity Sonar searches (httpx.AsyncClient)
-2. Claude ICP scoring & deduplication (anthropic.AsyncAnthropic)
-3. Save to contentCreator's DB via sync session (content_db module)
+1. Parallel Perplexity Sonar searches (httpx.AsyncClient), with concurrency
+   that backs off on 429s and grows again while calls succeed
+2. Claude ICP scoring (anthropic.AsyncAnthropic) in parallel chunks of
+   search results, so no single response outgrows max_tokens
+3. Topics are deduplicated across chunks and bulk-inserted into
+   contentCreator's DB (async content_db module) as each chunk finishes
 
 Entry point: run_trend_scout_task() — called by scheduler or manual trigger.
 """
@@ -17,12 +20,17 @@ import anthropic
 import httpx
 
 from app.config import settings
-from app.services.content_db import save_trending_topic
+from app.services.content_db import save_trending_topics, topic_hash
+from app.services.rate_limit import AdaptiveLimiter
 
 logger = logging.getLogger(__name__)
 
 PERPLEXITY_BASE_URL = "https://api.perplexity.ai"
 
+# Retries per call after a 429, and the fallback wait when there's no Retry-After
+MAX_THROTTLE_RETRIES = 4
+THROTTLE_BACKOFF_SECONDS = 2.0
+
 # Pre-built ICP-relevant search queries
 SEARCH_QUERIES = [
     {
@@ -121,10 +129,50 @@ async def _search_perplexity(
     }
 
 
+def _throttle_delay(exc: Exception, attempt: int) -> float | None:
+    """Seconds to wait if ``exc`` is a rate-limit response, else None."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        response = exc.response
+    elif isinstance(exc, anthropic.RateLimitError):
+        response = exc.response
+    else:
+        return None
+    if response.status_code != 429:
+        return None
+    try:
+        return float(response.headers.get("retry-after", ""))
+    except ValueError:
+        return THROTTLE_BACKOFF_SECONDS * 2 ** attempt
+
+
+async def _call_adaptive(limiter: AdaptiveLimiter, fn, *args):
+    """Run ``fn(*args)`` under ``limiter``, retrying (and narrowing) on 429s."""
+    attempt = 0
+    while True:
+        async with limiter:
+            try:
+                result = await fn(*args)
+            except Exception as e:
+                delay = _throttle_delay(e, attempt)
+                if delay is None or attempt >= MAX_THROTTLE_RETRIES:
+                    raise
+                limiter.record_throttle()
+                logger.info(f"Rate limited, concurrency now {limiter.limit}; retrying in {delay:.1f}s")
+            else:
+                limiter.record_success()
+                return result
+        attempt += 1
+        await asyncio.sleep(delay)
+
+
 async def _run_all_searches(
     queries: list[dict] | None = None,
 ) -> list[dict]:
-    """Run all Perplexity searches concurrently (max 3 at a time).
+    """Run all Perplexity searches concurrently.
+
+    Concurrency starts at ``trend_scout_search_concurrency``, halves on
+    every 429 and creeps back up (to ``trend_scout_max_search_concurrency``)
+    while searches succeed.
 
     Args:
         queries: Optional custom queries list. Defaults to SEARCH_QUERIES.
@@ -134,14 +182,16 @@ async def _run_all_searches(
     """
     queries = queries or SEARCH_QUERIES
     results: list[dict] = []
-    sem = asyncio.Semaphore(3)
-
-    async def _bounded_search(q: dict, client: httpx.AsyncClient) -> dict:
-        async with sem:
-            return await _search_perplexity(q["query"], q["platform"], client)
+    limiter = AdaptiveLimiter(
+        settings.trend_scout_search_concurrency,
+        settings.trend_scout_max_search_concurrency,
+    )
 
     async with httpx.AsyncClient() as client:
-        tasks = [_bounded_search(q, client) for q in queries]
+        tasks = [
+            _call_adaptive(limiter, _search_perplexity, q["query"], q["platform"], client)
+            for q in queries
+        ]
         settled = await asyncio.gather(*tasks, return_exceptions=True)
 
     for i, item in enumerate(settled):
@@ -166,11 +216,19 @@ async def _run_all_searches(
 # ---------------------------------------------------------------------------
 
 
-async def _score_and_extract_topics(search_results: list[dict]) -> list[dict]:
+async def _score_and_extract_topics(
+    search_results: list[dict],
+    client: anthropic.AsyncAnthropic | None = None,
+) -> list[dict]:
     """Use Claude to deduplicate, score for ICP relevance, and extract angles.
 
+    If the response is cut off at max_tokens (or doesn't parse) and there is
+    more than one search result, the results are split in half and each half
+    is scored separately.
+
     Args:
-        search_results: Output from _run_all_searches().
+        search_results: A chunk of the output from _run_all_searches().
+        client: Shared Anthropic client (one is created if not given).
 
     Returns:
         List of scored topic dicts.
@@ -211,7 +269,7 @@ Return as JSON array:
 
 Return ONLY the JSON array, no other text."""
 
-    client = anthropic.AsyncAnthropic(api_key=settings.anthropic_api_key)
+    client = client or anthropic.AsyncAnthropic(api_key=settings.anthropic_api_key)
     response = await client.messages.create(
         model="claude-sonnet-4-20250514",
         max_tokens=4096,
@@ -219,6 +277,11 @@ Return ONLY the JSON array, no other text."""
     )
 
     text = response.content[0].text.strip()
+    scorable = [r for r in search_results if not r.get("error")]
+
+    if response.stop_reason == "max_tokens" and len(scorable) > 1:
+        logger.warning(f"Scoring output truncated for {len(scorable)} results; splitting")
+        return await _score_halves(scorable, client)
 
     # Handle markdown fences
     if text.startswith("```"):
@@ -230,6 +293,9 @@ Return ONLY the JSON array, no other text."""
     try:
         topics = json.loads(text)
     except json.JSONDecodeError:
+        if len(scorable) > 1:
+            logger.warning(f"Failed to parse scoring for {len(scorable)} results; splitting")
+            return await _score_halves(scorable, client)
         logger.error(f"Failed to parse Claude response as JSON: {text[:200]}...")
         return []
 
@@ -239,6 +305,23 @@ Return ONLY the JSON array, no other text."""
     return topics
 
 
+async def _score_halves(search_results: list[dict], client: anthropic.AsyncAnthropic) -> list[dict]:
+    """Score each half of ``search_results`` separately and concatenate."""
+    mid = len(search_results) // 2
+    halves = await asyncio.gather(
+        _score_and_extract_topics(search_results[:mid], client),
+        _score_and_extract_topics(search_results[mid:], client),
+    )
+    return halves[0] + halves[1]
+
+
+def _chunk_results(search_results: list[dict], size: int) -> list[list[dict]]:
+    """Split successful search results into scoring chunks."""
+    successful = [r for r in search_results if not r.get("error")]
+    size = max(1, size)
+    return [successful[i:i + size] for i in range(0, len(successful), size)]
+
+
 # ---------------------------------------------------------------------------
 # Phase 3: Save + notify
 # ---------------------------------------------------------------------------
@@ -276,43 +359,58 @@ async def run_trend_scout_task(
             logger.error(f"Failed to send empty Slack report: {e}")
         return result
 
-    # Phase 2: Claude ICP scoring
-    scored_topics = await _score_and_extract_topics(search_results)
-    logger.info(f"Phase 2 complete: {len(scored_topics)} topics extracted")
+    # Phase 2 + 3: score chunks in parallel, save each chunk's new topics as it lands
+    chunks = _chunk_results(search_results, settings.trend_scout_score_chunk_size)
+    client = anthropic.AsyncAnthropic(api_key=settings.anthropic_api_key)
+    limiter = AdaptiveLimiter(settings.trend_scout_score_concurrency, len(chunks))
+    pending = [
+        asyncio.ensure_future(_call_adaptive(limiter, _score_and_extract_topics, chunk, client))
+        for chunk in chunks
+    ]
 
-    # Phase 3: Save to content DB (sync, run in executor to avoid blocking)
+    query_by_platform: dict[str, str] = {}
+    for r in search_results:
+        query_by_platform.setdefault(r["platform"], r["query"])
+
+    seen: set[str] = set()
+    scored_count = 0
+    duplicates = 0
     saved: list[dict] = []
-    loop = asyncio.get_event_loop()
-    for t in scored_topics:
-        search_query = None
-        for r in search_results:
-            if r["platform"] == t.get("source_platform"):
-                search_query = r["query"]
-                break
+    for next_chunk in asyncio.as_completed(pending):
+        try:
+            chunk_topics = await next_chunk
+        except Exception as e:
+            logger.error(f"Scoring chunk failed: {e}")
+            continue
+
+        new_topics = []
+        for t in chunk_topics:
+            if not t.get("topic"):
+                continue
+            key = topic_hash(t["topic"])
+            if key in seen:
+                duplicates += 1
+                continue
+            seen.add(key)
+            new_topics.append({**t, "search_query": query_by_platform.get(t.get("source_platform"))})
+        scored_count += len(new_topics)
+        if not new_topics:
+            continue
 
         try:
-            topic_dict = await loop.run_in_executor(
-                None,
-                lambda t=t, sq=search_query: save_trending_topic(
-                    topic=t["topic"],
-                    summary=t.get("summary"),
-                    source_urls=t.get("source_urls", []),
-                    relevance_score=t.get("relevance_score"),
-                    content_angles=t.get("content_angles", []),
-                    search_query=sq,
-                    batch_id=batch_id,
-                    source_platform=t.get("source_platform"),
-                ),
-            )
-            saved.append(topic_dict)
+            saved.extend(await save_trending_topics(new_topics, batch_id=batch_id))
         except Exception as e:
-            logger.error(f"Failed to save topic '{t.get('topic')}': {e}")
+            logger.error(f"Failed to save {len(new_topics)} topics: {e}")
 
+    logger.info(
+        f"Phase 2 complete: {scored_count} topics extracted from {len(chunks)} chunks "
+        f"({duplicates} cross-chunk duplicates dropped)"
+    )
     logger.info(f"Phase 3 complete: {len(saved)} topics saved (batch={batch_id})")
 
     result = {
         "batch_id": batch_id,
-        "topics_found": len(scored_topics),
+        "topics_found": scored_count,
         "topics_saved": len(saved),
         "topics": saved,
     }
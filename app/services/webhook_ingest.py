@@ -0,0 +1,66 @@
+"""Lean parsing and sampled debug logging for inbound webhooks.
+
+HeyReach webhooks carry the recent conversation, so bodies get large.
+Handlers validate straight from the raw bytes (one pass, in pydantic-core)
+and only decode to a dict, with orjson, when validation fails and we need
+the keys for diagnostics. Full bodies are never logged unconditionally:
+``webhook_debug_sample_rate`` opts a fraction of requests into a single
+structured (JSON) log line with a truncated body.
+"""
+
+import logging
+import random
+from typing import Any, TypeVar
+
+import orjson
+from pydantic import BaseModel, ValidationError
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def parse_json(body: bytes) -> Any:
+    """Decode a JSON body (raises ValueError if it isn't JSON)."""
+    return orjson.loads(body)
+
+
+def parse_payload(model: type[M], body: bytes) -> tuple[M | None, Any, ValidationError | None]:
+    """Validate ``body`` against ``model`` without building an intermediate dict.
+
+    Returns:
+        ``(payload, None, None)`` on success, or ``(None, data, error)`` when
+        the JSON is valid but doesn't fit the schema.
+
+    Raises:
+        ValueError: If the body isn't JSON at all.
+    """
+    try:
+        return model.model_validate_json(body), None, None
+    except ValidationError as e:
+        data = parse_json(body)
+        return None, data, e
+
+
+def payload_keys(data: Any) -> list[str] | str:
+    """Top-level keys of a decoded payload, for error responses and logs."""
+    return list(data.keys()) if isinstance(data, dict) else "not a dict"
+
+
+def log_webhook_sample(endpoint: str, body: bytes, **fields: Any) -> None:
+    """Log one structured line for a sampled fraction of webhook requests."""
+    rate = settings.webhook_debug_sample_rate
+    if rate <= 0 or (rate < 1 and random.random() >= rate):
+        return
+    limit = settings.webhook_debug_max_body_chars
+    record = {
+        "event": "webhook_sample",
+        "endpoint": endpoint,
+        "bytes": len(body),
+        **fields,
+        "body": body[:limit].decode("utf-8", errors="replace"),
+        "truncated": len(body) > limit,
+    }
+    logger.info(orjson.dumps(record, default=str).decode())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for the shared profile filtering engine.
+
+Compares the compiled-regex headline pre-filter in app/services/profile_filters.py
+against the previous per-keyword implementation on a synthetic engager list.
+
+Usage:
+    python scripts/bench_profile_filters.py                 # 20k engagers, 5 rounds
+    python scripts/bench_profile_filters.py --rows 50000    # bigger list
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Set minimal env defaults for config loading
+os.environ.setdefault("HEYREACH_API_KEY", "")
+os.environ.setdefault("SLACK_BOT_TOKEN", "")
+os.environ.setdefault("SLACK_CHANNEL_ID", "")
+
+from app.services.profile_filters import (  # noqa: E402
+    HEADLINE_REJECT_KEYWORDS,
+    NON_ENGLISH_INDICATORS,
+    prefilter_engagers_by_headline,
+)
+
+SAMPLE_HEADLINES = [
+    "CEO & Founder at Acme Growth Partners | Helping B2B SaaS scale outbound",
+    "Managing Director @ Northwind Consulting",
+    "Student at University of Michigan | Aspiring product manager",
+    "Head of Sales | Open to work",
+    "Directeur Général chez Société Exemple",
+    "Geschäftsführer bei Beispiel GmbH",
+    "公司经理 | 市场营销",
+    "Директор по развитию",
+    "مدير تنفيذي",
+    "Fractional CMO for founder-led agencies",
+    "Senior Software Engineer at BigCo",
+    "",
+]
+
+
+def _legacy_is_likely_english(text: str) -> bool:
+    """The pre-refactor implementation, kept here as the baseline."""
+    if not text or len(text) < 3:
+        return True
+    non_ascii = sum(1 for c in text if ord(c) > 127)
+    if non_ascii / len(text) > 0.15:
+        return False
+    if any("\u4e00" <= c <= "\u9fff" or "\u3040" <= c <= "\u30ff" or "\uac00" <= c <= "\ud7af" for c in text):
+        return False
+    if any("\u0400" <= c <= "\u04ff" for c in text):
+        return False
+    if any("\u0600" <= c <= "\u06ff" for c in text):
+        return False
+    text_lower = text.lower()
+    return not any(indicator in text_lower for indicator in NON_ENGLISH_INDICATORS)
+
+
+def _legacy_prefilter(engagers: list[dict]) -> list[dict]:
+    filtered = []
+    for engager in engagers:
+        headline_raw = (engager.get("reactor", {}).get("headline") or "").strip()
+        headline = headline_raw.lower()
+        if not headline:
+            filtered.append(engager)
+            continue
+        if not _legacy_is_likely_english(headline_raw):
+            continue
+        if any(kw in headline for kw in HEADLINE_REJECT_KEYWORDS):
+            continue
+        filtered.append(engager)
+    return filtered
+
+
+def _make_engagers(rows: int, seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    return [
+        {"reactor": {"headline": rng.choice(SAMPLE_HEADLINES), "profile_url": f"https://linkedin.com/in/u{i}"}}
+        for i in range(rows)
+    ]
+
+
+def _time(fn, engagers: list[dict], rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn(engagers)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20_000, help="Number of synthetic engagers")
+    parser.add_argument("--rounds", type=int, default=5, help="Timing rounds (best is reported)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    engagers = _make_engagers(args.rows, args.seed)
+
+    legacy_kept = _legacy_prefilter(engagers)
+    new_kept, _, _, _ = prefilter_engagers_by_headline(engagers)
+    assert len(legacy_kept) == len(new_kept), "engine disagrees with legacy filter"
+
+    legacy = _time(_legacy_prefilter, engagers, args.rounds)
+    engine = _time(lambda e: prefilter_engagers_by_headline(e), engagers, args.rounds)
+
+    print(f"Headline pre-filter over {args.rows:,} engagers (best of {args.rounds}):")
+    print(f"  legacy : {legacy * 1000:8.1f} ms  ({args.rows / legacy:,.0f} rows/s)")
+    print(f"  engine : {engine * 1000:8.1f} ms  ({args.rows / engine:,.0f} rows/s)")
+    print(f"  speedup: {legacy / engine:.1f}x  (kept {len(new_kept):,} rows)")
+
+
+if __name__ == "__main__":
+    main()
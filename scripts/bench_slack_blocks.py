@@ -0,0 +1,550 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for the precompiled Slack Block Kit templates.
+
+Renders a full draft card (draft message + classification + action buttons,
+as sent on every new reply and every update_message) and the daily report
+with both the template-backed builders in app/services/slack.py and the
+previous build-from-scratch implementations kept below as the baseline.
+
+Usage:
+    python scripts/bench_slack_blocks.py                     # 20k renders, 5 rounds
+    python scripts/bench_slack_blocks.py --renders 100000    # longer run
+"""
+
+import argparse
+import json
+import logging
+import os
+import re
+import sys
+import tempfile
+import time
+import uuid
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Set minimal env defaults for config loading
+os.environ.setdefault("HEYREACH_API_KEY", "")
+os.environ.setdefault("SLACK_BOT_TOKEN", "")
+os.environ.setdefault("SLACK_CHANNEL_ID", "")
+
+from app.models import FunnelStage  # noqa: E402
+from app.services import slack  # noqa: E402
+from app.services.reports import format_minutes  # noqa: E402
+from app.services.slack import STAGE_DISPLAY  # noqa: E402
+
+SAMPLE_STRATEGY = """\
+# Strategy
+
+## This Week's Focus
+
+Book 5 calls from the pitched channel. Follow up every calendar-sent lead
+within 24h.
+
+## Notes
+
+Nothing else.
+"""
+
+SAMPLE_METRICS = {
+    "outreach": {
+        "profiles_scraped": 1240,
+        "icp_qualified": 312,
+        "heyreach_uploaded": 280,
+        "costs": {"apify": 3.4, "deepseek": 0.82},
+    },
+    "conversations": {"new": 18, "drafts_approved": 14, "classifications": {"positive": 6}},
+    "funnel": {"pitched": 4, "calendar_sent": 2, "booked": 1},
+    "content": {"drafts_created": 3, "drafts_scheduled": 2, "drafts_posted": 1},
+    "speed_metrics": {
+        "speed_to_lead": {"avg_minutes": 7.5, "count": 12},
+        "speed_to_reply": {"avg_minutes": 42.0, "count": 14},
+    },
+}
+
+DRAFT_KWARGS = {
+    "lead_name": "Jane Doe",
+    "lead_title": "Founder",
+    "lead_company": "Acme Growth Partners",
+    "linkedin_url": "https://linkedin.com/in/janedoe",
+    "lead_message": "Thanks for reaching out - what does working together look like?",
+    "ai_draft": "Hey Jane, great question. Most founders we work with start with a short call...",
+    "funnel_stage": FunnelStage.POSITIVE_REPLY,
+    "stage_reasoning": "Lead asked about next steps",
+    "triggering_message": "Hi Jane, saw your post on outbound for agencies...",
+    "judge_score": 4.2,
+    "revision_count": 1,
+}
+
+
+# --- Baseline: the pre-template builders ------------------------------------
+
+def _legacy_build_draft_message(
+    lead_name: str,
+    lead_title: str | None,
+    lead_company: str | None,
+    linkedin_url: str,
+    lead_message: str,
+    ai_draft: str,
+    funnel_stage: FunnelStage | None = None,
+    stage_reasoning: str | None = None,
+    triggering_message: str | None = None,
+    judge_score: float | None = None,
+    revision_count: int = 0,
+) -> list[dict[str, Any]]:
+    # Build lead info line
+    lead_info = lead_name
+    if lead_title and lead_company:
+        lead_info = f"{lead_name} ({lead_title} @ {lead_company})"
+    elif lead_title:
+        lead_info = f"{lead_name} ({lead_title})"
+    elif lead_company:
+        lead_info = f"{lead_name} @ {lead_company}"
+
+    blocks = [
+        {
+            "type": "header",
+            "text": {
+                "type": "plain_text",
+                "text": "📩 New LinkedIn Reply",
+                "emoji": True
+            }
+        },
+    ]
+
+    # Add funnel stage context if available
+    if funnel_stage:
+        stage_label, stage_desc = STAGE_DISPLAY.get(
+            funnel_stage, (funnel_stage.value, "")
+        )
+        stage_text = f"*Stage:* {stage_label}"
+        if stage_reasoning:
+            stage_text += f"\n_{stage_reasoning}_"
+
+        blocks.append({
+            "type": "context",
+            "elements": [{"type": "mrkdwn", "text": stage_text}]
+        })
+
+    blocks.append({
+        "type": "section",
+        "fields": [
+            {
+                "type": "mrkdwn",
+                "text": f"*From:*\n{lead_info}"
+            },
+            {
+                "type": "mrkdwn",
+                "text": f"*LinkedIn:*\n<{linkedin_url}|View Profile>"
+            }
+        ]
+    })
+
+    # Show the outbound message that triggered this reply (if available)
+    if triggering_message:
+        blocks.append({
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": f"*Our Message:*\n{triggering_message}"
+            }
+        })
+
+    blocks.extend([
+        {
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": f"*Their Message:*\n_{lead_message}_"
+            }
+        },
+        {
+            "type": "divider"
+        },
+    ])
+
+    # Add judge quality score if available
+    if judge_score is not None:
+        if judge_score >= 4.0:
+            dot = ":large_green_circle:"
+        elif judge_score >= 3.5:
+            dot = ":large_yellow_circle:"
+        else:
+            dot = ":red_circle:"
+        score_text = f"{dot} *Quality: {judge_score:.1f}/5*"
+        if revision_count > 0:
+            score_text += f"  (revised {revision_count}x)"
+        blocks.append({
+            "type": "context",
+            "elements": [{"type": "mrkdwn", "text": score_text}]
+        })
+
+    blocks.extend([
+        {
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": f"*🤖 Suggested Reply:*\n{ai_draft}"
+            }
+        },
+        {
+            "type": "divider"
+        }
+    ])
+
+    return blocks
+
+
+def _legacy_build_classification_buttons(
+    draft_id: uuid.UUID,
+    is_first_reply: bool = False,
+    prospect_id: uuid.UUID | None = None,
+) -> list[dict[str, Any]]:
+    elements = []
+
+    # Only show Positive Reply button on first reply
+    if is_first_reply:
+        elements.append({
+            "type": "button",
+            "text": {"type": "plain_text", "text": "\U0001f44d Positive Reply", "emoji": True},
+            "action_id": "classify_positive",
+            "value": str(draft_id),
+        })
+
+    # Funnel stage buttons - always show
+    elements.extend([
+        {
+            "type": "button",
+            "text": {"type": "plain_text", "text": "\U0001f3af Pitched", "emoji": True},
+            "action_id": "funnel_pitched",
+            "value": str(draft_id),
+        },
+        {
+            "type": "button",
+            "text": {"type": "plain_text", "text": "\U0001f4c5 Calendar Shown", "emoji": True},
+            "action_id": "funnel_calendar_sent",
+            "value": str(draft_id),
+        },
+    ])
+
+    # Always show Not Interested and Not ICP buttons
+    elements.extend([
+        {
+            "type": "button",
+            "text": {"type": "plain_text", "text": "\U0001f44e Not Interested", "emoji": True},
+            "action_id": "classify_not_interested",
+            "value": str(draft_id),
+        },
+        {
+            "type": "button",
+            "text": {"type": "plain_text", "text": "\U0001f6ab Not ICP", "emoji": True},
+            "action_id": "classify_not_icp",
+            "value": str(draft_id),
+        },
+    ])
+
+    # Gift Leads button (always show)
+    # When prospect_id is available, use the streamlined confirm_icp flow
+    # Otherwise fall back to the legacy gift_leads flow (uses draft_id)
+    if prospect_id is not None:
+        elements.append({
+            "type": "button",
+            "text": {"type": "plain_text", "text": "\U0001f381 Gift Leads", "emoji": True},
+            "action_id": "confirm_icp_gift_leads",
+            "value": str(prospect_id),
+        })
+    else:
+        elements.append({
+            "type": "button",
+            "text": {"type": "plain_text", "text": "\U0001f381 Gift Leads", "emoji": True},
+            "action_id": "gift_leads",
+            "value": str(draft_id),
+        })
+
+    return [
+        {
+            "type": "actions",
+            "elements": elements,
+        }
+    ]
+
+
+def _legacy_build_action_buttons(draft_id: uuid.UUID) -> list[dict[str, Any]]:
+    return [
+        {
+            "type": "actions",
+            "elements": [
+                {
+                    "type": "button",
+                    "text": {"type": "plain_text", "text": "✅ Send", "emoji": True},
+                    "style": "primary",
+                    "action_id": "approve",
+                    "value": str(draft_id)
+                },
+                {
+                    "type": "button",
+                    "text": {"type": "plain_text", "text": "✏️ Edit", "emoji": True},
+                    "action_id": "edit",
+                    "value": str(draft_id)
+                },
+                {
+                    "type": "button",
+                    "text": {"type": "plain_text", "text": "🔄 Regenerate", "emoji": True},
+                    "action_id": "regenerate",
+                    "value": str(draft_id)
+                },
+                {
+                    "type": "button",
+                    "text": {"type": "plain_text", "text": "❌ Skip", "emoji": True},
+                    "style": "danger",
+                    "action_id": "reject",
+                    "value": str(draft_id)
+                }
+            ]
+        },
+        {
+            "type": "actions",
+            "elements": [
+                {
+                    "type": "button",
+                    "text": {"type": "plain_text", "text": "⏰ Snooze 1h", "emoji": True},
+                    "action_id": "snooze_1h",
+                    "value": str(draft_id)
+                },
+                {
+                    "type": "button",
+                    "text": {"type": "plain_text", "text": "⏰ Snooze 4h", "emoji": True},
+                    "action_id": "snooze_4h",
+                    "value": str(draft_id)
+                },
+                {
+                    "type": "button",
+                    "text": {"type": "plain_text", "text": "⏰ Tomorrow", "emoji": True},
+                    "action_id": "snooze_tomorrow",
+                    "value": str(draft_id)
+                }
+            ]
+        }
+    ]
+
+
+def _legacy_get_current_focus(path: str) -> str | None:
+    file_path = path
+    try:
+        text = Path(file_path).read_text(encoding="utf-8")
+    except (FileNotFoundError, OSError, UnicodeDecodeError):
+        return None
+
+    # Extract text between "## This Week's Focus" and the next "## " heading (or EOF)
+    match = re.search(
+        r"## This Week's Focus\n+(.*?)(?=\n## |\Z)",
+        text,
+        re.DOTALL,
+    )
+    if not match:
+        return None
+
+    focus = match.group(1).strip()
+    return focus or None
+
+
+def _legacy_build_daily_report_blocks(
+    report_date: date,
+    metrics: dict[str, Any],
+    strategy_path: str,
+) -> list[dict[str, Any]]:
+    outreach = metrics.get("outreach", {})
+    conversations = metrics.get("conversations", {})
+    funnel = metrics.get("funnel", {})
+    content = metrics.get("content", {})
+    costs = outreach.get("costs", {})
+    classifications = conversations.get("classifications", {})
+    speed_metrics = metrics.get("speed_metrics", {})
+
+    total_cost = costs.get("apify", 0) + costs.get("deepseek", 0)
+
+    # Extract speed metrics
+    speed_to_lead = speed_metrics.get("speed_to_lead")
+    speed_to_reply = speed_metrics.get("speed_to_reply")
+    stl_avg = format_minutes(speed_to_lead.get("avg_minutes") if speed_to_lead else None)
+    stl_count = speed_to_lead.get("count", 0) if speed_to_lead else 0
+    str_avg = format_minutes(speed_to_reply.get("avg_minutes") if speed_to_reply else None)
+    str_count = speed_to_reply.get("count", 0) if speed_to_reply else 0
+
+    blocks = [
+        {
+            "type": "header",
+            "text": {
+                "type": "plain_text",
+                "text": f"Daily Metrics - {report_date.strftime('%b %d, %Y')}",
+                "emoji": True
+            }
+        },
+        {
+            "type": "divider"
+        },
+    ]
+
+    # Append "This Week's Focus" if available
+    focus_text = _legacy_get_current_focus(strategy_path)
+    if focus_text:
+        blocks.append({
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": f"*:dart: This Week's Focus*\n{focus_text}",
+            },
+        })
+
+    blocks.extend([
+        {
+            "type": "section",
+            "fields": [
+                {
+                    "type": "mrkdwn",
+                    "text": (
+                        "*Outreach*\n"
+                        f"Profiles: {outreach.get('profiles_scraped', 0)}\n"
+                        f"ICP Qualified: {outreach.get('icp_qualified', 0)}\n"
+                        f"Uploaded: {outreach.get('heyreach_uploaded', 0)}"
+                    )
+                },
+                {
+                    "type": "mrkdwn",
+                    "text": (
+                        "*Conversations*\n"
+                        f"New: {conversations.get('new', 0)}\n"
+                        f"Approved: {conversations.get('drafts_approved', 0)}\n"
+                        f"Positive: {classifications.get('positive', 0)}"
+                    )
+                }
+            ]
+        },
+        {
+            "type": "section",
+            "fields": [
+                {
+                    "type": "mrkdwn",
+                    "text": (
+                        "*Funnel*\n"
+                        f"Pitched: {funnel.get('pitched', 0)}\n"
+                        f"Calendar Sent: {funnel.get('calendar_sent', 0)}\n"
+                        f"Booked: {funnel.get('booked', 0)}"
+                    )
+                },
+                {
+                    "type": "mrkdwn",
+                    "text": (
+                        "*Content*\n"
+                        f"Created: {content.get('drafts_created', 0)}\n"
+                        f"Scheduled: {content.get('drafts_scheduled', 0)}\n"
+                        f"Posted: {content.get('drafts_posted', 0)}"
+                    )
+                }
+            ]
+        },
+        {
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": (
+                    "*Response Speed*\n"
+                    f"Speed to Lead: {stl_avg} avg ({stl_count} replies)\n"
+                    f"Our Response: {str_avg} avg ({str_count} sent)"
+                )
+            }
+        },
+        {
+            "type": "context",
+            "elements": [
+                {
+                    "type": "mrkdwn",
+                    "text": f"Cost: ${total_cost:.2f}"
+                }
+            ]
+        }
+    ])
+
+    return blocks
+
+
+# --- Harness -------------------------------------------------------------------
+
+
+def _legacy_draft_card(draft_id: uuid.UUID, prospect_id: uuid.UUID) -> list[dict[str, Any]]:
+    blocks = _legacy_build_draft_message(**DRAFT_KWARGS)
+    blocks.extend(_legacy_build_classification_buttons(draft_id, True, prospect_id))
+    blocks.extend(_legacy_build_action_buttons(draft_id))
+    return blocks
+
+
+def _draft_card(draft_id: uuid.UUID, prospect_id: uuid.UUID) -> list[dict[str, Any]]:
+    blocks = slack.build_draft_message(**DRAFT_KWARGS)
+    blocks.extend(slack.build_classification_buttons(draft_id, True, prospect_id))
+    blocks.extend(slack.build_action_buttons(draft_id))
+    return blocks
+
+
+def _time(fn, renders: int, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(renders):
+            fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _report(label: str, legacy: float, templated: float, renders: int) -> None:
+    print(f"{label}:")
+    print(f"  legacy   : {legacy * 1000:8.1f} ms  ({renders / legacy:,.0f} renders/s)")
+    print(f"  templates: {templated * 1000:8.1f} ms  ({renders / templated:,.0f} renders/s)")
+    print(f"  speedup  : {legacy / templated:.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--renders", type=int, default=20_000, help="Renders per timing round")
+    parser.add_argument("--rounds", type=int, default=5, help="Timing rounds (best is reported)")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    draft_id, prospect_id = uuid.uuid4(), uuid.uuid4()
+    report_date = date(2026, 3, 2)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        strategy_path = str(Path(tmp) / "strategy.md")
+        Path(strategy_path).write_text(SAMPLE_STRATEGY, encoding="utf-8")
+        slack._STRATEGY_FILE_PATH = strategy_path
+
+        # Same Slack payload either way
+        assert json.dumps(_legacy_draft_card(draft_id, prospect_id)) == json.dumps(_draft_card(draft_id, prospect_id))
+        assert json.dumps(
+            _legacy_build_daily_report_blocks(report_date, SAMPLE_METRICS, strategy_path)
+        ) == json.dumps(slack.build_daily_report_blocks(report_date, SAMPLE_METRICS)), "daily report differs"
+
+        print(f"{args.renders:,} renders, best of {args.rounds}")
+        _report(
+            "Draft card (message + classification + action buttons)",
+            _time(lambda: _legacy_draft_card(draft_id, prospect_id), args.renders, args.rounds),
+            _time(lambda: _draft_card(draft_id, prospect_id), args.renders, args.rounds),
+            args.renders,
+        )
+        _report(
+            "Daily report (incl. strategy.md focus)",
+            _time(
+                lambda: _legacy_build_daily_report_blocks(report_date, SAMPLE_METRICS, strategy_path),
+                args.renders, args.rounds,
+            ),
+            _time(lambda: slack.build_daily_report_blocks(report_date, SAMPLE_METRICS), args.renders, args.rounds),
+            args.renders,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for HeyReach webhook ingestion (requests/s).
+
+Posts a realistic reply webhook (a long conversation, as HeyReach sends)
+through two minimal apps over an in-process ASGI transport:
+
+- before: the previous ingestion path, kept below as the baseline
+  (``@app.middleware("http")`` logging every header, raw body + parsed
+  dict logged at INFO, ``print(..., flush=True)``, json + ``Model(**data)``);
+- after: RequestLogMiddleware + the real ``heyreach_webhook`` handler.
+
+Logging is at INFO into /dev/null, so formatting and write costs count but
+the terminal doesn't. Background processing is stubbed out in both.
+
+Usage:
+    python scripts/bench_webhooks.py                       # 2k requests, 3 rounds
+    python scripts/bench_webhooks.py --messages 200        # bigger conversation
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Set minimal env defaults for config loading
+os.environ.setdefault("HEYREACH_API_KEY", "")
+os.environ.setdefault("SLACK_BOT_TOKEN", "")
+os.environ.setdefault("SLACK_CHANNEL_ID", "")
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+import httpx  # noqa: E402
+from fastapi import BackgroundTasks, FastAPI, Request  # noqa: E402
+
+from app import main  # noqa: E402
+from app.middleware import RequestLogMiddleware  # noqa: E402
+from app.schemas import HeyReachWebhookPayload  # noqa: E402
+
+logger = logging.getLogger("bench.legacy")
+
+
+def _payload(messages: int) -> bytes:
+    return json.dumps({
+        "is_inmail": False,
+        "recent_messages": [
+            {
+                "creation_time": f"2026-01-28T16:{i % 60:02d}:01Z",
+                "message": f"Message {i}: " + "thanks for reaching out, tell me more about what you do " * 3,
+                "is_reply": i % 2 == 0,
+            }
+            for i in range(messages)
+        ],
+        "conversation_id": "2-ODYwNmVkNDI=",
+        "campaign": {"name": "Founders Q1", "id": 123},
+        "sender": {"id": 123, "first_name": "Ian", "full_name": "Ian Shaw"},
+        "lead": {
+            "id": "lead-1",
+            "profile_url": "https://www.linkedin.com/in/johndoe",
+            "full_name": "John Doe",
+            "company_name": "Test Company",
+            "position": "CEO",
+        },
+        "timestamp": "2026-01-28T16:28:01Z",
+        "event_type": "every_message_reply_received",
+    }).encode()
+
+
+async def _noop(payload) -> None:
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Baseline: the previous ingestion path
+# ---------------------------------------------------------------------------
+
+
+def _legacy_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.middleware("http")
+    async def log_requests(request: Request, call_next):
+        logger.info(f"Request: {request.method} {request.url.path}")
+        logger.info(f"Headers: {dict(request.headers)}")
+        response = await call_next(request)
+        logger.info(f"Response status: {response.status_code}")
+        return response
+
+    @app.post("/webhook/heyreach")
+    async def heyreach_webhook(request: Request, background_tasks: BackgroundTasks) -> dict:
+        print("=== WEBHOOK RECEIVED ===", flush=True)
+        body = await request.body()
+        print(f"Body length: {len(body)}", flush=True)
+        logger.info(f"Raw webhook body: {body.decode('utf-8', errors='replace')}")
+        try:
+            data = json.loads(body)
+            logger.info(f"Parsed webhook data: {data}")
+        except Exception as e:
+            logger.error(f"Failed to parse webhook body: {e}")
+            return {"status": "error", "message": "Invalid JSON"}
+        try:
+            payload = HeyReachWebhookPayload(**data)
+            background_tasks.add_task(_noop, payload)
+            return {
+                "status": "received",
+                "conversation_id": payload.conversation_id,
+                "lead_name": payload.lead_name,
+            }
+        except Exception as e:
+            logger.error(f"Schema validation failed: {e}")
+            return {"status": "received_raw", "keys": list(data.keys())}
+
+    return app
+
+
+def _current_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(RequestLogMiddleware)
+    app.add_api_route("/webhook/heyreach", main.heyreach_webhook, methods=["POST"])
+    return app
+
+
+async def _rps(app: FastAPI, body: bytes, requests: int, rounds: int) -> float:
+    best = 0.0
+    transport = httpx.ASGITransport(app=app)
+    headers = {"content-type": "application/json", "user-agent": "HeyReach-Webhooks/1.0"}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(rounds):
+            started = time.perf_counter()
+            for _ in range(requests):
+                response = await client.post("/webhook/heyreach", content=body, headers=headers)
+                assert response.json()["status"] == "received"
+            best = max(best, requests / (time.perf_counter() - started))
+    return best
+
+
+async def _run(args: argparse.Namespace) -> tuple[int, float, float]:
+    body = _payload(args.messages)
+    before = await _rps(_legacy_app(), body, args.requests, args.rounds)
+    after = await _rps(_current_app(), body, args.requests, args.rounds)
+    return len(body), before, after
+
+
+def main_() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--messages", type=int, default=50)
+    args = parser.parse_args()
+
+    devnull = open(os.devnull, "w")
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(logging.StreamHandler(devnull))
+    root.setLevel(logging.INFO)
+    main.process_incoming_message = _noop
+
+    # The baseline prints on every request; keep that off the terminal
+    with contextlib.redirect_stdout(devnull):
+        size, before, after = asyncio.run(_run(args))
+
+    print(f"Payload: {args.messages} messages, {size:,} bytes; {args.requests:,} requests, best of {args.rounds}")
+    print(f"  before: {before:8.0f} req/s")
+    print(f"  after:  {after:8.0f} req/s  ({after / before:.1f}x)")
+
+
+if __name__ == "__main__":
+    main_()
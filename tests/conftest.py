@@ -34,6 +34,26 @@ def test_settings():
     return Settings()
 
 
+@pytest.fixture(autouse=True)
+def fresh_example_index():
+    """Each test gets an empty few-shot example index (it is loaded per DB)."""
+    from app.services import example_index
+
+    example_index._index = None
+    yield
+    example_index._index = None
+
+
+@pytest.fixture(autouse=True)
+def fresh_icp_verdict_cache():
+    """ICP verdicts cached by one test must not leak into the next."""
+    from app.services.gift_pipeline.icp_requalify import clear_verdict_cache
+
+    clear_verdict_cache()
+    yield
+    clear_verdict_cache()
+
+
 @pytest_asyncio.fixture
 async def test_db_engine():
     """Create a test database engine using SQLite in-memory."""
@@ -0,0 +1,57 @@
+"""Tests for running blocking SDK calls off the event loop."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.blocking_io import run_blocking
+from app.services.google_sheets import create_gift_leads_sheet_async
+
+
+class TestRunBlocking:
+    async def test_runs_on_pool_thread(self):
+        name = await run_blocking(lambda: threading.current_thread().name)
+        assert name.startswith("blocking-io")
+
+    async def test_propagates_exceptions(self):
+        def boom():
+            raise ValueError("nope")
+
+        with pytest.raises(ValueError, match="nope"):
+            await run_blocking(boom)
+
+
+class TestCreateGiftLeadsSheetAsync:
+    async def test_loop_stays_responsive_during_sheet_creation(self):
+        """A slow Drive round trip must not stall other coroutines."""
+        svc = MagicMock()
+
+        def slow_create(prospect_name, leads):
+            time.sleep(0.3)
+            return "https://docs.google.com/spreadsheets/d/abc"
+
+        svc.create_gift_leads_sheet.side_effect = slow_create
+        ticks: list[float] = []
+
+        async def ticker():
+            while True:
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        tick_task = asyncio.create_task(ticker())
+        with patch("app.services.google_sheets.get_google_sheets_service", return_value=svc):
+            url = await create_gift_leads_sheet_async("Jane", [{"full_name": "A"}])
+        tick_task.cancel()
+
+        assert url == "https://docs.google.com/spreadsheets/d/abc"
+        svc.create_gift_leads_sheet.assert_called_once_with("Jane", [{"full_name": "A"}])
+        gaps = [b - a for a, b in zip(ticks, ticks[1:])]
+        assert len(ticks) >= 10
+        assert max(gaps) < 0.15
+
+    async def test_returns_none_when_not_configured(self):
+        with patch("app.services.google_sheets.get_google_sheets_service", return_value=None):
+            assert await create_gift_leads_sheet_async("Jane", []) is None
@@ -83,6 +83,28 @@ class TestGetCurrentFocus:
         assert "Do the thing" in result
         assert "Do another thing" in result
 
+    def test_unchanged_file_not_reread(self, tmp_path):
+        """Repeat calls reuse the parsed focus while the file is unchanged."""
+        strategy_file = tmp_path / "strategy.md"
+        strategy_file.write_text(SAMPLE_STRATEGY, encoding="utf-8")
+
+        first = _get_current_focus(str(strategy_file))
+        with patch("app.services.slack.Path.read_text") as mock_read:
+            second = _get_current_focus(str(strategy_file))
+
+        assert second == first
+        mock_read.assert_not_called()
+
+    def test_edited_file_is_reparsed(self, tmp_path):
+        """A change to the file's mtime/size invalidates the cached focus."""
+        strategy_file = tmp_path / "strategy.md"
+        strategy_file.write_text(SAMPLE_STRATEGY, encoding="utf-8")
+        assert "Reply fast" in _get_current_focus(str(strategy_file))
+
+        strategy_file.write_text("## This Week's Focus\n\nShip the new onboarding\n", encoding="utf-8")
+
+        assert _get_current_focus(str(strategy_file)) == "Ship the new onboarding"
+
 
 class TestDailyReportFocusBlock:
     """Tests for focus block integration in build_daily_report_blocks()."""
@@ -10,6 +10,7 @@ from app.services.campaign_monitor import (
     get_daily_connection_stats,
     monitor_and_topup,
 )
+from app.services.pipeline_executor import PRIORITY_SCHEDULED
 
 
 # ---------------------------------------------------------------------------
@@ -81,17 +82,10 @@ class TestCheckCampaignFuel:
 
     @pytest.mark.asyncio
     async def test_parses_low_fuel(self):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {"items": [CAMPAIGN_LOW_FUEL]}
-
-        with patch("app.services.campaign_monitor.httpx.AsyncClient") as MockClient:
-            client_instance = AsyncMock()
-            client_instance.post.return_value = mock_resp
-            client_instance.__aenter__ = AsyncMock(return_value=client_instance)
-            client_instance.__aexit__ = AsyncMock(return_value=False)
-            MockClient.return_value = client_instance
+        heyreach = MagicMock()
+        heyreach.get_campaigns = AsyncMock(return_value={"items": [CAMPAIGN_LOW_FUEL]})
 
+        with patch("app.services.campaign_monitor.get_heyreach_client", return_value=heyreach):
             result = await check_campaign_fuel()
 
         assert result["pending"] == 0
@@ -103,17 +97,10 @@ class TestCheckCampaignFuel:
 
     @pytest.mark.asyncio
     async def test_parses_ok_fuel(self):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {"items": [CAMPAIGN_OK_FUEL]}
-
-        with patch("app.services.campaign_monitor.httpx.AsyncClient") as MockClient:
-            client_instance = AsyncMock()
-            client_instance.post.return_value = mock_resp
-            client_instance.__aenter__ = AsyncMock(return_value=client_instance)
-            client_instance.__aexit__ = AsyncMock(return_value=False)
-            MockClient.return_value = client_instance
+        heyreach = MagicMock()
+        heyreach.get_campaigns = AsyncMock(return_value={"items": [CAMPAIGN_OK_FUEL]})
 
+        with patch("app.services.campaign_monitor.get_heyreach_client", return_value=heyreach):
             result = await check_campaign_fuel()
 
         assert result["pending"] == 120
@@ -121,19 +108,12 @@ class TestCheckCampaignFuel:
 
     @pytest.mark.asyncio
     async def test_campaign_not_found_returns_none(self):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {"items": [
+        heyreach = MagicMock()
+        heyreach.get_campaigns = AsyncMock(return_value={"items": [
             _make_campaign(999, "ACTIVE", 50, 50, 50, 150)
-        ]}
-
-        with patch("app.services.campaign_monitor.httpx.AsyncClient") as MockClient:
-            client_instance = AsyncMock()
-            client_instance.post.return_value = mock_resp
-            client_instance.__aenter__ = AsyncMock(return_value=client_instance)
-            client_instance.__aexit__ = AsyncMock(return_value=False)
-            MockClient.return_value = client_instance
+        ]})
 
+        with patch("app.services.campaign_monitor.get_heyreach_client", return_value=heyreach):
             result = await check_campaign_fuel()
 
         assert result is None
@@ -148,34 +128,20 @@ class TestGetDailyConnectionStats:
     @pytest.mark.asyncio
     async def test_parses_daily_stats(self):
         stats_data = _make_stats_response([30, 28, 25, 18, 8, 10, 15])
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = stats_data
-
-        with patch("app.services.campaign_monitor.httpx.AsyncClient") as MockClient:
-            client_instance = AsyncMock()
-            client_instance.post.return_value = mock_resp
-            client_instance.__aenter__ = AsyncMock(return_value=client_instance)
-            client_instance.__aexit__ = AsyncMock(return_value=False)
-            MockClient.return_value = client_instance
+        heyreach = MagicMock()
+        heyreach.get_overall_stats = AsyncMock(return_value=stats_data)
 
+        with patch("app.services.campaign_monitor.get_heyreach_client", return_value=heyreach):
             result = await get_daily_connection_stats()
 
         assert result == [30, 28, 25, 18, 8, 10, 15]
 
     @pytest.mark.asyncio
     async def test_empty_stats(self):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {"connectionsSent": []}
-
-        with patch("app.services.campaign_monitor.httpx.AsyncClient") as MockClient:
-            client_instance = AsyncMock()
-            client_instance.post.return_value = mock_resp
-            client_instance.__aenter__ = AsyncMock(return_value=client_instance)
-            client_instance.__aexit__ = AsyncMock(return_value=False)
-            MockClient.return_value = client_instance
+        heyreach = MagicMock()
+        heyreach.get_overall_stats = AsyncMock(return_value={"connectionsSent": []})
 
+        with patch("app.services.campaign_monitor.get_heyreach_client", return_value=heyreach):
             result = await get_daily_connection_stats()
 
         assert result == []
@@ -253,11 +219,12 @@ class TestMonitorAndTopup:
              patch("app.services.campaign_monitor.get_daily_connection_stats") as mock_stats, \
              patch("app.services.campaign_monitor.get_slack_bot") as mock_slack, \
              patch("app.services.campaign_monitor._count_unprocessed_prospects") as mock_count, \
-             patch("asyncio.create_task") as mock_create_task:
+             patch("app.services.pipeline_executor.get_pipeline_executor") as mock_executor:
 
             mock_fuel.return_value = _FUEL_LOW
             mock_stats.return_value = [18, 8, 10]  # yesterday=10, deficit=20
             mock_count.return_value = 0
+            mock_executor.return_value.submit = AsyncMock()
 
             bot_instance = AsyncMock()
             mock_slack.return_value = bot_instance
@@ -268,7 +235,10 @@ class TestMonitorAndTopup:
         assert result["deficit"] == 20
         assert result["lead_finder_triggered"] is True
         assert result["batch_triggered"] is False
-        mock_create_task.assert_called_once()
+        mock_executor.return_value.submit.assert_awaited_once()
+        args, kwargs = mock_executor.return_value.submit.call_args
+        assert args == ("lead_finder", {"fetch_count": 60})
+        assert kwargs["priority"] == PRIORITY_SCHEDULED
 
     @pytest.mark.asyncio
     async def test_prefers_batch_over_lead_finder(self):
@@ -299,11 +269,12 @@ class TestMonitorAndTopup:
              patch("app.services.campaign_monitor.get_daily_connection_stats") as mock_stats, \
              patch("app.services.campaign_monitor.get_slack_bot") as mock_slack, \
              patch("app.services.campaign_monitor._count_unprocessed_prospects") as mock_count, \
-             patch("asyncio.create_task"):
+             patch("app.services.pipeline_executor.get_pipeline_executor") as mock_executor:
 
             mock_fuel.return_value = _FUEL_LOW
             mock_stats.return_value = []  # no data
             mock_count.return_value = 0
+            mock_executor.return_value.submit = AsyncMock()
 
             bot_instance = AsyncMock()
             mock_slack.return_value = bot_instance
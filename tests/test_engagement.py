@@ -216,6 +216,121 @@ class TestCheckEngagementPosts:
         assert profile.last_checked_at is not None
 
 
+    @pytest.mark.asyncio
+    async def test_processes_new_posts_concurrently_with_bound(self, test_db_session):
+        """Should skip seen posts in one query and fan out the rest under the semaphore."""
+        import asyncio
+
+        profiles = [
+            WatchedProfile(
+                linkedin_url=f"https://linkedin.com/in/user{i}",
+                name=f"User {i}",
+                category=WatchedProfileCategory.PROSPECT,
+                is_active=True,
+            )
+            for i in range(4)
+        ]
+        test_db_session.add_all(profiles)
+        await test_db_session.flush()
+        test_db_session.add(EngagementPost(
+            watched_profile_id=profiles[0].id,
+            post_url="https://linkedin.com/posts/user0",
+        ))
+        await test_db_session.commit()
+
+        items = [
+            {"postUrl": f"https://linkedin.com/posts/user{i}", "input": f"https://linkedin.com/in/user{i}"}
+            for i in range(4)
+        ]
+        mock_apify = MagicMock()
+        mock_apify.scrape_profile_posts.return_value = (items, 0.01)
+        mock_apify.extract_post_url.side_effect = lambda item: item["postUrl"]
+        mock_apify.extract_post_text.return_value = "Post text"
+
+        in_flight = 0
+        peak = 0
+
+        async def summarize(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return "Summary", "Comment", 10, 5
+
+        mock_deepseek = MagicMock()
+        mock_deepseek.summarize_and_draft_comment = summarize
+        mock_slack = AsyncMock()
+        mock_slack.send_engagement_notification.return_value = "ts"
+
+        with patch("app.services.engagement.async_session_factory") as mock_factory, \
+             patch("app.services.engagement.get_apify_service", return_value=mock_apify), \
+             patch("app.services.engagement.get_deepseek_client", return_value=mock_deepseek), \
+             patch("app.services.engagement.get_slack_bot", return_value=mock_slack), \
+             patch("app.services.engagement.settings") as mock_settings, \
+             patch("asyncio.to_thread", side_effect=lambda fn, **kw: fn(**kw)):
+            mock_settings.engagement_concurrency = 2
+            mock_settings.engagement_apify_batch_size = 25
+            mock_factory.return_value.__aenter__ = AsyncMock(return_value=test_db_session)
+            mock_factory.return_value.__aexit__ = AsyncMock(return_value=None)
+
+            result = await check_engagement_posts()
+
+        assert result["posts_new"] == 3
+        assert result["posts_notified"] == 3
+        assert peak == 2
+
+        stored = await test_db_session.execute(select(EngagementPost.post_url))
+        assert len(stored.scalars().all()) == 4
+
+
+    @pytest.mark.asyncio
+    async def test_polls_only_due_profiles_in_batches(self, test_db_session):
+        """Should skip recently checked profiles and split the rest into Apify batches."""
+        from datetime import timedelta
+
+        now = datetime.now(timezone.utc)
+        due = [
+            WatchedProfile(
+                linkedin_url=f"https://linkedin.com/in/due{i}",
+                name=f"Due {i}",
+                category=WatchedProfileCategory.PROSPECT,
+                is_active=True,
+            )
+            for i in range(3)
+        ]
+        fresh = WatchedProfile(
+            linkedin_url="https://linkedin.com/in/fresh",
+            name="Fresh",
+            category=WatchedProfileCategory.INFLUENCER,
+            is_active=True,
+            last_checked_at=now - timedelta(minutes=30),
+        )
+        test_db_session.add_all([*due, fresh])
+        await test_db_session.commit()
+
+        mock_apify = MagicMock()
+        mock_apify.scrape_profile_posts.return_value = ([], 0.01)
+
+        with patch("app.services.engagement.async_session_factory") as mock_factory, \
+             patch("app.services.engagement.get_apify_service", return_value=mock_apify), \
+             patch("app.services.engagement.settings") as mock_settings, \
+             patch("asyncio.to_thread", side_effect=lambda fn, **kw: fn(**kw)):
+            mock_settings.engagement_concurrency = 5
+            mock_settings.engagement_apify_batch_size = 2
+            mock_factory.return_value.__aenter__ = AsyncMock(return_value=test_db_session)
+            mock_factory.return_value.__aexit__ = AsyncMock(return_value=None)
+
+            result = await check_engagement_posts()
+
+        batches = [c.kwargs["linkedin_urls"] for c in mock_apify.scrape_profile_posts.call_args_list]
+        assert [len(b) for b in batches] == [2, 1]
+        assert "https://linkedin.com/in/fresh" not in sum(batches, [])
+        assert result["profiles_checked"] == 3
+        assert result["profiles_skipped"] == 1
+        assert result["apify_cost_usd"] == pytest.approx(0.02)
+
+
 class TestEngagementCostTracking:
     """Tests for engagement cost logging and accumulation."""
 
@@ -0,0 +1,80 @@
+"""Tests for adaptive watched-profile polling."""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from app.models import WatchedProfile, WatchedProfileCategory
+from app.services.engagement_polling import (
+    DEFAULT_POLL_INTERVAL,
+    MAX_POLL_INTERVAL,
+    MIN_POLL_INTERVAL,
+    estimate_poll_interval,
+    select_due_profiles,
+)
+
+NOW = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _profile(category=WatchedProfileCategory.INFLUENCER, last_checked_at=None, created_days_ago=1):
+    return WatchedProfile(
+        id=uuid.uuid4(),
+        linkedin_url=f"https://linkedin.com/in/{uuid.uuid4().hex[:8]}",
+        name="Someone",
+        category=category,
+        last_checked_at=last_checked_at,
+        created_at=NOW - timedelta(days=created_days_ago),
+    )
+
+
+class TestEstimatePollInterval:
+    def test_new_profile_uses_default(self):
+        assert estimate_poll_interval(_profile(), [], NOW) == DEFAULT_POLL_INTERVAL
+
+    def test_daily_poster_polled_twice_a_day(self):
+        posts = [NOW - timedelta(days=d) for d in range(5)]
+        assert estimate_poll_interval(_profile(), posts, NOW) == timedelta(hours=12)
+
+    def test_quiet_profile_backs_off_up_to_max(self):
+        posts = [NOW - timedelta(days=60), NOW - timedelta(days=61)]
+        assert estimate_poll_interval(_profile(), posts, NOW) == MAX_POLL_INTERVAL
+
+    def test_prospects_polled_more_often(self):
+        posts = [NOW - timedelta(days=d) for d in range(5)]
+        prospect = _profile(WatchedProfileCategory.PROSPECT)
+        assert estimate_poll_interval(prospect, posts, NOW) == timedelta(hours=6)
+
+    def test_never_below_minimum(self):
+        posts = [NOW - timedelta(hours=h) for h in range(10)]
+        prospect = _profile(WatchedProfileCategory.PROSPECT)
+        assert estimate_poll_interval(prospect, posts, NOW) == MIN_POLL_INTERVAL
+
+    def test_naive_timestamps_treated_as_utc(self):
+        posts = [(NOW - timedelta(days=d)).replace(tzinfo=None) for d in range(5)]
+        assert estimate_poll_interval(_profile(), posts, NOW) == timedelta(hours=12)
+
+
+class TestSelectDueProfiles:
+    def test_skips_recently_checked_profiles(self):
+        fresh = _profile(last_checked_at=NOW - timedelta(hours=1))
+        stale = _profile(last_checked_at=NOW - timedelta(days=2))
+        never = _profile()
+
+        due = select_due_profiles([fresh, stale, never], {}, NOW)
+        assert fresh not in due
+        assert set(due) == {stale, never}
+
+    def test_orders_by_category_then_overdue(self):
+        influencer = _profile(WatchedProfileCategory.INFLUENCER)
+        prospect_stale = _profile(WatchedProfileCategory.PROSPECT, last_checked_at=NOW - timedelta(days=1))
+        prospect_very_stale = _profile(WatchedProfileCategory.PROSPECT, last_checked_at=NOW - timedelta(days=3))
+
+        due = select_due_profiles([influencer, prospect_stale, prospect_very_stale], {}, NOW)
+        assert due == [prospect_very_stale, prospect_stale, influencer]
+
+    def test_history_makes_active_poster_due_sooner(self):
+        checked = NOW - timedelta(hours=7)
+        active = _profile(last_checked_at=checked)
+        quiet = _profile(last_checked_at=checked)
+        history = {active.id: [NOW - timedelta(hours=h) for h in (8, 16, 24)]}
+
+        assert select_due_profiles([active, quiet], history, NOW) == [active]
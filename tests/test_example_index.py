@@ -0,0 +1,100 @@
+"""Tests for the BM25 few-shot example index."""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Conversation, Draft, DraftStatus, FunnelStage
+from app.services.example_index import ExampleIndex, get_example_index
+from app.services.example_retriever import get_similar_examples
+
+
+async def _approved(
+    db: AsyncSession,
+    lead_message: str,
+    reply: str = "Nice one",
+    stage: FunnelStage = FunnelStage.POSITIVE_REPLY,
+    created_at: datetime | None = None,
+) -> tuple[Draft, Conversation]:
+    conv = Conversation(
+        id=uuid.uuid4(),
+        heyreach_lead_id=str(uuid.uuid4()),
+        linkedin_profile_url=f"https://linkedin.com/in/{uuid.uuid4()}",
+        lead_name="Lead",
+        funnel_stage=stage,
+        conversation_history=[{"role": "lead", "content": lead_message}],
+    )
+    db.add(conv)
+    await db.flush()
+    draft = Draft(
+        id=uuid.uuid4(),
+        conversation_id=conv.id,
+        ai_draft=reply,
+        status=DraftStatus.APPROVED,
+        created_at=created_at or datetime.now(timezone.utc),
+    )
+    db.add(draft)
+    await db.commit()
+    return draft, conv
+
+
+@pytest.mark.asyncio
+class TestExampleIndex:
+    async def test_old_relevant_draft_beats_recent_filler(self, test_db_session: AsyncSession):
+        """Drafts far outside the old 15-most-recent window are still found."""
+        old = datetime.now(timezone.utc) - timedelta(days=300)
+        await _approved(test_db_session, "We run a podcast for dental clinics", reply="Podcast reply", created_at=old)
+        for i in range(20):
+            await _approved(test_db_session, f"Thanks for connecting {i}", reply=f"Filler {i}")
+
+        result = await get_similar_examples(
+            stage=FunnelStage.POSITIVE_REPLY,
+            lead_context={},
+            current_lead_message="Our podcast helps dental clinics grow",
+            db=test_db_session,
+            limit=3,
+        )
+
+        assert result[-1].draft_reply == "Podcast reply"
+
+    async def test_loads_once_then_indexes_approvals(self, test_db_session: AsyncSession):
+        await _approved(test_db_session, "We sell coaching programs")
+        index = get_example_index()
+        await index.ensure_loaded(test_db_session)
+        assert len(index) == 1
+
+        draft, conv = await _approved(test_db_session, "Agency owner here, scaling outbound")
+        await index.ensure_loaded(test_db_session)  # no reload
+        assert len(index) == 1
+
+        index.add_approved(draft, conv)
+        hits = index.search(FunnelStage.POSITIVE_REPLY, "outbound agency", 1)
+        assert hits[0].lead_message == "Agency owner here, scaling outbound"
+
+    async def test_reindexing_moves_draft_between_stages(self, test_db_session: AsyncSession):
+        index = get_example_index()
+        await index.ensure_loaded(test_db_session)
+        draft, conv = await _approved(test_db_session, "Sounds good, send the link")
+        index.add_approved(draft, conv)
+
+        conv.funnel_stage = FunnelStage.PITCHED
+        index.add_approved(draft, conv)
+
+        assert index.search(FunnelStage.POSITIVE_REPLY, "link", 3) == []
+        assert len(index.search(FunnelStage.PITCHED, "link", 3)) == 1
+
+    async def test_snapshot_roundtrip_reads_only_newer_drafts(self, test_db_session: AsyncSession, tmp_path):
+        path = tmp_path / "index.json"
+        await _approved(test_db_session, "We coach SaaS founders")
+
+        first = ExampleIndex(str(path))
+        await first.ensure_loaded(test_db_session)
+        assert path.exists()
+
+        second = ExampleIndex(str(path))
+        second._load_snapshot()
+        assert len(second) == 1
+        assert await second._load_from_db(test_db_session, since=second._watermark) == 0
+        assert second.search(FunnelStage.POSITIVE_REPLY, "saas", 1)[0].lead_message == "We coach SaaS founders"
@@ -236,6 +236,126 @@ class TestHeyReachClient:
             assert "Failed to remove lead from list" in str(exc_info.value)
 
 
+@pytest.fixture
+def fast_retries():
+    """No backoff delay and no effective rate limit."""
+    from app.config import settings
+
+    with patch.object(settings, "heyreach_backoff_seconds", 0), \
+         patch.object(settings, "heyreach_requests_per_second", 1000.0), \
+         patch.object(settings, "heyreach_burst", 1000):
+        yield
+
+
+class TestHeyReachRetry:
+    """Tests for rate-limited retry with backoff."""
+
+    @pytest.mark.asyncio
+    async def test_retries_5xx_then_succeeds(self, fast_retries):
+        client = HeyReachClient(api_key="k")
+        responses = [Response(503), Response(502), Response(200, json={"addedCount": 1})]
+
+        with patch.object(client._client, "post", new_callable=AsyncMock, side_effect=responses) as mock_post:
+            result = await client.add_leads_to_list(1, [{"linkedin_url": "https://linkedin.com/in/a"}])
+
+        assert result["addedCount"] == 1
+        assert mock_post.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self, fast_retries):
+        client = HeyReachClient(api_key="k")
+
+        with patch.object(client._client, "post", new_callable=AsyncMock, return_value=Response(500)) as mock_post:
+            with pytest.raises(HeyReachError):
+                await client.remove_lead_from_list(1, "https://linkedin.com/in/a")
+
+        assert mock_post.await_count == client._max_retries + 1
+
+    @pytest.mark.asyncio
+    async def test_send_message_not_retried_on_5xx(self, fast_retries):
+        """A 5xx may mean the message went out; never risk a double send."""
+        client = HeyReachClient(api_key="k")
+
+        with patch.object(client._client, "post", new_callable=AsyncMock, return_value=Response(500)) as mock_post:
+            with pytest.raises(HeyReachError):
+                await client.send_message("conv", "acct", "hi")
+
+        assert mock_post.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_send_message_retried_on_429(self, fast_retries):
+        client = HeyReachClient(api_key="k")
+        responses = [Response(429, headers={"Retry-After": "0"}), Response(200, json={"success": True})]
+
+        with patch.object(client._client, "post", new_callable=AsyncMock, side_effect=responses) as mock_post:
+            result = await client.send_message("conv", "acct", "hi")
+
+        assert result == {"success": True}
+        assert mock_post.await_count == 2
+
+
+class TestBatchOperations:
+    """Tests for concurrent chunk upload and stop-and-remove."""
+
+    @pytest.mark.asyncio
+    async def test_upload_chunks_concurrently_and_dedupes(self):
+        import asyncio
+
+        from app.config import settings
+        from app.services.heyreach import upload_leads_to_list
+
+        in_flight = 0
+        peak = 0
+
+        async def add(list_id, chunk):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"addedCount": len(chunk) - 1, "updatedCount": 1, "failedCount": 0}
+
+        client = MagicMock()
+        client.add_leads_to_list = AsyncMock(side_effect=add)
+        leads = [{"linkedin_url": f"https://linkedin.com/in/u{i}"} for i in range(25)]
+        leads.append({"linkedin_url": "https://linkedin.com/in/U3/"})  # duplicate
+
+        with patch.object(settings, "heyreach_upload_concurrency", 3):
+            totals = await upload_leads_to_list(7, leads, client=client, chunk_size=5)
+
+        assert client.add_leads_to_list.await_count == 5
+        assert peak == 3
+        assert totals == {"added": 20, "updated": 5, "failed": 0, "failed_chunks": 0}
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_does_not_stop_others(self):
+        from app.services.heyreach import upload_leads_to_list
+
+        client = MagicMock()
+        client.add_leads_to_list = AsyncMock(side_effect=[
+            {"addedCount": 2}, HeyReachError("boom"), {"addedCount": 1},
+        ])
+        leads = [{"linkedin_url": f"https://linkedin.com/in/u{i}"} for i in range(5)]
+
+        totals = await upload_leads_to_list(7, leads, client=client, chunk_size=2)
+
+        assert totals["added"] == 3
+        assert totals["failed_chunks"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stop_and_remove_attempts_both(self):
+        from app.services.heyreach import stop_and_remove_lead
+
+        client = MagicMock()
+        client.stop_lead_in_campaign = AsyncMock(side_effect=HeyReachError("stop failed"))
+        client.remove_lead_from_list = AsyncMock(return_value={"success": True})
+
+        with pytest.raises(HeyReachError, match="stop failed"):
+            await stop_and_remove_lead(1, 2, "https://linkedin.com/in/a", client=client)
+
+        client.remove_lead_from_list.assert_awaited_once_with(list_id=2, linkedin_url="https://linkedin.com/in/a")
+
+
 class TestHeyReachWebhook:
     """Tests for the HeyReach webhook endpoint."""
 
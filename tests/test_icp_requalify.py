@@ -0,0 +1,92 @@
+"""Tests for concurrent tier-1 ICP re-qualification."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app.config import settings
+from app.services.gift_pipeline.icp_requalify import requalify_leads
+
+_ICP_CHECK = "app.services.gift_pipeline.deepseek_calls.check_icp_match"
+
+
+def _leads(n: int) -> list[dict]:
+    return [
+        {"full_name": f"Lead {i}", "linkedin_url": f"https://linkedin.com/in/lead{i}"}
+        for i in range(n)
+    ]
+
+
+@pytest.mark.asyncio
+class TestRequalifyLeads:
+    async def test_checks_run_concurrently_within_limit(self):
+        in_flight = peak = 0
+
+        async def icp_check(lead, cost_tracker, icp_criteria=None, strict=False):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"match": lead["full_name"] != "Lead 1", "confidence": "high", "reason": "r"}
+
+        with patch(_ICP_CHECK, side_effect=icp_check), \
+             patch.object(settings, "icp_requalify_concurrency", 4):
+            result = await requalify_leads(_leads(10), "tech founders")
+
+        assert peak == 4
+        assert result.checked == 10
+        assert [lead["full_name"] for lead in result.qualified] == [f"Lead {i}" for i in range(10) if i != 1]
+        assert result.rejected == ["Lead 1"]
+        assert result.qualified[0]["icp_confidence"] == "high"
+
+    async def test_stops_once_enough_qualified(self):
+        started = 0
+
+        async def icp_check(lead, cost_tracker, icp_criteria=None, strict=False):
+            nonlocal started
+            started += 1
+            await asyncio.sleep(0.01)
+            return {"match": True, "confidence": "high", "reason": "r"}
+
+        with patch(_ICP_CHECK, side_effect=icp_check), \
+             patch.object(settings, "icp_requalify_concurrency", 3):
+            result = await requalify_leads(_leads(30), "tech founders", stop_after=5)
+
+        assert len(result.qualified) == 5
+        assert started < 10
+        assert result.skipped > 0
+
+    async def test_reuses_cached_verdicts(self):
+        calls = 0
+
+        async def icp_check(lead, cost_tracker, icp_criteria=None, strict=False):
+            nonlocal calls
+            calls += 1
+            return {"match": True, "confidence": "high", "reason": "r"}
+
+        with patch(_ICP_CHECK, side_effect=icp_check):
+            await requalify_leads(_leads(3), "Tech Founders")
+            again = await requalify_leads(_leads(3), "tech  founders")
+            other_icp = await requalify_leads(_leads(3), "dentists")
+
+        assert again.cache_hits == 3
+        assert len(again.qualified) == 3
+        assert other_icp.cache_hits == 0
+        assert calls == 6
+
+    async def test_errors_not_cached_and_kept_when_asked(self):
+        async def icp_check(lead, cost_tracker, icp_criteria=None, strict=False):
+            if lead["full_name"] == "Lead 0":
+                raise RuntimeError("timeout")
+            return {"match": True, "confidence": "error", "reason": "DeepSeek down"}
+
+        with patch(_ICP_CHECK, side_effect=icp_check):
+            dropped = await requalify_leads(_leads(2), "x")
+            kept = await requalify_leads(_leads(2), "x", keep_on_error=True)
+
+        assert [lead["full_name"] for lead in dropped.qualified] == ["Lead 1"]
+        assert dropped.errors == ["Lead 0"]
+        assert len(kept.qualified) == 2
+        assert kept.cache_hits == 0
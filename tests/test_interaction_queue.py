@@ -0,0 +1,74 @@
+"""Tests for the deferred Slack interaction queue."""
+
+import asyncio
+
+from app.services.interaction_queue import InteractionQueue
+
+
+class TestInteractionQueue:
+    async def test_same_key_jobs_run_one_at_a_time_in_order(self):
+        queue = InteractionQueue(concurrency=5)
+        events: list[str] = []
+
+        def job(name: str):
+            async def run():
+                events.append(f"{name}:start")
+                await asyncio.sleep(0.01)
+                events.append(f"{name}:end")
+            return run
+
+        queue.submit(job("approve"), key="draft:1")
+        queue.submit(job("edit"), key="draft:1")
+        await queue.join()
+
+        assert events == ["approve:start", "approve:end", "edit:start", "edit:end"]
+        assert queue.stats()["serialized_keys"] == 0
+
+    async def test_different_keys_run_concurrently(self):
+        queue = InteractionQueue(concurrency=5)
+        running = 0
+        peak = 0
+
+        async def job():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        for i in range(3):
+            queue.submit(job, key=f"draft:{i}")
+        await queue.join()
+
+        assert peak == 3
+
+    async def test_duplicate_dropped_only_while_in_flight(self):
+        queue = InteractionQueue(concurrency=5)
+        calls = 0
+
+        async def job():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+
+        assert queue.submit(job, key="draft:1", dedupe_key="approve:1") is not None
+        assert queue.submit(job, key="draft:1", dedupe_key="approve:1") is None
+        await queue.join()
+        assert queue.submit(job, key="draft:1", dedupe_key="approve:1") is not None
+        await queue.join()
+
+        assert calls == 2
+        assert queue.stats()["deduplicated"] == 1
+
+    async def test_failed_job_is_counted_and_releases_key(self):
+        queue = InteractionQueue(concurrency=1)
+
+        async def boom():
+            raise RuntimeError("db down")
+
+        queue.submit(boom, key="draft:1", dedupe_key="approve:1")
+        await queue.join()
+
+        assert queue.stats()["failed"] == 1
+        assert queue.submit(boom, key="draft:1", dedupe_key="approve:1") is not None
+        await queue.join()
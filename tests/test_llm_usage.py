@@ -0,0 +1,99 @@
+"""Tests for prompt-cache markup and LLM usage/cost recording."""
+
+import json
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models import CostLog
+from app.services.llm_usage import LLMUsage, record_llm_cost
+from app.services.qa_agent import QA_SYSTEM_PROMPT, qa_check_draft
+
+
+class TestLLMUsage:
+    def test_from_anthropic_reads_cache_fields(self):
+        usage = LLMUsage.from_anthropic(SimpleNamespace(
+            input_tokens=200, output_tokens=50,
+            cache_read_input_tokens=1500, cache_creation_input_tokens=0,
+        ))
+        assert usage == LLMUsage(input_tokens=200, output_tokens=50, cache_read_tokens=1500)
+
+    def test_from_anthropic_tolerates_missing_fields(self):
+        usage = LLMUsage.from_anthropic(MagicMock(input_tokens=10, output_tokens=5))
+        assert usage == LLMUsage(input_tokens=10, output_tokens=5)
+
+    def test_from_deepseek_splits_cache_hits(self):
+        usage = LLMUsage.from_deepseek(SimpleNamespace(
+            prompt_tokens=1000, completion_tokens=80, prompt_cache_hit_tokens=768,
+        ))
+        assert usage == LLMUsage(input_tokens=232, output_tokens=80, cache_read_tokens=768)
+
+    def test_cache_pricing(self):
+        price_in, price_out = Decimal("0.000003"), Decimal("0.000015")
+        uncached = LLMUsage(input_tokens=2000, output_tokens=100).cost(price_in, price_out)
+        write = LLMUsage(input_tokens=500, cache_write_tokens=1500, output_tokens=100).cost(price_in, price_out)
+        read = LLMUsage(input_tokens=500, cache_read_tokens=1500, output_tokens=100).cost(price_in, price_out)
+
+        assert uncached == Decimal("0.007500")
+        assert write == Decimal("0.008625")
+        assert read == Decimal("0.003450")
+        assert LLMUsage(cache_read_tokens=1000).cost(price_in, price_out, Decimal("0.0000001")) == Decimal("0.000100")
+
+
+class TestRecordCost:
+    async def test_writes_cost_log_row(self, test_db_engine):
+        factory = async_sessionmaker(test_db_engine, class_=AsyncSession, expire_on_commit=False)
+        usage = LLMUsage(input_tokens=100, output_tokens=20, cache_read_tokens=900, cache_write_tokens=0)
+
+        with patch("app.database.async_session_factory", factory):
+            await record_llm_cost("anthropic", "qa_check", usage, Decimal("0.0012"), note="pitched")
+
+        async with factory() as session:
+            row = (await session.execute(select(CostLog))).scalar_one()
+        assert (row.provider, row.operation, row.note) == ("anthropic", "qa_check", "pitched")
+        assert row.units == 1020
+        assert row.cache_read_tokens == 900
+        assert row.cache_write_tokens == 0
+
+    async def test_db_failure_is_swallowed(self):
+        broken = MagicMock(side_effect=RuntimeError("db down"))
+        with patch("app.database.async_session_factory", broken):
+            await record_llm_cost("deepseek", "detect_stage", LLMUsage(), Decimal("0"))
+
+    def test_no_running_loop_is_a_noop(self):
+        assert record_llm_cost("deepseek", "detect_stage", LLMUsage(), Decimal("0")) is None
+
+
+class TestQAPromptCaching:
+    @pytest.mark.asyncio
+    async def test_static_prefix_marked_for_caching(self):
+        response = MagicMock()
+        response.content = [MagicMock(text=json.dumps({"score": 4.5, "issues": []}))]
+        response.usage = SimpleNamespace(
+            input_tokens=300, output_tokens=60, cache_read_input_tokens=1200, cache_creation_input_tokens=0,
+        )
+        client = AsyncMock()
+        client.messages.create = AsyncMock(return_value=response)
+        guidelines = [{"guideline_type": "dont", "content": "No formal greetings"}]
+
+        with patch("app.services.qa_agent.anthropic.AsyncAnthropic", return_value=client), \
+             patch("app.services.qa_agent.record_llm_cost") as record:
+            result = await qa_check_draft("Jane", "hi", "hey Jane", "positive_reply", guidelines=guidelines)
+
+        kwargs = client.messages.create.await_args.kwargs
+        assert kwargs["system"] == [
+            {"type": "text", "text": QA_SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}},
+        ]
+        guidelines_block, draft_block = kwargs["messages"][0]["content"]
+        assert guidelines_block["cache_control"] == {"type": "ephemeral"}
+        assert "No formal greetings" in guidelines_block["text"]
+        assert "cache_control" not in draft_block
+        assert "hey Jane" in draft_block["text"]
+
+        provider, operation, usage, cost = record.call_args.args
+        assert (provider, operation, usage.cache_read_tokens) == ("anthropic", "qa_check", 1200)
+        assert cost == result.cost_usd
@@ -160,6 +160,26 @@ class TestConvenienceFunctions:
             assert result is None
 
 
+class TestAsyncReads:
+    """Test the async facade."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_served_inline(self):
+        reader = ObsidianReader(local_vault_path="")
+        reader._cache["note.md"] = (SAMPLE_NOTE, time.time())
+
+        with patch("app.services.obsidian.run_blocking") as mock_run:
+            assert await reader.read_note_async("note.md") == SAMPLE_NOTE
+        mock_run.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_read_on_pool(self, tmp_path):
+        (tmp_path / "note.md").write_text(SAMPLE_NOTE, encoding="utf-8")
+        reader = ObsidianReader(local_vault_path=str(tmp_path))
+
+        assert await reader.read_note_async("note.md") == SAMPLE_NOTE
+
+
 class TestGetObsidianReader:
     """Test the singleton factory."""
 
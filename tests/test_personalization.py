@@ -0,0 +1,117 @@
+"""Tests for the bounded-concurrency personalization stage."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.personalization import chunked, map_bounded, personalize_leads
+from app.services.prospect_pipeline import validate_and_fix_batch, validate_messages_batch
+
+
+class TestMapBounded:
+    async def test_preserves_input_order(self):
+        async def fn(n):
+            await asyncio.sleep(0.01 * (5 - n))
+            return n * 10
+
+        assert await map_bounded([1, 2, 3, 4], fn, concurrency=4) == [10, 20, 30, 40]
+
+    async def test_respects_concurrency_limit(self):
+        in_flight = 0
+        peak = 0
+
+        async def fn(_):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        await map_bounded(list(range(10)), fn, concurrency=3)
+        assert peak == 3
+
+    async def test_timeout_and_error_yield_none(self):
+        async def fn(n):
+            if n == 1:
+                await asyncio.sleep(1)
+            if n == 2:
+                raise RuntimeError("boom")
+            return n
+
+        assert await map_bounded([0, 1, 2, 3], fn, concurrency=4, timeout=0.05) == [0, None, None, 3]
+
+
+class TestPersonalizeLeads:
+    async def test_sets_messages_and_drops_failures(self):
+        leads = [{"fullName": "A"}, {"fullName": "B"}, {"fullName": "C"}]
+
+        async def generate(lead):
+            return None if lead["fullName"] == "B" else f"Hi {lead['fullName']}"
+
+        personalized = await personalize_leads(leads, generate, concurrency=2)
+        assert [l["fullName"] for l in personalized] == ["A", "C"]
+        assert leads[1]["personalized_message"] is None
+
+
+def test_chunked():
+    assert chunked([1, 2, 3, 4, 5], 2) == [[1, 2], [3, 4], [5]]
+
+
+class TestValidateAndFixBatch:
+    async def test_regenerates_until_valid(self):
+        leads = [
+            {"fullName": "Good", "personalized_message": "ok"},
+            {"fullName": "Bad", "personalized_message": "wrong"},
+        ]
+
+        async def validate(batch):
+            return [
+                {"flag": "PASS"} if l["personalized_message"] != "wrong" else {"flag": "FAIL", "reason": "service"}
+                for l in batch
+            ]
+
+        with patch("app.services.prospect_pipeline.validate_messages_batch", side_effect=validate), \
+             patch("app.services.prospect_pipeline.generate_personalization_deepseek",
+                   new=AsyncMock(return_value="fixed")) as mock_gen:
+            await validate_and_fix_batch(leads)
+
+        mock_gen.assert_awaited_once()
+        assert leads[0].get("regenerated") is None
+        assert leads[1]["personalized_message"] == "fixed"
+        assert leads[1]["regenerated"] is True
+        assert leads[1]["validation"]["flag"] == "PASS"
+
+    async def test_stops_after_max_retries(self):
+        leads = [{"fullName": "Bad", "personalized_message": "wrong"}]
+
+        with patch("app.services.prospect_pipeline.validate_messages_batch",
+                   new=AsyncMock(return_value=[{"flag": "FAIL"}])) as mock_validate, \
+             patch("app.services.prospect_pipeline.generate_personalization_deepseek",
+                   new=AsyncMock(return_value="still wrong")) as mock_gen:
+            await validate_and_fix_batch(leads, max_retries=2)
+
+        assert mock_gen.await_count == 2
+        assert mock_validate.await_count == 3
+        assert leads[0]["validation"]["flag"] == "FAIL"
+
+
+class TestValidateMessagesBatch:
+    async def test_falls_back_to_single_validation_on_mismatch(self):
+        leads = [{"fullName": "A", "personalized_message": "a"}, {"fullName": "B", "personalized_message": "b"}]
+        resp = AsyncMock()
+        resp.raise_for_status = lambda: None
+        resp.json = lambda: {"choices": [{"message": {"content": '{"results": [{"index": 1, "flag": "PASS"}]}'}}]}
+        client = AsyncMock()
+        client.post.return_value = resp
+        client.__aenter__.return_value = client
+
+        with patch("app.services.prospect_pipeline.settings") as mock_settings, \
+             patch("app.services.prospect_pipeline.httpx.AsyncClient", return_value=client), \
+             patch("app.services.prospect_pipeline.validate_single_message",
+                   new=AsyncMock(return_value={"flag": "REVIEW"})) as mock_single:
+            mock_settings.deepseek_api_key = "key"
+            verdicts = await validate_messages_batch(leads)
+
+        assert mock_single.await_count == 2
+        assert [v["flag"] for v in verdicts] == ["REVIEW", "REVIEW"]
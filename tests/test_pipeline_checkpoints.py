@@ -0,0 +1,177 @@
+"""Tests for gift leads pipeline checkpointing and resume."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models import PipelineRun
+from app.services.gift_pipeline.checkpoints import (
+    PipelineCheckpoint,
+    decode_checkpoint,
+    encode_checkpoint,
+)
+from app.services.gift_pipeline.cost_tracker import CostTracker
+
+_ORCH = "app.services.gift_pipeline.orchestrator"
+
+
+@pytest.fixture
+def session_factory(test_db_engine):
+    factory = async_sessionmaker(test_db_engine, class_=AsyncSession, expire_on_commit=False)
+    with patch("app.services.gift_pipeline.checkpoints.async_session_factory", factory):
+        yield factory
+
+
+class TestEncoding:
+    def test_roundtrip(self):
+        state = {"engagers": [{"reactor": {"headline": "CEO"}}] * 50, "queries": ["a", "b"]}
+        blob = encode_checkpoint(state)
+        assert isinstance(blob, bytes)
+        assert decode_checkpoint(blob) == state
+
+    def test_compresses_repetitive_payloads(self):
+        state = {"engagers": [{"reactor": {"headline": "CEO at Acme", "profile_url": "x"}}] * 500}
+        assert len(encode_checkpoint(state)) < len(str(state)) / 10
+
+    def test_empty_blob(self):
+        assert decode_checkpoint(None) == {}
+
+
+class TestCostTrackerSerialization:
+    def test_roundtrip(self):
+        tracker = CostTracker()
+        tracker.add_google_search(10)
+        tracker.add_icp_check(3)
+        restored = CostTracker.from_dict(tracker.to_dict())
+        assert restored.get_total() == pytest.approx(tracker.get_total())
+        assert restored.counts["icp_checks"] == 3
+
+
+class TestPipelineCheckpoint:
+    async def test_create_save_and_load(self, session_factory):
+        cp = await PipelineCheckpoint.create("https://linkedin.com/in/p", "Pat", {"prospect_url": "u"})
+        tracker = CostTracker()
+        tracker.add_google_search(5)
+        await cp.save("queries", ["q1", "q2"], tracker, queries_generated=2)
+
+        loaded = await PipelineCheckpoint.load(cp.run_id)
+        assert loaded is not None
+        assert loaded.get("queries") == ["q1", "q2"]
+        assert loaded.last_completed_step == "queries"
+        assert loaded.params == {"prospect_url": "u"}
+        assert loaded.cost_tracker().counts["google_results"] == 5
+
+        async with session_factory() as session:
+            run = await session.get(PipelineRun, cp.run_id)
+            assert run.run_type == "gift_leads"
+            assert run.queries_generated == 2
+            assert run.last_completed_step == "queries"
+            assert run.count_google_searches == 5
+
+    async def test_completed_run_not_resumable(self, session_factory):
+        cp = await PipelineCheckpoint.create("u", "Pat", {})
+        await cp.finish("completed", final_leads=3)
+        assert await PipelineCheckpoint.load(cp.run_id) is None
+
+    async def test_create_falls_back_to_in_memory(self):
+        with patch(
+            "app.services.gift_pipeline.checkpoints.async_session_factory",
+            side_effect=RuntimeError("db down"),
+        ):
+            cp = await PipelineCheckpoint.create("u", "Pat", {})
+            assert cp.persistent is False
+            await cp.save("queries", ["q"])
+            assert cp.get("queries") == ["q"]
+
+
+class TestResume:
+    async def test_resume_skips_completed_steps(self, session_factory):
+        """A run interrupted after engager scraping resumes without re-running Apify search."""
+        from app.services.gift_pipeline.orchestrator import resume_gift_leads_pipeline
+
+        params = {"prospect_url": "https://linkedin.com/in/p", "prospect_name": "Pat", "min_leads": 1}
+        cp = await PipelineCheckpoint.create(params["prospect_url"], "Pat", params)
+        await cp.save("prospect_profile", {"fullName": "Pat"})
+        await cp.save("research", {"icp_description": "B2B founders"})
+        await cp.save("queries", ["q1"])
+        await cp.save("search_results", [{"url": "https://linkedin.com/posts/x"}])
+        await cp.save("filtered_posts", [{"url": "https://linkedin.com/posts/x"}])
+        await cp.save("engagers", [
+            {"reactor": {"headline": "CEO at Acme", "profile_url": "https://linkedin.com/in/a"}},
+        ])
+
+        lead = {
+            "linkedinUrl": "https://linkedin.com/in/a", "fullName": "Alice", "jobTitle": "CEO",
+            "companyName": "Acme", "headline": "CEO at Acme", "addressCountryOnly": "United States",
+        }
+        with (
+            patch(f"{_ORCH}.search_google", new_callable=AsyncMock) as mock_search,
+            patch(f"{_ORCH}.scrape_post_engagers", new_callable=AsyncMock) as mock_engagers,
+            patch(f"{_ORCH}._get_existing_profile_urls", new_callable=AsyncMock, return_value=set()),
+            patch(f"{_ORCH}.scrape_linkedin_profiles", new_callable=AsyncMock, return_value=[lead]),
+            patch(f"{_ORCH}.qualify_leads_with_deepseek", new_callable=AsyncMock, return_value=[lead]),
+            patch(f"{_ORCH}._sync_profiles_to_db", new_callable=AsyncMock, return_value=(1, 0)),
+            patch(f"{_ORCH}.generate_signal_notes", new_callable=AsyncMock, side_effect=lambda q, *a: q),
+        ):
+            result = await resume_gift_leads_pipeline(cp.run_id)
+
+        mock_search.assert_not_awaited()
+        mock_engagers.assert_not_awaited()
+        assert result["run_id"] == str(cp.run_id)
+        assert [l["full_name"] for l in result["leads"]] == ["Alice"]
+
+        async with session_factory() as session:
+            run = await session.get(PipelineRun, cp.run_id)
+            assert run.status == "completed"
+            assert run.final_leads == 1
+            assert run.last_completed_step == "result"
+
+    async def test_dry_run_skips_db_sync_and_emits_events(self, session_factory):
+        from app.services.gift_pipeline.orchestrator import resume_gift_leads_pipeline
+
+        params = {
+            "prospect_url": "https://linkedin.com/in/p", "prospect_name": "Pat",
+            "min_leads": 1, "dry_run": True,
+        }
+        cp = await PipelineCheckpoint.create(params["prospect_url"], "Pat", params)
+        await cp.save("prospect_profile", {"fullName": "Pat"})
+        await cp.save("research", {"icp_description": "B2B founders"})
+        await cp.save("queries", ["q1"])
+        await cp.save("search_results", [{"url": "https://linkedin.com/posts/x"}])
+        await cp.save("filtered_posts", [{"url": "https://linkedin.com/posts/x"}])
+        await cp.save("engagers", [
+            {"reactor": {"headline": "CEO at Acme", "profile_url": "https://linkedin.com/in/a"}},
+        ])
+
+        lead = {
+            "linkedinUrl": "https://linkedin.com/in/a", "fullName": "Alice", "jobTitle": "CEO",
+            "companyName": "Acme", "headline": "CEO at Acme", "addressCountryOnly": "United States",
+        }
+        events: list[dict] = []
+
+        async def on_event(event: dict) -> None:
+            events.append(event)
+
+        with (
+            patch(f"{_ORCH}._get_existing_profile_urls", new_callable=AsyncMock, return_value=set()),
+            patch(f"{_ORCH}.scrape_linkedin_profiles", new_callable=AsyncMock, return_value=[lead]),
+            patch(f"{_ORCH}.qualify_leads_with_deepseek", new_callable=AsyncMock, return_value=[lead]),
+            patch(f"{_ORCH}._sync_profiles_to_db", new_callable=AsyncMock) as mock_sync,
+            patch(f"{_ORCH}.generate_signal_notes", new_callable=AsyncMock, side_effect=lambda q, *a: q),
+        ):
+            result = await resume_gift_leads_pipeline(cp.run_id, on_event=on_event)
+
+        mock_sync.assert_not_awaited()
+        assert len(result["leads"]) == 1
+        assert events[-1]["step"] == "result"
+        assert events[-1]["step_index"] == 12
+        assert events[-1]["total_steps"] == 12
+        assert {"profile_batches", "signal_notes"} <= {e["step"] for e in events}
+
+    async def test_resume_unknown_run_returns_none(self, session_factory):
+        import uuid
+
+        from app.services.gift_pipeline.orchestrator import resume_gift_leads_pipeline
+
+        assert await resume_gift_leads_pipeline(uuid.uuid4()) is None
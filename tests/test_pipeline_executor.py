@@ -0,0 +1,195 @@
+"""Tests for the central pipeline executor."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models import PipelineRun
+from app.services.pipeline_executor import (
+    PRIORITY_INTERACTIVE,
+    PRIORITY_SCHEDULED,
+    PipelineCancelledError,
+    PipelineExecutor,
+)
+
+
+@pytest.fixture
+def session_factory(test_db_engine):
+    factory = async_sessionmaker(test_db_engine, class_=AsyncSession, expire_on_commit=False)
+    with patch("app.services.pipeline_executor.async_session_factory", factory):
+        yield factory
+
+
+async def _get_run(factory, run_id) -> PipelineRun:
+    async with factory() as session:
+        return await session.get(PipelineRun, run_id)
+
+
+def _recording_runner(started: list, gate: asyncio.Event):
+    async def runner(run_id, progress, name):
+        started.append(name)
+        await gate.wait()
+        return name
+
+    return runner
+
+
+class TestScheduling:
+    async def test_interactive_runs_before_scheduled(self, session_factory):
+        started: list[str] = []
+        gate = asyncio.Event()
+        executor = PipelineExecutor(max_concurrent=1, limits={}, runners={"x": _recording_runner(started, gate)})
+
+        first = await executor.submit("x", {"name": "first"})
+        scheduled = await executor.submit("x", {"name": "scheduled"}, priority=PRIORITY_SCHEDULED)
+        interactive = await executor.submit("x", {"name": "interactive"}, priority=PRIORITY_INTERACTIVE)
+        assert executor.queue_position(interactive) == 1
+        assert executor.queue_position(scheduled) == 2
+
+        gate.set()
+        assert await executor.wait(first) == "first"
+        await executor.wait(scheduled)
+        assert started == ["first", "interactive", "scheduled"]
+
+    async def test_per_type_limit(self, session_factory):
+        started: list[str] = []
+        gate = asyncio.Event()
+        runner = _recording_runner(started, gate)
+        executor = PipelineExecutor(max_concurrent=3, limits={"a": 1, "b": 1}, runners={"a": runner, "b": runner})
+
+        await executor.submit("a", {"name": "a1"})
+        a2 = await executor.submit("a", {"name": "a2"})
+        b1 = await executor.submit("b", {"name": "b1"})
+        await asyncio.sleep(0.05)
+        assert sorted(started) == ["a1", "b1"]
+        assert executor.queue_position(a2) == 1
+
+        gate.set()
+        await executor.wait(a2)
+        await executor.wait(b1)
+        assert started[-1] == "a2"
+
+    async def test_run_row_lifecycle(self, session_factory):
+        async def runner(run_id, progress):
+            await progress("step 1 done")
+            return {"ok": True}
+
+        executor = PipelineExecutor(runners={"x": runner})
+        run_id = await executor.submit("x", priority=PRIORITY_SCHEDULED)
+        assert (await _get_run(session_factory, run_id)).status == "queued"
+
+        assert await executor.wait(run_id) == {"ok": True}
+        run = await _get_run(session_factory, run_id)
+        assert run.status == "completed"
+        assert run.priority == PRIORITY_SCHEDULED
+        assert run.progress["message"] == "step 1 done"
+        assert run.completed_at is not None
+
+    async def test_failure_recorded(self, session_factory):
+        async def runner(run_id, progress):
+            raise RuntimeError("apify down")
+
+        executor = PipelineExecutor(runners={"x": runner})
+        run_id = await executor.submit("x")
+        with pytest.raises(RuntimeError, match="apify down"):
+            await executor.wait(run_id)
+
+        run = await _get_run(session_factory, run_id)
+        assert run.status == "failed"
+        assert run.error_message == "apify down"
+
+
+class TestCancellation:
+    async def test_cancel_queued(self, session_factory):
+        gate = asyncio.Event()
+        executor = PipelineExecutor(max_concurrent=1, limits={}, runners={"x": _recording_runner([], gate)})
+        running = await executor.submit("x", {"name": "running"})
+        queued = await executor.submit("x", {"name": "queued"})
+
+        assert await executor.cancel(queued) is True
+        assert executor.queue_position(queued) is None
+        assert (await _get_run(session_factory, queued)).status == "cancelled"
+        gate.set()
+        assert await executor.wait(running) == "running"
+
+    async def test_cancel_running(self, session_factory):
+        started: list[str] = []
+        executor = PipelineExecutor(runners={"x": _recording_runner(started, asyncio.Event())})
+        run_id = await executor.submit("x", {"name": "slow"})
+        await asyncio.sleep(0.01)
+        assert started == ["slow"]
+
+        assert await executor.cancel(run_id) is True
+        with pytest.raises(PipelineCancelledError):
+            await executor.wait(run_id)
+        assert (await _get_run(session_factory, run_id)).status == "cancelled"
+
+    async def test_cancel_flag_from_another_worker(self, session_factory):
+        release = asyncio.Event()
+
+        async def runner(run_id, progress):
+            await release.wait()
+            await progress("next step")
+            await asyncio.sleep(1)
+
+        executor = PipelineExecutor(runners={"x": runner})
+        run_id = await executor.submit("x")
+        await asyncio.sleep(0.01)
+
+        # Another worker only has the DB row
+        async with session_factory() as session:
+            run = await session.get(PipelineRun, run_id)
+            run.cancel_requested = True
+            await session.commit()
+
+        release.set()
+        with pytest.raises(PipelineCancelledError):
+            await executor.wait(run_id)
+
+    async def test_cancel_unknown_run(self, session_factory):
+        import uuid
+
+        assert await PipelineExecutor().cancel(uuid.uuid4()) is False
+
+
+class TestRecovery:
+    async def test_start_requeues_persisted_runs(self, session_factory):
+        async with session_factory() as session:
+            run = PipelineRun(run_type="x", status="queued", priority=50, run_params={"name": "left over"})
+            session.add(run)
+            await session.commit()
+            run_id = run.id
+
+        started: list[str] = []
+        gate = asyncio.Event()
+        gate.set()
+        executor = PipelineExecutor(runners={"x": _recording_runner(started, gate)})
+        assert await executor.start() == 1
+        assert await executor.wait(run_id) == "left over"
+        assert (await _get_run(session_factory, run_id)).status == "completed"
+
+
+class TestGiftLeadsRunner:
+    async def test_structured_progress_and_result_stored(self, session_factory):
+        async def fake_pipeline(on_event, pipeline_run_id, **params):
+            await on_event({
+                "message": "Step 3/12: Generating search queries...",
+                "step": "queries",
+                "step_index": 3,
+                "total_steps": 12,
+                "metrics": {"queries_generated": 0},
+            })
+            return {"leads": [{"full_name": "Alice"}], "run_id": str(pipeline_run_id)}
+
+        executor = PipelineExecutor()
+        with patch("app.services.gift_pipeline.run_gift_leads_pipeline_async", fake_pipeline):
+            run_id = await executor.submit("gift_leads", {"prospect_url": "u", "prospect_name": "Pat"})
+            result = await executor.wait(run_id)
+
+        assert result["run_id"] == str(run_id)
+        run = await _get_run(session_factory, run_id)
+        assert run.progress["step"] == "queries"
+        assert run.progress["step_index"] == 3
+        assert run.result == {"leads": [{"full_name": "Alice"}], "run_id": str(run_id)}
@@ -1,27 +1,40 @@
 """Tests for pipelines API router."""
 
-from unittest.mock import patch, MagicMock
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models import PipelineRun
+
+
+@pytest.fixture
+def mock_executor():
+    """Patch the pipeline executor used by the router."""
+    executor = MagicMock()
+    executor.submit = AsyncMock(return_value=uuid.uuid4())
+    executor.queue_position.return_value = None
+    with patch("app.routers.pipelines.get_pipeline_executor", return_value=executor):
+        yield executor
 
 
 class TestGiftLeadsEndpoint:
     """Tests for POST /api/pipelines/gift-leads."""
 
     @pytest.mark.asyncio
-    async def test_valid_request_returns_started(self, test_client):
-        """Should return 200 with started status for valid request."""
-        with patch("app.routers.pipelines.subprocess.Popen") as mock_popen:
-            mock_popen.return_value = MagicMock()
-            response = await test_client.post(
-                "/api/pipelines/gift-leads",
-                json={"prospect_url": "https://linkedin.com/in/johndoe"},
-            )
+    async def test_valid_request_returns_started(self, test_client, mock_executor):
+        """Should return 200 with started status and the queued run id."""
+        response = await test_client.post(
+            "/api/pipelines/gift-leads",
+            json={"prospect_url": "https://linkedin.com/in/johndoe"},
+        )
 
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "started"
         assert "johndoe" in data["message"]
+        assert data["run_id"] == str(mock_executor.submit.return_value)
 
     @pytest.mark.asyncio
     async def test_missing_prospect_url_returns_422(self, test_client):
@@ -46,96 +59,100 @@ class TestGiftLeadsEndpoint:
         assert "icp" in response.json()["detail"].lower()
 
     @pytest.mark.asyncio
-    async def test_skip_research_with_icp_succeeds(self, test_client):
+    async def test_skip_research_with_icp_succeeds(self, test_client, mock_executor):
         """Should succeed when skip_research is true and icp is provided."""
-        with patch("app.routers.pipelines.subprocess.Popen") as mock_popen:
-            mock_popen.return_value = MagicMock()
-            response = await test_client.post(
-                "/api/pipelines/gift-leads",
-                json={
-                    "prospect_url": "https://linkedin.com/in/johndoe",
-                    "skip_research": True,
-                    "icp": "B2B SaaS founders",
-                },
-            )
+        response = await test_client.post(
+            "/api/pipelines/gift-leads",
+            json={
+                "prospect_url": "https://linkedin.com/in/johndoe",
+                "skip_research": True,
+                "icp": "B2B SaaS founders",
+            },
+        )
 
         assert response.status_code == 200
 
     @pytest.mark.asyncio
-    async def test_subprocess_spawned_with_correct_args(self, test_client):
-        """Should spawn subprocess with correct CLI arguments."""
-        with patch("app.routers.pipelines.subprocess.Popen") as mock_popen:
-            mock_popen.return_value = MagicMock()
-            await test_client.post(
-                "/api/pipelines/gift-leads",
-                json={
-                    "prospect_url": "https://linkedin.com/in/johndoe",
-                    "icp": "B2B SaaS founders",
-                    "pain_points": "lead gen",
-                    "days_back": 7,
-                    "min_reactions": 100,
-                    "min_leads": 5,
-                    "max_leads": 15,
-                    "dry_run": True,
-                    "skip_research": True,
-                },
-            )
+    async def test_queues_in_process_pipeline_with_params(self, test_client, mock_executor):
+        """Should queue the in-process gift_leads run with mapped arguments."""
+        await test_client.post(
+            "/api/pipelines/gift-leads",
+            json={
+                "prospect_url": "https://linkedin.com/in/johndoe",
+                "icp": "B2B SaaS founders",
+                "pain_points": "lead gen",
+                "days_back": 7,
+                "min_reactions": 100,
+                "min_leads": 5,
+                "max_leads": 15,
+                "dry_run": True,
+                "skip_research": True,
+            },
+        )
 
-        mock_popen.assert_called_once()
-        cmd = mock_popen.call_args[0][0]
-        assert "--prospect-url" in cmd
-        assert "https://linkedin.com/in/johndoe" in cmd
-        assert "--icp" in cmd
-        assert "B2B SaaS founders" in cmd
-        assert "--pain-points" in cmd
-        assert "lead gen" in cmd
-        assert "--days-back" in cmd
-        assert "7" in cmd
-        assert "--min-reactions" in cmd
-        assert "100" in cmd
-        assert "--min-leads" in cmd
-        assert "5" in cmd
-        assert "--max-leads" in cmd
-        assert "15" in cmd
-        assert "--dry-run" in cmd
-        assert "--skip-research" in cmd
+        mock_executor.submit.assert_awaited_once()
+        run_type, params = mock_executor.submit.call_args[0]
+        assert run_type == "gift_leads"
+        assert params == {
+            "prospect_url": "https://linkedin.com/in/johndoe",
+            "prospect_name": "johndoe",
+            "user_icp": "B2B SaaS founders",
+            "user_pain_points": "lead gen",
+            "days_back": 7,
+            "min_reactions": 100,
+            "min_leads": 5,
+            "max_leads": 15,
+            "skip_research": True,
+            "dry_run": True,
+        }
 
     @pytest.mark.asyncio
-    async def test_missing_script_returns_500(self, test_client):
-        """Should return 500 when the gift leads script is not found."""
-        with patch("app.routers.pipelines.GIFT_LEADS_SCRIPT", "/nonexistent/path/script.py"):
-            with patch("app.routers.pipelines.Path") as mock_path_cls:
-                mock_path_instance = MagicMock()
-                mock_path_instance.exists.return_value = False
-                mock_path_cls.return_value = mock_path_instance
-                response = await test_client.post(
-                    "/api/pipelines/gift-leads",
-                    json={"prospect_url": "https://linkedin.com/in/johndoe"},
-                )
-
-        assert response.status_code == 500
-        assert "not found" in response.json()["detail"].lower()
+    async def test_optional_params_have_defaults(self, test_client, mock_executor):
+        """Should use default values when optional params are omitted."""
+        await test_client.post(
+            "/api/pipelines/gift-leads",
+            json={"prospect_url": "https://linkedin.com/in/johndoe/"},
+        )
+
+        params = mock_executor.submit.call_args[0][1]
+        assert params["prospect_name"] == "johndoe"
+        assert params["days_back"] == 14
+        assert params["min_reactions"] == 50
+        assert params["min_leads"] == 10
+        assert params["max_leads"] == 25
+        assert params["dry_run"] is False
+        assert params["skip_research"] is False
+
+
+class TestRunStatusEndpoint:
+    """Tests for GET /api/pipelines/runs/{run_id}."""
 
     @pytest.mark.asyncio
-    async def test_optional_params_have_defaults(self, test_client):
-        """Should use default values when optional params are omitted."""
-        with patch("app.routers.pipelines.subprocess.Popen") as mock_popen:
-            mock_popen.return_value = MagicMock()
-            await test_client.post(
-                "/api/pipelines/gift-leads",
-                json={"prospect_url": "https://linkedin.com/in/johndoe"},
+    async def test_returns_progress_and_result(self, test_client, test_db_engine, mock_executor):
+        factory = async_sessionmaker(test_db_engine, class_=AsyncSession, expire_on_commit=False)
+        async with factory() as session:
+            run = PipelineRun(
+                run_type="gift_leads",
+                status="completed",
+                progress={"message": "Pipeline complete", "step": "result", "step_index": 12},
+                result={"leads": [{"full_name": "Alice"}]},
             )
+            session.add(run)
+            await session.commit()
+            run_id = run.id
+
+        with patch("app.routers.pipelines.async_session_factory", factory):
+            response = await test_client.get(f"/api/pipelines/runs/{run_id}")
 
-        cmd = mock_popen.call_args[0][0]
-        # Defaults should be applied
-        assert "--days-back" in cmd
-        assert "14" in cmd
-        assert "--min-reactions" in cmd
-        assert "50" in cmd
-        assert "--min-leads" in cmd
-        assert "10" in cmd
-        assert "--max-leads" in cmd
-        assert "25" in cmd
-        # Boolean flags should NOT be present by default
-        assert "--dry-run" not in cmd
-        assert "--skip-research" not in cmd
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "completed"
+        assert data["progress"]["step"] == "result"
+        assert data["result"]["leads"][0]["full_name"] == "Alice"
+
+    @pytest.mark.asyncio
+    async def test_unknown_run_returns_404(self, test_client, test_db_engine):
+        factory = async_sessionmaker(test_db_engine, class_=AsyncSession, expire_on_commit=False)
+        with patch("app.routers.pipelines.async_session_factory", factory):
+            response = await test_client.get(f"/api/pipelines/runs/{uuid.uuid4()}")
+        assert response.status_code == 404
@@ -0,0 +1,116 @@
+"""Tests for the shared profile filtering engine."""
+
+import pytest
+
+from app.services.profile_filters import (
+    HEADLINE_KEEP,
+    HEADLINE_NON_ENGLISH,
+    HEADLINE_REJECTED,
+    KeywordMatcher,
+    classify_headlines,
+    classify_script,
+    filter_profiles,
+    is_likely_english,
+    prefilter_engagers_by_headline,
+)
+
+
+class TestKeywordMatcher:
+    def test_matches_substring(self):
+        matcher = KeywordMatcher(["intern", "open to work"])
+        assert matcher.search("summer intern at acme") == "intern"
+        assert matcher.matches("#open to work | marketing")
+        assert matcher.search("ceo at acme") is None
+
+    def test_prefers_longest_keyword(self):
+        matcher = KeywordMatcher(["director", "managing director"])
+        assert matcher.search("managing director") == "managing director"
+
+    def test_escapes_regex_characters(self):
+        matcher = KeywordMatcher(["c++", "n/a"])
+        assert matcher.matches("c++ developer")
+        assert not matcher.matches("cc developer")
+
+    def test_empty_keyword_list(self):
+        matcher = KeywordMatcher([])
+        assert matcher.search("anything") is None
+
+    def test_same_verdict_as_any_loop(self):
+        keywords = ["intern", "student", "looking for", "retired"]
+        matcher = KeywordMatcher(keywords)
+        for text in ["international sales", "ceo", "retired navy", "student of life", ""]:
+            assert matcher.matches(text) == any(kw in text for kw in keywords)
+
+
+class TestClassifyScript:
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("CEO at Acme", None),
+            ("公司经理", "CJK"),
+            ("Директор компании", "Cyrillic"),
+            ("مدير شركة", "Arabic"),
+            ("Директор 公司", "CJK"),
+        ],
+    )
+    def test_classifies(self, text, expected):
+        assert classify_script(text) == expected
+
+
+class TestIsLikelyEnglish:
+    def test_high_non_ascii_ratio_reason(self):
+        is_eng, reason = is_likely_english("Директор компании")
+        assert is_eng is False
+        assert reason.startswith("high non-ASCII ratio")
+
+    def test_script_reason_below_ratio(self):
+        is_eng, reason = is_likely_english("Founder and CEO of Acme Holdings 公司")
+        assert is_eng is False
+        assert reason == "contains CJK characters"
+
+    def test_accented_english_passes(self):
+        assert is_likely_english("Founder at Café Nero Consulting")[0] is True
+
+
+class TestClassifyHeadlines:
+    def test_batch_verdicts(self):
+        verdicts = classify_headlines(["CEO at Acme", "Student at MIT", "Directeur Général", None, "  "])
+        assert verdicts == [
+            HEADLINE_KEEP,
+            HEADLINE_REJECTED,
+            HEADLINE_NON_ENGLISH,
+            HEADLINE_KEEP,
+            HEADLINE_KEEP,
+        ]
+
+    def test_prefilter_handles_missing_reactor(self):
+        engagers = [{"reactor": None}, {}, {"reactor": {"headline": "Retired"}}]
+        filtered, kept, rejected, non_eng = prefilter_engagers_by_headline(engagers)
+        assert kept == 2
+        assert rejected == 1
+        assert non_eng == 0
+
+
+class TestFilterProfiles:
+    def _profiles(self):
+        return [
+            {"fullName": "A", "headline": "CEO at Acme", "jobTitle": "CEO", "companyName": "Acme",
+             "addressCountryOnly": "United States"},
+            {"fullName": "B", "headline": "Student", "jobTitle": "Intern", "companyName": "Acme",
+             "addressCountryOnly": "United States"},
+            {"fullName": "C", "headline": "CEO at Acme", "jobTitle": "CEO", "companyName": "Acme",
+             "addressCountryOnly": "Brazil"},
+            {"fullName": "D", "headline": "--", "addressCountryOnly": "Canada"},
+        ]
+
+    def test_location_and_completeness(self):
+        result = filter_profiles(self._profiles(), allowed_countries=["united states", "Canada"])
+        assert [p["fullName"] for p in result] == ["A", "B"]
+
+    def test_reject_headlines(self):
+        result = filter_profiles(self._profiles(), reject_headlines=True)
+        assert [p["fullName"] for p in result] == ["A", "C"]
+
+    def test_all_checks_disabled_keeps_everything(self):
+        result = filter_profiles(self._profiles(), require_complete=False)
+        assert len(result) == 4
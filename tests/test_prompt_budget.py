@@ -0,0 +1,124 @@
+"""Tests for token-budgeted prompt history and few-shot examples."""
+
+from unittest.mock import patch
+
+from app.config import settings
+from app.models import FunnelStage
+from app.prompts.budget import compress_message, count_tokens, fit_history
+from app.prompts.utils import build_history_section
+from app.services.example_retriever import RetrievedExample, format_examples_for_prompt
+from app.services.qa_agent import _build_qa_prompt
+
+
+def _thread(turns: int, words: int = 60) -> list[dict]:
+    return [
+        {
+            "role": "lead" if i % 2 else "you",
+            "content": f"Turn {i}. " + " ".join(f"word{i}x{j}" for j in range(words)),
+        }
+        for i in range(turns)
+    ]
+
+
+class TestCountTokens:
+    def test_counts_words_and_punctuation(self):
+        assert count_tokens("") == 0
+        assert count_tokens("Hi there!") == 3
+        assert count_tokens("profile") == 2
+        assert count_tokens("internationalization") == 5
+
+    def test_grows_with_text(self):
+        assert count_tokens("word " * 100) > count_tokens("word " * 10)
+
+
+class TestCompressMessage:
+    def test_short_message_unchanged(self):
+        assert compress_message("  Sounds   good ", 50) == "Sounds good"
+
+    def test_prefers_sentence_boundary(self):
+        text = "We run paid ads mostly. LinkedIn is new for us and we are still figuring it out."
+        assert compress_message(text, 40) == "We run paid ads mostly. …"
+
+    def test_falls_back_to_word_boundary(self):
+        assert compress_message("alpha beta gamma delta epsilon", 14) == "alpha beta …"
+
+
+class TestFitHistory:
+    @staticmethod
+    def render(msg, content):
+        return content
+
+    def test_unlimited_budget_keeps_everything(self):
+        history = _thread(10)
+        lines, omitted = fit_history(history, 0, self.render, recent_turns=2, compressed_chars=20)
+        assert lines == [m["content"] for m in history]
+        assert omitted == 0
+
+    def test_recent_verbatim_older_compressed_oldest_dropped(self):
+        history = _thread(40)
+        lines, omitted = fit_history(history, 600, self.render, recent_turns=3, compressed_chars=40)
+
+        assert lines[-3:] == [m["content"] for m in history[-3:]]
+        assert all(line.endswith("…") for line in lines[:-3])
+        assert omitted == 40 - len(lines) > 0
+        assert sum(count_tokens(line) for line in lines) <= 600
+
+    def test_newest_message_always_kept(self):
+        history = _thread(3, words=500)
+        lines, omitted = fit_history(history, 50, self.render, recent_turns=3, compressed_chars=40)
+        assert lines == [history[-1]["content"]]
+        assert omitted == 2
+
+
+class TestBuildHistorySectionBudget:
+    def test_short_thread_rendered_in_full(self):
+        history = _thread(4, words=5)
+        assert build_history_section(history) == build_history_section(history, max_tokens=0)
+
+    def test_long_thread_marks_omitted_messages(self):
+        history = _thread(60)
+        result = build_history_section(history, max_tokens=800)
+
+        assert result.splitlines()[0].startswith("_(")
+        assert "earlier messages omitted" in result
+        assert history[-1]["content"] in result
+        assert history[0]["content"] not in result
+        assert count_tokens(result) < count_tokens(build_history_section(history, max_tokens=0))
+
+    def test_default_budget_from_settings(self):
+        history = _thread(60)
+        with patch.object(settings, "prompt_history_token_budget", 0):
+            assert "omitted" not in build_history_section(history)
+
+    def test_qa_prompt_uses_budget(self):
+        history = _thread(60)
+        with patch.object(settings, "prompt_history_token_budget", 800):
+            prompt = _build_qa_prompt("Jane", "hi", "draft", "positive_reply", conversation_history=history)
+        assert "earlier messages omitted" in prompt
+        assert history[-1]["content"] in prompt
+
+
+class TestFormatExamplesBudget:
+    @staticmethod
+    def _example(i: int) -> RetrievedExample:
+        return RetrievedExample(
+            lead_name=f"Lead {i}",
+            lead_message=f"Lead message {i} " + "detail " * 40,
+            draft_reply=f"Reply {i}\nFollow-up question {i}?",
+            company=None,
+            title=None,
+            is_first_reply=True,
+            funnel_stage=FunnelStage.POSITIVE_REPLY,
+        )
+
+    def test_examples_stop_at_budget(self):
+        examples = [self._example(i) for i in range(5)]
+        unlimited = format_examples_for_prompt(examples, max_tokens=0)
+        budgeted = format_examples_for_prompt(examples, max_tokens=200)
+
+        assert unlimited.count("[This was approved and sent]") == 5
+        assert 0 < budgeted.count("[This was approved and sent]") < 5
+        assert count_tokens(budgeted) <= 200
+
+    def test_nothing_fits_returns_empty(self):
+        assert format_examples_for_prompt([self._example(0)], max_tokens=10) == ""
@@ -110,6 +110,63 @@ class TestSchedulerService:
         scheduler._scheduler.shutdown.assert_called_once()
 
 
+class TestPersistentJobStore:
+    """Tests for the shared SQLAlchemy job store and leader election."""
+
+    @pytest.fixture
+    def jobstore_url(self, tmp_path):
+        return f"sqlite:///{tmp_path / 'jobs.db'}"
+
+    @pytest.mark.asyncio
+    async def test_snooze_survives_restart(self, jobstore_url):
+        """Jobs written by one process should be visible after a restart."""
+        draft_id = uuid.uuid4()
+        first = SchedulerService(jobstore_url=jobstore_url)
+        first.start()
+        first.add_snooze_reminder(draft_id, datetime.now(timezone.utc) + timedelta(hours=1))
+        first.shutdown(wait=False)
+
+        second = SchedulerService(jobstore_url=jobstore_url)
+        second.start()
+        try:
+            info = second.get_job_info(draft_id)
+            assert info is not None
+            assert info["id"] == f"snooze_{draft_id}"
+            assert "daily_report" in [job["id"] for job in second.list_jobs()]
+
+            assert second.cancel_snooze_reminder(draft_id) is True
+            assert second.cancel_snooze_reminder(draft_id) is False
+        finally:
+            second.shutdown(wait=False)
+
+    @pytest.mark.asyncio
+    async def test_follower_stays_paused_until_it_wins_the_lock(self, jobstore_url):
+        """Only the lock holder should run jobs; a follower takes over later."""
+        from apscheduler.schedulers.base import STATE_PAUSED, STATE_RUNNING
+
+        service = SchedulerService(jobstore_url=jobstore_url)
+        with patch.object(service._leader_lock, "acquire", return_value=False):
+            service.start()
+        try:
+            assert service.is_leader is False
+            assert service._scheduler.state == STATE_PAUSED
+
+            service._set_leader(True)
+            assert service.is_leader is True
+            assert service._scheduler.state == STATE_RUNNING
+        finally:
+            service.shutdown(wait=False)
+
+    @pytest.mark.asyncio
+    async def test_sqlite_store_is_always_leader(self, jobstore_url):
+        service = SchedulerService(jobstore_url=jobstore_url)
+        service.start()
+        try:
+            assert service.is_leader is True
+        finally:
+            service.shutdown(wait=False)
+
+
 class TestScheduleSnoozeReminder:
     """Tests for the schedule_snooze_reminder helper function."""
 
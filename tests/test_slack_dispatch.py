@@ -0,0 +1,123 @@
+"""Tests for the rate-limited Slack dispatcher."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from slack_sdk.errors import SlackApiError
+
+from app.services.slack_dispatch import SlackDispatcher, TokenBucket
+
+
+def _rate_limited(retry_after: str = "0") -> SlackApiError:
+    response = MagicMock()
+    response.status_code = 429
+    response.headers = {"Retry-After": retry_after}
+    response.get.return_value = "ratelimited"
+    return SlackApiError("ratelimited", response)
+
+
+class TestTokenBucket:
+    async def test_burst_then_rate(self):
+        bucket = TokenBucket(rate=20, capacity=2)
+        started = time.monotonic()
+        for _ in range(4):
+            await bucket.acquire()
+        elapsed = time.monotonic() - started
+        # 2 free, then 2 more at 20/s
+        assert 0.08 <= elapsed < 0.5
+
+    async def test_pause_blocks_acquire(self):
+        bucket = TokenBucket(rate=100, capacity=5)
+        bucket.pause(0.1)
+        started = time.monotonic()
+        await bucket.acquire()
+        assert time.monotonic() - started >= 0.09
+
+
+class TestSend:
+    async def test_retries_after_rate_limit(self):
+        dispatcher = SlackDispatcher(rate_per_second=100, burst=5, max_retries=2)
+        call = AsyncMock(side_effect=[_rate_limited(), {"ts": "1.0"}])
+
+        response = await dispatcher.send(call, channel="C1", text="hi")
+
+        assert response == {"ts": "1.0"}
+        assert call.await_count == 2
+        call.assert_awaited_with(channel="C1", text="hi")
+        assert dispatcher.stats()["rate_limited"] == 1
+        assert dispatcher.stats()["sent"] == 1
+
+    async def test_gives_up_after_max_retries(self):
+        dispatcher = SlackDispatcher(rate_per_second=100, burst=5, max_retries=1)
+        call = AsyncMock(side_effect=_rate_limited())
+
+        with pytest.raises(SlackApiError):
+            await dispatcher.send(call, channel="C1", text="hi")
+        assert call.await_count == 2
+        assert dispatcher.stats()["failed"] == 1
+
+    async def test_other_errors_not_retried(self):
+        dispatcher = SlackDispatcher(rate_per_second=100, burst=5)
+        call = AsyncMock(side_effect=SlackApiError("nope", {"error": "channel_not_found"}))
+
+        with pytest.raises(SlackApiError):
+            await dispatcher.send(call, channel="C1", text="hi")
+        assert call.await_count == 1
+
+    async def test_submit_is_fire_and_forget(self):
+        dispatcher = SlackDispatcher(rate_per_second=100, burst=5)
+        call = AsyncMock(side_effect=RuntimeError("down"))
+
+        task = dispatcher.submit(call, channel="C1", text="hi")
+        assert await task is None
+        assert dispatcher.stats()["failed"] == 1
+
+
+class TestProgressCoalescing:
+    async def test_updates_edit_one_message_with_latest_text(self):
+        dispatcher = SlackDispatcher(rate_per_second=100, burst=10, progress_interval=0.05)
+        post = AsyncMock(return_value={"ts": "P1"})
+        update = AsyncMock(return_value={"ok": True})
+
+        ts = await dispatcher.progress(post, update, channel="C1", thread_ts="T1", text="Step 1")
+        for step in range(2, 6):
+            assert await dispatcher.progress(post, update, channel="C1", thread_ts="T1", text=f"Step {step}") == ts
+        await dispatcher.drain()
+
+        post.assert_awaited_once_with(channel="C1", text="Step 1", thread_ts="T1")
+        update.assert_awaited_once_with(channel="C1", ts="P1", text="Step 5")
+        assert dispatcher.stats()["coalesced"] == 3
+
+    async def test_separate_threads_get_separate_messages(self):
+        dispatcher = SlackDispatcher(rate_per_second=100, burst=10, progress_interval=0)
+        post = AsyncMock(side_effect=[{"ts": "P1"}, {"ts": "P2"}])
+        update = AsyncMock()
+
+        assert await dispatcher.progress(post, update, channel="C1", thread_ts="T1", text="a") == "P1"
+        assert await dispatcher.progress(post, update, channel="C1", thread_ts="T2", text="b") == "P2"
+
+
+class TestSlackBotIntegration:
+    async def test_pipeline_progress_coalesced_through_bot(self):
+        from unittest.mock import patch
+
+        from app.config import settings
+        from app.services.slack import SlackBot
+
+        with patch("app.services.slack.AsyncWebClient") as MockClient, \
+             patch.object(settings, "slack_progress_interval_seconds", 0.01):
+            client = MagicMock()
+            client.chat_postMessage = AsyncMock(return_value={"ts": "P1"})
+            client.chat_update = AsyncMock(return_value={"ok": True})
+            MockClient.return_value = client
+
+            bot = SlackBot(bot_token="t", channel_id="C1")
+            await bot.send_pipeline_progress("Step 1", "T1")
+            await bot.send_pipeline_progress("Step 2", "T1")
+            await bot.drain()
+
+        client.chat_postMessage.assert_awaited_once()
+        assert client.chat_update.await_args.kwargs["text"] == "Step 2"
+        assert bot.dispatch_stats()["sent"] == 2
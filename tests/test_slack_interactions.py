@@ -10,6 +10,8 @@ from unittest.mock import AsyncMock, patch
 import pytest
 from httpx import AsyncClient
 
+from app.services import interaction_queue
+
 
 def create_slack_signature(secret: str, timestamp: str, body: str) -> str:
     """Create a valid Slack signature for testing."""
@@ -60,6 +62,22 @@ def create_view_submission_payload(draft_id: str, edited_text: str) -> dict:
     }
 
 
+@pytest.fixture(autouse=True)
+def fresh_interaction_queue():
+    """Fresh queue per test (it binds to the running loop) with no real response_url posts."""
+    interaction_queue._queue = None
+    with patch.object(
+        interaction_queue.InteractionQueue, "_post_feedback", new_callable=AsyncMock
+    ) as mock_feedback:
+        yield mock_feedback
+    interaction_queue._queue = None
+
+
+async def drain_interactions() -> None:
+    """Wait for the deferred interaction jobs queued by the endpoint."""
+    await interaction_queue.get_interaction_queue().join()
+
+
 class TestSlackSignatureVerification:
     """Tests for Slack signature verification."""
 
@@ -126,6 +144,7 @@ class TestSlackSignatureVerification:
             )
             # Should return 200 (acknowledgment)
             assert response.status_code == 200
+            await drain_interactions()
 
 
 class TestBlockActionsRouting:
@@ -155,6 +174,7 @@ class TestBlockActionsRouting:
                 headers=self._make_request_headers(body),
             )
             assert response.status_code == 200
+            await drain_interactions()
             mock_handler.assert_called_once()
 
     @pytest.mark.asyncio
@@ -171,6 +191,7 @@ class TestBlockActionsRouting:
                 headers=self._make_request_headers(body),
             )
             assert response.status_code == 200
+            await drain_interactions()
             mock_handler.assert_called_once()
 
     @pytest.mark.asyncio
@@ -187,6 +208,7 @@ class TestBlockActionsRouting:
                 headers=self._make_request_headers(body),
             )
             assert response.status_code == 200
+            await drain_interactions()
             mock_handler.assert_called_once()
 
     @pytest.mark.asyncio
@@ -203,6 +225,7 @@ class TestBlockActionsRouting:
                 headers=self._make_request_headers(body),
             )
             assert response.status_code == 200
+            await drain_interactions()
             mock_handler.assert_called_once()
 
     @pytest.mark.asyncio
@@ -219,6 +242,7 @@ class TestBlockActionsRouting:
                 headers=self._make_request_headers(body),
             )
             assert response.status_code == 200
+            await drain_interactions()
             mock_handler.assert_called_once()
 
 
@@ -249,4 +273,80 @@ class TestViewSubmission:
                 headers=self._make_request_headers(body),
             )
             assert response.status_code == 200
+            await drain_interactions()
             mock_handler.assert_called_once()
+
+
+class TestDeferredDispatch:
+    """The endpoint acknowledges before the handler's work runs."""
+
+    def _make_request_headers(self, body: str) -> dict:
+        timestamp = str(int(time.time()))
+        signature = create_slack_signature("test_signing_secret", timestamp, body)
+        return {
+            "Content-Type": "application/x-www-form-urlencoded",
+            "X-Slack-Request-Timestamp": timestamp,
+            "X-Slack-Signature": signature,
+        }
+
+    @pytest.mark.asyncio
+    async def test_acknowledges_before_slow_handler_finishes(self, test_client: AsyncClient):
+        """A slow handler (e.g. DB stall) doesn't delay the 200."""
+        import asyncio
+
+        release = asyncio.Event()
+
+        async def slow_handler(*args, **kwargs):
+            await release.wait()
+
+        payload = create_block_actions_payload("approve", str(uuid.uuid4()))
+        body = f"payload={json.dumps(payload)}"
+
+        with patch("app.routers.slack.handle_approve", side_effect=slow_handler) as mock_handler:
+            response = await asyncio.wait_for(
+                test_client.post("/slack/interactions", content=body, headers=self._make_request_headers(body)),
+                timeout=2,
+            )
+            assert response.status_code == 200
+            release.set()
+            await drain_interactions()
+            mock_handler.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_double_click_approve_processed_once(self, test_client: AsyncClient):
+        """A second Approve click while the first is in flight is dropped."""
+        import asyncio
+
+        release = asyncio.Event()
+
+        async def slow_handler(*args, **kwargs):
+            await release.wait()
+
+        payload = create_block_actions_payload("approve", str(uuid.uuid4()))
+        body = f"payload={json.dumps(payload)}"
+
+        with patch("app.routers.slack.handle_approve", side_effect=slow_handler) as mock_handler:
+            for _ in range(2):
+                response = await test_client.post(
+                    "/slack/interactions", content=body, headers=self._make_request_headers(body),
+                )
+                assert response.status_code == 200
+            release.set()
+            await drain_interactions()
+
+        mock_handler.assert_called_once()
+        assert interaction_queue.get_interaction_queue().stats()["deduplicated"] == 1
+
+    @pytest.mark.asyncio
+    async def test_feedback_posted_to_response_url(self, test_client: AsyncClient, fresh_interaction_queue):
+        """Approve gets immediate ephemeral feedback via response_url."""
+        payload = create_block_actions_payload("approve", str(uuid.uuid4()))
+        body = f"payload={json.dumps(payload)}"
+
+        with patch("app.routers.slack.handle_approve", new_callable=AsyncMock):
+            await test_client.post("/slack/interactions", content=body, headers=self._make_request_headers(body))
+            await drain_interactions()
+
+        url, text = fresh_interaction_queue.await_args.args
+        assert url == "https://hooks.slack.com/actions/test"
+        assert "Sending" in text
@@ -0,0 +1,101 @@
+"""Tests for precompiled Slack Block Kit templates."""
+
+import uuid
+from datetime import date
+
+import pytest
+
+from app.models import FunnelStage
+from app.services.slack import (
+    build_action_buttons,
+    build_classification_buttons,
+    build_draft_message,
+)
+from app.services.slack_templates import DIVIDER, Fmt, Slot, compile_template, header
+
+
+class TestCompileTemplate:
+    def test_fills_slots_and_format_fields(self):
+        render = compile_template({
+            "type": "section",
+            "text": {"type": "mrkdwn", "text": Fmt("*{name}* spent ${cost:.2f} on {day:%b %d}")},
+            "value": Slot("value"),
+        })
+
+        block = render(name="Jane {x}", cost=1.5, day=date(2026, 3, 2), value=[1, 2])
+
+        assert block == {
+            "type": "section",
+            "text": {"type": "mrkdwn", "text": "*Jane {x}* spent $1.50 on Mar 02"},
+            "value": [1, 2],
+        }
+
+    def test_static_subtrees_shared_between_renders(self):
+        render = compile_template([header("Title"), {"type": "context", "text": Slot("text")}, DIVIDER])
+
+        first, second = render(text="a"), render(text="b")
+
+        assert first[0] is second[0]
+        assert first[2] is DIVIDER
+        assert first[1] is not second[1]
+        assert (first[1]["text"], second[1]["text"]) == ("a", "b")
+
+    def test_static_list_renders_fresh_top_level_list(self):
+        skeleton = [DIVIDER]
+        render = compile_template(skeleton)
+
+        blocks = render()
+        blocks.append({"type": "divider"})
+
+        assert render() == [DIVIDER]
+        assert skeleton == [DIVIDER]
+
+    def test_missing_value_raises(self):
+        render = compile_template({"text": Slot("text")})
+        with pytest.raises(TypeError):
+            render()
+
+    def test_rejects_non_name_fields(self):
+        with pytest.raises(ValueError):
+            compile_template(Fmt("{lead.name}"))
+
+
+class TestDraftBuilders:
+    def test_classification_button_variants(self):
+        draft_id, prospect_id = uuid.uuid4(), uuid.uuid4()
+
+        with_prospect = build_classification_buttons(draft_id, is_first_reply=True, prospect_id=prospect_id)
+        legacy = build_classification_buttons(draft_id)
+
+        first_ids = [e["action_id"] for e in with_prospect[0]["elements"]]
+        assert first_ids[0] == "classify_positive"
+        assert with_prospect[0]["elements"][-1]["value"] == str(prospect_id)
+        assert "classify_positive" not in [e["action_id"] for e in legacy[0]["elements"]]
+        assert legacy[0]["elements"][-1] == {
+            "type": "button",
+            "text": {"type": "plain_text", "text": "\U0001f381 Gift Leads", "emoji": True},
+            "action_id": "gift_leads",
+            "value": str(draft_id),
+        }
+
+    def test_action_buttons_carry_draft_id(self):
+        draft_id = uuid.uuid4()
+        blocks = build_action_buttons(draft_id)
+        values = {e["value"] for block in blocks for e in block["elements"]}
+        assert values == {str(draft_id)}
+        assert blocks[0]["elements"][0]["style"] == "primary"
+
+    def test_draft_message_optional_blocks(self):
+        minimal = build_draft_message("Jane", None, None, "https://x", "hi", "hello")
+        full = build_draft_message(
+            "Jane", "CEO", "Acme", "https://x", "hi", "hello",
+            funnel_stage=FunnelStage.PITCHED,
+            triggering_message="ours",
+            judge_score=3.6,
+            revision_count=2,
+        )
+
+        assert len(minimal) == 6
+        assert len(full) == 9
+        assert full[2]["fields"][0]["text"] == "*From:*\nJane (CEO @ Acme)"
+        assert full[6]["elements"][0]["text"] == ":large_yellow_circle: *Quality: 3.6/5*  (revised 2x)"
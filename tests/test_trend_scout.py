@@ -30,35 +30,68 @@ class TestContentDb:
         }
         assert expected.issubset(cols)
 
-    @patch("app.services.content_db._get_content_engine")
-    def test_save_trending_topic(self, mock_engine):
-        """save_trending_topic should insert a row and return a dict."""
-        from app.services.content_db import save_trending_topic
-
-        # Set up a mock session
-        mock_session = MagicMock()
-        mock_engine.return_value = MagicMock()
-
-        with patch("app.services.content_db._get_content_session") as mock_get_sess:
-            mock_get_sess.return_value = mock_session
-
-            result = save_trending_topic(
-                topic="AI for coaches",
-                summary="Big trend in coaching",
-                source_urls=["https://example.com"],
-                relevance_score=8,
-                content_angles=["Share your take"],
-                batch_id="abc123",
-                source_platform="reddit",
-            )
-
-        assert result["topic"] == "AI for coaches"
-        assert result["relevance_score"] == 8
-        assert result["batch_id"] == "abc123"
-        assert result["status"] == "new"
-        mock_session.add.assert_called_once()
-        mock_session.commit.assert_called_once()
-        mock_session.close.assert_called_once()
+    @pytest_asyncio.fixture
+    async def content_db(self, tmp_path):
+        """Point the content DB at a throwaway SQLite file."""
+        from app.config import settings
+        from app.services import content_db
+
+        with patch.object(settings, "content_db_url", f"sqlite+aiosqlite:///{tmp_path}/content.db"):
+            await content_db.dispose_content_engine()
+            async with content_db._get_content_engine().begin() as conn:
+                await conn.run_sync(content_db.ContentBase.metadata.create_all)
+            yield content_db
+            await content_db.dispose_content_engine()
+
+    @pytest.mark.asyncio
+    async def test_save_trending_topics(self, content_db):
+        """save_trending_topics should bulk-insert rows and return dicts."""
+        saved = await content_db.save_trending_topics(
+            [
+                {
+                    "topic": "AI for coaches",
+                    "summary": "Big trend in coaching",
+                    "source_urls": ["https://example.com"],
+                    "relevance_score": 8,
+                    "content_angles": ["Share your take"],
+                    "source_platform": "reddit",
+                },
+                {"topic": "Pricing high-ticket offers", "relevance_score": 6},
+            ],
+            batch_id="abc123",
+        )
+
+        assert [t["topic"] for t in saved] == ["AI for coaches", "Pricing high-ticket offers"]
+        assert saved[0]["relevance_score"] == 8
+        assert saved[0]["batch_id"] == "abc123"
+        assert saved[0]["status"] == "new"
+        assert saved[1]["source_urls"] == []
+
+        from sqlalchemy import func, select
+
+        async with content_db._get_content_session() as session:
+            count = await session.scalar(select(func.count()).select_from(content_db.TrendingTopic))
+        assert count == 2
+
+    @pytest.mark.asyncio
+    async def test_save_skips_existing_and_in_batch_duplicates(self, content_db):
+        """Topics matching a recent title (after normalization) are not re-inserted."""
+        await content_db.save_trending_topics([{"topic": "AI for Coaches"}], batch_id="one")
+
+        saved = await content_db.save_trending_topics(
+            [{"topic": "ai for coaches!"}, {"topic": "Referrals"}, {"topic": "referrals"}],
+            batch_id="two",
+        )
+
+        assert [t["topic"] for t in saved] == ["Referrals"]
+
+    @pytest.mark.asyncio
+    async def test_save_empty_list_skips_db(self):
+        from app.services.content_db import save_trending_topics
+
+        with patch("app.services.content_db._get_content_session") as mock_session:
+            assert await save_trending_topics([]) == []
+        mock_session.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -153,10 +186,10 @@ class TestTrendScoutPipeline:
         with (
             patch("app.services.trend_scout._search_perplexity", new_callable=AsyncMock, return_value=mock_search_result),
             patch("app.services.trend_scout._score_and_extract_topics", new_callable=AsyncMock, return_value=mock_scored),
-            patch("app.services.trend_scout.save_trending_topic") as mock_save,
+            patch("app.services.trend_scout.save_trending_topics", new_callable=AsyncMock) as mock_save,
             patch("app.services.slack.get_slack_bot") as mock_slack,
         ):
-            mock_save.return_value = {**mock_scored[0], "id": "test-id", "status": "new"}
+            mock_save.return_value = [{**mock_scored[0], "id": "test-id", "status": "new"}]
             mock_bot = AsyncMock()
             mock_slack.return_value = mock_bot
 
@@ -169,6 +202,96 @@ class TestTrendScoutPipeline:
         mock_bot.send_trend_scout_report.assert_called_once()
 
 
+class TestTrendScoutScaling:
+    """Tests for adaptive search concurrency and chunked scoring."""
+
+    @pytest.mark.asyncio
+    async def test_adaptive_limiter_halves_on_throttle_and_regrows(self):
+        from app.services.rate_limit import AdaptiveLimiter
+
+        limiter = AdaptiveLimiter(4, 8)
+        limiter.record_throttle()
+        assert limiter.limit == 2
+        limiter.record_throttle()
+        limiter.record_throttle()
+        assert limiter.limit == 1
+        limiter.record_success()
+        assert limiter.limit == 2
+
+    @pytest.mark.asyncio
+    async def test_search_retried_after_429(self):
+        import httpx
+
+        from app.services import trend_scout
+
+        request = httpx.Request("POST", "https://api.perplexity.ai/chat/completions")
+        throttled = httpx.HTTPStatusError(
+            "429", request=request,
+            response=httpx.Response(429, headers={"Retry-After": "0"}, request=request),
+        )
+        ok = {"content": "c", "citations": [], "query": "q", "platform": "web"}
+
+        with patch.object(trend_scout, "_search_perplexity", new_callable=AsyncMock, side_effect=[throttled, ok]) as mock_search:
+            results = await trend_scout._run_all_searches([{"query": "q", "platform": "web"}])
+
+        assert results == [ok]
+        assert mock_search.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_truncated_scoring_splits_chunk(self):
+        from app.services.trend_scout import _score_and_extract_topics
+
+        truncated = MagicMock(stop_reason="max_tokens")
+        truncated.content = [MagicMock(text='[{"topic": "A", "summ')]
+
+        def _topic(name):
+            resp = MagicMock(stop_reason="end_turn")
+            resp.content = [MagicMock(text=f'[{{"topic": "{name}", "relevance_score": 7}}]')]
+            return resp
+
+        client = AsyncMock()
+        client.messages.create.side_effect = [truncated, _topic("A"), _topic("B")]
+        results = [
+            {"content": "one", "citations": [], "query": "q1", "platform": "reddit"},
+            {"content": "two", "citations": [], "query": "q2", "platform": "web"},
+        ]
+
+        topics = await _score_and_extract_topics(results, client)
+
+        assert sorted(t["topic"] for t in topics) == ["A", "B"]
+        assert client.messages.create.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_pipeline_scores_chunks_and_dedupes_across_them(self):
+        from app.config import settings
+        from app.services.trend_scout import run_trend_scout_task
+
+        queries = [{"query": f"q{i}", "platform": "web"} for i in range(5)]
+        chunk_topics = [
+            [{"topic": "AI for Coaches", "relevance_score": 8}, {"topic": "Pricing", "relevance_score": 6}],
+            [{"topic": "ai for coaches!", "relevance_score": 9}],
+            [{"topic": "Referrals", "relevance_score": 7}],
+        ]
+
+        async def _search(query, platform, client):
+            return {"content": query, "citations": [], "query": query, "platform": platform}
+
+        with (
+            patch.object(settings, "trend_scout_score_chunk_size", 2),
+            patch("app.services.trend_scout._search_perplexity", side_effect=_search),
+            patch("app.services.trend_scout._score_and_extract_topics", new_callable=AsyncMock, side_effect=chunk_topics) as mock_score,
+            patch("app.services.trend_scout.save_trending_topics", new_callable=AsyncMock, side_effect=lambda topics, batch_id: topics) as mock_save,
+            patch("app.services.slack.get_slack_bot", return_value=AsyncMock()),
+        ):
+            result = await run_trend_scout_task(queries)
+
+        assert mock_score.await_count == 3
+        assert [len(call.args[0]) for call in mock_score.await_args_list] == [2, 2, 1]
+        assert result["topics_found"] == 3
+        assert sum(len(call.args[0]) for call in mock_save.await_args_list) == 3
+        assert {"Pricing", "Referrals"} <= {t["topic"] for t in result["topics"]}
+
+
 # ---------------------------------------------------------------------------
 # Scheduler registration tests
 # ---------------------------------------------------------------------------
@@ -0,0 +1,87 @@
+"""Tests for lean webhook parsing, sampled debug logging and request logging."""
+
+import json
+import logging
+from unittest.mock import patch
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.config import settings
+from app.middleware import RequestLogMiddleware
+from app.schemas import HeyReachWebhookPayload
+from app.services.webhook_ingest import log_webhook_sample, parse_payload, payload_keys
+
+VALID = json.dumps({
+    "lead": {"full_name": "John Doe", "profile_url": "https://www.linkedin.com/in/johndoe"},
+    "recent_messages": [{"creation_time": "2026-01-28T16:28:01Z", "message": "Hi", "is_reply": True}],
+    "conversation_id": "conv-1",
+    "sender": {"id": 123},
+}).encode()
+
+
+class TestParsePayload:
+    def test_validates_from_raw_bytes(self):
+        payload, data, error = parse_payload(HeyReachWebhookPayload, VALID)
+
+        assert payload.lead_name == "John Doe"
+        assert payload.conversation_id == "conv-1"
+        assert data is None and error is None
+
+    def test_schema_mismatch_returns_decoded_data(self):
+        payload, data, error = parse_payload(HeyReachWebhookPayload, b'{"unexpected": 1}')
+
+        assert payload is None
+        assert error is not None
+        assert payload_keys(data) == ["unexpected"]
+
+    def test_invalid_json_raises_value_error(self):
+        with pytest.raises(ValueError):
+            parse_payload(HeyReachWebhookPayload, b"not json")
+
+    def test_payload_keys_non_dict(self):
+        assert payload_keys([1, 2]) == "not a dict"
+
+
+class TestWebhookSampling:
+    def test_off_by_default(self, caplog):
+        with caplog.at_level(logging.INFO, logger="app.services.webhook_ingest"):
+            log_webhook_sample("/webhook/heyreach", VALID)
+        assert caplog.records == []
+
+    def test_sampled_line_is_json_and_truncated(self, caplog):
+        body = b'{"x": "' + b"a" * 100 + b'"}'
+        with patch.object(settings, "webhook_debug_sample_rate", 1.0), \
+             patch.object(settings, "webhook_debug_max_body_chars", 20), \
+             caplog.at_level(logging.INFO, logger="app.services.webhook_ingest"):
+            log_webhook_sample("/webhook/heyreach", body, status="received")
+
+        assert len(caplog.records) == 1
+        record = json.loads(caplog.records[0].getMessage())
+        assert record["endpoint"] == "/webhook/heyreach"
+        assert record["status"] == "received"
+        assert record["bytes"] == len(body)
+        assert len(record["body"]) == 20
+        assert record["truncated"] is True
+
+
+class TestRequestLogMiddleware:
+    async def test_logs_one_line_without_headers(self, caplog):
+        app = FastAPI()
+        app.add_middleware(RequestLogMiddleware)
+
+        @app.post("/echo")
+        async def echo() -> dict:
+            return {"ok": True}
+
+        transport = httpx.ASGITransport(app=app)
+        with caplog.at_level(logging.INFO, logger="app.middleware"):
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.post("/echo", headers={"authorization": "secret"})
+
+        assert response.json() == {"ok": True}
+        lines = [r.getMessage() for r in caplog.records if r.name == "app.middleware"]
+        assert len(lines) == 1
+        assert lines[0].startswith("POST /echo 200 ")
+        assert "secret" not in lines[0]